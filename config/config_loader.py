@@ -4,6 +4,8 @@ import json
 import os
 import logging
 
+from config.config_schema import JetQueConfig, parse_config
+
 def load_config(config_file='jetque/config/config.json'):
     """
     Loads the configuration from a JSON file.
@@ -23,6 +25,18 @@ def load_config(config_file='jetque/config/config.json'):
     with open(config_file_path, 'r') as file:
         return json.load(file)
 
+def load_typed_config(config_file='jetque/config/config.json') -> JetQueConfig:
+    """
+    Loads the configuration from a JSON file and validates it, so invalid values fail at startup.
+
+    :param config_file: Path to the configuration file.
+    :return: The validated configuration.
+    :raises ConfigError: If a configuration value is missing or invalid.
+    """
+    config: JetQueConfig = parse_config(load_config(config_file))
+    logging.debug("Validated configuration with %d animation styles", len(config.animations))
+    return config
+
 def save_config(config_data, config_file='jetque/config/config.json'):
     """
     Saves the configuration to a JSON file.
@@ -0,0 +1,116 @@
+# jetque/config/config_names.py
+
+from typing import Dict, FrozenSet
+
+from PyQt6.QtCore import QEasingCurve, Qt
+from PyQt6.QtGui import QFont
+
+# Configuration names of the animation types, Qt enums and settings animations are styled with,
+# shared by the configuration schema and AnimationFactory.
+
+DYNAMIC_ANIMATION_TYPES: FrozenSet[str] = frozenset({"Directional", "Parabola", "Swivel"})
+STATIC_ANIMATION_TYPES: FrozenSet[str] = frozenset({"Stationary", "Pow"})
+RENDER_MODES: FrozenSet[str] = frozenset({"Full", "DirtyRegion", "SpriteBatch"})
+
+ANIMATION_EASING_MAP: Dict[str, QEasingCurve.Type] = {
+    "Linear": QEasingCurve.Type.Linear,
+    "In-Quadratic": QEasingCurve.Type.InQuad,
+    "Out-Quadratic": QEasingCurve.Type.OutQuad,
+    "In-Out-Quadratic": QEasingCurve.Type.InOutQuad,
+    "Out-In-Quadratic": QEasingCurve.Type.OutInQuad,
+    "In-Cubic": QEasingCurve.Type.InCubic,
+    "Out-Cubic": QEasingCurve.Type.OutCubic,
+    "In-Out-Cubic": QEasingCurve.Type.InOutCubic,
+    "Out-In-Cubic": QEasingCurve.Type.OutInCubic,
+    "In-Quartic": QEasingCurve.Type.InQuart,
+    "Out-Quartic": QEasingCurve.Type.OutQuart,
+    "In-Out-Quartic": QEasingCurve.Type.InOutQuart,
+    "Out-In-Quartic": QEasingCurve.Type.OutInQuart,
+    "In-Quintic": QEasingCurve.Type.InQuint,
+    "Out-Quintic": QEasingCurve.Type.OutQuint,
+    "In-Out-Quintic": QEasingCurve.Type.InOutQuint,
+    "Out-In-Quint": QEasingCurve.Type.OutInQuint,
+    "In-Sinusoidal": QEasingCurve.Type.InSine,
+    "Out-Sinusoidal": QEasingCurve.Type.OutSine,
+    "In-Out-Sinusoidal": QEasingCurve.Type.InOutSine,
+    "Out-In-Sinusoidal": QEasingCurve.Type.OutInSine,
+    "In-Exponential": QEasingCurve.Type.InExpo,
+    "Out-Exponential": QEasingCurve.Type.OutExpo,
+    "In-Out-Exponential": QEasingCurve.Type.InOutExpo,
+    "Out-In-Exponential": QEasingCurve.Type.OutInExpo,
+    "In-Circular": QEasingCurve.Type.InCirc,
+    "Out-Circular": QEasingCurve.Type.OutCirc,
+    "In-Out-Circular": QEasingCurve.Type.InOutCirc,
+    "Out-In-Circular": QEasingCurve.Type.OutInCirc,
+    "In-Elastic": QEasingCurve.Type.InElastic,
+    "Out-Elastic": QEasingCurve.Type.OutElastic,
+    "In-Out-Elastic": QEasingCurve.Type.InOutElastic,
+    "Out-In-Elastic": QEasingCurve.Type.OutInElastic,
+    "In-Back": QEasingCurve.Type.InBack,
+    "Out-Back": QEasingCurve.Type.OutBack,
+    "In-Out-Back": QEasingCurve.Type.InOutBack,
+    "Out-In-Back": QEasingCurve.Type.OutInBack,
+    "In-Bounce": QEasingCurve.Type.InBounce,
+    "Out-Bounce": QEasingCurve.Type.OutBounce,
+    "In-Out-Bounce": QEasingCurve.Type.InOutBounce,
+    "Out-In-Bounce": QEasingCurve.Type.OutInBounce
+}
+
+ANIMATION_JIGGLE_MAP: Dict[str, int] = {
+    "Low": 75,
+    "Medium": 50,
+    "High": 25
+}
+
+FONT_CAPITALIZATION_MAP: Dict[str, QFont.Capitalization] = {
+    "Normal": QFont.Capitalization.MixedCase,
+    "All-Lowercase": QFont.Capitalization.AllLowercase,
+    "All-Uppercase": QFont.Capitalization.AllUppercase,
+    "Capitalize-Words": QFont.Capitalization.Capitalize,
+    "Small-Caps": QFont.Capitalization.SmallCaps
+}
+
+FONT_STRETCH_MAP: Dict[str, QFont.Stretch] = {
+    "Unstretched": getattr(QFont.Stretch, "Unstretched", None) or getattr(QFont.Stretch, "Unstreched"),  # Renamed in PyQt6 6.2
+    "Any-Stretch": QFont.Stretch.AnyStretch,
+    "Ultra-Condensed": QFont.Stretch.UltraCondensed,
+    "Extra-Condensed": QFont.Stretch.ExtraCondensed,
+    "Condensed": QFont.Stretch.Condensed,
+    "Semi-Condensed": QFont.Stretch.SemiCondensed,
+    "Semi-Expanded": QFont.Stretch.SemiExpanded,
+    "Expanded": QFont.Stretch.Expanded,
+    "Extra-Expanded": QFont.Stretch.ExtraExpanded,
+    "Ultra-Expanded": QFont.Stretch.UltraExpanded
+}
+
+FONT_WEIGHT_MAP: Dict[str, QFont.Weight] = {
+    "Normal": QFont.Weight.Normal,
+    "Thin": QFont.Weight.Thin,
+    "Extra-Light": QFont.Weight.ExtraLight,
+    "Light": QFont.Weight.Light,
+    "Medium": QFont.Weight.Medium,
+    "Demi-Bold": QFont.Weight.DemiBold,
+    "Bold": QFont.Weight.Bold,
+    "Extra-Bold": QFont.Weight.ExtraBold,
+    "Black": QFont.Weight.Black
+}
+
+PEN_STYLE_MAP: Dict[str, Qt.PenStyle] = {
+    "Solid": Qt.PenStyle.SolidLine,
+    "Dash": Qt.PenStyle.DashLine,
+    "Dot": Qt.PenStyle.DotLine,
+    "Dash-Dot": Qt.PenStyle.DashDotLine,
+    "Dash-Dot-Dot": Qt.PenStyle.DashDotDotLine
+}
+
+PEN_CAP_STYLE_MAP: Dict[str, Qt.PenCapStyle] = {
+    "Square": Qt.PenCapStyle.SquareCap,
+    "Flat": Qt.PenCapStyle.FlatCap,
+    "Round": Qt.PenCapStyle.RoundCap
+}
+
+PEN_JOIN_STYLE_MAP: Dict[str, Qt.PenJoinStyle] = {
+    "Bevel": Qt.PenJoinStyle.BevelJoin,
+    "Miter": Qt.PenJoinStyle.MiterJoin,
+    "Round": Qt.PenJoinStyle.RoundJoin
+}
@@ -0,0 +1,520 @@
+# jetque/config/config_schema.py
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, TypeVar
+
+from PyQt6.QtCore import QEasingCurve, Qt
+from PyQt6.QtGui import QColor, QFont
+
+from config import config_names
+
+# Constants
+DEFAULT_FONT_TYPE: str = "Arial"
+DEFAULT_FONT_SIZE: int = 16
+DEFAULT_SPAWN_BUDGET: float = 4.0  # Milliseconds of animation building allowed per frame
+DEFAULT_RENDER_MODE: str = "Full"  # Dirty region repainting and sprite batching are opted into per config
+
+T = TypeVar("T")
+
+
+class ConfigError(ValueError):
+    """Raised at load time when a configuration value is missing or invalid."""
+
+    def __init__(self, path: str, message: str) -> None:
+        """
+        Initialize the error.
+
+        Args:
+            path (str): The location of the invalid value, e.g. "animations.Hit.duration".
+            message (str): What is wrong with the value.
+        """
+        super().__init__(f"{path}: {message}")
+        self.path: str = path
+
+
+@dataclass(frozen=True, slots=True)
+class FontConfig:
+    """
+    Validated font settings of an animation style.
+
+    Attributes:
+        font_type (str): The font family.
+        font_size (int): The point size.
+        font_weight (QFont.Weight): The weight.
+        font_capitalization (QFont.Capitalization): The capitalization.
+        font_stretch (QFont.Stretch): The stretch.
+        font_letter_spacing (float): Absolute letter spacing in pixels.
+        font_word_spacing (float): Word spacing in pixels.
+        font_italic (bool): Whether the font is italic.
+        font_kerning (bool): Whether kerning is enabled.
+        font_overline (bool): Whether the text is overlined.
+        font_strikethrough (bool): Whether the text is struck through.
+        font_underline (bool): Whether the text is underlined.
+    """
+
+    font_type: str
+    font_size: int
+    font_weight: QFont.Weight
+    font_capitalization: QFont.Capitalization
+    font_stretch: QFont.Stretch
+    font_letter_spacing: float
+    font_word_spacing: float
+    font_italic: bool
+    font_kerning: bool
+    font_overline: bool
+    font_strikethrough: bool
+    font_underline: bool
+
+
+@dataclass(frozen=True, slots=True)
+class AnimationConfig:
+    """
+    Validated and normalised configuration of one animation style.
+
+    Durations are in milliseconds and every share of the duration, written as a fraction like 0.25 in the
+    configuration, is an int percentage.
+
+    Attributes:
+        name (str): The style name.
+        animation_type (str): The animation type, e.g. "Parabola".
+        duration (int): The duration in milliseconds.
+        starting_position (str): The name of the starting position.
+        ending_position (str): The name of the ending position.
+        behavior (Optional[str]): The path behavior of directional animations, e.g. "CurvedLeft".
+        sound (Optional[str]): The sound file played when the animation starts.
+        easing_style (QEasingCurve.Type): The easing curve of the movement.
+        fade_in (bool): Whether the animation fades in.
+        fade_out (bool): Whether the animation fades out.
+        fade_in_percentage (int): Share of the duration spent fading in.
+        fade_out_percentage (int): Share of the duration spent fading out.
+        fade_in_easing_style (QEasingCurve.Type): The easing curve of the fade-in.
+        fade_out_easing_style (QEasingCurve.Type): The easing curve of the fade-out.
+        phase_1_percentage (int): Share of the duration spent in phase 1.
+        phase_2_percentage (int): Share of the duration spent in phase 2.
+        font (FontConfig): The font settings.
+        text_color (QColor): The text color.
+        outline (bool): Whether the text is outlined.
+        outline_thickness (int): The outline thickness.
+        outline_color (QColor): The outline color.
+        outline_pen_style (Qt.PenStyle): The outline pen style.
+        outline_pen_cap_style (Qt.PenCapStyle): The outline pen cap style.
+        outline_pen_join_style (Qt.PenJoinStyle): The outline pen join style.
+        drop_shadow (bool): Whether the text casts a drop shadow.
+        drop_shadow_offset (Tuple[float, float]): The drop shadow offset.
+        drop_shadow_blur_radius (float): The drop shadow blur radius.
+        drop_shadow_color (QColor): The drop shadow color.
+        jiggle (bool): Whether static animations jiggle.
+        jiggle_intensity (int): The jiggle interval, lower is more intense.
+        scale_percentage (float): The peak scale factor of Pow animations.
+        scale_easing_style (QEasingCurve.Type): The easing curve of the scaling.
+    """
+
+    name: str
+    animation_type: str
+    duration: int
+    starting_position: str
+    ending_position: str
+    behavior: Optional[str]
+    sound: Optional[str]
+    easing_style: QEasingCurve.Type
+    fade_in: bool
+    fade_out: bool
+    fade_in_percentage: int
+    fade_out_percentage: int
+    fade_in_easing_style: QEasingCurve.Type
+    fade_out_easing_style: QEasingCurve.Type
+    phase_1_percentage: int
+    phase_2_percentage: int
+    font: FontConfig
+    text_color: QColor
+    outline: bool
+    outline_thickness: int
+    outline_color: QColor
+    outline_pen_style: Qt.PenStyle
+    outline_pen_cap_style: Qt.PenCapStyle
+    outline_pen_join_style: Qt.PenJoinStyle
+    drop_shadow: bool
+    drop_shadow_offset: Tuple[float, float]
+    drop_shadow_blur_radius: float
+    drop_shadow_color: QColor
+    jiggle: bool
+    jiggle_intensity: int
+    scale_percentage: float
+    scale_easing_style: QEasingCurve.Type
+
+
+@dataclass(frozen=True, slots=True)
+class JetQueConfig:
+    """
+    Validated application configuration, parsed once at load.
+
+    Attributes:
+        animations (Dict[str, AnimationConfig]): The animation styles keyed by name.
+        spawn_budget_ms (float): Milliseconds of animation building allowed per frame.
+        animation_speed (float): Global animation speed multiplier.
+        render_mode (str): How the overlay views repaint, one of config_names.RENDER_MODES.
+        raw (Dict[str, Any]): The configuration as loaded, e.g. for saving it back.
+    """
+
+    animations: Dict[str, AnimationConfig] = field(default_factory=dict)
+    spawn_budget_ms: float = DEFAULT_SPAWN_BUDGET
+    animation_speed: float = 1.0
+    render_mode: str = DEFAULT_RENDER_MODE
+    raw: Dict[str, Any] = field(default_factory=dict)
+
+
+def parse_config(raw: Mapping[str, Any]) -> JetQueConfig:
+    """
+    Validate and normalise a loaded configuration.
+
+    Args:
+        raw (Mapping[str, Any]): The configuration as loaded from JSON.
+
+    Returns:
+        JetQueConfig: The typed configuration.
+
+    Raises:
+        ConfigError: If a value is missing or invalid.
+    """
+    if not isinstance(raw, Mapping):
+        raise ConfigError("config", "must be an object")
+
+    animations: Any = raw.get("animations", {})
+    if not isinstance(animations, Mapping):
+        raise ConfigError("animations", "must be an object of named animation styles")
+
+    render_mode: str = _string(raw, "render_mode", "config", DEFAULT_RENDER_MODE)
+    if render_mode not in config_names.RENDER_MODES:
+        raise ConfigError(
+            "config.render_mode", f"must be one of {sorted(config_names.RENDER_MODES)}, got {render_mode!r}"
+        )
+
+    return JetQueConfig(
+        animations={
+            str(name): parse_animation_config(str(name), animation, f"animations.{name}")
+            for name, animation in animations.items()
+        },
+        spawn_budget_ms=_number(raw, "spawn_budget_ms", "config", DEFAULT_SPAWN_BUDGET, minimum=0.0),
+        animation_speed=_number(raw, "animation_speed", "config", 1.0, minimum=0.0),
+        render_mode=render_mode,
+        raw=dict(raw)
+    )
+
+
+def parse_animation_config(name: str, raw: Mapping[str, Any], path: Optional[str] = None) -> AnimationConfig:
+    """
+    Validate and normalise the configuration of one animation style.
+
+    Args:
+        name (str): The style name.
+        raw (Mapping[str, Any]): The style as loaded from JSON.
+        path (Optional[str]): The location of the style reported in errors, defaults to the name.
+
+    Returns:
+        AnimationConfig: The typed style configuration.
+
+    Raises:
+        ConfigError: If a value is missing or invalid.
+    """
+    path = path or name
+    if not isinstance(raw, Mapping):
+        raise ConfigError(path, "must be an object")
+
+    animation_type: Any = raw.get("type")
+    known_types = config_names.DYNAMIC_ANIMATION_TYPES | config_names.STATIC_ANIMATION_TYPES
+    if animation_type not in known_types:
+        raise ConfigError(f"{path}.type", f"must be one of {sorted(known_types)}, got {animation_type!r}")
+
+    if "duration" not in raw:
+        raise ConfigError(f"{path}.duration", "is required")
+    duration_seconds: float = _number(raw, "duration", path, 0.0, minimum=0.0)
+    if duration_seconds <= 0.0:
+        raise ConfigError(f"{path}.duration", "must be greater than 0 seconds")
+
+    font: FontConfig = FontConfig(
+        font_type=_string(raw, "font_type", path, DEFAULT_FONT_TYPE),
+        font_size=int(_number(raw, "font_size", path, DEFAULT_FONT_SIZE, minimum=1)),
+        font_weight=_name(raw, "font_weight", path, config_names.FONT_WEIGHT_MAP, "Normal"),
+        font_capitalization=_name(raw, "font_capitalization", path, config_names.FONT_CAPITALIZATION_MAP, "Normal"),
+        font_stretch=_name(raw, "font_stretch", path, config_names.FONT_STRETCH_MAP, "Unstretched"),
+        font_letter_spacing=_number(raw, "font_letter_spacing", path, 0.0),
+        font_word_spacing=_number(raw, "font_word_spacing", path, 0.0),
+        font_italic=_boolean(raw, "font_italic", path, False),
+        font_kerning=_boolean(raw, "font_kerning", path, True),
+        font_overline=_boolean(raw, "font_overline", path, False),
+        font_strikethrough=_boolean(raw, "font_strikethrough", path, False),
+        font_underline=_boolean(raw, "font_underline", path, False)
+    )
+
+    drop_shadow_offset: Any = raw.get("drop_shadow_offset", (-3.5, 6.1))
+    if (
+            not isinstance(drop_shadow_offset, (list, tuple))
+            or len(drop_shadow_offset) != 2
+            or not all(_is_number(value) for value in drop_shadow_offset)
+    ):
+        raise ConfigError(f"{path}.drop_shadow_offset", f"must be an [x, y] pair, got {drop_shadow_offset!r}")
+
+    jiggle_intensity: Any = raw.get("jiggle_intensity", "Medium")
+    if not _is_number(jiggle_intensity):
+        jiggle_intensity = _name(raw, "jiggle_intensity", path, config_names.ANIMATION_JIGGLE_MAP, "Medium")
+
+    return AnimationConfig(
+        name=name,
+        animation_type=animation_type,
+        duration=int(duration_seconds * 1000),
+        starting_position=_string(raw, "starting_position", path, "Top-Left"),
+        ending_position=_string(raw, "ending_position", path, "Top-Left"),
+        behavior=_optional(raw, "behavior", path, _string),
+        sound=_optional(raw, "sound", path, _string),
+        easing_style=_easing(raw, "easing_style", path),
+        fade_in=_boolean(raw, "fade_in", path, False),
+        fade_out=_boolean(raw, "fade_out", path, False),
+        fade_in_percentage=_percentage(raw, "fade_in_percentage", path, 0.0),
+        fade_out_percentage=_percentage(raw, "fade_out_percentage", path, 0.0),
+        fade_in_easing_style=_easing(raw, "fade_in_easing_style", path),
+        fade_out_easing_style=_easing(raw, "fade_out_easing_style", path),
+        phase_1_percentage=_percentage(raw, "phase_1_percentage", path, 0.5),
+        phase_2_percentage=_percentage(raw, "phase_2_percentage", path, 0.5),
+        font=font,
+        text_color=_color(raw, "text_color", path, "white"),
+        outline=_boolean(raw, "outline", path, False),
+        outline_thickness=int(_number(raw, "outline_thickness", path, 1, minimum=0)),
+        outline_color=_color(raw, "outline_color", path, "black"),
+        outline_pen_style=_name(raw, "outline_pen_style", path, config_names.PEN_STYLE_MAP, "Solid"),
+        outline_pen_cap_style=_name(raw, "outline_pen_cap_style", path, config_names.PEN_CAP_STYLE_MAP, "Round"),
+        outline_pen_join_style=_name(raw, "outline_pen_join_style", path, config_names.PEN_JOIN_STYLE_MAP, "Round"),
+        drop_shadow=_boolean(raw, "drop_shadow", path, False),
+        drop_shadow_offset=(float(drop_shadow_offset[0]), float(drop_shadow_offset[1])),
+        drop_shadow_blur_radius=_number(raw, "drop_shadow_blur_radius", path, 7.0, minimum=0.0),
+        drop_shadow_color=_color(raw, "drop_shadow_color", path, [0, 0, 0, 191]),
+        jiggle=_boolean(raw, "jiggle", path, False),
+        jiggle_intensity=int(jiggle_intensity),
+        scale_percentage=_number(raw, "scale_percentage", path, 1.70, minimum=0.0),
+        scale_easing_style=_easing(raw, "scale_easing_style", path)
+    )
+
+
+def parse_color(value: Any, path: str = "color") -> QColor:
+    """
+    Parse a configured color.
+
+    The component type decides the scale, not the magnitude: [1, 0, 0] is an almost black 0-255 color,
+    [1.0, 0.0, 0.0] is pure red.
+
+    Args:
+        value (Any): A color name or "#rrggbb" string, an [r, g, b(, a)] list of 0-255 ints,
+                     or an [r, g, b(, a)] list of 0.0-1.0 floats.
+        path (str): The location of the value reported in errors.
+
+    Returns:
+        QColor: The parsed color.
+
+    Raises:
+        ConfigError: If the value is not a valid color, or mixes ints and floats.
+    """
+    color: QColor = QColor()
+    if isinstance(value, str):
+        color = QColor(value)
+    elif isinstance(value, (list, tuple)) and len(value) in (3, 4):
+        if all(isinstance(part, float) for part in value):
+            if all(0.0 <= part <= 1.0 for part in value):
+                color = QColor.fromRgbF(*value)
+        elif all(isinstance(part, int) and not isinstance(part, bool) for part in value):
+            if all(0 <= part <= 255 for part in value):
+                color = QColor(*value)
+    if not color.isValid():
+        raise ConfigError(
+            path,
+            f"must be a color name, \"#rrggbb\", an [r, g, b(, a)] list of 0-255 ints "
+            f"or of 0.0-1.0 floats, got {value!r}"
+        )
+    return color
+
+
+def _color(raw: Mapping[str, Any], key: str, path: str, default: Any) -> QColor:
+    """
+    Parse an optional color value.
+
+    Args:
+        raw (Mapping[str, Any]): The object holding the value.
+        key (str): The key of the value.
+        path (str): The location of the object reported in errors.
+        default (Any): The configured form of the color used when the key is missing.
+
+    Returns:
+        QColor: The parsed color.
+    """
+    return parse_color(raw.get(key, default), f"{path}.{key}")
+
+
+def _easing(raw: Mapping[str, Any], key: str, path: str) -> QEasingCurve.Type:
+    """
+    Parse an optional easing style name, defaulting to Linear.
+
+    Args:
+        raw (Mapping[str, Any]): The object holding the value.
+        key (str): The key of the value.
+        path (str): The location of the object reported in errors.
+
+    Returns:
+        QEasingCurve.Type: The easing curve type.
+    """
+    return _name(raw, key, path, config_names.ANIMATION_EASING_MAP, "Linear")
+
+
+def _name(raw: Mapping[str, Any], key: str, path: str, names: Mapping[str, T], default: str) -> T:
+    """
+    Parse an optional value that must be one of a set of names.
+
+    Args:
+        raw (Mapping[str, Any]): The object holding the value.
+        key (str): The key of the value.
+        path (str): The location of the object reported in errors.
+        names (Mapping[str, T]): The accepted names and what they stand for.
+        default (str): The name used when the key is missing.
+
+    Returns:
+        T: What the name stands for.
+
+    Raises:
+        ConfigError: If the value is not one of the names.
+    """
+    value: Any = raw.get(key, default)
+    if value not in names:
+        raise ConfigError(f"{path}.{key}", f"must be one of {sorted(names)}, got {value!r}")
+    return names[value]
+
+
+def _percentage(raw: Mapping[str, Any], key: str, path: str, default: float) -> int:
+    """
+    Parse an optional share of a duration, written as a fraction like 0.25, into an int percentage.
+
+    Args:
+        raw (Mapping[str, Any]): The object holding the value.
+        key (str): The key of the value.
+        path (str): The location of the object reported in errors.
+        default (float): The fraction used when the key is missing.
+
+    Returns:
+        int: The percentage, 0-100.
+
+    Raises:
+        ConfigError: If the value is not a fraction between 0.0 and 1.0, e.g. 25 instead of 0.25.
+    """
+    value: Any = raw.get(key, default)
+    if not _is_number(value):
+        raise ConfigError(f"{path}.{key}", f"must be a number, got {value!r}")
+    if not 0.0 <= value <= 1.0:
+        raise ConfigError(f"{path}.{key}", f"must be a fraction of the duration between 0.0 and 1.0, got {value!r}")
+    return round(value * 100)
+
+
+def _number(
+        raw: Mapping[str, Any],
+        key: str,
+        path: str,
+        default: float,
+        minimum: Optional[float] = None
+) -> float:
+    """
+    Parse an optional number.
+
+    Args:
+        raw (Mapping[str, Any]): The object holding the value.
+        key (str): The key of the value.
+        path (str): The location of the object reported in errors.
+        default (float): The number used when the key is missing.
+        minimum (Optional[float]): The smallest accepted number, or None for no bound.
+
+    Returns:
+        float: The number.
+
+    Raises:
+        ConfigError: If the value is not a number or is below the minimum.
+    """
+    value: Any = raw.get(key, default)
+    if not _is_number(value):
+        raise ConfigError(f"{path}.{key}", f"must be a number, got {value!r}")
+    if minimum is not None and value < minimum:
+        raise ConfigError(f"{path}.{key}", f"must be at least {minimum}, got {value!r}")
+    return float(value)
+
+
+def _boolean(raw: Mapping[str, Any], key: str, path: str, default: bool) -> bool:
+    """
+    Parse an optional boolean.
+
+    Args:
+        raw (Mapping[str, Any]): The object holding the value.
+        key (str): The key of the value.
+        path (str): The location of the object reported in errors.
+        default (bool): The value used when the key is missing.
+
+    Returns:
+        bool: The boolean.
+
+    Raises:
+        ConfigError: If the value is not a boolean.
+    """
+    value: Any = raw.get(key, default)
+    if not isinstance(value, bool):
+        raise ConfigError(f"{path}.{key}", f"must be true or false, got {value!r}")
+    return value
+
+
+def _string(raw: Mapping[str, Any], key: str, path: str, default: Optional[str] = None) -> str:
+    """
+    Parse an optional string.
+
+    Args:
+        raw (Mapping[str, Any]): The object holding the value.
+        key (str): The key of the value.
+        path (str): The location of the object reported in errors.
+        default (Optional[str]): The string used when the key is missing.
+
+    Returns:
+        str: The string.
+
+    Raises:
+        ConfigError: If the value is not a non-empty string.
+    """
+    value: Any = raw.get(key, default)
+    if not isinstance(value, str) or not value:
+        raise ConfigError(f"{path}.{key}", f"must be a non-empty string, got {value!r}")
+    return value
+
+
+def _optional(
+        raw: Mapping[str, Any],
+        key: str,
+        path: str,
+        parse: Callable[[Mapping[str, Any], str, str], T]
+) -> Optional[T]:
+    """
+    Parse a value that may be missing or null.
+
+    Args:
+        raw (Mapping[str, Any]): The object holding the value.
+        key (str): The key of the value.
+        path (str): The location of the object reported in errors.
+        parse (Callable[[Mapping[str, Any], str, str], T]): The parser of present values.
+
+    Returns:
+        Optional[T]: The parsed value, or None if it is missing.
+    """
+    if raw.get(key) is None:
+        return None
+    return parse(raw, key, path)
+
+
+def _is_number(value: Any) -> bool:
+    """
+    Check whether a JSON value is a number, booleans excluded.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        bool: True for ints and floats.
+    """
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
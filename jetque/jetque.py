@@ -6,7 +6,10 @@ from typing import List
 
 from PyQt6.QtWidgets import QApplication
 
+from config.config_loader import load_typed_config
+from config.config_schema import JetQueConfig
 from jetque.source.animations.anchor_object import AnchorObject
+from jetque.source.animations.animation_manager import AnimationManager
 from jetque.source.gui.jetque_overlay import JetQueOverlay
 from jetque.source.gui.jetque_window import JetQueWindow
 from jetque.source.utilities.global_key_listener_thread import GlobalKeyListenerThread
@@ -23,11 +26,17 @@ class JetQue(QApplication):
         """
         super().__init__(sys_argv)
 
+        # Validate the whole configuration before any window exists, so a bad value fails here with its path
+        self.config: JetQueConfig = load_typed_config()
+
         screen = QApplication.primaryScreen()
         available_geometry = screen.availableGeometry()
 
         self.window: JetQueWindow = JetQueWindow()
-        self.overlay: JetQueOverlay = JetQueOverlay(available_geometry)
+        self.overlay: JetQueOverlay = JetQueOverlay(available_geometry, render_mode=self.config.render_mode)
+        screen.availableGeometryChanged.connect(self.overlay.set_geometry)
+        self.animation_manager: AnimationManager = AnimationManager(self.config, parent=self)
+        self.overlay.attach_animation_manager(self.animation_manager)
         test_anchor = AnchorObject("Incoming")
         self.overlay.add_anchor_point(test_anchor)
 
@@ -13,6 +13,8 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from jetque.source.gui.cache_policy import ITEM_KIND_ANCHOR, apply_cache_mode
+
 
 class AnchorCircleObject(QGraphicsObject):
     """Interactive circle item for animation anchors."""
@@ -58,6 +60,7 @@ class AnchorCircleObject(QGraphicsObject):
 
         # For better interaction
         self.setAcceptHoverEvents(True)
+        apply_cache_mode(self, ITEM_KIND_ANCHOR)
 
     def boundingRect(self) -> QRectF:
         """Return the bounding rectangle of the circle.
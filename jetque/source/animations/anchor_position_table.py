@@ -0,0 +1,119 @@
+# jetque/source/animations/anchor_position_table.py
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QPointF, QRectF, pyqtSignal
+
+from jetque.source.animations.anchor_object import AnchorObject
+
+# Constants
+GRID_POSITIONS: Dict[str, Tuple[float, float]] = {  # Named positions as fractions of the overlay size
+    "Top-Left": (0.0, 0.0),
+    "Top-Center": (0.5, 0.0),
+    "Top-Right": (1.0, 0.0),
+    "Middle-Left": (0.0, 0.5),
+    "Middle-Center": (0.5, 0.5),
+    "Middle-Right": (1.0, 0.5),
+    "Bottom-Left": (0.0, 1.0),
+    "Bottom-Center": (0.5, 1.0),
+    "Bottom-Right": (1.0, 1.0)
+}
+ANCHOR_START_SUFFIX: str = "-Start"  # e.g. "Incoming-Start" is the start circle of the "Incoming" anchor
+ANCHOR_END_SUFFIX: str = "-End"  # e.g. "Incoming-End" is the end circle of the "Incoming" anchor
+
+
+class AnchorPositionTable(QObject):
+    """
+    Named animation positions of one overlay, computed from its geometry and anchors.
+
+    The table holds the nine grid positions of the overlay and the start and end circle centers of every
+    watched anchor. It is recomputed only when the overlay geometry changes or an anchor moves, and
+    positionsChanged is emitted only if a position actually changed, so styles resolved against it stay
+    valid between those events.
+
+    Attributes:
+        positionsChanged (pyqtSignal): Emitted after a recomputation changed at least one position.
+        geometry (QRectF): The overlay geometry in scene coordinates.
+        anchors (List[AnchorObject]): The anchors whose circles are part of the table.
+        positions (Dict[str, QPointF]): The current positions keyed by name.
+    """
+
+    positionsChanged = pyqtSignal()
+
+    def __init__(self, geometry: QRectF, parent: Optional[QObject] = None) -> None:
+        """
+        Initialize the table for an overlay geometry.
+
+        Args:
+            geometry (QRectF): The overlay geometry in scene coordinates.
+            parent (Optional[QObject]): The parent object.
+        """
+        super().__init__(parent)
+        self.geometry: QRectF = QRectF(geometry)
+        self.anchors: List[AnchorObject] = []
+        self.positions: Dict[str, QPointF] = {}
+        self.recompute()
+
+    def position(self, name: Optional[str]) -> Optional[QPointF]:
+        """
+        Get a named position.
+
+        Args:
+            name (Optional[str]): A grid position (e.g. "Top-Left") or an anchor circle (e.g. "Incoming-Start").
+
+        Returns:
+            Optional[QPointF]: A copy of the position, or None for unknown names.
+        """
+        position: Optional[QPointF] = self.positions.get(name)
+        return QPointF(position) if position is not None else None
+
+    def set_geometry(self, geometry: QRectF) -> None:
+        """
+        Update the overlay geometry, e.g. after the screen changed.
+
+        Args:
+            geometry (QRectF): The new overlay geometry in scene coordinates.
+        """
+        if QRectF(geometry) == self.geometry:
+            return
+        self.geometry = QRectF(geometry)
+        self.recompute()
+
+    def watch_anchor(self, anchor: AnchorObject) -> None:
+        """
+        Add the circles of an anchor to the table and recompute whenever the anchor moves.
+
+        Args:
+            anchor (AnchorObject): The anchor to watch.
+        """
+        if anchor in self.anchors:
+            return
+        self.anchors.append(anchor)
+        anchor.positionChanged.connect(self.recompute)
+        self.recompute()
+
+    def recompute(self) -> None:
+        """Recompute every position, emitting positionsChanged if any of them changed."""
+        try:
+            positions: Dict[str, QPointF] = {
+                name: QPointF(
+                    self.geometry.left() + self.geometry.width() * x_fraction,
+                    self.geometry.top() + self.geometry.height() * y_fraction
+                )
+                for name, (x_fraction, y_fraction) in GRID_POSITIONS.items()
+            }
+            for anchor in self.anchors:
+                positions[anchor.group_name + ANCHOR_START_SUFFIX] = anchor.start_circle.mapToScene(
+                    anchor.start_circle.rect.center()
+                )
+                positions[anchor.group_name + ANCHOR_END_SUFFIX] = anchor.end_circle.mapToScene(
+                    anchor.end_circle.rect.center()
+                )
+
+            if positions != self.positions:
+                self.positions = positions
+                logging.debug("AnchorPositionTable recomputed %d positions.", len(positions))
+                self.positionsChanged.emit()
+        except Exception as e:
+            logging.exception("Error recomputing anchor positions: %s", e)
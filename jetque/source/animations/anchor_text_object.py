@@ -14,6 +14,7 @@ from PyQt6.QtWidgets import (
 )
 
 from jetque.source.animations.anchor_editable_text_item import AnchorEditableTextItem
+from jetque.source.gui.cache_policy import ITEM_KIND_ANCHOR, apply_cache_mode
 
 
 class AnchorTextObject(QGraphicsObject):
@@ -81,6 +82,9 @@ class AnchorTextObject(QGraphicsObject):
         self.x_item.setAcceptHoverEvents(True)
         self.y_item.setAcceptHoverEvents(True)
 
+        for item in (self.prefix_item, self.x_item, self.comma_item, self.y_item, self.suffix_item):
+            apply_cache_mode(item, ITEM_KIND_ANCHOR)
+
     def _update_text(self) -> None:
         """Update the text items with the current position."""
         position_label = 'Start' if self.is_start else 'End'
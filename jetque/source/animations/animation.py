@@ -1,14 +1,15 @@
 # src/animations/animation.py
 
 import logging
-from typing import Optional
+from array import array
+from typing import Optional, Sequence, Tuple
 
 from PyQt6.QtCore import (
     QEasingCurve, QPointF, QPropertyAnimation, QSequentialAnimationGroup, QParallelAnimationGroup, QAbstractAnimation,
     QObject
 )
 
-from PyQt6.QtMultimedia import QSoundEffect
+from jetque.source.managers.sound_cue import SoundCue
 
 
 class Animation(QParallelAnimationGroup):
@@ -19,7 +20,7 @@ class Animation(QParallelAnimationGroup):
     def __init__(
             self,
             animation_type: str,
-            sound: QSoundEffect,
+            sound: Optional[SoundCue],
             duration: int,
             starting_position: QPointF,
             fade_in: bool,
@@ -37,7 +38,7 @@ class Animation(QParallelAnimationGroup):
 
         Args:
             animation_type (str): The type of animation.
-            sound (QSoundEffect): The sound effect to play.
+            sound (Optional[SoundCue]): The preloaded sound to play.
             duration (int): The duration of the animation in milliseconds.
             starting_position (QPointF): The starting position of the animation.
             fade_in (bool): Whether the animation fades in.
@@ -53,7 +54,7 @@ class Animation(QParallelAnimationGroup):
         super().__init__(parent)
         # Initialize common attributes between all Animation children
         self.type: str = animation_type
-        self.sound: QSoundEffect = sound
+        self.sound: Optional[SoundCue] = sound
         self.animation_object: Optional[QObject] = animation_object
         self.duration: int = duration
         self.starting_position: QPointF = starting_position
@@ -103,12 +104,33 @@ class Animation(QParallelAnimationGroup):
         except Exception as e:
             logging.exception("Failed to start Animation: %s", e)
 
+    def batch_path(self) -> Optional[Tuple[Sequence[float], QPointF, QEasingCurve.Type]]:
+        """
+        Get the path followed when this animation is driven by an AnimationBatch instead of its own timers.
+
+        Returns:
+            Optional[Tuple[Sequence[float], QPointF, QEasingCurve.Type]]:
+                Interleaved coordinates of evenly timed samples, the offset added to them and the easing curve,
+                or None if the animation animates more than position and opacity and cannot be batched.
+        """
+        return (
+            array("d", (self.starting_position.x(), self.starting_position.y()) * 2),
+            QPointF(),
+            QEasingCurve.Type.Linear
+        )
+
+    def play_sound(self) -> None:
+        """
+        Play the associated sound effect without starting the animation timers.
+        """
+        self._play_sound()
+
     def _play_sound(self) -> None:
         """
         Play the associated sound effect if available.
         """
         if not self.sound:
-            logging.warning("No sound effect to play for Animation.")
+            logging.debug("No sound effect to play for Animation.")
             return
 
         try:
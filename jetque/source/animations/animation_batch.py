@@ -0,0 +1,366 @@
+# jetque/source/animations/animation_batch.py
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PyQt6.QtCore import QEasingCurve, QPointF
+from PyQt6.QtWidgets import QGraphicsItem
+
+from jetque.source.animations.easing_table import EasingTable
+
+# Constants
+DEFAULT_BATCH_CAPACITY: int = 64  # Slots allocated up front, doubled whenever they run out
+PATH_TABLE_COMPACT_ROWS: int = 4096  # Rows of released paths tolerated before the path table is rebuilt
+
+
+class AnimationBatch:
+    """
+    Struct-of-arrays store for active animations, evaluated in one vectorised pass per frame.
+
+    Every animation moves along evenly timed samples, like a PathAnimation does: the shared buffer of
+    a sampled AnimationPath, or the keyframes of a straight or swivel path. The samples of every path
+    are stacked in one table, so positions of all slots are interpolated together however many
+    different paths are running. Eased progress comes from the EasingTable and the opacity of the
+    fade-in and fade-out windows is evaluated in the same pass.
+
+    Attributes:
+        capacity (int): Number of slots currently allocated.
+        path_table (np.ndarray): The samples of every registered path, stacked, shape (rows, 2).
+        path_start (np.ndarray): Row of the first sample of each slot's path.
+        path_last (np.ndarray): Index of the last sample of each slot's path, at least 1.
+        offset (np.ndarray): Translation applied to each slot's path, shape (capacity, 2).
+        start_time (np.ndarray): Clock time in milliseconds at which each animation started.
+        duration (np.ndarray): Duration of the movement of each animation in milliseconds.
+        total_duration (np.ndarray): Milliseconds after which each animation, fades included, is finished.
+        easing (np.ndarray): QEasingCurve.Type values used for movement.
+        fade_in_duration (np.ndarray): Fade-in window in milliseconds, 0 when disabled.
+        fade_in_easing (np.ndarray): QEasingCurve.Type values used for fading in.
+        fade_out_delay (np.ndarray): Milliseconds before the fade-out window opens.
+        fade_out_duration (np.ndarray): Fade-out window in milliseconds, 0 when disabled.
+        fade_out_easing (np.ndarray): QEasingCurve.Type values used for fading out.
+        active (np.ndarray): Mask of slots holding a running animation.
+        items (List[Optional[QGraphicsItem]]): The graphics item driven by each slot.
+        owners (List[Any]): Arbitrary owner object handed back when a slot finishes.
+        easing_table (EasingTable): Lookup tables used to evaluate the easing curves.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_BATCH_CAPACITY, easing_table: Optional[EasingTable] = None) -> None:
+        """
+        Initialize an empty batch.
+
+        Args:
+            capacity (int): The number of slots to allocate up front.
+            easing_table (Optional[EasingTable]): Shared easing lookup tables, sampled here if not provided.
+        """
+        self.capacity: int = 0
+        self.path_table: np.ndarray = np.zeros((0, 2))
+        self.path_start: np.ndarray = np.zeros(0, dtype=np.int64)
+        self.path_last: np.ndarray = np.ones(0, dtype=np.int64)
+        self.offset: np.ndarray = np.zeros((0, 2))
+        self.start_time: np.ndarray = np.zeros(0)
+        self.duration: np.ndarray = np.ones(0)
+        self.total_duration: np.ndarray = np.ones(0)
+        self.easing: np.ndarray = np.zeros(0, dtype=np.int16)
+        self.fade_in_duration: np.ndarray = np.zeros(0)
+        self.fade_in_easing: np.ndarray = np.zeros(0, dtype=np.int16)
+        self.fade_out_delay: np.ndarray = np.zeros(0)
+        self.fade_out_duration: np.ndarray = np.zeros(0)
+        self.fade_out_easing: np.ndarray = np.zeros(0, dtype=np.int16)
+        self.active: np.ndarray = np.zeros(0, dtype=bool)
+        self.items: List[Optional[QGraphicsItem]] = []
+        self.owners: List[Any] = []
+        self.easing_table: EasingTable = easing_table if easing_table is not None else EasingTable()
+        self._free_slots: List[int] = []
+        self._slot_paths: List[Optional[int]] = []
+        self._slots_by_owner: Dict[int, int] = {}
+        # Registered paths keyed by id() of their buffer: the buffer, its first row and the number of slots using it
+        self._paths: Dict[int, List[Any]] = {}
+        self._released_rows: int = 0
+        self._grow(max(1, capacity))
+
+    def __len__(self) -> int:
+        """
+        Get the number of running animations.
+
+        Returns:
+            int: The number of active slots.
+        """
+        return self.capacity - len(self._free_slots)
+
+    def add(
+            self,
+            item: QGraphicsItem,
+            path_positions: Sequence[float],
+            start_time: float,
+            duration: int,
+            offset: Optional[QPointF] = None,
+            total_duration: Optional[int] = None,
+            easing_style: QEasingCurve.Type = QEasingCurve.Type.Linear,
+            fade_in_duration: int = 0,
+            fade_in_easing_style: QEasingCurve.Type = QEasingCurve.Type.Linear,
+            fade_out_delay: int = 0,
+            fade_out_duration: int = 0,
+            fade_out_easing_style: QEasingCurve.Type = QEasingCurve.Type.Linear,
+            owner: Any = None
+    ) -> int:
+        """
+        Add an animation to the batch and move its item to where the animation starts.
+
+        Args:
+            item (QGraphicsItem): The graphics item to move and fade.
+            path_positions (Sequence[float]): Interleaved x and y coordinates of at least two evenly timed samples.
+                                              Buffers shared between animations are stored once.
+            start_time (float): The frame clock time at which the animation starts, in milliseconds.
+            duration (int): The duration of the movement in milliseconds.
+            offset (Optional[QPointF]): Translation applied to every sample.
+            total_duration (Optional[int]): Milliseconds until the animation is finished, the duration by default.
+            easing_style (QEasingCurve.Type): The easing curve for movement.
+            fade_in_duration (int): The fade-in duration in milliseconds, 0 to disable fading in.
+            fade_in_easing_style (QEasingCurve.Type): The easing curve for fading in.
+            fade_out_delay (int): The fade-out delay in milliseconds.
+            fade_out_duration (int): The fade-out duration in milliseconds, 0 to disable fading out.
+            fade_out_easing_style (QEasingCurve.Type): The easing curve for fading out.
+            owner (Any): Object handed back by advance() once the animation finishes.
+
+        Returns:
+            int: The slot index assigned to the animation.
+        """
+        if not self._free_slots:
+            self._grow(self.capacity * 2)
+
+        slot: int = self._free_slots.pop()
+        path_key, first_row, sample_count = self._register_path(path_positions)
+        self._slot_paths[slot] = path_key
+        self.path_start[slot] = first_row
+        self.path_last[slot] = sample_count - 1
+        self.offset[slot] = (offset.x(), offset.y()) if offset is not None else (0.0, 0.0)
+        self.start_time[slot] = start_time
+        self.duration[slot] = max(1, duration)
+        self.total_duration[slot] = duration if total_duration is None else total_duration
+        self.easing[slot] = easing_style.value
+        self.fade_in_duration[slot] = fade_in_duration
+        self.fade_in_easing[slot] = fade_in_easing_style.value
+        self.fade_out_delay[slot] = fade_out_delay
+        self.fade_out_duration[slot] = fade_out_duration
+        self.fade_out_easing[slot] = fade_out_easing_style.value
+        self.active[slot] = True
+        self.items[slot] = item
+        self.owners[slot] = owner
+        if owner is not None:
+            self._slots_by_owner[id(owner)] = slot
+
+        # Place the item before it is first painted instead of waiting for the next frame
+        slots: np.ndarray = np.asarray([slot])
+        positions, opacities, _ = self.evaluate_slots(slots, start_time)
+        self._apply(slots, positions, opacities)
+        return slot
+
+    def remove(self, slot: int) -> None:
+        """
+        Release a slot so it can be reused.
+
+        Args:
+            slot (int): The slot index to release.
+        """
+        if not self.active[slot]:
+            return
+        self.active[slot] = False
+        self.items[slot] = None
+        if self.owners[slot] is not None:
+            self._slots_by_owner.pop(id(self.owners[slot]), None)
+        self.owners[slot] = None
+        self._release_path(self._slot_paths[slot])
+        self._slot_paths[slot] = None
+        self._free_slots.append(slot)
+
+    def remove_owner(self, owner: Any) -> None:
+        """
+        Release the slot belonging to the given owner, if any.
+
+        Args:
+            owner (Any): The owner object passed to add().
+        """
+        slot: Optional[int] = self._slots_by_owner.get(id(owner))
+        if slot is not None and self.owners[slot] is owner:
+            self.remove(slot)
+
+    def evaluate_slots(self, slots: np.ndarray, now: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute positions and opacities of the given slots at the given time.
+
+        Positions are interpolated between the two samples around the eased progress and extrapolated
+        past the end samples when an easing curve overshoots, exactly like PathAnimation.position_at.
+
+        Args:
+            slots (np.ndarray): Indices of active slots.
+            now (float): The frame clock time in milliseconds.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Their positions (n, 2), their opacities (n,)
+                                                       and a mask of the slots that are finished.
+        """
+        elapsed: np.ndarray = now - self.start_time[slots]
+        progress: np.ndarray = np.clip(elapsed / self.duration[slots], 0.0, 1.0)
+        eased: np.ndarray = self.easing_table.values(self.easing[slots], progress)
+
+        last: np.ndarray = self.path_last[slots]
+        scaled: np.ndarray = eased * last
+        index: np.ndarray = np.clip(np.floor(scaled).astype(np.int64), 0, last - 1)
+        ratio: np.ndarray = (scaled - index)[:, np.newaxis]
+        rows: np.ndarray = self.path_start[slots] + index
+        left: np.ndarray = self.path_table[rows]
+        positions: np.ndarray = left + (self.path_table[rows + 1] - left) * ratio + self.offset[slots]
+
+        opacities: np.ndarray = np.ones(slots.size)
+
+        fade_in_duration: np.ndarray = self.fade_in_duration[slots]
+        fading_in: np.ndarray = fade_in_duration > 0.0
+        if fading_in.any():
+            fade_in_progress = np.clip(elapsed[fading_in] / fade_in_duration[fading_in], 0.0, 1.0)
+            opacities[fading_in] *= self.easing_table.values(self.fade_in_easing[slots][fading_in], fade_in_progress)
+
+        fade_out_duration: np.ndarray = self.fade_out_duration[slots]
+        fading_out: np.ndarray = fade_out_duration > 0.0
+        if fading_out.any():
+            fade_out_progress = np.clip(
+                (elapsed[fading_out] - self.fade_out_delay[slots][fading_out]) / fade_out_duration[fading_out],
+                0.0,
+                1.0
+            )
+            opacities[fading_out] *= 1.0 - self.easing_table.values(
+                self.fade_out_easing[slots][fading_out], fade_out_progress
+            )
+
+        return positions, opacities, elapsed >= self.total_duration[slots]
+
+    def advance(self, now: float) -> List[Any]:
+        """
+        Evaluate the batch, push the results to the graphics items and release finished slots.
+
+        Args:
+            now (float): The frame clock time in milliseconds.
+
+        Returns:
+            List[Any]: The owners of the animations that finished on this frame.
+        """
+        finished_owners: List[Any] = []
+        if not len(self):
+            return finished_owners
+
+        slots: np.ndarray = np.flatnonzero(self.active)
+        positions, opacities, finished = self.evaluate_slots(slots, now)
+        self._apply(slots, positions, opacities)
+
+        for slot in slots[finished].tolist():
+            finished_owners.append(self.owners[slot])
+            self.remove(slot)
+
+        return finished_owners
+
+    def _apply(self, slots: np.ndarray, positions: np.ndarray, opacities: np.ndarray) -> None:
+        """
+        Push evaluated positions and opacities to the graphics items of the given slots.
+
+        Args:
+            slots (np.ndarray): The evaluated slots.
+            positions (np.ndarray): Their positions, shape (n, 2).
+            opacities (np.ndarray): Their opacities, shape (n,).
+        """
+        for slot, (x, y), opacity in zip(slots.tolist(), positions.tolist(), opacities.tolist()):
+            item: Optional[QGraphicsItem] = self.items[slot]
+            try:
+                item.setPos(x, y)
+                item.setOpacity(opacity)
+            except Exception as e:
+                logging.exception("Failed to update batched item in slot %d: %s", slot, e)
+
+    def _register_path(self, path_positions: Sequence[float]) -> Tuple[int, int, int]:
+        """
+        Store the samples of a path in the path table, once per buffer however many slots follow it.
+
+        Args:
+            path_positions (Sequence[float]): Interleaved x and y coordinates of the samples.
+
+        Returns:
+            Tuple[int, int, int]: The key of the path, the row of its first sample and its number of samples.
+        """
+        key: int = id(path_positions)
+        entry: Optional[List[Any]] = self._paths.get(key)
+        if entry is not None and entry[0] is path_positions:
+            entry[2] += 1
+            return key, entry[1], len(path_positions) // 2
+
+        samples: np.ndarray = np.asarray(path_positions, dtype=np.float64).reshape(-1, 2)
+        if len(samples) == 1:
+            samples = np.repeat(samples, 2, axis=0)
+        first_row: int = len(self.path_table)
+        self.path_table = np.concatenate((self.path_table, samples))
+        # Keep the buffer referenced, so its id() is not reused while slots still point at its rows
+        self._paths[key] = [path_positions, first_row, 1]
+        return key, first_row, len(samples)
+
+    def _release_path(self, key: Optional[int]) -> None:
+        """
+        Drop a slot's use of a path, rebuilding the path table once enough released rows piled up.
+
+        Args:
+            key (Optional[int]): The key of the path.
+        """
+        entry: Optional[List[Any]] = self._paths.get(key)
+        if entry is None:
+            return
+        entry[2] -= 1
+        if entry[2] > 0:
+            return
+        del self._paths[key]
+        self._released_rows += max(2, len(entry[0]) // 2)
+        if self._released_rows > max(PATH_TABLE_COMPACT_ROWS, len(self.path_table) // 2):
+            self._compact_paths()
+
+    def _compact_paths(self) -> None:
+        """Rebuild the path table from the paths still in use and move every slot to the new rows."""
+        tables: List[np.ndarray] = []
+        first_row: int = 0
+        new_rows: Dict[int, int] = {}
+        for key, entry in self._paths.items():
+            samples: np.ndarray = self.path_table[entry[1]:entry[1] + max(2, len(entry[0]) // 2)]
+            new_rows[key] = first_row
+            entry[1] = first_row
+            first_row += len(samples)
+            tables.append(samples)
+        self.path_table = np.concatenate(tables) if tables else np.zeros((0, 2))
+        for slot in np.flatnonzero(self.active).tolist():
+            self.path_start[slot] = new_rows[self._slot_paths[slot]]
+        self._released_rows = 0
+
+    def _grow(self, capacity: int) -> None:
+        """
+        Enlarge every array to the given capacity, keeping existing slots intact.
+
+        Args:
+            capacity (int): The new number of slots.
+        """
+        extra: int = capacity - self.capacity
+        if extra <= 0:
+            return
+
+        self.path_start = np.concatenate((self.path_start, np.zeros(extra, dtype=np.int64)))
+        self.path_last = np.concatenate((self.path_last, np.ones(extra, dtype=np.int64)))
+        self.offset = np.concatenate((self.offset, np.zeros((extra, 2))))
+        self.start_time = np.concatenate((self.start_time, np.zeros(extra)))
+        self.duration = np.concatenate((self.duration, np.ones(extra)))
+        self.total_duration = np.concatenate((self.total_duration, np.ones(extra)))
+        self.easing = np.concatenate((self.easing, np.zeros(extra, dtype=np.int16)))
+        self.fade_in_duration = np.concatenate((self.fade_in_duration, np.zeros(extra)))
+        self.fade_in_easing = np.concatenate((self.fade_in_easing, np.zeros(extra, dtype=np.int16)))
+        self.fade_out_delay = np.concatenate((self.fade_out_delay, np.zeros(extra)))
+        self.fade_out_duration = np.concatenate((self.fade_out_duration, np.zeros(extra)))
+        self.fade_out_easing = np.concatenate((self.fade_out_easing, np.zeros(extra, dtype=np.int16)))
+        self.active = np.concatenate((self.active, np.zeros(extra, dtype=bool)))
+        self.items.extend([None] * extra)
+        self.owners.extend([None] * extra)
+        self._slot_paths.extend([None] * extra)
+        # Hand out low slots first so the active region stays compact
+        self._free_slots.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
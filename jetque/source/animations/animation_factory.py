@@ -1,34 +1,56 @@
 # src/animations/animation_factory.py
 
 import logging
-from typing import Any, Dict, Optional, List
-
-from PyQt6.QtCore import QEasingCurve, QPointF, QUrl, QObject, Qt
-from PyQt6.QtGui import QPixmap, QFontDatabase, QFont, QPen, QColor
-from PyQt6.QtMultimedia import QSoundEffect
-from PyQt6.QtWidgets import QWidget
-
+import re
+import time
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import QEasingCurve, QPointF, QObject, Qt, pyqtSignal
+from PyQt6.QtGui import QPixmap, QFontDatabase, QFont, QPen, QColor, QGuiApplication
+from PyQt6.QtWidgets import QGraphicsObject, QWidget
+
+from config import config_names
+from config.config_schema import AnimationConfig, FontConfig
+from jetque.source.animations.anchor_position_table import AnchorPositionTable
 from jetque.source.animations.animation import Animation
 from jetque.source.animations.animation_font import AnimationFont
-from jetque.source.animations.animation_point_f import AnimationPointF
-from jetque.source.animations.animation_text import AnimationText
+from jetque.source.animations.animation_path import AnimationPath, PathCache
+from jetque.source.animations.animation_style import AnimationStyle
+from jetque.source.animations.animation_sprite import AnimationSprite
 from jetque.source.animations.dynamics.directional_animation import DirectionalAnimation
 from jetque.source.animations.dynamics.parabola_animation import ParabolaAnimation
 from jetque.source.animations.dynamics.swivel_animation import SwivelAnimation
 from jetque.source.animations.statics.stationary_animation import StationaryAnimation
 from jetque.source.animations.statics.pow_animation import PowAnimation
+from jetque.source.gui.items.jq_graphics_static_text_item import JQGraphicsStaticTextItem
+from jetque.source.managers.font_cache import FontCache
+from jetque.source.managers.glyph_atlas import GlyphAtlas
+from jetque.source.managers.icon_cache import IconCache
+from jetque.source.managers.sound_bank import SoundBank
+from jetque.source.managers.sprite_cache import Sprite, SpriteCache
 
 # Constants
-DEFAULT_FRAMERATE: int = 60
-TEMPORARY_WIDGET_WIDTH: float = 500.0  # Temporary width until specific overlays are passed
-TEMPORARY_WIDGET_HEIGHT: float = 600.0  # Temporary height until specific overlays are passed
+DEFAULT_FRAMERATE: int = 60  # Fallback when the refresh rate of the display is unknown
+TEMPORARY_WIDGET_WIDTH: float = 500.0  # Fallback width while no overlay position table is set
+TEMPORARY_WIDGET_HEIGHT: float = 600.0  # Fallback height while no overlay position table is set
+RICH_TEXT_PATTERN: re.Pattern = re.compile(r"<[A-Za-z!/][^>]*>|&#?\w+;")  # Tags or entities of rich text messages
 
 
 class AnimationFactory(QObject):
     """
     Factory class responsible for creating Animation instances based on configuration.
+
+    Attributes:
+        batchBuilt (pyqtSignal): Emitted after build_animations with the style name, the number of
+                                 animations built and the build time of the batch in milliseconds.
+        last_batch_build_time (float): Build time of the latest batch in milliseconds.
+        position_table (Optional[AnchorPositionTable]): Positions of the overlay the styles are compiled for,
+                                                        ANIMATION_POSITION_MAP is used while it is None.
     """
 
+    batchBuilt = pyqtSignal(str, int, float)
+
     ANIMATION_POSITION_MAP: Dict[str, QPointF] = {
         "Top-Left": QPointF(0.0, 0.0),
         "Top-Center": QPointF(TEMPORARY_WIDGET_WIDTH / 2.0, 0.0),
@@ -41,346 +63,349 @@ class AnimationFactory(QObject):
         "Bottom-Right": QPointF(TEMPORARY_WIDGET_WIDTH, TEMPORARY_WIDGET_HEIGHT)
     }
 
-    ANIMATION_EASING_MAP: Dict[str, QEasingCurve.Type] = {
-        "Linear": QEasingCurve.Type.Linear,
-        "In-Quadratic": QEasingCurve.Type.InQuad,
-        "Out-Quadratic": QEasingCurve.Type.OutQuad,
-        "In-Out-Quadratic": QEasingCurve.Type.InOutQuad,
-        "Out-In-Quadratic": QEasingCurve.Type.OutInQuad,
-        "In-Cubic": QEasingCurve.Type.InCubic,
-        "Out-Cubic": QEasingCurve.Type.OutCubic,
-        "In-Out-Cubic": QEasingCurve.Type.InOutCubic,
-        "Out-In-Cubic": QEasingCurve.Type.OutInCubic,
-        "In-Quartic": QEasingCurve.Type.InQuart,
-        "Out-Quartic": QEasingCurve.Type.OutQuart,
-        "In-Out-Quartic": QEasingCurve.Type.InOutQuart,
-        "Out-In-Quartic": QEasingCurve.Type.OutInQuart,
-        "In-Quintic": QEasingCurve.Type.InQuint,
-        "Out-Quintic": QEasingCurve.Type.OutQuint,
-        "In-Out-Quintic": QEasingCurve.Type.InOutQuint,
-        "Out-In-Quint": QEasingCurve.Type.OutInQuint,
-        "In-Sinusoidal": QEasingCurve.Type.InSine,
-        "Out-Sinusoidal": QEasingCurve.Type.OutSine,
-        "In-Out-Sinusoidal": QEasingCurve.Type.InOutSine,
-        "Out-In-Sinusoidal": QEasingCurve.Type.OutInSine,
-        "In-Exponential": QEasingCurve.Type.InExpo,
-        "Out-Exponential": QEasingCurve.Type.OutExpo,
-        "In-Out-Exponential": QEasingCurve.Type.InOutExpo,
-        "Out-In-Exponential": QEasingCurve.Type.OutInExpo,
-        "In-Circular": QEasingCurve.Type.InCirc,
-        "Out-Circular": QEasingCurve.Type.OutCirc,
-        "In-Out-Circular": QEasingCurve.Type.InOutCirc,
-        "Out-In-Circular": QEasingCurve.Type.OutInCirc,
-        "In-Elastic": QEasingCurve.Type.InElastic,
-        "Out-Elastic": QEasingCurve.Type.OutElastic,
-        "In-Out-Elastic": QEasingCurve.Type.InOutElastic,
-        "Out-In-Elastic": QEasingCurve.Type.OutInElastic,
-        "In-Back": QEasingCurve.Type.InBack,
-        "Out-Back": QEasingCurve.Type.OutBack,
-        "In-Out-Back": QEasingCurve.Type.InOutBack,
-        "Out-In-Back": QEasingCurve.Type.OutInBack,
-        "In-Bounce": QEasingCurve.Type.InBounce,
-        "Out-Bounce": QEasingCurve.Type.OutBounce,
-        "In-Out-Bounce": QEasingCurve.Type.InOutBounce,
-        "Out-In-Bounce": QEasingCurve.Type.OutInBounce
-    }
+    ANIMATION_EASING_MAP: Dict[str, QEasingCurve.Type] = config_names.ANIMATION_EASING_MAP
+    ANIMATION_JIGGLE_MAP: Dict[str, int] = config_names.ANIMATION_JIGGLE_MAP
+    FONT_CAPITALIZATION_MAP: Dict[str, QFont.Capitalization] = config_names.FONT_CAPITALIZATION_MAP
+    FONT_STRETCH_MAP: Dict[str, QFont.Stretch] = config_names.FONT_STRETCH_MAP
+    FONT_WEIGHT_MAP: Dict[str, QFont.Weight] = config_names.FONT_WEIGHT_MAP
+    PEN_STYLE_MAP: Dict[str, Qt.PenStyle] = config_names.PEN_STYLE_MAP
+    PEN_CAP_STYLE_MAP: Dict[str, Qt.PenCapStyle] = config_names.PEN_CAP_STYLE_MAP
+    PEN_JOIN_STYLE_MAP: Dict[str, Qt.PenJoinStyle] = config_names.PEN_JOIN_STYLE_MAP
 
-    ANIMATION_JIGGLE_MAP: Dict[str, int] = {
-        "Low": 75,
-        "Medium": 50,
-        "High": 25
-    }
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.font_cache: FontCache = FontCache.shared()
+        self.sound_bank: SoundBank = SoundBank(parent=self)
+        self.icon_cache: IconCache = IconCache.shared()
+        self.sprite_cache: SpriteCache = SpriteCache.shared()
+        self.path_cache: PathCache = PathCache()
+        self.last_batch_build_time: float = 0.0
+        self.position_table: Optional[AnchorPositionTable] = None
+
+    def compile_style(self, config: AnimationConfig) -> Optional[AnimationStyle]:
+        """
+        Compiles a validated animation configuration into an immutable AnimationStyle.
 
-    FONT_CAPITALIZATION_MAP: Dict[str, QFont.Capitalization] = {
-        "Normal": QFont.Capitalization.MixedCase,
-        "All-Lowercase": QFont.Capitalization.AllLowercase,
-        "All-Uppercase": QFont.Capitalization.AllUppercase,
-        "Capitalize-Words": QFont.Capitalization.Capitalize,
-        "Small-Caps": QFont.Capitalization.SmallCaps
-    }
+        Every font, pen, color and derived duration or position is resolved here once,
+        so build_animation only does per-message work.
 
-    FONT_STRETCH_MAP: Dict[str, QFont.Stretch] = {
-        "Unstretched": QFont.Stretch.Unstreched,
-        "Any-Stretch": QFont.Stretch.AnyStretch,
-        "Ultra-Condensed": QFont.Stretch.UltraCondensed,
-        "Extra-Condensed": QFont.Stretch.ExtraCondensed,
-        "Condensed": QFont.Stretch.Condensed,
-        "Semi-Condensed": QFont.Stretch.SemiCondensed,
-        "Semi-Expanded": QFont.Stretch.SemiExpanded,
-        "Expanded": QFont.Stretch.Expanded,
-        "Extra-Expanded": QFont.Stretch.ExtraExpanded,
-        "Ultra-Expanded": QFont.Stretch.UltraExpanded
-    }
+        Args:
+            config (AnimationConfig): The validated configuration of the animation style.
 
-    FONT_WEIGHT_MAP: Dict[str, QFont.Weight] = {
-        "Normal": QFont.Weight.Normal,
-        "Thin": QFont.Weight.Thin,
-        "Extra-Light": QFont.Weight.ExtraLight,
-        "Light": QFont.Weight.Light,
-        "Medium": QFont.Weight.Medium,
-        "Demi-Bold": QFont.Weight.DemiBold,
-        "Bold": QFont.Weight.Bold,
-        "Extra-Bold": QFont.Weight.ExtraBold,
-        "Black": QFont.Weight.Black
-    }
+        Returns:
+            Optional[AnimationStyle]: The compiled style or None if compilation failed.
+        """
+        try:
+            duration: int = config.duration
+            positions: Optional[Dict[str, Any]] = self._get_style_positions(config)
+            if positions is None:
+                return None
+            fade_in_duration: int = self._get_phase_duration(duration, config.fade_in_percentage)
+            fade_out_duration: int = self._get_phase_duration(duration, config.fade_out_percentage)
+
+            font_config: FontConfig = config.font
+            font: AnimationFont = self.font_cache.font(
+                font_type=font_config.font_type,
+                font_size=font_config.font_size,
+                font_weight=font_config.font_weight,
+                font_capitalization=font_config.font_capitalization,
+                font_stretch=font_config.font_stretch,
+                font_letter_spacing=font_config.font_letter_spacing,
+                font_word_spacing=font_config.font_word_spacing,
+                font_italic=font_config.font_italic,
+                font_kerning=font_config.font_kerning,
+                font_overline=font_config.font_overline,
+                font_strikethrough=font_config.font_strikethrough,
+                font_underline=font_config.font_underline
+            )
 
-    PEN_STYLE_MAP: Dict[str, Qt.PenStyle] = {
-        "Solid": Qt.PenStyle.SolidLine,
-        "Dash": Qt.PenStyle.DashLine,
-        "Dot": Qt.PenStyle.DotLine,
-        "Dash-Dot": Qt.PenStyle.DashDotLine,
-        "Dash-Dot-Dot": Qt.PenStyle.DashDotDotLine
-    }
+            outline_pen: QPen = QPen(
+                QColor(config.outline_color),
+                config.outline_thickness * 2,
+                config.outline_pen_style,
+                config.outline_pen_cap_style,
+                config.outline_pen_join_style
+            )
 
-    PEN_CAP_STYLE_MAP: Dict[str, Qt.PenCapStyle] = {
-        "Square": Qt.PenCapStyle.SquareCap,
-        "Flat": Qt.PenCapStyle.FlatCap,
-        "Round": Qt.PenCapStyle.RoundCap
-    }
+            style: AnimationStyle = AnimationStyle(
+                name=config.name,
+                animation_type=config.animation_type,
+                parent_type=self._get_animation_type_parent(config.animation_type),
+                sound=self.sound_bank.cue(config.sound),
+                duration=duration,
+                **positions,
+                easing_style=config.easing_style,
+                fade_in=config.fade_in,
+                fade_out=config.fade_out,
+                fade_in_duration=fade_in_duration,
+                fade_out_duration=fade_out_duration,
+                fade_out_delay=self._get_fade_out_delay(duration, fade_out_duration),
+                fade_in_easing_style=config.fade_in_easing_style,
+                fade_out_easing_style=config.fade_out_easing_style,
+                font=font,
+                font_metrics=self.font_cache.metrics(font),
+                text_color=QColor(config.text_color),
+                outline=config.outline,
+                outline_pen=outline_pen,
+                drop_shadow=config.drop_shadow,
+                drop_shadow_offset=QPointF(*config.drop_shadow_offset),
+                drop_shadow_blur_radius=config.drop_shadow_blur_radius,
+                drop_shadow_color=QColor(config.drop_shadow_color),
+                jiggle=config.jiggle,
+                jiggle_intensity=config.jiggle_intensity,
+                scale_percentage=config.scale_percentage,
+                scale_easing_style=config.scale_easing_style,
+                phase_1_duration=self._get_phase_duration(duration, config.phase_1_percentage),
+                phase_2_duration=self._get_phase_duration(duration, config.phase_2_percentage),
+                glyph_atlas=GlyphAtlas(
+                    font=font,
+                    color=QColor(config.text_color),
+                    outline_pen=outline_pen if config.outline else None,
+                    drop_shadow_offset=QPointF(*config.drop_shadow_offset) if config.drop_shadow else None,
+                    drop_shadow_blur_radius=config.drop_shadow_blur_radius,
+                    drop_shadow_color=QColor(config.drop_shadow_color),
+                    device_pixel_ratio=self._get_device_pixel_ratio(),
+                    font_metrics=self.font_cache.metrics(font)
+                )
+            )
 
-    PEN_JOIN_STYLE_MAP: Dict[str, Qt.PenJoinStyle] = {
-        "Bevel": Qt.PenJoinStyle.BevelJoin,
-        "Miter": Qt.PenJoinStyle.MiterJoin,
-        "Round": Qt.PenJoinStyle.RoundJoin
-    }
+            logging.debug("Compiled animation style: %s", style.name)
+            return style
 
-    def __init__(self, parent=None) -> None:
-        super().__init__(parent)
-        # noinspection PyArgumentList
-        self.font_database: QFontDatabase = QFontDatabase()
+        except Exception as e:
+            logging.exception("Error in compile_style: %s", e)
+            return None
 
-    def build_animation(self, config: Dict[str, Any], message: str = "Unassigned Message") -> Optional[Animation]:
+    def reposition_style(self, style: AnimationStyle, config: AnimationConfig) -> AnimationStyle:
         """
-        Builds an Animation instance based on the provided configuration.
+        Resolves the positions and path of a compiled style again, e.g. after an anchor it starts or ends at moved.
+        Fonts, pens, sounds and glyph atlases do not depend on positions and are kept.
 
         Args:
-            config (Dict[str, Any]): Configuration dictionary for the animation.
+            style (AnimationStyle): The compiled style.
+            config (AnimationConfig): The validated configuration the style was compiled from.
 
         Returns:
-            Optional[Animation]: The created Animation instance or None if creation failed.
-            :param config:
-            :param message:
+            AnimationStyle: The style itself if its positions did not change, otherwise a repositioned copy.
         """
         try:
-            parent = self.parent()
-            animation_type: str = config.get("type")
-            sound: QSoundEffect = self._get_sound_effect(config.get("sound"))
-            duration: int = int(config.get("duration") * 1000)
-            starting_position: QPointF = self.ANIMATION_POSITION_MAP.get(config.get("starting_position"))
-            fade_in: bool = config.get("fade_in", False)
-            fade_out: bool = config.get("fade_out", False)
-            fade_in_percentage: float = config.get("fade_in_percentage")
-            fade_in_duration: int = self._get_phase_duration(duration, fade_in_percentage)
-            fade_out_percentage: float = config.get("fade_out_percentage")
-            fade_out_duration: int = self._get_phase_duration(duration, fade_out_percentage)
-            fade_out_delay: int = self._get_fade_out_delay(duration, fade_out_duration)
-            fade_in_easing_style: QEasingCurve.Type = (
-                self.ANIMATION_EASING_MAP.get(config.get("fade_in_easing_style"))
-            )
-            fade_out_easing_style: QEasingCurve.Type = (
-                self.ANIMATION_EASING_MAP.get(config.get("fade_out_easing_style"))
-            )
+            starting_position: Optional[QPointF] = self._get_position(config.starting_position)
+            ending_position: Optional[QPointF] = self._get_position(config.ending_position)
+            if starting_position == style.starting_position and ending_position == style.ending_position:
+                return style
+            positions: Optional[Dict[str, Any]] = self._get_style_positions(config)
+            if positions is None:
+                return style
+            return replace(style, **positions)
+        except Exception as e:
+            logging.exception("Error in reposition_style: %s", e)
+            return style
 
-            animation_font: AnimationFont = AnimationFont(
-                font_type=config.get("font_type"),
-                font_size=config.get("font_size"),
-                font_weight=self.FONT_WEIGHT_MAP.get(config.get("font_weight")),
-                font_capitalization=self.FONT_CAPITALIZATION_MAP.get(config.get("font_capitalization")),
-                font_stretch=self.FONT_STRETCH_MAP.get(config.get("font_stretch")),
-                font_letter_spacing=config.get("font_letter_spacing"),
-                font_word_spacing=config.get("font_word_spacing"),
-                font_italic=config.get("font_italic"),
-                font_kerning=config.get("font_kerning"),
-                font_overline=config.get("font_overline"),
-                font_strikethrough=config.get("font_strikethrough"),
-                font_underline=config.get("font_underline")
-            )
+    def reposition_styles(
+            self,
+            styles: Dict[str, AnimationStyle],
+            configs: Dict[str, AnimationConfig]
+    ) -> Dict[str, AnimationStyle]:
+        """
+        Resolves the positions and paths of compiled styles again, repositioning only those whose positions changed.
 
-            animation_outline_pen: QPen = QPen(
-                QColor(config.get("outline_color")),
-                int(config.get("outline_thickness")) * 2,
-                self.PEN_STYLE_MAP.get(config.get("outline_pen_style")),
-                self.PEN_CAP_STYLE_MAP.get(config.get("outline_pen_cap_style")),
-                self.PEN_JOIN_STYLE_MAP.get(config.get("outline_pen_join_style"))
-            )
+        Args:
+            styles (Dict[str, AnimationStyle]): The compiled styles keyed by style name.
+            configs (Dict[str, AnimationConfig]): The validated configurations the styles were compiled from.
 
-            animation_text: AnimationText = AnimationText(
-                text_font=animation_font,
-                text_message=message,
-                text_color=config.get("text_color"),
-                outline=config.get("outline"),
-                outline_pen=animation_outline_pen,
-                drop_shadow=config.get("drop_shadow"),
-                drop_shadow_offset=config.get("drop_shadow_offset"),
-                drop_shadow_blur_radius=config.get("drop_shadow_blur_radius"),
-                drop_shadow_color=config.get("drop_shadow_color"),
-                parent=self.parent()
-            )
+        Returns:
+            Dict[str, AnimationStyle]: The styles, repositioned where needed, keyed by style name.
+        """
+        return {
+            name: self.reposition_style(style, configs[name]) if name in configs else style
+            for name, style in styles.items()
+        }
 
-            logging.debug("Building animation of type: %s", animation_type)
-
-            parent_type: str = self._get_animation_type_parent(animation_type)
-            if parent_type == "Dynamic":
-                return self._build_dynamic_animation(config,
-                                                     animation_type,
-                                                     sound,
-                                                     duration,
-                                                     starting_position,
-                                                     fade_in,
-                                                     fade_out,
-                                                     fade_in_duration,
-                                                     fade_out_duration,
-                                                     fade_out_delay,
-                                                     fade_in_easing_style,
-                                                     fade_out_easing_style,
-                                                     animation_text,
-                                                     parent)
-            elif parent_type == "Static":
-                return self._build_static_animation(config,
-                                                    animation_type,
-                                                    sound,
-                                                    duration,
-                                                    starting_position,
-                                                    fade_in, fade_out,
-                                                    fade_in_duration,
-                                                    fade_out_duration,
-                                                    fade_out_delay,
-                                                    fade_in_easing_style,
-                                                    fade_out_easing_style,
-                                                    animation_text,
-                                                    parent)
+    def compile_styles(self, configs: Dict[str, AnimationConfig]) -> Dict[str, AnimationStyle]:
+        """
+        Compiles a set of named animation configurations, skipping the ones that fail to compile.
+
+        Args:
+            configs (Dict[str, AnimationConfig]): Validated animation configurations keyed by style name.
+
+        Returns:
+            Dict[str, AnimationStyle]: The compiled styles keyed by style name.
+        """
+        styles: Dict[str, AnimationStyle] = {}
+        for name, config in configs.items():
+            style: Optional[AnimationStyle] = self.compile_style(config)
+            if style is not None:
+                styles[name] = style
             else:
-                logging.error("Unknown animation type: %s", animation_type)
-                return None
+                logging.error("Skipping animation style that failed to compile: %s", name)
+        return styles
+
+    def build_animation(
+            self,
+            style: AnimationStyle,
+            message: str = "Unassigned Message",
+            position: Optional[QPointF] = None
+    ) -> Optional[Animation]:
+        """
+        Builds an Animation instance displaying a message in a compiled style.
+
+        Args:
+            style (AnimationStyle): The compiled style of the animation.
+            message (str): The message the animation displays.
+            position (Optional[QPointF]): Starting position overriding the style's, the whole trajectory moves with it.
 
+        Returns:
+            Optional[Animation]: The created Animation instance or None if creation failed.
+        """
+        try:
+            logging.debug("Building animation of type: %s", style.animation_type)
+            animation: Optional[Animation] = self._build_animation(
+                style, message, position, self.parent(), self._get_path_positions(style)
+            )
+            logging.debug("Animation built successfully: %s", animation)
+            return animation
         except Exception as e:
             logging.exception("Error in build_animation: %s", e)
             return None
 
+    def build_animations(
+            self,
+            style: AnimationStyle,
+            messages: Sequence[str],
+            positions: Optional[Sequence[Optional[QPointF]]] = None
+    ) -> List[Animation]:
+        """
+        Builds one Animation per message of a burst in the same compiled style.
+
+        The parent, the sampled path and the per-build logging are resolved once for the whole batch,
+        so a burst costs less per animation than the same number of build_animation calls.
+        The build time of the batch is stored in last_batch_build_time and reported through batchBuilt.
+
+        Args:
+            style (AnimationStyle): The compiled style of the animations.
+            messages (Sequence[str]): The message of every animation.
+            positions (Optional[Sequence[Optional[QPointF]]]): Starting position of every animation, None (or
+                                                                a None entry) to keep the style's.
+
+        Returns:
+            List[Animation]: The animations that were built, in message order.
+        """
+        animations: List[Animation] = []
+        batch_start: float = time.perf_counter()
+        try:
+            parent = self.parent()
+            path_positions: Optional[Sequence[float]] = self._get_path_positions(style)
+
+            for index, message in enumerate(messages):
+                position: Optional[QPointF] = positions[index] if positions and index < len(positions) else None
+                animation: Optional[Animation] = self._build_animation(style, message, position, parent, path_positions)
+                if animation is not None:
+                    animations.append(animation)
+
+            self.last_batch_build_time = (time.perf_counter() - batch_start) * 1000.0
+            self.batchBuilt.emit(style.name, len(animations), self.last_batch_build_time)
+            logging.debug(
+                "Built %d of %d %s animations in %.2f ms.",
+                len(animations), len(messages), style.name, self.last_batch_build_time
+            )
+        except Exception as e:
+            logging.exception("Error in build_animations: %s", e)
+        return animations
+
+    def _build_animation(
+            self,
+            style: AnimationStyle,
+            message: str,
+            position: Optional[QPointF],
+            parent,
+            path_positions: Optional[Sequence[float]]
+    ) -> Optional[Animation]:
+        """
+        Builds the text item and animation of one message from arguments resolved by the caller.
+
+        Args:
+            style (AnimationStyle): The compiled style of the animation.
+            message (str): The message the animation displays.
+            position (Optional[QPointF]): Starting position overriding the style's, or None.
+            parent: The parent object.
+            path_positions (Optional[Sequence[float]]): The sampled path of the style, or None for straight paths.
+
+        Returns:
+            Optional[Animation]: The created Animation instance or None if creation failed.
+        """
+        sprite: Optional[Sprite] = (
+            style.glyph_atlas.compose(message, self.sprite_cache) if style.glyph_atlas is not None else None
+        )
+        text_item: QGraphicsObject
+        if sprite is not None:
+            text_item = AnimationSprite(sprite=sprite, parent=parent)
+        elif self._is_plain_text(message):
+            text_item = self._get_static_text_item(style, message, parent)
+        else:
+            text_item = AnimationSprite(sprite=self._get_text_sprite(style, message), parent=parent)
+        offset: QPointF = position - style.starting_position if position is not None else QPointF()
+
+        if style.parent_type == "Dynamic":
+            return self._build_dynamic_animation(style, text_item, offset, path_positions, parent)
+        elif style.parent_type == "Static":
+            return self._build_static_animation(style, text_item, offset, parent)
+        else:
+            logging.error("Unknown animation type: %s", style.animation_type)
+            return None
+
     def _build_dynamic_animation(
             self,
-            config: Dict[str, Any],
-            animation_type: str,
-            sound: QSoundEffect,
-            duration: int,
-            starting_position: QPointF,
-            fade_in: bool,
-            fade_out: bool,
-            fade_in_duration: int,
-            fade_out_duration: int,
-            fade_out_delay: int,
-            fade_in_easing_style: QEasingCurve.Type,
-            fade_out_easing_style: QEasingCurve.Type,
-            text_item: AnimationText,
+            style: AnimationStyle,
+            text_item: QGraphicsObject,
+            offset: QPointF,
+            path_positions: Optional[Sequence[float]],
             parent=None
     ) -> Optional[Animation]:
         """
         Builds a dynamic type Animation instance.
 
         Args:
-            config (Dict[str, Any]): Configuration dictionary for the animation.
-            animation_type (str): The type of animation.
-            sound (str): Sound associated with the animation.
-            duration (int): Duration of the animation.
-            starting_position (QPointF): Starting position of the animation.
-            fade_in (bool): Whether to fade in.
-            fade_out (bool): Whether to fade out.
-            fade_in_duration (int): Fade in duration.
-            fade_out_duration (int): Fade out duration.
-            fade_out_delay (int): Fade out delay.
-            fade_in_easing_style (QEasingCurve.Type): Easing style for fade in.
-            fade_out_easing_style (QEasingCurve.Type): Easing style for fade out.
-            text_item (AnimationObject): Label associated with the animation.
+            style (AnimationStyle): The compiled style of the animation.
+            text_item (QGraphicsObject): Label associated with the animation.
+            offset (QPointF): Translation of the whole trajectory from the style's positions.
+            path_positions (Optional[Sequence[float]]): The sampled path of the style, or None for straight paths.
+            parent: The parent object.
 
         Returns:
             Optional[Animation]: The created dynamic Animation instance or None.
         """
         try:
-            ending_position: QPointF = self.ANIMATION_POSITION_MAP.get(
-                config.get("ending_position", "Top-Left")
-            )
-            easing_style: QEasingCurve.Type = self.ANIMATION_EASING_MAP.get(
-                config.get("easing_style", "Linear"),
-                QEasingCurve.Type.Linear
-            )
+            common: Dict[str, Any] = self._get_common_arguments(style, text_item, offset, parent)
 
-            if animation_type == "Directional":
+            if style.animation_type == "Directional":
                 animation = DirectionalAnimation(
-                    animation_type=animation_type,
-                    sound=sound,
-                    duration=duration,
-                    starting_position=starting_position,
-                    fade_in=fade_in,
-                    fade_out=fade_out,
-                    fade_in_duration=fade_in_duration,
-                    fade_out_duration=fade_out_duration,
-                    fade_out_delay=fade_out_delay,
-                    fade_in_easing_style=fade_in_easing_style,
-                    fade_out_easing_style=fade_out_easing_style,
-                    animation_object=text_item,
-                    ending_position=ending_position,
-                    easing_style=easing_style,
-                    parent=parent
-                )
-            elif animation_type == "Parabola":
-                vertex_position: QPointF = self._get_vertex_position(starting_position, ending_position)
-                parabola_points: List[AnimationPointF] = self._generate_parabola_data(
-                    starting_position,
-                    vertex_position,
-                    ending_position,
-                    self._get_total_parabola_points(duration, DEFAULT_FRAMERATE)
+                    **common,
+                    ending_position=style.ending_position + offset,
+                    easing_style=style.easing_style,
+                    path_positions=path_positions
                 )
+            elif style.animation_type == "Parabola":
                 animation = ParabolaAnimation(
-                    animation_type=animation_type,
-                    sound=sound,
-                    duration=duration,
-                    starting_position=starting_position,
-                    fade_in=fade_in,
-                    fade_out=fade_out,
-                    fade_in_duration=fade_in_duration,
-                    fade_out_duration=fade_out_duration,
-                    fade_out_delay=fade_out_delay,
-                    fade_in_easing_style=fade_in_easing_style,
-                    fade_out_easing_style=fade_out_easing_style,
-                    animation_object=text_item,
-                    ending_position=ending_position,
-                    easing_style=easing_style,
-                    parabola_points=parabola_points,
-                    parent=parent
-                )
-            elif animation_type == "Swivel":
-                phase_1_percentage: float = config.get("phase_1_percentage", 0.50)
-                phase_2_percentage: float = config.get("phase_2_percentage", 0.50)
-                swivel_position: QPointF = self._get_swivel_position(
-                    starting_position,
-                    ending_position,
-                    phase_1_percentage
+                    **common,
+                    ending_position=style.ending_position + offset,
+                    easing_style=style.easing_style,
+                    parabola_points=None,
+                    parabola_positions=path_positions
                 )
+            elif style.animation_type == "Swivel":
                 animation = SwivelAnimation(
-                    animation_type=animation_type,
-                    sound=sound,
-                    duration=duration,
-                    starting_position=starting_position,
-                    fade_in=fade_in,
-                    fade_out=fade_out,
-                    fade_in_duration=fade_in_duration,
-                    fade_out_duration=fade_out_duration,
-                    fade_out_delay=fade_out_delay,
-                    fade_in_easing_style=fade_in_easing_style,
-                    fade_out_easing_style=fade_out_easing_style,
-                    animation_object=text_item,
-                    ending_position=ending_position,
-                    easing_style=easing_style,
-                    phase_1_duration=self._get_phase_duration(duration, phase_1_percentage),
-                    phase_2_duration=self._get_phase_duration(duration, phase_2_percentage),
-                    swivel_position=swivel_position,
-                    parent=parent
+                    **common,
+                    ending_position=style.ending_position + offset,
+                    easing_style=style.easing_style,
+                    phase_1_duration=style.phase_1_duration,
+                    phase_2_duration=style.phase_2_duration,
+                    swivel_position=style.swivel_position + offset,
+                    swivel_positions=path_positions
                 )
             else:
-                logging.error("Unknown dynamic animation subtype: %s", animation_type)
+                logging.error("Unknown dynamic animation subtype: %s", style.animation_type)
                 return None
 
-            logging.debug("Animation built successfully: %s", animation)
             return animation
 
         except Exception as e:
@@ -389,104 +414,279 @@ class AnimationFactory(QObject):
 
     def _build_static_animation(
             self,
-            config: Dict[str, Any],
-            animation_type: str,
-            sound: QSoundEffect,
-            duration: int,
-            starting_position: QPointF,
-            fade_in: bool,
-            fade_out: bool,
-            fade_in_duration: int,
-            fade_out_duration: int,
-            fade_out_delay: int,
-            fade_in_easing_style: QEasingCurve.Type,
-            fade_out_easing_style: QEasingCurve.Type,
-            text_item: AnimationText,
+            style: AnimationStyle,
+            text_item: QGraphicsObject,
+            offset: QPointF,
             parent=None
     ) -> Optional[Animation]:
         """
         Builds a static type Animation instance.
 
         Args:
-            config (Dict[str, Any]): Configuration dictionary for the animation.
-            animation_type (str): The type of animation.
-            sound (str): Sound associated with the animation.
-            duration (int): Duration of the animation.
-            starting_position (QPointF): Starting position of the animation.
-            fade_in (bool): Whether to fade in.
-            fade_out (bool): Whether to fade out.
-            fade_in_duration (int): Fade in duration.
-            fade_out_duration (int): Fade out duration.
-            fade_out_delay (int): Fade out delay.
-            fade_in_easing_style (QEasingCurve.Type): Easing style for fade in.
-            fade_out_easing_style (QEasingCurve.Type): Easing style for fade out.
-            text_item (AnimationObject): Label associated with the animation.
+            style (AnimationStyle): The compiled style of the animation.
+            text_item (QGraphicsObject): Label associated with the animation.
+            offset (QPointF): Translation from the style's starting position.
+            parent: The parent object.
 
         Returns:
             Optional[Animation]: The created static Animation instance or None.
         """
         try:
-            jiggle: bool = config.get("jiggle", False)
-            jiggle_intensity: int = self.ANIMATION_JIGGLE_MAP.get(config.get("jiggle_intensity", "Medium"), 50)
+            common: Dict[str, Any] = self._get_common_arguments(style, text_item, offset, parent)
 
-            if animation_type == "Stationary":
+            if style.animation_type == "Stationary":
                 animation = StationaryAnimation(
-                    animation_type=animation_type,
-                    sound=sound,
-                    duration=duration,
-                    starting_position=starting_position,
-                    fade_in=fade_in,
-                    fade_out=fade_out,
-                    fade_in_duration=fade_in_duration,
-                    fade_out_duration=fade_out_duration,
-                    fade_out_delay=fade_out_delay,
-                    fade_in_easing_style=fade_in_easing_style,
-                    fade_out_easing_style=fade_out_easing_style,
-                    animation_object=text_item,
-                    jiggle=jiggle,
-                    jiggle_intensity=jiggle_intensity,
-                    parent=parent
-                )
-            elif animation_type == "Pow":
-                scale_percentage: float = config.get("scale_percentage", 1.70)
-                phase_1_percentage: float = config.get("phase_1_percentage", 0.50)
-                phase_2_percentage: float = config.get("phase_2_percentage", 0.50)
-                scale_easing_style: QEasingCurve.Type = self.ANIMATION_EASING_MAP.get(
-                    config.get("scale_easing_style", "Linear"),
-                    QEasingCurve.Type.Linear
+                    **common,
+                    jiggle=style.jiggle,
+                    jiggle_intensity=style.jiggle_intensity
                 )
+            elif style.animation_type == "Pow":
                 animation = PowAnimation(
-                    animation_type=animation_type,
-                    sound=sound,
-                    duration=duration,
-                    starting_position=starting_position,
-                    fade_in=fade_in,
-                    fade_out=fade_out,
-                    fade_in_duration=fade_in_duration,
-                    fade_out_duration=fade_out_duration,
-                    fade_out_delay=fade_out_delay,
-                    fade_in_easing_style=fade_in_easing_style,
-                    fade_out_easing_style=fade_out_easing_style,
-                    animation_object=text_item,
-                    jiggle=jiggle,
-                    jiggle_intensity=jiggle_intensity,
-                    scale_percentage=scale_percentage,
-                    phase_1_duration=self._get_phase_duration(duration, phase_1_percentage),
-                    phase_2_duration=self._get_phase_duration(duration, phase_2_percentage),
-                    scale_easing_style=scale_easing_style,
-                    parent=parent
+                    **common,
+                    jiggle=style.jiggle,
+                    jiggle_intensity=style.jiggle_intensity,
+                    scale_percentage=style.scale_percentage,
+                    phase_1_duration=style.phase_1_duration,
+                    phase_2_duration=style.phase_2_duration,
+                    scale_easing_style=style.scale_easing_style
                 )
             else:
-                logging.error("Unknown static animation subtype: %s", animation_type)
+                logging.error("Unknown static animation subtype: %s", style.animation_type)
                 return None
 
-            logging.debug("Animation built successfully: %s", animation)
             return animation
 
         except Exception as e:
             logging.exception("Error building static animation: %s", e)
             return None
 
+    @staticmethod
+    def _get_common_arguments(
+            style: AnimationStyle,
+            text_item: QGraphicsObject,
+            offset: QPointF,
+            parent=None
+    ) -> Dict[str, Any]:
+        """
+        Gets the constructor arguments shared by every Animation subclass.
+
+        Args:
+            style (AnimationStyle): The compiled style of the animation.
+            text_item (QGraphicsObject): Label associated with the animation.
+            offset (QPointF): Translation from the style's starting position.
+            parent: The parent object.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for the Animation constructor.
+        """
+        return {
+            "animation_type": style.animation_type,
+            "sound": style.sound,
+            "duration": style.duration,
+            "starting_position": style.starting_position + offset,
+            "fade_in": style.fade_in,
+            "fade_out": style.fade_out,
+            "fade_in_duration": style.fade_in_duration,
+            "fade_out_duration": style.fade_out_duration,
+            "fade_out_delay": style.fade_out_delay,
+            "fade_in_easing_style": style.fade_in_easing_style,
+            "fade_out_easing_style": style.fade_out_easing_style,
+            "animation_object": text_item,
+            "parent": parent
+        }
+
+    def _get_style_positions(self, config: AnimationConfig) -> Optional[Dict[str, Any]]:
+        """
+        Resolves the positions of an animation style and the path it follows between them.
+
+        Args:
+            config (AnimationConfig): The validated configuration of the animation style.
+
+        Returns:
+            Optional[Dict[str, Any]]: The position and path fields of the AnimationStyle, or None for unknown positions.
+        """
+        starting_position: Optional[QPointF] = self._get_position(config.starting_position)
+        ending_position: Optional[QPointF] = self._get_position(config.ending_position)
+        if starting_position is None or ending_position is None:
+            logging.error(
+                "Unknown position in animation style %s: %s -> %s",
+                config.name, config.starting_position, config.ending_position
+            )
+            return None
+        phase_1_fraction: float = config.phase_1_percentage / 100.0
+        vertex_position: QPointF = self._get_vertex_position(starting_position, ending_position)
+        swivel_position: QPointF = self._get_swivel_position(starting_position, ending_position, phase_1_fraction)
+        return {
+            "starting_position": starting_position,
+            "ending_position": ending_position,
+            "vertex_position": vertex_position,
+            "swivel_position": swivel_position,
+            "path": self._get_path(
+                config.animation_type,
+                config.behavior,
+                starting_position,
+                vertex_position,
+                swivel_position,
+                ending_position,
+                (config.phase_1_percentage, config.phase_2_percentage)
+            )
+        }
+
+    def _get_position(self, name: Optional[str]) -> Optional[QPointF]:
+        """
+        Resolves a named position against the overlay position table, or the fallback map without one.
+
+        Args:
+            name (Optional[str]): A grid position (e.g. "Top-Left") or an anchor circle (e.g. "Incoming-Start").
+
+        Returns:
+            Optional[QPointF]: The position, or None for unknown names.
+        """
+        if self.position_table is not None:
+            return self.position_table.position(name)
+        position: Optional[QPointF] = self.ANIMATION_POSITION_MAP.get(name)
+        return QPointF(position) if position is not None else None
+
+    def _get_path(
+            self,
+            animation_type: str,
+            behavior: Optional[str],
+            starting_position: QPointF,
+            vertex_position: QPointF,
+            swivel_position: QPointF,
+            ending_position: QPointF,
+            phase_percentages: Tuple[float, float]
+    ) -> Optional[AnimationPath]:
+        """
+        Gets the cached path an animation type follows, None for straight directional animations.
+
+        Args:
+            animation_type (str): The type of animation.
+            behavior (Optional[str]): The configured path behavior (e.g. "CurvedLeft") of directional animations.
+            starting_position (QPointF): Starting position of the animation.
+            vertex_position (QPointF): Vertex of Parabola animations.
+            swivel_position (QPointF): Turning point of Swivel animations.
+            ending_position (QPointF): Ending position of the animation.
+            phase_percentages (Tuple[float, float]): Shares of the duration of the two Swivel phases.
+
+        Returns:
+            Optional[AnimationPath]: The path, or None to move in a straight line.
+        """
+        if animation_type == "Parabola":
+            return self.path_cache.build("Parabola", starting_position, vertex_position, ending_position)
+        if animation_type == "Swivel":
+            return self.path_cache.build(
+                "Swivel", starting_position, swivel_position, ending_position, timing=phase_percentages
+            )
+        if animation_type == "Directional" and behavior and behavior != "Directional":
+            return self.path_cache.build(behavior, starting_position, vertex_position, ending_position)
+        return None
+
+    def _get_path_positions(self, style: AnimationStyle) -> Optional[Sequence[float]]:
+        """
+        Samples the path of a style once per displayed frame of its duration.
+
+        Args:
+            style (AnimationStyle): The compiled style of the animation.
+
+        Returns:
+            Optional[Sequence[float]]: The shared interleaved coordinates, or None for straight paths.
+        """
+        if style.path is None:
+            return None
+        return style.path.buffer_for(style.duration, self._get_frame_rate())
+
+    @staticmethod
+    def _get_frame_rate() -> float:
+        """
+        Gets the refresh rate of the primary screen, the rate path samples are taken at.
+
+        Returns:
+            float: The refresh rate in frames per second, DEFAULT_FRAMERATE if it is unknown.
+        """
+        screen = QGuiApplication.primaryScreen()
+        frame_rate: float = screen.refreshRate() if screen is not None else 0.0
+        return frame_rate if frame_rate > 0.0 else float(DEFAULT_FRAMERATE)
+
+    @staticmethod
+    def _is_plain_text(message: str) -> bool:
+        """
+        Checks whether a message holds no rich text markup, so it can be shown by a JQGraphicsStaticTextItem.
+
+        Args:
+            message (str): The message the animation displays.
+
+        Returns:
+            bool: True unless the message contains tags or entities.
+        """
+        return RICH_TEXT_PATTERN.search(message) is None
+
+    def _get_static_text_item(self, style: AnimationStyle, message: str, parent) -> JQGraphicsStaticTextItem:
+        """
+        Builds the lightweight text item of a plain message the glyph atlas of its style cannot compose.
+
+        Unlike a text sprite it rasterizes nothing for messages without a drop shadow, so messages that are
+        shown once, e.g. large damage numbers, do not fill the sprite cache.
+
+        Args:
+            style (AnimationStyle): The compiled style of the animation.
+            message (str): The message the animation displays.
+            parent: The parent object.
+
+        Returns:
+            JQGraphicsStaticTextItem: The text item with the outline and drop shadow of the style.
+        """
+        return JQGraphicsStaticTextItem(
+            font=style.font,
+            text=message,
+            color=style.text_color,
+            outline=style.outline,
+            outline_pen=style.outline_pen,
+            drop_shadow=style.drop_shadow,
+            drop_shadow_offset=style.drop_shadow_offset,
+            drop_shadow_blur_radius=style.drop_shadow_blur_radius,
+            drop_shadow_color=style.drop_shadow_color,
+            font_metrics=style.font_metrics,
+            parent_object=parent,
+            sprite_cache=self.sprite_cache
+        )
+
+    def _get_text_sprite(self, style: AnimationStyle, message: str) -> Sprite:
+        """
+        Gets the cached sprite of a rich text message the glyph atlas of its style cannot compose.
+
+        Args:
+            style (AnimationStyle): The compiled style of the animation.
+            message (str): The message the animation displays.
+
+        Returns:
+            Sprite: The sprite with the outline and drop shadow of the style baked in.
+        """
+        sprite: Sprite = self.sprite_cache.text_sprite(
+            font=style.font,
+            text=message,
+            color=style.text_color,
+            outline_pen=style.outline_pen if style.outline else None,
+            device_pixel_ratio=self._get_device_pixel_ratio(),
+            font_metrics=style.font_metrics
+        )
+        if style.drop_shadow:
+            sprite = self.sprite_cache.shadowed(
+                sprite, style.drop_shadow_offset, style.drop_shadow_blur_radius, style.drop_shadow_color
+            )
+        return sprite
+
+    @staticmethod
+    def _get_device_pixel_ratio() -> float:
+        """
+        Gets the device pixel ratio of the primary screen, the ratio sprites are rendered at.
+
+        Returns:
+            float: The device pixel ratio, 1.0 if it is unknown.
+        """
+        screen = QGuiApplication.primaryScreen()
+        return screen.devicePixelRatio() if screen is not None else 1.0
+
     @staticmethod
     def _get_animation_type_parent(animation_type: str) -> str:
         """
@@ -498,42 +698,25 @@ class AnimationFactory(QObject):
         Returns:
             str: Parent category ("Dynamic", "Static", or "Unknown Parent Type").
         """
-        dynamic_types = {"Directional", "Parabola", "Swivel"}
-        static_types = {"Stationary", "Pow"}
-
-        if animation_type in dynamic_types:
+        if animation_type in config_names.DYNAMIC_ANIMATION_TYPES:
             return "Dynamic"
-        elif animation_type in static_types:
+        elif animation_type in config_names.STATIC_ANIMATION_TYPES:
             return "Static"
         else:
             return "Unknown Parent Type"
 
-    @staticmethod
-    def _get_sound_effect(sound: str) -> QSoundEffect:
-        """
-        Initialize the sound effect if a sound file is provided.
-        """
-        try:
-            sound_effect = QSoundEffect()
-            sound_effect.setSource(QUrl.fromLocalFile(sound))
-            logging.debug("Sound Created for Animation: %s", sound)
-            return sound_effect
-        except Exception as e:
-            logging.exception("Error Creating Sound for Animation: %s", e)
-
-    @staticmethod
-    def _get_icon_pixmap(icon: str) -> QPixmap:
+    def _get_icon_pixmap(self, icon: str) -> QPixmap:
         """
-        Converts an icon file name to a QPixmap.
+        Looks up the pixmap of an icon in the shared icon cache.
 
         Args:
-            icon (str): The icon file name.
+            icon (str): The icon name or file name.
 
         Returns:
-            QPixmap: The QPixmap object created from the icon.
+            QPixmap: The cached pixmap of the icon.
         """
         try:
-            pixmap = QPixmap(icon)
+            pixmap = self.icon_cache.pixmap(icon)
             if pixmap.isNull():
                 logging.warning("Failed to load pixmap for icon: %s", icon)
             return pixmap
@@ -553,14 +736,18 @@ class AnimationFactory(QObject):
         return QWidget()
 
     @staticmethod
-    def _get_phase_duration(duration: int, percentage: float) -> int:
+    def _get_phase_duration(duration: int, percentage: int) -> int:
         """
-        Get the phase duration of a faded in or out animation
+        Get the duration of a phase, fade-in or fade-out from its share of the animation duration.
+
+        Args:
+            duration (int): The duration of the animation in milliseconds.
+            percentage (int): The share of the duration, from 0 to 100.
 
         Returns:
-            fade_duration (int): The phase duration of a faded in or out animation.
+            int: The phase duration in milliseconds.
         """
-        return int(duration * percentage)
+        return duration * percentage // 100
 
     @staticmethod
     def _get_fade_out_delay(duration: int, fade_out_duration: int) -> int:
@@ -615,127 +802,6 @@ class AnimationFactory(QObject):
         except Exception as e:
             logging.exception("Failed to calculate vertex position: %s", e)
 
-    @staticmethod
-    def _get_total_parabola_points(duration: int, fps: int = DEFAULT_FRAMERATE) -> int:
-        return int(float(duration / 1000.0) * fps)
-
-    @staticmethod
-    def _generate_parabola_data(
-            starting_position: QPointF,
-            vertex_position: QPointF,
-            ending_position: QPointF,
-            num_points: int
-    ) -> List[AnimationPointF]:
-        """
-        Generate evenly spaced AnimationPointF points along a parabola with their position percentages.
-
-        Parameters:
-            starting_position (QPointF): The starting point of the parabola.
-            vertex_position (QPointF): The vertex point of the parabola.
-            ending_position (QPointF): The ending point of the parabola.
-            num_points (int): The number of points to generate.
-
-        Returns:
-            List[AnimationPointF]: A list of AnimationPointF objects evenly spaced along the parabola curve,
-                                    each with an associated key_value between 0.0 and 1.0.
-        """
-        try:
-            logging.debug("Starting generation of parabola data with %d points.", num_points)
-
-            # Validate input
-            if num_points < 2:
-                logging.warning("num_points is less than 2. Returning start and end points only.")
-                return [
-                    AnimationPointF(starting_position.x(), starting_position.y(), 0.0),
-                    AnimationPointF(ending_position.x(), ending_position.y(), 1.0)
-                ]
-
-            # Calculate quadratic coefficients using vertex form: y = a(x - h)^2 + k
-            h: float = vertex_position.x()
-            k: float = vertex_position.y()
-            try:
-                denominator: float = (starting_position.x() - h) ** 2
-                a: float = (starting_position.y() - k) / denominator
-                b: float = -2.0 * a * h
-                c: float = a * h ** 2.0 + k
-                logging.debug("Quadratic coefficients calculated: a=%.6f, b=%.6f, c=%.6f", a, b, c)
-            except ZeroDivisionError:
-                logging.exception("Division by zero when calculating quadratic coefficients. Using default y = x^2.")
-                a, b, c = 1.0, 0.0, 0.0
-
-            # Precompute a fine grid of points to approximate arc length
-            steps: int = 1000
-            x_start: float = starting_position.x()
-            x_end: float = ending_position.x()
-            dx: float = (x_end - x_start) / steps
-            x_values: List[float] = [x_start + i * dx for i in range(steps + 1)]
-            y_values: List[float] = [a * x ** 2.0 + b * x + c for x in x_values]
-
-            # Compute cumulative arc length
-            cumulative_lengths: List[float] = [0.0]
-            for i in range(1, len(x_values)):
-                dx_segment: float = x_values[i] - x_values[i - 1]
-                dy_segment: float = y_values[i] - y_values[i - 1]
-                segment_length: float = (dx_segment ** 2.0 + dy_segment ** 2.0) ** 0.5
-                cumulative_lengths.append(cumulative_lengths[-1] + segment_length)
-
-            total_length: float = cumulative_lengths[-1]
-            logging.debug("Total arc length approximated: %.6f", total_length)
-
-            # Desired spacing between points
-            spacing: float = float(total_length / (num_points - 1))
-            logging.debug("Desired spacing between points: %.6f", spacing)
-
-            # Function to find the x for a given target length using binary search
-            def _find_x(target_len: float) -> float:
-                left: int = 0
-                right: int = len(cumulative_lengths) - 1
-                while left <= right:
-                    mid: int = (left + right) // 2
-                    current_length: float = cumulative_lengths[mid]
-                    if current_length < target_len:
-                        left = mid + 1
-                    else:
-                        right = mid - 1
-                if left == 0:
-                    return x_values[0]
-                elif left >= len(cumulative_lengths):
-                    return x_values[-1]
-                else:
-                    length_before: float = cumulative_lengths[left - 1]
-                    length_after: float = cumulative_lengths[left]
-                    ratio: float = ((target_len - length_before) /
-                                    (length_after - length_before)
-                                    if (length_after - length_before) != 0.0
-                                    else 0.0
-                                    )
-                    interpolated_x: float = x_values[left - 1] + ratio * (x_values[left] - x_values[left - 1])
-                    return interpolated_x
-
-            # Generate points
-            animation_points: List[AnimationPointF] = []
-            for i in range(num_points):
-                target_length: float = spacing * i
-                x: float = _find_x(target_length)
-                y: float = a * x ** 2.0 + b * x + c
-                key_value: float = (target_length / total_length) if total_length != 0 else 0.0
-                animation_point: AnimationPointF = AnimationPointF(x, y, key_value)
-                animation_points.append(animation_point)
-                logging.debug(
-                    "Added point %d: (%.6f, %.6f) with key_value %.6f",
-                    i, x, y, key_value
-                )
-
-            return animation_points
-
-        except Exception as e:
-            logging.exception(f"Failed to generate parabola data: {e}")
-            # Return default start and end points with corresponding key_values
-            return [
-                AnimationPointF(starting_position.x(), starting_position.y(), 0.0),
-                AnimationPointF(ending_position.x(), ending_position.y(), 1.0)
-            ]
-
     @staticmethod
     def _create_q_font(
             font_type: str,
@@ -763,9 +829,10 @@ class AnimationFactory(QObject):
         return q_font
 
     @staticmethod
-    def _get_font_style(font_database: QFontDatabase, font_type: str, font_italic: bool) -> int:
+    def _get_font_style(font_type: str, font_italic: bool) -> int:
         if font_italic:
-            if font_database.isSmoothlyScalable(font_type) and font_database.italic(font_type):
+            # QFontDatabase only has static methods in Qt 6
+            if QFontDatabase.isSmoothlyScalable(font_type) and "Italic" in QFontDatabase.styles(font_type):
                 return QFont.Style.StyleItalic.value
             else:
                 return QFont.Style.StyleOblique.value
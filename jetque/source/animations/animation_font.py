@@ -1,4 +1,6 @@
 # src/animations/animation_font.py
+from typing import Tuple
+
 from PyQt6.QtGui import QFont
 
 
@@ -38,6 +40,12 @@ class AnimationFont(QFont):
             italic=font_italic
         )
 
+        # Parameter tuple shared fonts and metrics are cached under, see FontCache
+        self.cache_key: Tuple = self.make_cache_key(
+            font_type, font_size, font_weight, font_capitalization, font_stretch, font_letter_spacing,
+            font_word_spacing, font_italic, font_kerning, font_overline, font_strikethrough, font_underline
+        )
+
         # Initializes more font attributes than the parent QFont
         self.setCapitalization(font_capitalization)
         self.setStretch(font_stretch)
@@ -47,3 +55,30 @@ class AnimationFont(QFont):
         self.setOverline(font_overline)
         self.setStrikeOut(font_strikethrough)
         self.setUnderline(font_underline)
+
+    @staticmethod
+    def make_cache_key(
+            font_type: str,
+            font_size: int,
+            font_weight: QFont.Weight,
+            font_capitalization: QFont.Capitalization,
+            font_stretch: QFont.Stretch,
+            font_letter_spacing: float,
+            font_word_spacing: float,
+            font_italic: bool,
+            font_kerning: bool,
+            font_overline: bool,
+            font_strikethrough: bool,
+            font_underline: bool
+    ) -> Tuple:
+        """
+        Build the hashable tuple identifying a font by all of its parameters.
+
+        Returns:
+            Tuple: The font parameter tuple.
+        """
+        return (
+            font_type, font_size, font_weight, font_capitalization, font_stretch, font_letter_spacing,
+            font_word_spacing, bool(font_italic), bool(font_kerning), bool(font_overline),
+            bool(font_strikethrough), bool(font_underline)
+        )
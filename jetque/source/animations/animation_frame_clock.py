@@ -0,0 +1,72 @@
+# jetque/source/animations/animation_frame_clock.py
+
+import logging
+from typing import Optional
+
+from PyQt6.QtCore import QElapsedTimer, QObject, QTimer, Qt, pyqtSignal
+
+# Constants
+DEFAULT_FRAME_INTERVAL: int = 16  # Milliseconds per frame at roughly 60 Hz
+
+
+class AnimationFrameClock(QObject):
+    """
+    Master frame clock that drives every batched animation from a single timer.
+
+    Attributes:
+        frameTicked (pyqtSignal): Emitted once per frame with the current clock time in milliseconds.
+        frame_timer (QTimer): Precise timer that fires once per frame.
+        elapsed_timer (QElapsedTimer): Monotonic clock used to timestamp frames.
+    """
+
+    frameTicked = pyqtSignal(float)
+
+    def __init__(self, frame_interval: int = DEFAULT_FRAME_INTERVAL, parent: Optional[QObject] = None) -> None:
+        """
+        Initialize the frame clock.
+
+        Args:
+            frame_interval (int): The interval between frames in milliseconds.
+            parent (Optional[QObject]): The parent object.
+        """
+        super().__init__(parent)
+        self.elapsed_timer: QElapsedTimer = QElapsedTimer()
+        self.elapsed_timer.start()
+        self.frame_timer: QTimer = QTimer(self)
+        self.frame_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.frame_timer.setInterval(frame_interval)
+        self.frame_timer.timeout.connect(self._on_timeout)
+
+    def now(self) -> float:
+        """
+        Get the current clock time.
+
+        Returns:
+            float: Milliseconds elapsed since the clock was created.
+        """
+        return self.elapsed_timer.nsecsElapsed() / 1_000_000.0
+
+    def is_running(self) -> bool:
+        """
+        Check whether the clock is currently ticking.
+
+        Returns:
+            bool: True if frames are being emitted, False otherwise.
+        """
+        return self.frame_timer.isActive()
+
+    def start(self) -> None:
+        """Start emitting frames if the clock is not already running."""
+        if not self.frame_timer.isActive():
+            self.frame_timer.start()
+            logging.debug("AnimationFrameClock started.")
+
+    def stop(self) -> None:
+        """Stop emitting frames."""
+        if self.frame_timer.isActive():
+            self.frame_timer.stop()
+            logging.debug("AnimationFrameClock stopped.")
+
+    def _on_timeout(self) -> None:
+        """Emit the frame signal with the current clock time."""
+        self.frameTicked.emit(self.now())
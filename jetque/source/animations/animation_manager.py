@@ -1,14 +1,20 @@
 # src/animations/animation_manager.py
 
 import logging
-from typing import Any, Dict, List
+from typing import Dict, List, Optional, Sequence, Union
 
-from PyQt6.QtCore import QObject, QTimer, pyqtSlot
-from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import QEasingCurve, QObject, QPointF, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtWidgets import QGraphicsObject, QGraphicsScene, QWidget
 
+from config.config_schema import JetQueConfig
+from jetque.source.animations.anchor_position_table import AnchorPositionTable
 from jetque.source.animations.animation import Animation
+from jetque.source.animations.animation_batch import AnimationBatch
 from jetque.source.animations.animation_factory import AnimationFactory
-from jetque.source.animations.animation_text import AnimationText
+from jetque.source.animations.animation_frame_clock import AnimationFrameClock
+from jetque.source.animations.animation_spawn_scheduler import AnimationSpawnScheduler
+from jetque.source.animations.animation_style import AnimationStyle
+from jetque.source.managers.lifecycle_manager import LifecycleManager
 
 
 class AnimationManager(QObject):
@@ -22,15 +28,31 @@ class AnimationManager(QObject):
             Dictionary containing lists of active static animations categorized by type.
         detect_intersections_timer (QTimer):
             Timer to periodically detect intersections between animations.
+        lifecycle_manager (LifecycleManager):
+            Tracks the graphics item owned by each animation and tears both down when it finishes.
+        styles (Dict[str, AnimationStyle]):
+            Compiled animation styles keyed by name, rebuilt whenever the configuration changes.
+        spawn_scheduler (AnimationSpawnScheduler):
+            Scheduler that builds requested animations within a per-frame time budget.
+        animation_batch (AnimationBatch):
+            Positions and fades of every animation that only moves and fades, evaluated together each frame.
+        frame_clock (AnimationFrameClock):
+            Master clock driving the batch, ticking only while it holds animations.
+        is_idle (bool):
+            True while no animation is active and every periodic timer is stopped.
+        idleChanged (pyqtSignal):
+            Emitted with the new idle state whenever the manager falls asleep or wakes up.
     """
 
-    def __init__(self, config: Dict[str, Any], parent=None) -> None:
+    idleChanged = pyqtSignal(bool)
+
+    def __init__(self, config: JetQueConfig, parent=None) -> None:
         """
         Initializes the AnimationController with the given parent widget and configuration.
 
         Args:
             parent (QWidget): The parent widget for the controller.
-            config (Dict[str, Any]): Configuration dictionary for animations.
+            config (JetQueConfig): The configuration validated at startup by load_typed_config.
         """
         super().__init__(parent)
         self.dynamic_animations: Dict[str, List[Animation]] = {
@@ -42,48 +64,87 @@ class AnimationManager(QObject):
             "stationary_animations": [],
             "pow_animations": []
         }
-        self.config = config
+        self.config: JetQueConfig = config
         self.animation_factory = AnimationFactory(self)
+        self.lifecycle_manager = LifecycleManager(parent=self)
+        self.styles: Dict[str, AnimationStyle] = self.animation_factory.compile_styles(self.config.animations)
         self.detect_intersections_timer = QTimer(self)
         self.detect_intersections_timer.setInterval(1000)  # Interval in milliseconds
         self.detect_intersections_timer.timeout.connect(self._detect_intersections)
-        self.detect_intersections_timer.start()
+        self.spawn_scheduler = AnimationSpawnScheduler(
+            self.animation_factory.build_animation,
+            budget=self.config.spawn_budget_ms,
+            batch_build_function=self.animation_factory.build_animations,
+            parent=self
+        )
+        self.spawn_scheduler.animationSpawned.connect(self.start_animation)
+        self.animation_batch = AnimationBatch()
+        self.frame_clock = AnimationFrameClock(parent=self)
+        self.frame_clock.frameTicked.connect(self._advance_batched_animations)
+        self.is_idle: bool = True  # Periodic timers only run while animations are active
         logging.debug("AnimationController initialized with config: %s", config)
 
-    def setup_animation(self, animation_creation_attributes: Dict[str, Any]) -> None:
+    def setup_animation(
+            self,
+            style: Union[AnimationStyle, str],
+            message: str = "Unassigned Message"
+    ) -> None:
         """
-        Sets up an animation based on the provided creation attributes.
+        Queues an animation to be built in the given style and started on an upcoming frame,
+        within the spawn scheduler's time budget.
 
         Args:
-            animation_creation_attributes (Dict[str, Any]): Attributes for creating the animation.
+            style (Union[AnimationStyle, str]): The compiled style, or the name of a loaded style.
+            message (str): The message the animation displays.
         """
         try:
-            animation = self.animation_factory.build_animation(animation_creation_attributes)
-            if animation:
-                self.start_animation(animation)
-                logging.info("Animation setup and started: %s", animation)
-            else:
-                logging.warning("Failed to build animation with attributes: %s", animation_creation_attributes)
+            if isinstance(style, str):
+                style_name: str = style
+                style = self.styles.get(style_name)
+                if style is None:
+                    logging.warning("No animation style named: %s", style_name)
+                    return
+            self.spawn_scheduler.schedule(style, message)
         except Exception as e:
             logging.exception("Error in setup_animation: %s", e)
 
+    def reload_styles(self, config: JetQueConfig) -> None:
+        """
+        Recompiles the animation styles after a configuration change.
+        Animations that are already queued or running keep the style they were requested with.
+
+        Args:
+            config (JetQueConfig): The new validated configuration.
+        """
+        try:
+            self.config = config
+            self.styles = self.animation_factory.compile_styles(self.config.animations)
+            logging.debug("Reloaded %d animation styles.", len(self.styles))
+        except Exception as e:
+            logging.exception("Error in reload_styles: %s", e)
+
     def start_animation(self, animation: Animation) -> None:
         """
         Starts the given animation and adds it to the appropriate active animations list.
+        Animations that only move and fade join the batch evaluated on every frame clock tick;
+        the others run their own property animations.
 
         Args:
             animation (Animation): The animation instance to start.
         """
         try:
-            animation.finished.connect(lambda: self.handle_animation_finished(animation))
-            animation_type = type(animation).__name__.lower()
             if isinstance(animation, Animation):
-                if hasattr(self.dynamic_animations, animation_type + '_animations'):
-                    self.dynamic_animations[animation_type + '_animations'].append(animation)
-                elif hasattr(self.static_animations, animation_type + '_animations'):
-                    self.static_animations[animation_type + '_animations'].append(animation)
+                self._wake()
+                self.lifecycle_manager.track(animation, animation.animation_object, self.handle_animation_finished)
+                animation_list = self._get_active_list(animation)
+                if animation_list is not None:
+                    animation_list.append(animation)
                 self.request_display(animation.animation_object)
-                animation.start()  # TODO: Maybe pass (DeletionPolicy = DeleteWhenStopped) and adjust Stop logic
+                batch_path = animation.batch_path()
+                if batch_path is not None:
+                    self._start_batched_animation(animation, *batch_path)
+                else:
+                    animation.start()  # TODO: Maybe pass (DeletionPolicy = DeleteWhenStopped) and adjust Stop logic
                 logging.info("Animation started: %s", animation)
             else:
                 logging.warning("Attempted to start invalid animation type: %s", type(animation))
@@ -112,31 +173,178 @@ class AnimationManager(QObject):
             animation (Animation): The animation instance to clean up.
         """
         try:
-            animation_type = type(animation).__name__.lower()
+            self.animation_batch.remove_owner(animation)
+            animation_list = self._get_active_list(animation)
             removed = False
-            if animation in self.dynamic_animations.get(f"{animation_type}_animations", []):
-                self.dynamic_animations[f"{animation_type}_animations"].remove(animation)
-                removed = True
-            elif animation in self.static_animations.get(f"{animation_type}_animations", []):
-                self.static_animations[f"{animation_type}_animations"].remove(animation)
+            if animation_list is not None and animation in animation_list:
+                animation_list.remove(animation)
                 removed = True
             if removed:
-                animation.deleteLater()
+                self.lifecycle_manager.release(animation)
                 logging.debug("Animation cleaned up and deleted: %s", animation)
             else:
                 logging.warning("Attempted to clean up animation not found in active lists: %s", animation)
+            self._sleep_if_inactive()
         except Exception as e:
             logging.exception("Error in clean_up_animation: %s", e)
 
-    def request_display(self, animation_object: AnimationText) -> None:
+    def _start_batched_animation(
+            self,
+            animation: Animation,
+            path_positions: Sequence[float],
+            path_offset: QPointF,
+            easing_style: QEasingCurve.Type
+    ) -> None:
+        """
+        Hands an animation to the batch instead of starting its own timers.
+
+        Args:
+            animation (Animation): The animation to drive.
+            path_positions (Sequence[float]): Interleaved coordinates of the evenly timed samples it follows.
+            path_offset (QPointF): Translation added to the samples.
+            easing_style (QEasingCurve.Type): The easing curve for movement.
+        """
+        self.animation_batch.add(
+            animation.animation_object,
+            path_positions,
+            self.frame_clock.now(),
+            animation.duration,
+            offset=path_offset,
+            total_duration=animation.totalDuration(),
+            easing_style=easing_style,
+            fade_in_duration=animation.fade_in_duration if animation.fade_in else 0,
+            fade_in_easing_style=animation.fade_in_easing_style,
+            fade_out_delay=animation.fade_out_delay,
+            fade_out_duration=animation.fade_out_duration if animation.fade_out else 0,
+            fade_out_easing_style=animation.fade_out_easing_style,
+            owner=animation
+        )
+        animation.play_sound()
+        self.frame_clock.start()
+
+    def _advance_batched_animations(self, now: float) -> None:
+        """
+        Moves and fades every batched animation to the given frame time and cleans up the finished ones.
+
+        Args:
+            now (float): The frame clock time in milliseconds.
+        """
+        try:
+            for animation in self.animation_batch.advance(now):
+                self.handle_animation_finished(animation)
+            if not len(self.animation_batch):
+                self.frame_clock.stop()
+        except Exception as e:
+            logging.exception("Error in advance_batched_animations: %s", e)
+
+    def active_animation_count(self) -> int:
+        """
+        Counts the animations that are currently running.
+
+        Returns:
+            int: The number of active animations.
+        """
+        dynamic_count: int = sum(len(animations) for animations in self.dynamic_animations.values())
+        static_count: int = sum(len(animations) for animations in self.static_animations.values())
+        return dynamic_count + static_count
+
+    def _wake(self) -> None:
+        """
+        Leaves the idle state, restarting the periodic timers before the first new animation is shown.
+        """
+        if not self.is_idle:
+            return
+        self.is_idle = False
+        self.detect_intersections_timer.start()
+        self.idleChanged.emit(False)
+        logging.debug("AnimationManager woke up.")
+
+    def _sleep_if_inactive(self) -> None:
+        """
+        Enters the idle state once no animation is active, stopping every periodic timer.
+        """
+        if self.is_idle or self.active_animation_count():
+            return
+        self.is_idle = True
+        self.detect_intersections_timer.stop()
+        self.frame_clock.stop()
+        self.idleChanged.emit(True)
+        logging.debug("AnimationManager is idle.")
+
+    def set_position_table(self, position_table: Optional[AnchorPositionTable]) -> None:
+        """
+        Compiles the styles against the positions of an overlay, and repositions them whenever those positions change.
+
+        Args:
+            position_table (Optional[AnchorPositionTable]): The overlay position table, or None for the fallback
+                                                            positions.
+        """
+        try:
+            previous: Optional[AnchorPositionTable] = self.animation_factory.position_table
+            if previous is not None:
+                previous.positionsChanged.disconnect(self._reposition_styles)
+            self.animation_factory.position_table = position_table
+            if position_table is not None:
+                position_table.positionsChanged.connect(self._reposition_styles)
+            self.reload_styles(self.config)
+        except Exception as e:
+            logging.exception("Error in set_position_table: %s", e)
+
+    @pyqtSlot()
+    def _reposition_styles(self) -> None:
+        """
+        Resolves the positions and paths of the styles that depend on a moved position, e.g. while an anchor is
+        dragged, without recompiling their fonts, pens, sounds and glyph atlases.
+        """
+        try:
+            self.styles = self.animation_factory.reposition_styles(self.styles, self.config.animations)
+        except Exception as e:
+            logging.exception("Error in reposition_styles: %s", e)
+
+    def set_scene(self, scene: Optional[QGraphicsScene]) -> None:
+        """
+        Sets the scene animation objects are displayed in.
+
+        Args:
+            scene (Optional[QGraphicsScene]): The overlay scene, or None to stop displaying animations.
+        """
+        self.lifecycle_manager.set_scene(scene)
+
+    def live_object_counts(self) -> Dict[str, int]:
+        """
+        Reports how many animations and animation objects are still alive, per class.
+
+        Returns:
+            Dict[str, int]: Live instance counts per class name.
+        """
+        return self.lifecycle_manager.live_counts()
+
+    def _get_active_list(self, animation: Animation) -> Optional[List[Animation]]:
+        """
+        Gets the active animations list matching the animation's type.
+
+        Args:
+            animation (Animation): The animation instance.
+
+        Returns:
+            Optional[List[Animation]]: The matching active list, or None for unknown types.
+        """
+        key: str = f"{type(animation).__name__.replace('Animation', '').lower()}_animations"
+        if key in self.dynamic_animations:
+            return self.dynamic_animations[key]
+        return self.static_animations.get(key)
+
+    def request_display(self, animation_object: QGraphicsObject) -> None:
         """
         Sends a request to the Overlay to display the animation.
 
         Args:
-            animation_object (AnimationText): The animation instance's animation_object to be displayed.
+            animation_object (QGraphicsObject): The animation instance's animation_object to be displayed.
         """
-        # TODO: Logic to display the animation_object on the overlay will be implemented here
-        pass
+        try:
+            self.lifecycle_manager.display(animation_object)
+        except Exception as e:
+            logging.exception("Error in request_display: %s", e)
 
     @pyqtSlot()
     def handle_animation_finished(self, animation: Animation) -> None:
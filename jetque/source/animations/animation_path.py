@@ -0,0 +1,447 @@
+# jetque/source/animations/animation_path.py
+
+import logging
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PyQt6.QtCore import QPointF
+
+# Constants
+ARC_LENGTH_SAMPLES_PER_SEGMENT: int = 512  # Parameter samples per segment in the arc-length lookup table
+DEFAULT_PATH_CACHE_SIZE: int = 128  # Distinct paths kept with their lookup tables
+PATH_BUFFER_CACHE_SIZE: int = 8  # Sample counts memoised per path, e.g. one per refresh rate and duration
+MAX_PATH_SAMPLES: int = 2048  # Upper bound of the samples taken for one animation
+DEFAULT_CURVE_BEND: float = 0.25  # Sideways offset of a curved path at its middle, relative to its length
+
+Point = Tuple[float, float]
+
+
+@dataclass(frozen=True)
+class PathSegment(ABC):
+    """
+    One piece of a trajectory, evaluated over its curve parameter from 0.0 to 1.0.
+    Segments are immutable and hashable, so identical paths share one cached lookup table.
+    """
+
+    @abstractmethod
+    def evaluate(self, t: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the segment at an array of curve parameters.
+
+        Args:
+            t (np.ndarray): Curve parameters between 0.0 and 1.0, shape (n,).
+
+        Returns:
+            np.ndarray: The positions, shape (n, 2).
+        """
+
+
+@dataclass(frozen=True)
+class LineSegment(PathSegment):
+    """
+    Straight segment between two points.
+
+    Attributes:
+        start (Point): The starting point.
+        end (Point): The ending point.
+    """
+
+    start: Point
+    end: Point
+
+    def evaluate(self, t: np.ndarray) -> np.ndarray:
+        t = t[:, np.newaxis]
+        return (1.0 - t) * np.asarray(self.start) + t * np.asarray(self.end)
+
+
+@dataclass(frozen=True)
+class QuadraticBezierSegment(PathSegment):
+    """
+    Quadratic Bezier segment.
+
+    Attributes:
+        start (Point): The starting point.
+        control (Point): The control point.
+        end (Point): The ending point.
+    """
+
+    start: Point
+    control: Point
+    end: Point
+
+    def evaluate(self, t: np.ndarray) -> np.ndarray:
+        t = t[:, np.newaxis]
+        u = 1.0 - t
+        return u * u * np.asarray(self.start) + 2.0 * u * t * np.asarray(self.control) + t * t * np.asarray(self.end)
+
+
+@dataclass(frozen=True)
+class CubicBezierSegment(PathSegment):
+    """
+    Cubic Bezier segment.
+
+    Attributes:
+        start (Point): The starting point.
+        control_1 (Point): The first control point.
+        control_2 (Point): The second control point.
+        end (Point): The ending point.
+    """
+
+    start: Point
+    control_1: Point
+    control_2: Point
+    end: Point
+
+    def evaluate(self, t: np.ndarray) -> np.ndarray:
+        t = t[:, np.newaxis]
+        u = 1.0 - t
+        return (
+            u * u * u * np.asarray(self.start)
+            + 3.0 * u * u * t * np.asarray(self.control_1)
+            + 3.0 * u * t * t * np.asarray(self.control_2)
+            + t * t * t * np.asarray(self.end)
+        )
+
+
+@dataclass(frozen=True)
+class CatmullRomSegment(PathSegment):
+    """
+    Uniform Catmull-Rom segment running from point_1 to point_2, shaped by their neighbours.
+
+    Attributes:
+        point_0 (Point): The point before the segment.
+        point_1 (Point): The starting point.
+        point_2 (Point): The ending point.
+        point_3 (Point): The point after the segment.
+    """
+
+    point_0: Point
+    point_1: Point
+    point_2: Point
+    point_3: Point
+
+    def evaluate(self, t: np.ndarray) -> np.ndarray:
+        t = t[:, np.newaxis]
+        p0, p1, p2, p3 = (np.asarray(point) for point in (self.point_0, self.point_1, self.point_2, self.point_3))
+        return 0.5 * (
+            2.0 * p1
+            + (p2 - p0) * t
+            + (2.0 * p0 - 5.0 * p1 + 4.0 * p2 - p3) * t * t
+            + (3.0 * p1 - p0 - 3.0 * p2 + p3) * t * t * t
+        )
+
+
+class AnimationPath:
+    """
+    Trajectory made of segments, with an arc-length lookup table built once for constant-speed sampling.
+
+    By default the whole path is travelled at constant speed. An optional timing assigns each segment
+    its share of the duration instead, e.g. the two phases of a swivel, and speed is then constant
+    within each segment.
+
+    Attributes:
+        segments (Tuple[PathSegment, ...]): The segments of the path, in travel order.
+        timing (Optional[Tuple[float, ...]]): Relative duration of every segment, or None for constant speed.
+        lookup_positions (np.ndarray): Positions sampled along the path, shape (n, 2).
+        lookup_lengths (np.ndarray): Cumulative arc length at every sampled position, shape (n,).
+        length (float): Total arc length of the path.
+        time_knots (np.ndarray): Time fractions at the segment boundaries.
+        distance_knots (np.ndarray): Arc lengths at the segment boundaries.
+    """
+
+    def __init__(self, segments: Sequence[PathSegment], timing: Optional[Sequence[float]] = None) -> None:
+        """
+        Build the arc-length lookup table of a path.
+
+        Args:
+            segments (Sequence[PathSegment]): The segments of the path, in travel order.
+            timing (Optional[Sequence[float]]): Relative duration of every segment, or None for constant speed.
+        """
+        self.segments: Tuple[PathSegment, ...] = tuple(segments)
+        self.timing: Optional[Tuple[float, ...]] = tuple(timing) if timing is not None else None
+        self._buffers: "OrderedDict[int, array]" = OrderedDict()
+
+        t: np.ndarray = np.linspace(0.0, 1.0, ARC_LENGTH_SAMPLES_PER_SEGMENT + 1)
+        positions: List[np.ndarray] = []
+        boundary_indices: List[int] = [0]
+        for index, segment in enumerate(self.segments):
+            segment_positions: np.ndarray = segment.evaluate(t)
+            positions.append(segment_positions if index == 0 else segment_positions[1:])
+            boundary_indices.append(boundary_indices[-1] + ARC_LENGTH_SAMPLES_PER_SEGMENT)
+
+        self.lookup_positions: np.ndarray = np.concatenate(positions)
+        steps: np.ndarray = np.hypot(*np.diff(self.lookup_positions, axis=0).T)
+        self.lookup_lengths: np.ndarray = np.concatenate(([0.0], np.cumsum(steps)))
+        self.length: float = float(self.lookup_lengths[-1])
+
+        self.distance_knots: np.ndarray = self.lookup_lengths[boundary_indices]
+        if self.timing is None or self.length == 0.0:
+            self.time_knots: np.ndarray = (
+                self.distance_knots / self.length if self.length else np.linspace(0.0, 1.0, len(boundary_indices))
+            )
+        else:
+            durations: np.ndarray = np.asarray(self.timing, dtype=np.float64)
+            self.time_knots = np.concatenate(([0.0], np.cumsum(durations))) / max(durations.sum(), 1e-12)
+
+    def positions_at(self, progress: np.ndarray) -> np.ndarray:
+        """
+        Get the positions at an array of time fractions.
+
+        Args:
+            progress (np.ndarray): Time fractions between 0.0 and 1.0.
+
+        Returns:
+            np.ndarray: The positions, shape (n, 2).
+        """
+        distance: np.ndarray = np.interp(progress, self.time_knots, self.distance_knots)
+        return np.column_stack((
+            np.interp(distance, self.lookup_lengths, self.lookup_positions[:, 0]),
+            np.interp(distance, self.lookup_lengths, self.lookup_positions[:, 1])
+        ))
+
+    def sample(self, count: int) -> np.ndarray:
+        """
+        Sample the path at evenly spaced times, e.g. once per frame.
+
+        Args:
+            count (int): The number of samples, at least 2.
+
+        Returns:
+            np.ndarray: The positions, shape (count, 2).
+        """
+        return self.positions_at(np.linspace(0.0, 1.0, max(2, count)))
+
+    def buffer(self, count: int) -> array:
+        """
+        Sample the path as a flat buffer of interleaved x and y coordinates, e.g. for a PathAnimation.
+        Buffers are memoised per count and shared between calls, so they must not be modified.
+
+        Args:
+            count (int): The number of samples, at least 2.
+
+        Returns:
+            array: The interleaved coordinates, 2 * count doubles.
+        """
+        positions: Optional[array] = self._buffers.get(count)
+        if positions is None:
+            positions = array("d", self.sample(count).ravel().tobytes())
+            self._buffers[count] = positions
+            if len(self._buffers) > PATH_BUFFER_CACHE_SIZE:
+                self._buffers.popitem(last=False)
+        else:
+            self._buffers.move_to_end(count)
+        return positions
+
+    def buffer_for(self, duration: int, frame_rate: float) -> array:
+        """
+        Sample the path once per displayed frame of an animation, independently of how many
+        objects the animation creates.
+
+        Args:
+            duration (int): The duration of the animation in milliseconds.
+            frame_rate (float): The refresh rate of the display in frames per second.
+
+        Returns:
+            array: The interleaved coordinates of the samples, see buffer.
+        """
+        count: int = int(duration / 1000.0 * frame_rate) + 1
+        return self.buffer(min(max(2, count), MAX_PATH_SAMPLES))
+
+
+class PathCache:
+    """
+    Keeps the arc-length lookup table of every distinct path, so it is built only once.
+
+    Attributes:
+        max_size (int): Number of distinct paths kept.
+        paths (OrderedDict): Cached paths keyed by (segments, timing), in least recently used order.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_PATH_CACHE_SIZE) -> None:
+        """
+        Initialize an empty path cache.
+
+        Args:
+            max_size (int): Number of distinct paths kept.
+        """
+        self.max_size: int = max_size
+        self.paths: "OrderedDict[Tuple, AnimationPath]" = OrderedDict()
+
+    def get(self, segments: Sequence[PathSegment], timing: Optional[Sequence[float]] = None) -> AnimationPath:
+        """
+        Get the path made of the given segments, building its lookup table on first use.
+
+        Args:
+            segments (Sequence[PathSegment]): The segments of the path, in travel order.
+            timing (Optional[Sequence[float]]): Relative duration of every segment, or None for constant speed.
+
+        Returns:
+            AnimationPath: The cached path.
+        """
+        key: Tuple = (tuple(segments), tuple(timing) if timing is not None else None)
+        path: Optional[AnimationPath] = self.paths.get(key)
+        if path is not None:
+            self.paths.move_to_end(key)
+            return path
+
+        path = AnimationPath(segments, timing)
+        self.paths[key] = path
+        if len(self.paths) > self.max_size:
+            self.paths.popitem(last=False)
+        logging.debug("PathCache built path of %d segments, length %.2f", len(path.segments), path.length)
+        return path
+
+    def build(
+            self,
+            behavior: str,
+            starting_position: QPointF,
+            vertex_position: QPointF,
+            ending_position: QPointF,
+            timing: Optional[Sequence[float]] = None
+    ) -> Optional[AnimationPath]:
+        """
+        Get the path of a named behavior between the given positions.
+
+        Args:
+            behavior (str): The behavior name, a key of PATH_BUILDERS.
+            starting_position (QPointF): The starting position.
+            vertex_position (QPointF): The vertex, swivel or other intermediate position.
+            ending_position (QPointF): The ending position.
+            timing (Optional[Sequence[float]]): Relative duration of every segment, or None for constant speed.
+
+        Returns:
+            Optional[AnimationPath]: The cached path, or None for unknown behaviors.
+        """
+        builder: Optional[Callable[[QPointF, QPointF, QPointF], Tuple[PathSegment, ...]]] = PATH_BUILDERS.get(behavior)
+        if builder is None:
+            logging.error("Unknown path behavior: %s", behavior)
+            return None
+        return self.get(builder(starting_position, vertex_position, ending_position), timing)
+
+
+def _point(position: QPointF) -> Point:
+    """
+    Convert a QPointF to a hashable point.
+
+    Args:
+        position (QPointF): The position.
+
+    Returns:
+        Point: The (x, y) tuple.
+    """
+    return position.x(), position.y()
+
+
+def catmull_rom_segments(points: Sequence[Point]) -> Tuple[PathSegment, ...]:
+    """
+    Build a Catmull-Rom spline passing through every point, the end points being repeated as neighbours.
+
+    Args:
+        points (Sequence[Point]): The points to pass through, at least 2.
+
+    Returns:
+        Tuple[PathSegment, ...]: One segment per consecutive pair of points.
+    """
+    padded: List[Point] = [points[0], *points, points[-1]]
+    return tuple(
+        CatmullRomSegment(padded[index], padded[index + 1], padded[index + 2], padded[index + 3])
+        for index in range(len(points) - 1)
+    )
+
+
+def parabola_segments(
+        starting_position: QPointF,
+        vertex_position: QPointF,
+        ending_position: QPointF
+) -> Tuple[PathSegment, ...]:
+    """
+    Build the parabola y = a(x - h)^2 + k with its vertex at (h, k) through the starting position,
+    from the starting x to the ending x, as the equivalent quadratic Bezier segment.
+
+    Args:
+        starting_position (QPointF): The starting position.
+        vertex_position (QPointF): The vertex of the parabola.
+        ending_position (QPointF): The ending position, only its x is used.
+
+    Returns:
+        Tuple[PathSegment, ...]: The parabola segment.
+    """
+    h: float = vertex_position.x()
+    k: float = vertex_position.y()
+    try:
+        a: float = (starting_position.y() - k) / (starting_position.x() - h) ** 2
+    except ZeroDivisionError:
+        logging.warning("Parabola vertex is above its start, using the default y = x^2.")
+        a, h, k = 1.0, 0.0, 0.0
+
+    x_start: float = starting_position.x()
+    x_end: float = ending_position.x()
+    y_start: float = a * (x_start - h) ** 2 + k
+    y_end: float = a * (x_end - h) ** 2 + k
+    # The tangents at both ends meet halfway along x
+    control: Point = ((x_start + x_end) / 2.0, y_start + a * (x_start - h) * (x_end - x_start))
+    return (QuadraticBezierSegment((x_start, y_start), control, (x_end, y_end)),)
+
+
+def swivel_segments(
+        starting_position: QPointF,
+        swivel_position: QPointF,
+        ending_position: QPointF
+) -> Tuple[PathSegment, ...]:
+    """
+    Build the two straight phases of a swivel.
+
+    Args:
+        starting_position (QPointF): The starting position.
+        swivel_position (QPointF): The position where the path turns.
+        ending_position (QPointF): The ending position.
+
+    Returns:
+        Tuple[PathSegment, ...]: The phase 1 and phase 2 segments.
+    """
+    return (
+        LineSegment(_point(starting_position), _point(swivel_position)),
+        LineSegment(_point(swivel_position), _point(ending_position))
+    )
+
+
+def curved_segments(
+        starting_position: QPointF,
+        ending_position: QPointF,
+        side: float,
+        bend: float = DEFAULT_CURVE_BEND
+) -> Tuple[PathSegment, ...]:
+    """
+    Build a path that bows to one side of the straight line between two positions.
+
+    Args:
+        starting_position (QPointF): The starting position.
+        ending_position (QPointF): The ending position.
+        side (float): 1.0 to bow left of the direction of travel, -1.0 to bow right.
+        bend (float): The sideways offset of the path at its middle, relative to its length.
+
+    Returns:
+        Tuple[PathSegment, ...]: The curved segment.
+    """
+    dx: float = ending_position.x() - starting_position.x()
+    dy: float = ending_position.y() - starting_position.y()
+    # (dy, -dx) points left of the direction of travel in y-down scene coordinates
+    control: Point = (
+        starting_position.x() + dx / 2.0 + side * bend * dy * 2.0,
+        starting_position.y() + dy / 2.0 - side * bend * dx * 2.0
+    )
+    return (QuadraticBezierSegment(_point(starting_position), control, _point(ending_position)),)
+
+
+PATH_BUILDERS: Dict[str, Callable[[QPointF, QPointF, QPointF], Tuple[PathSegment, ...]]] = {
+    "Directional": lambda start, vertex, end: (LineSegment(_point(start), _point(end)),),
+    "Parabola": parabola_segments,
+    "Swivel": swivel_segments,
+    "CurvedLeft": lambda start, vertex, end: curved_segments(start, end, 1.0),
+    "CurvedRight": lambda start, vertex, end: curved_segments(start, end, -1.0),
+    "Spline": lambda start, vertex, end: catmull_rom_segments([_point(start), _point(vertex), _point(end)])
+}
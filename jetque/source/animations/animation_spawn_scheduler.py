@@ -0,0 +1,169 @@
+# jetque/source/animations/animation_spawn_scheduler.py
+
+import logging
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+from config.config_schema import DEFAULT_SPAWN_BUDGET
+from jetque.source.animations.animation import Animation
+from jetque.source.animations.animation_style import AnimationStyle
+
+# Constants
+DEFAULT_SPAWN_INTERVAL: int = 16  # Milliseconds between spawn frames
+DEFAULT_BUILD_COST: float = 1.0  # Predicted milliseconds for a style that has never been built
+BUILD_COST_SMOOTHING: float = 0.2  # Weight of the newest measurement in the moving average
+
+
+class AnimationSpawnScheduler(QObject):
+    """
+    Spreads animation creation over several frames so a burst of events never stalls the event loop.
+
+    Each frame builds as many pending animations as are predicted to fit the time budget,
+    using a moving average of the measured build cost of every style name, and carries the rest over.
+    At least one animation is built per frame so the queue always drains.
+
+    Attributes:
+        animationSpawned (pyqtSignal): Emitted with every animation that was built.
+        build_function (Callable[[AnimationStyle, str], Optional[Animation]]): Builds an animation from a style and message.
+        batch_build_function (Optional[Callable[[AnimationStyle, Sequence[str]], List[Animation]]]):
+            Builds the animations of several messages in one style, or None to build them one by one.
+        budget (float): Milliseconds of building allowed per frame.
+        pending (Deque[Tuple[AnimationStyle, str]]): Spawn requests waiting to be built.
+        build_costs (Dict[str, float]): Moving average build cost in milliseconds per style name.
+        spawn_timer (QTimer): Timer that runs one spawn frame per interval while requests are pending.
+    """
+
+    animationSpawned = pyqtSignal(object)
+
+    def __init__(
+            self,
+            build_function: Callable[[AnimationStyle, str], Optional[Animation]],
+            budget: float = DEFAULT_SPAWN_BUDGET,
+            interval: int = DEFAULT_SPAWN_INTERVAL,
+            batch_build_function: Optional[Callable[[AnimationStyle, Sequence[str]], List[Animation]]] = None,
+            parent: Optional[QObject] = None
+    ) -> None:
+        """
+        Initialize the spawn scheduler.
+
+        Args:
+            build_function (Callable[[AnimationStyle, str], Optional[Animation]]): Builds an animation from a style and message.
+            budget (float): Milliseconds of building allowed per frame.
+            interval (int): Milliseconds between spawn frames.
+            batch_build_function (Optional[Callable[[AnimationStyle, Sequence[str]], List[Animation]]]):
+                Builds the animations of several messages in one style, or None to build them one by one.
+            parent (Optional[QObject]): The parent object.
+        """
+        super().__init__(parent)
+        self.build_function: Callable[[AnimationStyle, str], Optional[Animation]] = build_function
+        self.batch_build_function: Optional[Callable[[AnimationStyle, Sequence[str]], List[Animation]]] = (
+            batch_build_function
+        )
+        self.budget: float = budget
+        self.pending: Deque[Tuple[AnimationStyle, str]] = deque()
+        self.build_costs: Dict[str, float] = {}
+        self.spawn_timer: QTimer = QTimer(self)
+        self.spawn_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.spawn_timer.setInterval(interval)
+        self.spawn_timer.timeout.connect(self._spawn_frame)
+
+    def schedule(self, style: AnimationStyle, message: str) -> None:
+        """
+        Queue an animation to be built on an upcoming frame.
+
+        Args:
+            style (AnimationStyle): The compiled style the animation is built in.
+            message (str): The message the animation displays.
+        """
+        self.pending.append((style, message))
+        if not self.spawn_timer.isActive():
+            self.spawn_timer.start()
+
+    def clear(self) -> None:
+        """Drop every pending request and stop spawning."""
+        self.pending.clear()
+        self.spawn_timer.stop()
+
+    def estimated_cost(self, style: AnimationStyle) -> float:
+        """
+        Get the predicted build cost of a style.
+
+        Args:
+            style (AnimationStyle): The compiled style the animation is built in.
+
+        Returns:
+            float: The predicted build time in milliseconds.
+        """
+        return self.build_costs.get(style.name, DEFAULT_BUILD_COST)
+
+    def _spawn_frame(self) -> None:
+        """
+        Build pending animations until the next one is predicted to exceed the frame budget.
+        Consecutive requests in the same style are built together when a batch build function is set.
+        """
+        frame_start: float = time.perf_counter()
+        spent: float = 0.0
+        built: int = 0
+
+        while self.pending:
+            style: AnimationStyle = self.pending[0][0]
+            predicted: float = self.build_costs.get(style.name, DEFAULT_BUILD_COST)
+            if built and spent + predicted > self.budget:
+                break
+
+            messages: List[str] = [self.pending.popleft()[1]]
+            if self.batch_build_function is not None:
+                while (
+                        self.pending
+                        and self.pending[0][0] is style
+                        and spent + predicted * (len(messages) + 1) <= self.budget
+                ):
+                    messages.append(self.pending.popleft()[1])
+
+            build_start: float = time.perf_counter()
+            animations: List[Animation] = self._build(style, messages)
+            build_end: float = time.perf_counter()
+
+            cost: float = (build_end - build_start) * 1000.0 / len(messages)
+            previous: Optional[float] = self.build_costs.get(style.name)
+            self.build_costs[style.name] = (
+                cost if previous is None else previous + (cost - previous) * BUILD_COST_SMOOTHING
+            )
+            spent = (build_end - frame_start) * 1000.0
+            built += len(messages)
+
+            for animation in animations:
+                self.animationSpawned.emit(animation)
+            if len(animations) < len(messages):
+                logging.warning(
+                    "Failed to build %d scheduled animations for style: %s",
+                    len(messages) - len(animations), style.name
+                )
+
+        if self.pending:
+            logging.debug("Spawned %d animations in %.2f ms, %d carried over.", built, spent, len(self.pending))
+        else:
+            self.spawn_timer.stop()
+
+    def _build(self, style: AnimationStyle, messages: List[str]) -> List[Animation]:
+        """
+        Build the animations of consecutive requests in the same style.
+
+        Args:
+            style (AnimationStyle): The compiled style the animations are built in.
+            messages (List[str]): The message of every animation.
+
+        Returns:
+            List[Animation]: The animations that were built.
+        """
+        try:
+            if len(messages) > 1:
+                return self.batch_build_function(style, messages)
+            animation: Optional[Animation] = self.build_function(style, messages[0])
+            return [animation] if animation else []
+        except Exception as e:
+            logging.exception("Error building scheduled animation: %s", e)
+            return []
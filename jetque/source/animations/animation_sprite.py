@@ -0,0 +1,95 @@
+# jetque/source/animations/animation_sprite.py
+
+import logging
+from typing import Any, Optional
+
+from PyQt6.QtCore import QObject, QRectF
+from PyQt6.QtGui import QPainter
+from PyQt6.QtWidgets import QGraphicsItem, QGraphicsObject
+
+from jetque.source.gui.cache_policy import ITEM_KIND_BATCHED, ITEM_KIND_SPRITE, apply_cache_mode, batches_sprites
+from jetque.source.gui.sprite_batch_renderer import SPRITE_BATCH_PROPERTY
+from jetque.source.managers.sprite_cache import Sprite
+
+
+class AnimationSprite(QGraphicsObject):
+    """
+    Displays a pre-rendered animation label, so painting it while it moves, fades or scales is a single blit.
+
+    Unlike AnimationText it holds no text layout, outline path or graphics effect, only a reference to a
+    sprite shared with every label showing the same text in the same style, drop shadow included.
+
+    Attributes:
+        sprite (Sprite): The pre-rendered label.
+    """
+
+    def __init__(
+            self,
+            sprite: Sprite,
+            parent: Optional[QObject] = None
+    ) -> None:
+        """
+        Initializes the AnimationSprite with the provided parameters.
+
+        Args:
+            sprite (Sprite): The pre-rendered label.
+            parent (Optional[QObject]): The parent object.
+        """
+        super().__init__()
+
+        try:
+            self.setParent(parent)
+            self.sprite: Sprite = sprite
+            self.setTransformOriginPoint(self.sprite.layout_rect.center())
+            apply_cache_mode(self, ITEM_KIND_SPRITE)
+        except Exception as e:
+            logging.exception("Failed to initialize AnimationSprite: %s", e)
+
+    def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value: Any) -> Any:
+        """
+        Drop the item coordinate cache when the sprite is added to a scene whose view batches sprites,
+        before Qt paints the sprite into a cache it would otherwise draw on top of the batch.
+
+        Args:
+            change (QGraphicsItem.GraphicsItemChange): The type of change.
+            value (Any): The value associated with the change.
+
+        Returns:
+            Any: The result of the change.
+        """
+        if change == QGraphicsItem.GraphicsItemChange.ItemSceneHasChanged and batches_sprites(value):
+            apply_cache_mode(self, ITEM_KIND_BATCHED)
+        return super().itemChange(change, value)
+
+    def boundingRect(self) -> QRectF:
+        """
+        Get the rectangle covered by the sprite.
+
+        Returns:
+            QRectF: The bounding rectangle in item coordinates.
+        """
+        return self.sprite.rect
+
+    def paint(
+            self,
+            painter: QPainter,
+            option,
+            widget: Optional[object] = None
+    ) -> None:
+        """
+        Blit the sprite, smoothing it only while the item is scaled.
+        Nothing is painted on viewports that draw sprites with the SpriteBatchRenderer instead.
+
+        Args:
+            painter (QPainter): The painter used to draw the item.
+            option: Style options for the item.
+            widget (Optional[object], optional): The widget being painted on. Defaults to None.
+        """
+        try:
+            if widget is not None and widget.property(SPRITE_BATCH_PROPERTY):
+                return
+            if self.scale() != 1.0:
+                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+            painter.drawPixmap(self.sprite.rect.topLeft(), self.sprite.pixmap)
+        except Exception as e:
+            logging.exception("Failed to paint AnimationSprite: %s", e)
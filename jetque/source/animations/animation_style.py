@@ -0,0 +1,93 @@
+# jetque/source/animations/animation_style.py
+
+from dataclasses import dataclass
+from typing import Optional
+
+from PyQt6.QtCore import QEasingCurve, QPointF
+from PyQt6.QtGui import QColor, QFontMetricsF, QPen
+
+from jetque.source.animations.animation_font import AnimationFont
+from jetque.source.animations.animation_path import AnimationPath
+from jetque.source.managers.glyph_atlas import GlyphAtlas
+from jetque.source.managers.sound_cue import SoundCue
+
+
+@dataclass(frozen=True)
+class AnimationStyle:
+    """
+    Immutable, fully resolved description of how one kind of animation looks and moves.
+
+    Styles are compiled once from an animation configuration by AnimationFactory.compile_style,
+    so building an animation only does per-message work.
+
+    Attributes:
+        name (str): The name the style is registered under.
+        animation_type (str): The type of animation (e.g. "Parabola", "Pow").
+        parent_type (str): The parent category of the animation type ("Dynamic" or "Static").
+        sound (Optional[SoundCue]): The preloaded sound played when the animation starts.
+        duration (int): The duration of the animation in milliseconds.
+        starting_position (QPointF): The starting position of the animation.
+        ending_position (QPointF): The ending position of dynamic animations.
+        vertex_position (QPointF): The vertex of Parabola animations.
+        swivel_position (QPointF): The turning point of Swivel animations.
+        path (Optional[AnimationPath]): The cached path followed by curved animations, None for straight ones.
+        easing_style (QEasingCurve.Type): The easing curve for movement.
+        fade_in (bool): Whether the animation fades in.
+        fade_out (bool): Whether the animation fades out.
+        fade_in_duration (int): The fade-in duration in milliseconds.
+        fade_out_duration (int): The fade-out duration in milliseconds.
+        fade_out_delay (int): The fade-out delay in milliseconds.
+        fade_in_easing_style (QEasingCurve.Type): The easing curve for fade-in.
+        fade_out_easing_style (QEasingCurve.Type): The easing curve for fade-out.
+        font (AnimationFont): The font of the animation text.
+        font_metrics (QFontMetricsF): The float font metrics of the font.
+        text_color (QColor): The color of the animation text.
+        outline (bool): Whether the text is outlined.
+        outline_pen (QPen): The pen used to draw the outline.
+        drop_shadow (bool): Whether the text casts a drop shadow.
+        drop_shadow_offset (QPointF): The offset of the drop shadow.
+        drop_shadow_blur_radius (float): The blur radius of the drop shadow.
+        drop_shadow_color (QColor): The color of the drop shadow.
+        jiggle (bool): Whether static animations jiggle.
+        jiggle_intensity (int): The jiggle interval in milliseconds.
+        scale_percentage (float): The peak scale of Pow animations.
+        scale_easing_style (QEasingCurve.Type): The easing curve for Pow scaling.
+        phase_1_duration (int): The duration of phase 1 in milliseconds.
+        phase_2_duration (int): The duration of phase 2 in milliseconds.
+        glyph_atlas (Optional[GlyphAtlas]): Pre-rendered digits and affixes numbers are composed from, if any.
+    """
+
+    name: str
+    animation_type: str
+    parent_type: str
+    sound: Optional[SoundCue]
+    duration: int
+    starting_position: QPointF
+    ending_position: QPointF
+    vertex_position: QPointF
+    swivel_position: QPointF
+    path: Optional[AnimationPath]
+    easing_style: QEasingCurve.Type
+    fade_in: bool
+    fade_out: bool
+    fade_in_duration: int
+    fade_out_duration: int
+    fade_out_delay: int
+    fade_in_easing_style: QEasingCurve.Type
+    fade_out_easing_style: QEasingCurve.Type
+    font: AnimationFont
+    font_metrics: QFontMetricsF
+    text_color: QColor
+    outline: bool
+    outline_pen: QPen
+    drop_shadow: bool
+    drop_shadow_offset: QPointF
+    drop_shadow_blur_radius: float
+    drop_shadow_color: QColor
+    jiggle: bool
+    jiggle_intensity: int
+    scale_percentage: float
+    scale_easing_style: QEasingCurve.Type
+    phase_1_duration: int
+    phase_2_duration: int
+    glyph_atlas: Optional[GlyphAtlas] = None
@@ -7,6 +7,8 @@ from PyQt6.QtCore import QPointF, Qt, QRectF
 from PyQt6.QtGui import QColor, QFont, QPainter, QPen, QPainterPath, QFontMetricsF, QPixmap
 from PyQt6.QtWidgets import QGraphicsTextItem, QGraphicsDropShadowEffect, QGraphicsPixmapItem
 
+from jetque.source.managers.font_cache import FontCache
+
 
 class AnimationText(QGraphicsTextItem):
     """
@@ -17,6 +19,7 @@ class AnimationText(QGraphicsTextItem):
         outline (bool): Indicates if outline effect is enabled.
         text_drop_shadow_effect (QGraphicsDropShadowEffect): The drop shadow effect applied to the text item.
         font_metrics_f (QFontMetricsF): The float font metrics of the text font.
+        text_advance (float): The horizontal advance of the text.
         outline_pen (QPen): The pen used to draw the outline.
         TODO ADD MISSING ATTRIBUTES.
     """
@@ -36,6 +39,8 @@ class AnimationText(QGraphicsTextItem):
             icon_pixmap: QPixmap = None,
             icon_alignment: str = "left",  # String instead of bool incase more options are created
             icon_padding: float = 0.0,
+            font_metrics: Optional[QFontMetricsF] = None,
+            font_cache: Optional[FontCache] = None,
             parent=None
     ) -> None:
         """
@@ -51,6 +56,8 @@ class AnimationText(QGraphicsTextItem):
             drop_shadow_offset (QPointF): The offset of the drop shadow.
             drop_shadow_blur_radius (float): The blur radius of the drop shadow.
             drop_shadow_color (QColor): The color of the drop shadow.
+            font_metrics (Optional[QFontMetricsF]): Shared metrics of text_font, measured here if not provided.
+            font_cache (Optional[FontCache]): Cache the text advance is memoised in, the shared one by default.
             parent: The parent widget.
             TODO ADD MISSING ARGUMENTS.
         """
@@ -66,7 +73,11 @@ class AnimationText(QGraphicsTextItem):
             self.icon: bool = icon
             self.icon_alignment: str = icon_alignment
             self.icon_padding: float = icon_padding
-            self.font_metrics_f: QFontMetricsF = QFontMetricsF(self.font())
+            self.font_metrics_f: QFontMetricsF = (
+                font_metrics if font_metrics is not None else QFontMetricsF(self.font())
+            )
+            font_cache = font_cache if font_cache is not None else FontCache.shared()
+            self.text_advance: float = font_cache.horizontal_advance(text_font, text_message)
             self.outline_pen: QPen = outline_pen
             self.outline_path: QPainterPath = QPainterPath()
             self.text_drop_shadow_effect = QGraphicsDropShadowEffect(self)
@@ -94,7 +105,7 @@ class AnimationText(QGraphicsTextItem):
                         self.outline_pen.widthF() + (
                                 outline_rect.width()
                                 - 2.0 * self.outline_pen.width()
-                                - self.font_metrics_f.horizontalAdvance(self.toPlainText())
+                                - self.text_advance
                         ) / 2.0,
                         self.outline_pen.widthF() + self.font_metrics_f.ascent()
                     ),
@@ -138,7 +149,7 @@ class AnimationText(QGraphicsTextItem):
                 if self.icon_alignment.lower() == "left":
                     x_position = -icon_pixmap.width() - additional_x_offset
                 elif self.icon_alignment.lower() == "right":
-                    x_position = self.font_metrics_f.horizontalAdvance(self.toPlainText()) + additional_x_offset
+                    x_position = self.text_advance + additional_x_offset
 
                 y_position = self.text_drop_shadow_effect.yOffset() + (self.outline_pen.widthF() / 2.0)
 
@@ -1,10 +1,10 @@
 # src/animations/dynamics/directional_animation.py
-from typing import Optional
+from typing import Optional, Sequence
 
 from PyQt6.QtCore import QEasingCurve, QPointF, QObject
-from PyQt6.QtMultimedia import QSoundEffect
 
 from jetque.source.animations.dynamics.dynamic_animation import DynamicAnimation
+from jetque.source.managers.sound_cue import SoundCue
 
 
 class DirectionalAnimation(DynamicAnimation):
@@ -17,7 +17,7 @@ class DirectionalAnimation(DynamicAnimation):
     def __init__(
             self,
             animation_type: str,
-            sound: QSoundEffect,
+            sound: Optional[SoundCue],
             duration: int,
             starting_position: QPointF,
             fade_in: bool,
@@ -30,6 +30,7 @@ class DirectionalAnimation(DynamicAnimation):
             animation_object: Optional[QObject],
             ending_position: QPointF,
             easing_style: QEasingCurve.Type,
+            path_positions: Optional[Sequence[float]] = None,
             parent=None
     ) -> None:
         """
@@ -37,7 +38,7 @@ class DirectionalAnimation(DynamicAnimation):
 
         Args:
             animation_type (str): The type of animation.
-            sound (QSoundEffect): The sound effect to play.
+            sound (Optional[SoundCue]): The preloaded sound to play.
             duration (int): The duration of the animation in milliseconds.
             starting_position (QPointF): The starting position of the animation.
             fade_in (bool): Whether the animation fades in.
@@ -50,6 +51,7 @@ class DirectionalAnimation(DynamicAnimation):
             animation_object (Optional[QObject]): The object associated with the animation.
             ending_position (QPointF): The ending position of the animation.
             easing_style (QEasingCurve.Type): The easing curve type for the animation.
+            path_positions (Optional[Sequence[float]]): Interleaved coordinates of a sampled curved path, if any.
             parent: The parent object.
         """
         super().__init__(
@@ -69,3 +71,4 @@ class DirectionalAnimation(DynamicAnimation):
             easing_style=easing_style,
             parent=parent
         )
+        self.set_path_positions(path_positions)
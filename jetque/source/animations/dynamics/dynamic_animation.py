@@ -1,10 +1,12 @@
 # src/animations/dynamic_animation.py
-from typing import Optional
+from array import array
+from typing import List, Optional, Sequence, Tuple
 
 from PyQt6.QtCore import QEasingCurve, QPointF, QObject
-from PyQt6.QtMultimedia import QSoundEffect
 
 from jetque.source.animations.animation import Animation
+from jetque.source.animations.path_animation import PathAnimation
+from jetque.source.managers.sound_cue import SoundCue
 
 
 class DynamicAnimation(Animation):
@@ -14,12 +16,14 @@ class DynamicAnimation(Animation):
     Attributes:
         ending_position (QPointF): The ending position of the animation.
         easing_style (QEasingCurve.Type): The easing curve type for the animation.
+        path_positions (Optional[Sequence[float]]): Interleaved coordinates of a sampled curved path, if any.
+        path_offset (QPointF): Translation from the sampled path to the starting position.
     """
 
     def __init__(
             self,
             animation_type: str,
-            sound: QSoundEffect,
+            sound: Optional[SoundCue],
             duration: int,
             starting_position: QPointF,
             fade_in: bool,
@@ -39,7 +43,7 @@ class DynamicAnimation(Animation):
 
         Args:
             animation_type (str): The type of animation.
-            sound (QSoundEffect): The sound effect to play.
+            sound (Optional[SoundCue]): The preloaded sound to play.
             duration (int): The duration of the animation in milliseconds.
             starting_position (QPointF): The starting position of the animation.
             fade_in (bool): Whether the animation fades in.
@@ -73,5 +77,64 @@ class DynamicAnimation(Animation):
         # Initialize common attributes between all DynamicAnimation children
         self.ending_position: QPointF = ending_position
         self.easing_style: QEasingCurve.Type = easing_style
+        self.path_positions: Optional[Sequence[float]] = None
+        self.path_offset: QPointF = QPointF()
         self.animation.setEndValue(self.ending_position)
         self.animation.setEasingCurve(self.easing_style)
+
+    def set_path_positions(self, path_positions: Optional[Sequence[float]]) -> None:
+        """
+        Move along a sampled path instead of straight to the ending position.
+        The keyframed position animation is replaced by a PathAnimation that interpolates the shared
+        buffer directly, so the animation holds no per-sample objects. The path is translated so it
+        begins at the starting position.
+
+        Args:
+            path_positions (Optional[Sequence[float]]): Interleaved x and y coordinates of evenly timed samples,
+                                                        None to keep the straight path.
+        """
+        if not path_positions or len(path_positions) < 4:
+            return
+        self.path_positions = path_positions
+        self.removeAnimation(self.animation)
+        self.animation.deleteLater()
+        self.path_offset = self.starting_position - QPointF(path_positions[0], path_positions[1])
+        self.animation = PathAnimation(
+            self.animation_object,
+            path_positions,
+            self.duration,
+            self.easing_style,
+            offset=self.path_offset
+        )
+        self.addAnimation(self.animation)
+
+    def set_path_points(self, path_points: Optional[List[QPointF]]) -> None:
+        """
+        Move along evenly timed points of a path instead of straight to the ending position.
+
+        Args:
+            path_points (Optional[List[QPointF]]): The sampled path positions, None to keep the straight path.
+        """
+        if not path_points or len(path_points) < 2:
+            return
+        self.set_path_positions(array("d", (coordinate for point in path_points for coordinate in (point.x(), point.y()))))
+
+    def batch_path(self) -> Optional[Tuple[Sequence[float], QPointF, QEasingCurve.Type]]:
+        """
+        Get the path followed when this animation is driven by an AnimationBatch instead of its own timers.
+        A sampled path is shared as is; otherwise the item moves straight to the ending position.
+
+        Returns:
+            Optional[Tuple[Sequence[float], QPointF, QEasingCurve.Type]]:
+                Interleaved coordinates of evenly timed samples, the offset added to them and the easing curve.
+        """
+        if self.path_positions is not None:
+            return self.path_positions, self.path_offset, self.easing_style
+        return (
+            array("d", (
+                self.starting_position.x(), self.starting_position.y(),
+                self.ending_position.x(), self.ending_position.y()
+            )),
+            QPointF(),
+            self.easing_style
+        )
@@ -1,11 +1,11 @@
 # src/animations/dynamics/parabola_animation.py
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from PyQt6.QtCore import QEasingCurve, QPointF, QObject
-from PyQt6.QtMultimedia import QSoundEffect
 
 from jetque.source.animations.dynamics.dynamic_animation import DynamicAnimation
+from jetque.source.managers.sound_cue import SoundCue
 
 
 class ParabolaAnimation(DynamicAnimation):
@@ -17,7 +17,7 @@ class ParabolaAnimation(DynamicAnimation):
     def __init__(
             self,
             animation_type: str,
-            sound: QSoundEffect,
+            sound: Optional[SoundCue],
             duration: int,
             starting_position: QPointF,
             fade_in: bool,
@@ -31,6 +31,7 @@ class ParabolaAnimation(DynamicAnimation):
             ending_position: QPointF,
             easing_style: QEasingCurve.Type,
             parabola_points: Optional[List[QPointF]],
+            parabola_positions: Optional[Sequence[float]] = None,
             parent=None
     ) -> None:
         """
@@ -38,7 +39,7 @@ class ParabolaAnimation(DynamicAnimation):
 
         Args:
             animation_type (str): The type of animation.
-            sound (QSoundEffect): The sound effect to play.
+            sound (Optional[SoundCue]): The preloaded sound to play.
             duration (int): The duration of the animation in milliseconds.
             starting_position (QPointF): The starting position of the animation.
             fade_in (bool): Whether the animation fades in.
@@ -52,6 +53,8 @@ class ParabolaAnimation(DynamicAnimation):
             ending_position (QPointF): The ending position of the animation.
             easing_style (QEasingCurve.Type): The easing curve type for the animation.
             parabola_points (Optional[List[QPointF]]): The positions along the curve of the animation.
+            parabola_positions (Optional[Sequence[float]]): Interleaved coordinates of the sampled curve,
+                                                            used instead of parabola_points when given.
             parent: The parent object.
         """
         super().__init__(
@@ -74,7 +77,7 @@ class ParabolaAnimation(DynamicAnimation):
 
         # Initialize ParabolaAnimation specific attributes
         self.parabola_points: Optional[List[QPointF]] = parabola_points
-
-        for i, point in enumerate(self.parabola_points):
-            t = i / (len(self.parabola_points) - 1)  # Normalized time (0 to 1)
-            self.animation.setKeyValueAt(t, point)
+        if parabola_positions:
+            self.set_path_positions(parabola_positions)
+        else:
+            self.set_path_points(self.parabola_points)
@@ -1,10 +1,11 @@
 # src/animations/dynamics/swivel_animation.py
-from typing import Optional
+from array import array
+from typing import Optional, Sequence, Tuple
 
 from PyQt6.QtCore import QEasingCurve, QPointF, QPropertyAnimation, QSequentialAnimationGroup, QObject
-from PyQt6.QtMultimedia import QSoundEffect
 
 from jetque.source.animations.dynamics.dynamic_animation import DynamicAnimation
+from jetque.source.managers.sound_cue import SoundCue
 
 
 class SwivelAnimation(DynamicAnimation):
@@ -16,7 +17,7 @@ class SwivelAnimation(DynamicAnimation):
     def __init__(
             self,
             animation_type: str,
-            sound: QSoundEffect,
+            sound: Optional[SoundCue],
             duration: int,
             starting_position: QPointF,
             fade_in: bool,
@@ -32,6 +33,7 @@ class SwivelAnimation(DynamicAnimation):
             phase_1_duration: int,
             phase_2_duration: int,
             swivel_position: QPointF,
+            swivel_positions: Optional[Sequence[float]] = None,
             parent=None
     ) -> None:
         """
@@ -39,7 +41,7 @@ class SwivelAnimation(DynamicAnimation):
 
         Args:
             animation_type (str): The type of animation.
-            sound (QSoundEffect): The sound effect to play.
+            sound (Optional[SoundCue]): The preloaded sound to play.
             duration (int): The duration of the animation in milliseconds.
             starting_position (QPointF): The starting position of the animation.
             fade_in (bool): Whether the animation fades in.
@@ -55,6 +57,9 @@ class SwivelAnimation(DynamicAnimation):
             phase_1_duration (int): The duration of phase 1
             phase_2_duration (int): The duration of phase 2
             swivel_position (QPointF): The Swivel position for the animation.
+            swivel_positions (Optional[Sequence[float]]): Interleaved coordinates of evenly timed samples along
+                                                          both phases. Without them the swivel position is
+                                                          reached halfway.
             parent: The parent object.
         """
         super().__init__(
@@ -82,7 +87,10 @@ class SwivelAnimation(DynamicAnimation):
         # self.removeAnimation(self.animation)  # Removes Phase 1 from Parallel Group
         # self.phase_1_duration: int = phase_1_duration
         self.swivel_position: QPointF = swivel_position
-        self.animation.setKeyValueAt(0.5, self.swivel_position)
+        if swivel_positions:
+            self.set_path_positions(swivel_positions)
+        else:
+            self.animation.setKeyValueAt(0.5, self.swivel_position)
         # self.animation.setDuration(self.phase_1_duration)
         # self.animation.setEndValue(self.swivel_position)
         # Phase 2
@@ -97,3 +105,24 @@ class SwivelAnimation(DynamicAnimation):
         # self.animation_sequence.addAnimation(self.animation)
         # self.animation_sequence.addAnimation(self.animation2)
         # self.addAnimation(self.animation_sequence)  # Adds the Sequence to the Parallel Group
+
+    def batch_path(self) -> Optional[Tuple[Sequence[float], QPointF, QEasingCurve.Type]]:
+        """
+        Get the path followed when this animation is driven by an AnimationBatch instead of its own timers.
+        Without a sampled path the item passes the swivel position halfway, like its keyframed animation.
+
+        Returns:
+            Optional[Tuple[Sequence[float], QPointF, QEasingCurve.Type]]:
+                Interleaved coordinates of evenly timed samples, the offset added to them and the easing curve.
+        """
+        if self.path_positions is not None:
+            return super().batch_path()
+        return (
+            array("d", (
+                self.starting_position.x(), self.starting_position.y(),
+                self.swivel_position.x(), self.swivel_position.y(),
+                self.ending_position.x(), self.ending_position.y()
+            )),
+            QPointF(),
+            self.easing_style
+        )
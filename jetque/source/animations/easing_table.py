@@ -0,0 +1,166 @@
+# jetque/source/animations/easing_table.py
+
+import bisect
+import logging
+from typing import List, Tuple, Union
+
+import numpy as np
+from PyQt6.QtCore import QEasingCurve
+
+# Constants
+EASING_TABLE_TOLERANCE: float = 1e-4  # Maximum absolute difference from QEasingCurve.valueForProgress
+EASING_TABLE_INITIAL_INTERVALS: int = 64  # Uniform intervals each curve starts from before refinement
+EASING_TABLE_MINIMUM_INTERVAL: float = 1e-6  # Refinement stops here, e.g. at the jumps of the Expo curves
+EASING_TABLE_CURVE_COUNT: int = QEasingCurve.Type.BezierSpline.value  # Linear through CosineCurve
+
+
+class EasingTable:
+    """
+    Dense lookup tables for the standard QEasingCurve types, sampled once at startup.
+
+    Each curve is sampled adaptively so linear interpolation between samples stays within
+    EASING_TABLE_TOLERANCE of QEasingCurve.valueForProgress, including the steep ends of the
+    circular curves and the kinks of the bounce curves. Rows are indexed by QEasingCurve.Type.value,
+    which covers every curve in AnimationFactory.ANIMATION_EASING_MAP. Types that need extra
+    parameters (BezierSpline, TCBSpline and Custom) fall back to Linear.
+
+    Attributes:
+        progress_samples (List[List[float]]): Sampled progress values of each curve.
+        value_samples (List[List[float]]): Sampled eased values of each curve.
+        table_progress (np.ndarray): All progress samples concatenated, curve k offset by 2 * k.
+        table_values (np.ndarray): All eased samples concatenated, aligned with table_progress.
+        row_last_index (np.ndarray): Index in the concatenated arrays of the last sample of each curve.
+    """
+
+    def __init__(self, tolerance: float = EASING_TABLE_TOLERANCE / 2.0) -> None:
+        """
+        Sample every standard easing curve.
+
+        Args:
+            tolerance (float): The interpolation error targeted while refining the samples.
+        """
+        self.progress_samples: List[List[float]] = []
+        self.value_samples: List[List[float]] = []
+
+        for easing_value in range(EASING_TABLE_CURVE_COUNT):
+            progress, values = self._sample_curve(QEasingCurve(QEasingCurve.Type(easing_value)), tolerance)
+            self.progress_samples.append(progress)
+            self.value_samples.append(values)
+
+        self.table_progress: np.ndarray = np.concatenate(
+            [np.asarray(progress) + 2.0 * row for row, progress in enumerate(self.progress_samples)]
+        )
+        self.table_values: np.ndarray = np.concatenate([np.asarray(values) for values in self.value_samples])
+        self.row_last_index: np.ndarray = np.cumsum([len(progress) for progress in self.progress_samples]) - 1
+
+        logging.debug("EasingTable sampled %d curves into %d points.", EASING_TABLE_CURVE_COUNT, self.table_values.size)
+
+    def value(self, easing_style: Union[QEasingCurve.Type, int], progress: float) -> float:
+        """
+        Evaluate one easing curve at one progress value.
+
+        Args:
+            easing_style (Union[QEasingCurve.Type, int]): The easing curve type or its value.
+            progress (float): The linear progress between 0.0 and 1.0.
+
+        Returns:
+            float: The eased progress.
+        """
+        row: int = self._row(easing_style)
+        if row < 0:
+            return progress
+
+        progress_samples: List[float] = self.progress_samples[row]
+        value_samples: List[float] = self.value_samples[row]
+        progress = min(max(progress, 0.0), 1.0)
+
+        index: int = min(bisect.bisect_right(progress_samples, progress) - 1, len(progress_samples) - 2)
+        left: float = progress_samples[index]
+        right: float = progress_samples[index + 1]
+        ratio: float = (progress - left) / (right - left)
+        return value_samples[index] + (value_samples[index + 1] - value_samples[index]) * ratio
+
+    def values(self, easing_styles: Union[np.ndarray, QEasingCurve.Type, int], progress: np.ndarray) -> np.ndarray:
+        """
+        Evaluate easing curves over an array of progress values in one vectorised pass.
+
+        Args:
+            easing_styles (Union[np.ndarray, QEasingCurve.Type, int]): One curve for every element,
+                                                                    or an array of QEasingCurve.Type values.
+            progress (np.ndarray): Linear progress values between 0.0 and 1.0.
+
+        Returns:
+            np.ndarray: The eased progress values.
+        """
+        progress = np.clip(np.asarray(progress, dtype=np.float64), 0.0, 1.0)
+
+        if isinstance(easing_styles, np.ndarray):
+            rows: np.ndarray = easing_styles.astype(np.int64)
+        else:
+            rows = np.full(progress.shape, self._row(easing_styles), dtype=np.int64)
+
+        unsupported: np.ndarray = (rows < 0) | (rows >= EASING_TABLE_CURVE_COUNT)
+        rows = np.where(unsupported, QEasingCurve.Type.Linear.value, rows)
+
+        keys: np.ndarray = progress + 2.0 * rows
+        index: np.ndarray = np.searchsorted(self.table_progress, keys, side="right") - 1
+        index = np.minimum(index, self.row_last_index[rows] - 1)
+
+        left: np.ndarray = self.table_progress[index]
+        right: np.ndarray = self.table_progress[index + 1]
+        ratio: np.ndarray = (keys - left) / (right - left)
+        eased: np.ndarray = self.table_values[index] + (self.table_values[index + 1] - self.table_values[index]) * ratio
+        return np.where(unsupported, progress, eased)
+
+    @staticmethod
+    def _row(easing_style: Union[QEasingCurve.Type, int]) -> int:
+        """
+        Get the table row of an easing curve.
+
+        Args:
+            easing_style (Union[QEasingCurve.Type, int]): The easing curve type or its value.
+
+        Returns:
+            int: The row index, or -1 if the curve is not tabulated.
+        """
+        row: int = easing_style.value if isinstance(easing_style, QEasingCurve.Type) else int(easing_style)
+        return row if 0 <= row < EASING_TABLE_CURVE_COUNT else -1
+
+    @staticmethod
+    def _sample_curve(curve: QEasingCurve, tolerance: float) -> Tuple[List[float], List[float]]:
+        """
+        Sample an easing curve, subdividing intervals until linear interpolation is within tolerance.
+
+        Args:
+            curve (QEasingCurve): The curve to sample.
+            tolerance (float): The maximum interpolation error at the probed quarter points.
+
+        Returns:
+            Tuple[List[float], List[float]]: The sampled progress values and their eased values.
+        """
+        value_for_progress = curve.valueForProgress
+        progress_samples: List[float] = [0.0]
+        value_samples: List[float] = [value_for_progress(0.0)]
+
+        for interval in range(EASING_TABLE_INITIAL_INTERVALS):
+            pending: List[Tuple[float, float]] = [
+                ((interval + 1) / EASING_TABLE_INITIAL_INTERVALS,
+                 value_for_progress((interval + 1) / EASING_TABLE_INITIAL_INTERVALS))
+            ]
+            while pending:
+                left, left_value = progress_samples[-1], value_samples[-1]
+                right, right_value = pending[-1]
+                width: float = right - left
+                accurate: bool = width <= EASING_TABLE_MINIMUM_INTERVAL or all(
+                    abs(value_for_progress(left + width * q) - (left_value + (right_value - left_value) * q)) <= tolerance
+                    for q in (0.25, 0.5, 0.75)
+                )
+                if accurate:
+                    pending.pop()
+                    progress_samples.append(right)
+                    value_samples.append(right_value)
+                else:
+                    middle: float = left + width / 2.0
+                    pending.append((middle, value_for_progress(middle)))
+
+        return progress_samples, value_samples
@@ -0,0 +1,93 @@
+# jetque/source/animations/path_animation.py
+
+import logging
+from typing import Optional, Sequence
+
+from PyQt6.QtCore import QEasingCurve, QObject, QPointF, QVariantAnimation
+
+
+class PathAnimation(QVariantAnimation):
+    """
+    Moves an item along a sampled path, interpolating between the samples on every animation tick.
+
+    The path is a flat buffer of interleaved x and y coordinates shared by every animation following the
+    same path, so an animation only holds a reference to it however many samples the path has, and no
+    keyframe or point objects are created per animation.
+
+    Attributes:
+        target_item (Optional[QObject]): The item moved along the path, it must provide setPos.
+        positions (Sequence[float]): Interleaved x and y coordinates of the evenly timed samples.
+        last_index (int): Index of the last sample.
+        offset_x (float): Horizontal translation applied to every sample.
+        offset_y (float): Vertical translation applied to every sample.
+    """
+
+    def __init__(
+            self,
+            target_item: Optional[QObject],
+            positions: Sequence[float],
+            duration: int,
+            easing_style: QEasingCurve.Type,
+            offset: Optional[QPointF] = None,
+            parent: Optional[QObject] = None
+    ) -> None:
+        """
+        Initialize the PathAnimation with the given parameters.
+
+        Args:
+            target_item (Optional[QObject]): The item moved along the path, it must provide setPos.
+            positions (Sequence[float]): Interleaved x and y coordinates of at least two evenly timed samples.
+            duration (int): The duration of the animation in milliseconds.
+            easing_style (QEasingCurve.Type): The easing curve applied to the progress along the path.
+            offset (Optional[QPointF]): Translation applied to every sample, so one buffer serves every
+                                        starting position of the same trajectory.
+            parent (Optional[QObject]): The parent object.
+        """
+        super().__init__(parent)
+        self.target_item: Optional[QObject] = target_item
+        self.positions: Sequence[float] = positions
+        self.last_index: int = len(positions) // 2 - 1
+        self.offset_x: float = offset.x() if offset is not None else 0.0
+        self.offset_y: float = offset.y() if offset is not None else 0.0
+        self.setStartValue(0.0)
+        self.setEndValue(1.0)
+        self.setDuration(duration)
+        self.setEasingCurve(easing_style)
+
+    def position_at(self, progress: float) -> QPointF:
+        """
+        Get the position at a progress along the path, extrapolating the end samples when an
+        easing curve overshoots like keyframed property animations do.
+
+        Args:
+            progress (float): The eased progress, 0.0 at the first sample and 1.0 at the last.
+
+        Returns:
+            QPointF: The interpolated position.
+        """
+        scaled: float = progress * self.last_index
+        index: int = min(max(int(scaled), 0), self.last_index - 1)
+        ratio: float = scaled - index
+        offset: int = index * 2
+        positions: Sequence[float] = self.positions
+        x: float = positions[offset]
+        y: float = positions[offset + 1]
+        return QPointF(
+            x + (positions[offset + 2] - x) * ratio + self.offset_x,
+            y + (positions[offset + 3] - y) * ratio + self.offset_y
+        )
+
+    def updateCurrentValue(self, value) -> None:
+        """
+        Move the target item to the position of the current eased progress.
+
+        Args:
+            value: The eased progress supplied by QVariantAnimation.
+        """
+        if self.target_item is None or value is None:
+            return
+        try:
+            self.target_item.setPos(self.position_at(float(value)))
+        except Exception as e:
+            logging.exception("Error updating PathAnimation: %s", e)
+            self.target_item = None  # Stop updating e.g. an item deleted while the animation runs
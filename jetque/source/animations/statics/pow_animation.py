@@ -1,10 +1,11 @@
 # src/animations/statics/pow_animation.py
-from typing import Optional
+from typing import Optional, Sequence, Tuple
 
 from PyQt6.QtCore import QEasingCurve, QPointF, QPropertyAnimation, QSequentialAnimationGroup, QPauseAnimation, QObject
-from PyQt6.QtMultimedia import QSoundEffect
 
 from jetque.source.animations.statics.static_animation import StaticAnimation
+from jetque.source.gui.cache_policy import ITEM_KIND_SCALING, apply_cache_mode
+from jetque.source.managers.sound_cue import SoundCue
 
 
 class PowAnimation(StaticAnimation):
@@ -15,7 +16,7 @@ class PowAnimation(StaticAnimation):
     def __init__(
             self,
             animation_type: str,
-            sound: QSoundEffect,
+            sound: Optional[SoundCue],
             duration: int,
             starting_position: QPointF,
             fade_in: bool,
@@ -39,7 +40,7 @@ class PowAnimation(StaticAnimation):
 
         Args:
             animation_type (str): The type of animation.
-            sound (QSoundEffect): The sound effect to play.
+            sound (Optional[SoundCue]): The preloaded sound to play.
             duration (int): The duration of the animation in milliseconds.
             starting_position (QPointF): The starting position of the animation.
             fade_in (bool): Whether the animation fades in.
@@ -81,6 +82,7 @@ class PowAnimation(StaticAnimation):
         self.scale_easing_style: QEasingCurve.Type = scale_easing_style
         self.phase_1_duration: int = phase_1_duration
         self.phase_2_duration: int = phase_2_duration
+        apply_cache_mode(self.animation_object, ITEM_KIND_SCALING)  # A cached bitmap would blur while scaled up
         self.scale_animation = QPropertyAnimation(self.animation_object, b"scale")
         self.scale_animation.setDuration(self.phase_1_duration)
         self.scale_animation.setStartValue(1.0)
@@ -96,3 +98,12 @@ class PowAnimation(StaticAnimation):
             self.jiggle_animation_sequence.addAnimation(self.jiggle_pause_animation)
             self.jiggle_animation_sequence.addAnimation(self.jiggle_animation)
             self.addAnimation(self.jiggle_animation_sequence)
+
+    def batch_path(self) -> Optional[Tuple[Sequence[float], QPointF, QEasingCurve.Type]]:
+        """
+        Get the path followed when this animation is driven by an AnimationBatch instead of its own timers.
+
+        Returns:
+            Optional[Tuple[Sequence[float], QPointF, QEasingCurve.Type]]: Always None, the batch does not animate scale.
+        """
+        return None
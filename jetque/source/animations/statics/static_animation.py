@@ -3,12 +3,12 @@
 import logging
 import math
 import random
-from typing import Optional
+from typing import Optional, Sequence, Tuple
 
 from PyQt6.QtCore import QEasingCurve, QPointF, QPropertyAnimation, QObject
-from PyQt6.QtMultimedia import QSoundEffect
 
 from jetque.source.animations.animation import Animation
+from jetque.source.managers.sound_cue import SoundCue
 
 # Constants
 JIGGLE_AMOUNT = 2.0
@@ -27,7 +27,7 @@ class StaticAnimation(Animation):
     def __init__(
             self,
             animation_type: str,
-            sound: QSoundEffect,
+            sound: Optional[SoundCue],
             duration: int,
             starting_position: QPointF,
             fade_in: bool,
@@ -47,7 +47,7 @@ class StaticAnimation(Animation):
 
         Args:
             animation_type (str): The type of animation.
-            sound (QSoundEffect): The sound effect to play.
+            sound (Optional[SoundCue]): The preloaded sound to play.
             duration (int): The duration of the animation in milliseconds.
             starting_position (QPointF): The starting position of the animation.
             fade_in (bool): Whether the animation fades in.
@@ -95,6 +95,18 @@ class StaticAnimation(Animation):
             self.jiggle_animation.setEndValue(self.starting_position)
             self.addAnimation(self.jiggle_animation)
 
+    def batch_path(self) -> Optional[Tuple[Sequence[float], QPointF, QEasingCurve.Type]]:
+        """
+        Get the path followed when this animation is driven by an AnimationBatch instead of its own timers.
+
+        Returns:
+            Optional[Tuple[Sequence[float], QPointF, QEasingCurve.Type]]:
+                The starting position held still, or None while jiggling since jiggles are random per loop.
+        """
+        if self.jiggle:
+            return None
+        return super().batch_path()
+
     def _apply_jiggle(self) -> None:
         """
         Apply a random jiggle effect to the AnimationTextItem position.
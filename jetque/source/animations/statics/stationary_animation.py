@@ -2,9 +2,9 @@
 from typing import Optional
 
 from PyQt6.QtCore import QEasingCurve, QPointF, QObject
-from PyQt6.QtMultimedia import QSoundEffect
 
 from jetque.source.animations.statics.static_animation import StaticAnimation
+from jetque.source.managers.sound_cue import SoundCue
 
 
 class StationaryAnimation(StaticAnimation):
@@ -15,7 +15,7 @@ class StationaryAnimation(StaticAnimation):
     def __init__(
             self,
             animation_type: str,
-            sound: QSoundEffect,
+            sound: Optional[SoundCue],
             duration: int,
             starting_position: QPointF,
             fade_in: bool,
@@ -35,7 +35,7 @@ class StationaryAnimation(StaticAnimation):
 
         Args:
             animation_type (str): The type of animation.
-            sound (QSoundEffect): The sound effect to play.
+            sound (Optional[SoundCue]): The preloaded sound to play.
             duration (int): The duration of the animation in milliseconds.
             starting_position (QPointF): The starting position of the animation.
             fade_in (bool): Whether the animation fades in.
@@ -0,0 +1,99 @@
+# jetque/source/gui/anchor_region_layout.py
+
+import logging
+from typing import List
+
+from PyQt6.QtCore import QRect, QRectF
+
+from jetque.source.animations.anchor_object import AnchorObject
+
+# Constants
+DEFAULT_REGION_MARGIN: float = 200.0  # Pixels around an anchor's circles that its animations may travel into
+
+
+class AnchorRegionLayout:
+    """
+    Computes the screen regions the animations of a set of anchors play in.
+
+    Each anchor covers the rect around its start and end circles, grown by a margin for animations that
+    travel past them. Overlapping regions are merged, so no part of the screen is shown by two region
+    views at once, which would composite the same translucent pixels twice.
+
+    Attributes:
+        geometry (QRectF): The overlay geometry in scene coordinates, regions never reach past it.
+        margin (float): Pixels around an anchor's circles that its animations may travel into.
+    """
+
+    def __init__(self, geometry: QRectF, margin: float = DEFAULT_REGION_MARGIN) -> None:
+        """
+        Initialize the layout for an overlay geometry.
+
+        Args:
+            geometry (QRectF): The overlay geometry in scene coordinates.
+            margin (float): Pixels around an anchor's circles that its animations may travel into.
+        """
+        self.geometry: QRectF = QRectF(geometry)
+        self.margin: float = margin
+
+    def set_geometry(self, geometry: QRectF) -> None:
+        """
+        Update the overlay geometry, e.g. after the screen changed.
+
+        Args:
+            geometry (QRectF): The new overlay geometry in scene coordinates.
+        """
+        self.geometry = QRectF(geometry)
+
+    def anchor_region(self, anchor: AnchorObject) -> QRectF:
+        """
+        Get the region an anchor's animations play in.
+
+        Args:
+            anchor (AnchorObject): The anchor.
+
+        Returns:
+            QRectF: The rect around the anchor's circles grown by the margin, clipped to the overlay geometry.
+        """
+        circles: QRectF = anchor.start_circle.sceneBoundingRect().united(anchor.end_circle.sceneBoundingRect())
+        return circles.adjusted(-self.margin, -self.margin, self.margin, self.margin).intersected(self.geometry)
+
+    def regions(self, anchors: List[AnchorObject]) -> List[QRect]:
+        """
+        Get the merged regions of a set of anchors.
+
+        Args:
+            anchors (List[AnchorObject]): The anchors whose animations are displayed.
+
+        Returns:
+            List[QRect]: Non-overlapping regions in scene coordinates, aligned to whole pixels.
+        """
+        try:
+            return self.merge([self.anchor_region(anchor).toAlignedRect() for anchor in anchors])
+        except Exception as e:
+            logging.exception("Error computing anchor regions: %s", e)
+            return [self.geometry.toAlignedRect()]
+
+    @staticmethod
+    def merge(rects: List[QRect]) -> List[QRect]:
+        """
+        Replace overlapping rects by their bounding rect until no two rects overlap.
+
+        Args:
+            rects (List[QRect]): The rects to merge, empty rects are dropped.
+
+        Returns:
+            List[QRect]: The merged rects.
+        """
+        merged: List[QRect] = [QRect(rect) for rect in rects if not rect.isEmpty()]
+        changed: bool = True
+        while changed:
+            changed = False
+            for index, rect in enumerate(merged):
+                for other_index in range(index + 1, len(merged)):
+                    if rect.intersects(merged[other_index]):
+                        merged[index] = rect.united(merged.pop(other_index))
+                        changed = True
+                        break
+                if changed:
+                    break
+        return merged
@@ -0,0 +1,118 @@
+# jetque/source/gui/dirty_region_tracker.py
+
+import logging
+from typing import List, Optional
+
+from PyQt6.QtCore import QObject, QRect, QRectF
+from PyQt6.QtGui import QRegion
+from PyQt6.QtWidgets import QGraphicsView
+
+# Constants
+DEFAULT_FULL_UPDATE_THRESHOLD: float = 0.35  # Dirty share of the viewport above which the whole viewport is repainted
+DIRTY_RECT_MARGIN: int = 2  # Pixels added around every dirty rect for antialiased edges, like QGraphicsView does
+
+
+class DirtyRegionTracker(QObject):
+    """
+    Repaints only the parts of a view's viewport that changed, instead of the whole viewport every frame.
+
+    The scene reports the old and new bounding rects of every item that moved or changed through its changed
+    signal, the tracker maps them to the viewport and repaints their union. When the dirty area passes a share
+    of the viewport, a single full update is cheaper than clipping to many rects, so the whole viewport is
+    repainted instead. The view should use NoViewportUpdate while the tracker is enabled, so it does not
+    schedule repaints of its own.
+
+    Attributes:
+        view (QGraphicsView): The view whose viewport is repainted.
+        full_update_threshold (float): Dirty share of the viewport above which the whole viewport is repainted.
+        enabled (bool): Whether scene changes are being tracked.
+        last_dirty_fraction (float): Dirty share of the viewport of the last change.
+        last_region (QRegion): The region repainted for the last change, empty after a full update.
+        full_updates (int): Number of changes that repainted the whole viewport.
+        partial_updates (int): Number of changes that repainted only their dirty region.
+    """
+
+    def __init__(
+            self,
+            view: QGraphicsView,
+            full_update_threshold: float = DEFAULT_FULL_UPDATE_THRESHOLD,
+            parent: Optional[QObject] = None
+    ) -> None:
+        """
+        Initialize a disabled tracker for a view.
+
+        Args:
+            view (QGraphicsView): The view whose viewport is repainted.
+            full_update_threshold (float): Dirty share of the viewport above which the whole viewport is repainted.
+            parent (Optional[QObject]): The parent object.
+        """
+        super().__init__(parent)
+        self.view: QGraphicsView = view
+        self.full_update_threshold: float = full_update_threshold
+        self.enabled: bool = False
+        self.last_dirty_fraction: float = 0.0
+        self.last_region: QRegion = QRegion()
+        self.full_updates: int = 0
+        self.partial_updates: int = 0
+
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Start or stop tracking the changes of the view's scene.
+
+        Args:
+            enabled (bool): True to repaint dirty regions of the viewport on scene changes.
+        """
+        if enabled == self.enabled or self.view.scene() is None:
+            return
+        try:
+            if enabled:
+                self.view.scene().changed.connect(self.handle_scene_changed)
+            else:
+                self.view.scene().changed.disconnect(self.handle_scene_changed)
+            self.enabled = enabled
+        except Exception as e:
+            logging.exception("Error switching dirty region tracking: %s", e)
+
+    def handle_scene_changed(self, rects: List[QRectF]) -> None:
+        """
+        Repaint the part of the viewport covered by changed scene rects, or all of it past the threshold.
+
+        The dirty area is the sum of the rect areas, so overlapping rects count twice and the tracker
+        rather falls back to a full update than clips to a region that covers most of the viewport anyway.
+
+        Args:
+            rects (List[QRectF]): The changed rects in scene coordinates.
+        """
+        if not rects:
+            return
+        try:
+            viewport_rect: QRect = self.view.viewport().rect()
+            viewport_area: int = max(1, viewport_rect.width() * viewport_rect.height())
+            dirty_rects: List[QRect] = []
+            dirty_area: int = 0
+            for rect in rects:
+                dirty_rect: QRect = self.view.mapFromScene(rect).boundingRect().adjusted(
+                    -DIRTY_RECT_MARGIN, -DIRTY_RECT_MARGIN, DIRTY_RECT_MARGIN, DIRTY_RECT_MARGIN
+                ).intersected(viewport_rect)
+                if dirty_rect.isEmpty():
+                    continue
+                dirty_rects.append(dirty_rect)
+                dirty_area += dirty_rect.width() * dirty_rect.height()
+
+            self.last_dirty_fraction = dirty_area / viewport_area
+            if self.last_dirty_fraction >= self.full_update_threshold:
+                self.last_region = QRegion()
+                self.full_updates += 1
+                self.view.viewport().update()
+                return
+
+            region: QRegion = QRegion()
+            for dirty_rect in dirty_rects:
+                region = region.united(dirty_rect)
+            if region.isEmpty():
+                return
+            self.last_region = region
+            self.partial_updates += 1
+            self.view.viewport().update(region)
+        except Exception as e:
+            logging.exception("Error repainting dirty region: %s", e)
@@ -0,0 +1,151 @@
+# jetque/source/gui/frame_timing.py
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Constants
+DEFAULT_FRAME_TIMING_CAPACITY: int = 1024  # Frames kept in the ring buffer, about 7 seconds at 144 Hz
+DEFAULT_REFRESH_RATE: float = 60.0  # Display refresh rate in Hz when the screen does not report one
+IDLE_GAP: float = 250.0  # Milliseconds between frames after which rendering is considered to have been asleep
+DROPPED_FRAME_TOLERANCE: float = 1.5  # Refresh intervals a frame interval may last before frames count as dropped
+PERCENTILES: Tuple[int, ...] = (50, 95, 99)
+HISTOGRAM_BUCKETS: List[float] = [0.0, 1.0, 2.0, 4.0, 6.94, 8.33, 11.11, 16.67, 33.33, float("inf")]  # Milliseconds
+
+
+class FrameTimingRecorder:
+    """
+    Records paint durations and frame intervals of a view in fixed-size ring buffers.
+
+    Recording a frame only writes two floats into preallocated arrays, percentiles and histograms are computed
+    when asked for. Frame intervals longer than the display's refresh interval count the refreshes they missed as
+    dropped frames, except for gaps long enough that rendering was asleep because nothing was animating.
+
+    Attributes:
+        capacity (int): Number of frames kept.
+        refresh_rate (float): Refresh rate of the display in Hz.
+        paint_durations (np.ndarray): Paint duration of the most recent frames in milliseconds.
+        frame_intervals (np.ndarray): Time between the starts of the most recent consecutive frames in milliseconds.
+        frame_count (int): Number of frames recorded since the last reset.
+        interval_count (int): Number of frame intervals recorded since the last reset.
+        dropped_frames (int): Number of refreshes missed since the last reset.
+        last_frame_start (Optional[float]): Start time of the last frame in milliseconds.
+    """
+
+    def __init__(
+            self,
+            capacity: int = DEFAULT_FRAME_TIMING_CAPACITY,
+            refresh_rate: float = DEFAULT_REFRESH_RATE
+    ) -> None:
+        """
+        Initialize empty ring buffers.
+
+        Args:
+            capacity (int): Number of frames kept.
+            refresh_rate (float): Refresh rate of the display in Hz.
+        """
+        self.capacity: int = capacity
+        self.refresh_rate: float = refresh_rate
+        self.paint_durations: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        self.frame_intervals: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        self.frame_count: int = 0
+        self.interval_count: int = 0
+        self.dropped_frames: int = 0
+        self.last_frame_start: Optional[float] = None
+
+    def set_refresh_rate(self, refresh_rate: float) -> None:
+        """
+        Set the refresh rate dropped frames are counted against.
+
+        Args:
+            refresh_rate (float): Refresh rate of the display in Hz, ignored unless positive.
+        """
+        if refresh_rate > 0.0:
+            self.refresh_rate = refresh_rate
+
+    def reset(self) -> None:
+        """Forget every recorded frame."""
+        self.frame_count = 0
+        self.interval_count = 0
+        self.dropped_frames = 0
+        self.last_frame_start = None
+
+    def record(self, frame_start: float, frame_end: float) -> None:
+        """
+        Record one painted frame.
+
+        Args:
+            frame_start (float): Time the paint started in milliseconds.
+            frame_end (float): Time the paint ended in milliseconds.
+        """
+        self.paint_durations[self.frame_count % self.capacity] = frame_end - frame_start
+        self.frame_count += 1
+
+        if self.last_frame_start is not None:
+            interval: float = frame_start - self.last_frame_start
+            if interval < IDLE_GAP:
+                self.frame_intervals[self.interval_count % self.capacity] = interval
+                self.interval_count += 1
+                refresh_interval: float = 1000.0 / self.refresh_rate
+                if interval > refresh_interval * DROPPED_FRAME_TOLERANCE:
+                    self.dropped_frames += int(round(interval / refresh_interval)) - 1
+        self.last_frame_start = frame_start
+
+    def percentiles(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the percentiles of the recorded paint durations and frame intervals.
+
+        Returns:
+            Dict[str, Dict[str, float]]: "paint" and "interval" percentiles in milliseconds keyed "p50", "p95"
+                                         and "p99", empty while nothing was recorded.
+        """
+        summary: Dict[str, Dict[str, float]] = {}
+        for name, samples in (("paint", self._paint_samples()), ("interval", self._interval_samples())):
+            if len(samples):
+                values: np.ndarray = np.percentile(samples, PERCENTILES)
+                summary[name] = {f"p{percentile}": float(value) for percentile, value in zip(PERCENTILES, values)}
+            else:
+                summary[name] = {}
+        return summary
+
+    def histogram(self) -> Dict[str, int]:
+        """
+        Get the number of recorded paint durations per bucket.
+
+        Returns:
+            Dict[str, int]: Frame counts keyed by bucket, e.g. "4.00-6.94" milliseconds or "33.33+".
+        """
+        counts, _ = np.histogram(self._paint_samples(), bins=HISTOGRAM_BUCKETS)
+        labels: List[str] = [
+            f"{low:.2f}+" if high == float("inf") else f"{low:.2f}-{high:.2f}"
+            for low, high in zip(HISTOGRAM_BUCKETS[:-1], HISTOGRAM_BUCKETS[1:])
+        ]
+        return {label: int(count) for label, count in zip(labels, counts)}
+
+    def summary(self) -> Dict[str, object]:
+        """
+        Get every statistic of the recorded frames.
+
+        Returns:
+            Dict[str, object]: Frame and dropped frame counts, refresh rate, percentiles and histogram.
+        """
+        try:
+            return {
+                "frames": self.frame_count,
+                "dropped_frames": self.dropped_frames,
+                "refresh_rate": self.refresh_rate,
+                "percentiles": self.percentiles(),
+                "histogram": self.histogram(),
+            }
+        except Exception as e:
+            logging.exception("Error summarizing frame timing: %s", e)
+            return {}
+
+    def _paint_samples(self) -> np.ndarray:
+        """Get the paint durations currently held by the ring buffer."""
+        return self.paint_durations[:min(self.frame_count, self.capacity)]
+
+    def _interval_samples(self) -> np.ndarray:
+        """Get the frame intervals currently held by the ring buffer."""
+        return self.frame_intervals[:min(self.interval_count, self.capacity)]
@@ -1,15 +1,18 @@
 import logging
-import math
 from typing import Optional
 
 from PyQt6.QtCore import QPointF, Qt, QRectF
-from PyQt6.QtGui import QColor, QPixmap, QImage, QPainter, QPen
+from PyQt6.QtGui import QColor, QGuiApplication, QPainter, QPixmap, QPen
 from PyQt6.QtWidgets import (
     QGraphicsDropShadowEffect,
     QGraphicsPixmapItem,
     QGraphicsItem,
 )
 
+from jetque.source.gui.cache_policy import ITEM_KIND_SPRITE, apply_cache_mode
+from jetque.source.managers.icon_cache import IconCache
+from jetque.source.managers.sprite_cache import Sprite, SpriteCache
+
 
 class JQGraphicsPixmapItem(QGraphicsPixmapItem):
     """
@@ -24,10 +27,13 @@ class JQGraphicsPixmapItem(QGraphicsPixmapItem):
         drop_shadow_blur_radius (float): Blur radius of the drop shadow.
         drop_shadow_color (QColor): Color of the drop shadow.
         alignment (str): If the item is on the left or right of the Parent graphics item.
-        drop_shadow_effect (QGraphicsDropShadowEffect): Drop shadow effect applied.
+        drop_shadow_effect (QGraphicsDropShadowEffect): Parameters of the drop shadow baked into the sprite.
         collision_rect (QRectF): Collision rectangle (not including drop shadow).
         _bounding_rect (QRectF): Cached bounding rectangle including drop shadow.
         original_pixmap (QPixmap): The originally loaded (or outlined) pixmap before scaling.
+        icon_cache (IconCache): Cache the outlined and scaled pixmaps are looked up in.
+        sprite_cache (SpriteCache): Cache the pixmap and its drop shadow are rendered into.
+        sprite (Optional[Sprite]): The pixmap over its baked drop shadow, or None without a drop shadow.
     """
 
     def __init__(
@@ -40,7 +46,9 @@ class JQGraphicsPixmapItem(QGraphicsPixmapItem):
             drop_shadow_blur_radius: float = 7.0,
             drop_shadow_color: QColor = QColor(0, 0, 0, 191),
             alignment: str = "left",
+            icon_cache: Optional[IconCache] = None,
             parent: Optional[QGraphicsItem] = None,
+            sprite_cache: Optional[SpriteCache] = None,
     ) -> None:
         super().__init__(parent)
 
@@ -56,26 +64,25 @@ class JQGraphicsPixmapItem(QGraphicsPixmapItem):
         self.collision_rect: QRectF = QRectF()
         self._bounding_rect: QRectF = QRectF()
         self.original_pixmap: QPixmap = QPixmap()
+        self.icon_cache: IconCache = icon_cache if icon_cache is not None else IconCache.shared()
+        self.sprite_cache: SpriteCache = sprite_cache if sprite_cache is not None else SpriteCache.shared()
+        self.sprite: Optional[Sprite] = None
 
         try:
-            # Load the pixmap with optional outline
-            if self.outline:
-                pixmap = self._add_outline_to_image()
-            else:
-                pixmap = QPixmap(self.file_path)
-
-            self.original_pixmap = pixmap
+            # Look up the pixmap with optional outline
+            self.original_pixmap = self.icon_cache.pixmap(self.file_path, self._cache_outline_pen())
             self.setPixmap(self.original_pixmap)
 
-            # Apply drop shadow effect if requested
+            # Configure the drop shadow, it is baked into the sprite instead of attached as a live effect
             if self.drop_shadow:
                 self.drop_shadow_effect.setOffset(self.drop_shadow_offset)
                 self.drop_shadow_effect.setBlurRadius(self.drop_shadow_blur_radius)
                 self.drop_shadow_effect.setColor(self.drop_shadow_color)
-                self.setGraphicsEffect(self.drop_shadow_effect)
 
             self.prepareGeometryChange()
             self._bounding_rect = self.calculate_bounding_rect()
+            self.update_sprite()
+            apply_cache_mode(self, ITEM_KIND_SPRITE)  # A pixmap blit with or without a baked drop shadow
 
             # Set the origin point to the center for transformations
             self.setTransformOriginPoint(
@@ -89,6 +96,48 @@ class JQGraphicsPixmapItem(QGraphicsPixmapItem):
     def boundingRect(self) -> QRectF:
         return self._bounding_rect
 
+    def paint(self, painter: QPainter, option, widget=None) -> None:
+        """
+        Blit the pixmap over its baked drop shadow, or draw the pixmap directly without a drop shadow.
+
+        Args:
+            painter (QPainter): The painter used to draw the item.
+            option: Style options for the item.
+            widget (optional): The widget being painted on.
+        """
+        if self.sprite is None or self.sprite.pixmap.isNull():
+            super().paint(painter, option, widget)
+            return
+        painter.drawPixmap(self.sprite.rect.topLeft(), self.sprite.pixmap)
+
+    def update_sprite(self) -> None:
+        """
+        Render the current pixmap over its drop shadow once, so painting the item does not blur the shadow every frame.
+        """
+        if not self.drop_shadow:
+            self.sprite = None
+            return
+        try:
+            screen = QGuiApplication.primaryScreen()
+            pixmap_rect: QRectF = QRectF(self.offset(), self.pixmap().deviceIndependentSize())
+            sprite: Sprite = self.sprite_cache.sprite(
+                ("JQGraphicsPixmapItem", self.pixmap().cacheKey()),
+                pixmap_rect,
+                lambda painter: painter.drawPixmap(self.offset(), self.pixmap()),
+                screen.devicePixelRatio() if screen is not None else 1.0
+            )
+            self.sprite = self.sprite_cache.shadowed(
+                sprite,
+                self.drop_shadow_effect.offset(),
+                self.drop_shadow_effect.blurRadius(),
+                self.drop_shadow_effect.color()
+            )
+            self.prepareGeometryChange()  # The blurred shadow may reach past the offset
+            self._bounding_rect = self._bounding_rect.united(self.sprite.rect)
+        except Exception as e:
+            logging.exception("Failed to update JQGraphicsPixmapItem sprite: %s", e)
+            self.sprite = None
+
     def setParentItem(self, parent: Optional[QGraphicsItem]) -> None:
         super().setParentItem(parent)
         self._scale_and_position_pixmap_item()
@@ -119,50 +168,6 @@ class JQGraphicsPixmapItem(QGraphicsPixmapItem):
             logging.exception("Failed to calculate boundingRect: %s", e)
             return super().boundingRect()
 
-    def _add_outline_to_image(self) -> QPixmap:
-        original_image: QImage = QImage(self.file_path)
-
-        if original_image.format() != QImage.Format.Format_ARGB32_Premultiplied:
-            original_image = original_image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
-
-        local_pen: QPen = QPen(self.outline_pen)
-        local_pen.setWidthF(local_pen.widthF() * 2.0)
-        pen_width: float = local_pen.widthF()
-        half_pen_width: float = pen_width / 2.0
-        padding: int = math.ceil(half_pen_width)
-        under_padding: float = (1.0 - (padding - half_pen_width)) / 2.0
-        if under_padding.is_integer():
-            under_padding = 0.0
-
-        new_width: int = original_image.width() + 2 * padding
-        new_height: int = original_image.height() + 2 * padding
-
-        new_image: QImage = QImage(new_width, new_height, QImage.Format.Format_ARGB32_Premultiplied)
-        new_image.fill(Qt.GlobalColor.transparent)
-
-        painter: QPainter = QPainter(new_image)
-        try:
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-            painter.setPen(local_pen)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-
-            rect: QRectF = QRectF(
-                padding - under_padding,
-                padding - under_padding,
-                original_image.width(),
-                original_image.height(),
-                )
-
-            painter.drawRect(rect)
-            painter.drawImage(QPointF(padding, padding), original_image)
-        except Exception as e:
-            logging.exception("Failed to add outline to image: %s", e)
-        finally:
-            painter.end()
-
-        outlined_pixmap: QPixmap = QPixmap.fromImage(new_image)
-        return outlined_pixmap
-
     def _scale_and_position_pixmap_item(self) -> None:
         """
         Scale and position the pixmap item relative to the text item by physically resizing the pixmap.
@@ -180,17 +185,11 @@ class JQGraphicsPixmapItem(QGraphicsPixmapItem):
             if orig_height == 0:
                 return
 
-            # Calculate scale factor
-            scale_factor: float = text_height / orig_height
-
-            # Scale the original pixmap physically
-            scaled_width = int(self.original_pixmap.width() * scale_factor)
-            scaled_height = int(self.original_pixmap.height() * scale_factor)
-            scaled_pixmap = self.original_pixmap.scaled(
-                scaled_width,
-                scaled_height,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
+            # Look up the pixmap scaled to the text height
+            scaled_pixmap: QPixmap = self.icon_cache.pixmap(
+                self.file_path,
+                self._cache_outline_pen(),
+                height=int(text_height)
             )
 
             # Set the newly scaled pixmap
@@ -199,6 +198,7 @@ class JQGraphicsPixmapItem(QGraphicsPixmapItem):
 
             # Recalculate bounding and collision rects
             self._bounding_rect = self.calculate_bounding_rect()
+            self.update_sprite()
 
             # Update transform origin point
             self.setTransformOriginPoint(
@@ -225,3 +225,12 @@ class JQGraphicsPixmapItem(QGraphicsPixmapItem):
 
         except Exception as e:
             logging.exception("Failed to scale and position pixmap item: %s", e)
+
+    def _cache_outline_pen(self) -> Optional[QPen]:
+        """
+        Get the outline pen the icon cache variant is keyed by.
+
+        Returns:
+            Optional[QPen]: The outline pen, or None when the item is not outlined.
+        """
+        return self.outline_pen if self.outline else None
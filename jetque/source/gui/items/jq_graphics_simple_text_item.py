@@ -2,8 +2,12 @@ import logging
 from typing import Optional
 
 from PyQt6.QtCore import QPointF, Qt, QRectF, QObject
-from PyQt6.QtGui import QColor, QFont, QPen
-from PyQt6.QtWidgets import QGraphicsDropShadowEffect, QGraphicsSimpleTextItem, QGraphicsItem
+from PyQt6.QtGui import QColor, QFont, QGuiApplication, QPainter, QPen
+from PyQt6.QtWidgets import QGraphicsDropShadowEffect, QGraphicsSimpleTextItem, QGraphicsItem, QStyleOptionGraphicsItem
+
+from jetque.source.gui.cache_policy import ITEM_KIND_LIVE_TEXT, ITEM_KIND_SPRITE, apply_cache_mode
+from jetque.source.managers.icon_cache import pen_key
+from jetque.source.managers.sprite_cache import Sprite, SpriteCache
 
 
 class JQGraphicsSimpleTextItem(QGraphicsSimpleTextItem):
@@ -15,9 +19,11 @@ class JQGraphicsSimpleTextItem(QGraphicsSimpleTextItem):
         color (QColor): Color of the text to display.
         outline_pen (QPen): Pen used for the text outline.
         drop_shadow (bool): Flag to enable or disable drop shadow effect.
-        drop_shadow_effect (QGraphicsDropShadowEffect): Effect for the text drop shadow.
+        drop_shadow_effect (QGraphicsDropShadowEffect): Parameters of the drop shadow baked into the sprite.
         collision_rect (QRectF): Rectangle used for collision detection.
         _bounding_rect (QRectF): Cached bounding rectangle of the item.
+        sprite_cache (SpriteCache): Cache the text and its drop shadow are rendered into.
+        sprite (Optional[Sprite]): The text over its baked drop shadow, or None without a drop shadow.
     """
 
     def __init__(
@@ -31,7 +37,8 @@ class JQGraphicsSimpleTextItem(QGraphicsSimpleTextItem):
             drop_shadow_offset: QPointF = QPointF(3.5, 6.1),
             drop_shadow_blur_radius: float = 7.0,
             drop_shadow_color: QColor = QColor(0, 0, 0, 191),
-            parent: Optional[QGraphicsItem] = None
+            parent: Optional[QGraphicsItem] = None,
+            sprite_cache: Optional[SpriteCache] = None
     ) -> None:
         """
         Initialize the JQGraphicsSimpleTextItem with specified properties.
@@ -47,6 +54,7 @@ class JQGraphicsSimpleTextItem(QGraphicsSimpleTextItem):
             drop_shadow_blur_radius (float, optional): Blur radius for the drop shadow.
             drop_shadow_color (QColor, optional): Color of the drop shadow.
             parent (Optional[QGraphicsItem], optional): Parent QGraphicsItem.
+            sprite_cache (Optional[SpriteCache], optional): Cache for the baked drop shadow, the shared one by default.
         """
         super().__init__(parent)
 
@@ -60,6 +68,8 @@ class JQGraphicsSimpleTextItem(QGraphicsSimpleTextItem):
             self.drop_shadow_effect: QGraphicsDropShadowEffect = QGraphicsDropShadowEffect()
             self.collision_rect: QRectF = QRectF()
             self._bounding_rect: QRectF = QRectF()
+            self.sprite_cache: SpriteCache = sprite_cache if sprite_cache is not None else SpriteCache.shared()
+            self.sprite: Optional[Sprite] = None
 
             if self.outline:
                 # Apply outline effect
@@ -69,18 +79,17 @@ class JQGraphicsSimpleTextItem(QGraphicsSimpleTextItem):
             self.setBrush(self.color)
 
             if self.drop_shadow:
-                # Apply drop shadow effect
+                # Configure the drop shadow, it is baked into the sprite instead of attached as a live effect
                 self.drop_shadow_effect.setOffset(drop_shadow_offset)
                 self.drop_shadow_effect.setBlurRadius(drop_shadow_blur_radius)
                 self.drop_shadow_effect.setColor(drop_shadow_color)
-                self.prepareGeometryChange()  # Call before boundingRect changes
-                self.setGraphicsEffect(self.drop_shadow_effect)
 
             self.prepareGeometryChange()  # Call before boundingRect changes
             self._bounding_rect = self._calculate_bounding_rect()
 
             # Set the origin point to the center for transformations (excludes drop shadow)
             self.setTransformOriginPoint(self.collision_rect.width() / 2.0, self.collision_rect.height() / 2.0)
+            self.update_sprite()
         except Exception as e:
             logging.exception("Failed to initialize JQGraphicsSimpleTextItem: %s", e)
 
@@ -122,3 +131,63 @@ class JQGraphicsSimpleTextItem(QGraphicsSimpleTextItem):
         except Exception as e:
             logging.exception("Failed to calculate boundingRect: %s", e)
             return super().boundingRect()
+
+    def update_sprite(self) -> None:
+        """
+        Render the text over its drop shadow once, so painting the item does not blur the shadow every frame.
+
+        Call it again after changing the text, font, colors or drop shadow of the item.
+        """
+        if not self.drop_shadow:
+            self.sprite = None
+            apply_cache_mode(self, ITEM_KIND_LIVE_TEXT)
+            return
+        try:
+            screen = QGuiApplication.primaryScreen()
+            sprite: Sprite = self.sprite_cache.sprite(
+                (
+                    "JQGraphicsSimpleTextItem",
+                    self.font().key(),
+                    self.text(),
+                    self.brush().color().rgba(),
+                    pen_key(self.pen()) if self.outline else None
+                ),
+                self.collision_rect,
+                self._render_text,
+                screen.devicePixelRatio() if screen is not None else 1.0
+            )
+            self.sprite = self.sprite_cache.shadowed(
+                sprite,
+                self.drop_shadow_effect.offset(),
+                self.drop_shadow_effect.blurRadius(),
+                self.drop_shadow_effect.color()
+            )
+            self.prepareGeometryChange()  # The blurred shadow may reach past the offset
+            self._bounding_rect = self._calculate_bounding_rect().united(self.sprite.rect)
+        except Exception as e:
+            logging.exception("Failed to update JQGraphicsSimpleTextItem sprite: %s", e)
+            self.sprite = None
+        apply_cache_mode(self, ITEM_KIND_LIVE_TEXT if self.sprite is None else ITEM_KIND_SPRITE)
+
+    def paint(self, painter: QPainter, option, widget=None) -> None:
+        """
+        Blit the text over its baked drop shadow, or draw the text directly without a drop shadow.
+
+        Args:
+            painter (QPainter): The painter used to draw the item.
+            option: Style options for the item.
+            widget (optional): The widget being painted on.
+        """
+        if self.sprite is None or self.sprite.pixmap.isNull():
+            super().paint(painter, option, widget)
+            return
+        painter.drawPixmap(self.sprite.rect.topLeft(), self.sprite.pixmap)
+
+    def _render_text(self, painter: QPainter) -> None:
+        """
+        Draw the text the way QGraphicsSimpleTextItem does, used to render its sprite.
+
+        Args:
+            painter (QPainter): The painter of the sprite image, in item coordinates.
+        """
+        super().paint(painter, QStyleOptionGraphicsItem(), None)
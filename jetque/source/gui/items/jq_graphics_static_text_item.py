@@ -0,0 +1,504 @@
+# jetque/source/gui/items/jq_graphics_static_text_item.py
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Hashable, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QPointF, QRectF, Qt
+from PyQt6.QtGui import (
+    QColor, QFont, QFontMetricsF, QGlyphRun, QGuiApplication, QPainter, QPainterPath, QPen, QPixmap, QRawFont,
+    QTextLayout, QTextLine, QTextOption
+)
+from PyQt6.QtWidgets import QGraphicsItem, QGraphicsObject
+
+from jetque.source.gui.cache_policy import (
+    ITEM_KIND_BATCHED, ITEM_KIND_LIVE_TEXT, ITEM_KIND_SPRITE, apply_cache_mode, batches_sprites
+)
+from jetque.source.gui.sprite_batch_renderer import SPRITE_BATCH_PROPERTY
+from jetque.source.managers.font_cache import FontCache
+from jetque.source.managers.glyph_cache import GlyphCache
+from jetque.source.managers.icon_cache import pen_key
+from jetque.source.managers.sprite_cache import ANTIALIASING_PADDING, TEXT_MARGIN, Sprite, SpriteCache, render_pixmap
+
+# Constants
+STATIC_TEXT_CACHE_SIZE: int = 256  # Text layouts kept with their outlines, e.g. recurring skill names
+SIMPLE_TEXT_LIMIT: int = 0x0300  # Characters below the combining marks are drawn without shaping
+
+
+@dataclass
+class StaticTextLayout:
+    """
+    The positioned glyphs and outline of a text, shared by every item showing the same text in the same font.
+
+    Attributes:
+        font (QFont): The font of the text.
+        text (str): The text, always shown as plain text.
+        outline_pen (Optional[QPen]): The outline pen, or None for no outline.
+        device_pixel_ratio (float): The device pixel ratio the outline is rendered at.
+        glyph_runs (List[QGlyphRun]): The glyphs of the text, positioned in item coordinates.
+        layout_rect (QRectF): The text box, placed like the text of SpriteCache.text_sprite.
+        ink_rect (QRectF): The rectangle covered by the glyphs and their outline.
+        advance (float): The horizontal advance of the text.
+        line_height (float): The height of a line of the font.
+        baseline (QPointF): The origin of the glyphs' baseline.
+        outline_layers (List[Tuple[QPointF, QPixmap]]): Where each rendered glyph outline is drawn, in item
+                                                        coordinates, resolved when the layout is created.
+    """
+    font: QFont
+    text: str
+    outline_pen: Optional[QPen]
+    device_pixel_ratio: float
+    glyph_runs: List[QGlyphRun]
+    layout_rect: QRectF
+    ink_rect: QRectF
+    advance: float
+    line_height: float
+    baseline: QPointF
+    outline_layers: List[Tuple[QPointF, QPixmap]] = field(default_factory=list)
+
+
+_layouts: "OrderedDict[Hashable, StaticTextLayout]" = OrderedDict()
+
+
+def static_text_layout(
+        font: QFont,
+        text: str,
+        outline_pen: Optional[QPen] = None,
+        font_metrics: Optional[QFontMetricsF] = None,
+        device_pixel_ratio: float = 1.0,
+        glyph_cache: Optional[GlyphCache] = None,
+        font_cache: Optional[FontCache] = None
+) -> StaticTextLayout:
+    """
+    Get the layout of a text, positioning its glyphs and composing its outline only the first time.
+
+    The outline is assembled from glyph outlines rendered once per glyph by the glyph cache, so neither creating
+    the layout of a new text nor painting it strokes the outline of the whole text.
+
+    Args:
+        font (QFont): The font of the text.
+        text (str): The text, always shown as plain text.
+        outline_pen (Optional[QPen]): The outline pen, or None for no outline.
+        font_metrics (Optional[QFontMetricsF]): Shared metrics of font, measured here if not provided.
+        device_pixel_ratio (float): The device pixel ratio the outline is displayed at.
+        glyph_cache (Optional[GlyphCache]): Cache of the glyph outlines, the shared one by default.
+        font_cache (Optional[FontCache]): Cache the advance of the text is memoised in, the shared one by default.
+
+    Returns:
+        StaticTextLayout: The cached layout.
+    """
+    key: Hashable = (font.key(), text, pen_key(outline_pen), device_pixel_ratio)
+    layout: Optional[StaticTextLayout] = _layouts.get(key)
+    if layout is not None:
+        _layouts.move_to_end(key)
+        return layout
+
+    glyph_cache = glyph_cache if glyph_cache is not None else GlyphCache.shared()
+    font_cache = font_cache if font_cache is not None else FontCache.shared()
+    metrics: QFontMetricsF = font_metrics if font_metrics is not None else font_cache.metrics(font)
+    baseline: QPointF = QPointF(TEXT_MARGIN, TEXT_MARGIN + metrics.ascent())
+    glyph_runs: List[QGlyphRun] = _position_glyphs(font, text, baseline, glyph_cache)
+    advance: float = font_cache.horizontal_advance(font, text)
+
+    padding: float = ANTIALIASING_PADDING + (outline_pen.widthF() / 2.0 if outline_pen is not None else 0.0)
+    layout_rect: QRectF = QRectF(0.0, 0.0, advance + 2.0 * TEXT_MARGIN, metrics.height() + 2.0 * TEXT_MARGIN)
+    ink_rect: QRectF = QRectF(
+        TEXT_MARGIN - padding,
+        TEXT_MARGIN - padding,
+        advance + 2.0 * padding,
+        metrics.height() + 2.0 * padding
+    ).united(layout_rect)
+
+    layout = StaticTextLayout(
+        font=QFont(font),
+        text=text,
+        outline_pen=QPen(outline_pen) if outline_pen is not None else None,
+        device_pixel_ratio=device_pixel_ratio,
+        glyph_runs=glyph_runs,
+        layout_rect=layout_rect,
+        ink_rect=ink_rect,
+        advance=advance,
+        line_height=metrics.height(),
+        baseline=baseline
+    )
+    if layout.outline_pen is not None:
+        _compose_outline(layout, glyph_cache)
+    _layouts[key] = layout
+    while len(_layouts) > STATIC_TEXT_CACHE_SIZE:
+        _layouts.popitem(last=False)
+    return layout
+
+
+def _position_glyphs(
+        font: QFont,
+        text: str,
+        baseline: QPointF,
+        glyph_cache: GlyphCache
+) -> List[QGlyphRun]:
+    """
+    Position the glyphs of a text on a baseline.
+
+    Texts of characters the font holds, without combining marks or complex scripts, are placed from the kerned
+    advances of the raw font, which costs a fraction of shaping them. Other texts, and fonts with spacing,
+    capitalization or decorations, are shaped by a QTextLayout.
+
+    Args:
+        font (QFont): The font of the text.
+        text (str): The text.
+        baseline (QPointF): The origin of the baseline.
+        glyph_cache (GlyphCache): Cache of the raw fonts.
+
+    Returns:
+        List[QGlyphRun]: The positioned glyphs.
+    """
+    if (
+            font.letterSpacing() == 0.0
+            and font.wordSpacing() == 0.0
+            and font.capitalization() == QFont.Capitalization.MixedCase
+            and not (font.underline() or font.overline() or font.strikeOut())
+            and all(ord(character) < SIMPLE_TEXT_LIMIT for character in text)
+    ):
+        raw_font: QRawFont = glyph_cache.raw_font(font)
+        glyph_indexes: List[int] = raw_font.glyphIndexesForString(text)
+        if glyph_indexes and all(glyph_indexes):
+            positions: List[QPointF] = []
+            x: float = baseline.x()
+            for glyph_advance in raw_font.advancesForGlyphIndexes(glyph_indexes, QRawFont.LayoutFlag.KernedAdvances):
+                positions.append(QPointF(x, baseline.y()))
+                x += glyph_advance.x()
+            glyph_run: QGlyphRun = QGlyphRun()
+            glyph_run.setRawFont(raw_font)
+            glyph_run.setGlyphIndexes(glyph_indexes)
+            glyph_run.setPositions(positions)
+            return [glyph_run]
+
+    text_layout: QTextLayout = QTextLayout(text, font)
+    text_option: QTextOption = QTextOption()
+    text_option.setWrapMode(QTextOption.WrapMode.NoWrap)
+    text_layout.setTextOption(text_option)
+    text_layout.beginLayout()
+    line: QTextLine = text_layout.createLine()
+    text_layout.endLayout()
+    if not line.isValid():
+        return []
+    line.setPosition(QPointF(baseline.x(), baseline.y() - line.ascent()))
+    return text_layout.glyphRuns()
+
+
+def _compose_outline(layout: StaticTextLayout, glyph_cache: GlyphCache) -> None:
+    """
+    Resolve where the rendered outline of every glyph of a layout is drawn, and widen its ink rect to cover them.
+
+    Decoration lines are not glyphs, so the outline of a decorated font is stroked along the whole text instead.
+
+    Args:
+        layout (StaticTextLayout): The layout of an outlined text.
+        glyph_cache (GlyphCache): Cache of the glyph outlines.
+    """
+    font: QFont = layout.font
+    outline_pen: QPen = layout.outline_pen
+    if font.underline() or font.overline() or font.strikeOut():
+        text_path: QPainterPath = QPainterPath()
+        text_path.addText(layout.baseline, font, layout.text)
+        outline_pixmap, outline_rect = render_pixmap(
+            layout.ink_rect, lambda painter: painter.strokePath(text_path, outline_pen), layout.device_pixel_ratio
+        )
+        if not outline_pixmap.isNull():
+            layout.outline_layers.append((outline_rect.topLeft(), outline_pixmap))
+        return
+
+    layout.outline_layers, outline_rect = glyph_cache.outline_layers(
+        layout.glyph_runs, outline_pen, layout.device_pixel_ratio
+    )
+    layout.ink_rect = layout.ink_rect.united(outline_rect)
+
+
+class JQGraphicsStaticTextItem(QGraphicsObject):
+    """
+    A lightweight text item for plain text, e.g. combat numbers.
+
+    The glyphs are positioned once per text and drawn as a glyph run over outlines and drop shadows rendered once
+    per glyph by a GlyphCache, so neither constructing nor painting the item lays out a QTextDocument or strokes
+    and blurs the whole text. Only the drop shadow of an icon is baked into a sprite, like the other JQGraphics
+    items do.
+
+    Attributes:
+        font (QFont): Font used for the text.
+        text (str): The text to display, never interpreted as rich text.
+        color (QColor): Color of the text to display.
+        outline (bool): Flag to enable or disable outline effect.
+        outline_pen (QPen): Pen used for the text outline.
+        drop_shadow (bool): Flag to enable or disable drop shadow effect.
+        drop_shadow_offset (QPointF): Offset of the drop shadow.
+        drop_shadow_blur_radius (float): Blur radius of the drop shadow.
+        drop_shadow_color (QColor): Color of the drop shadow.
+        icon_pixmap (Optional[QPixmap]): Icon drawn beside the text at the height of the font, or None.
+        icon_alignment (str): The side of the text the icon is drawn on, "left" or "right".
+        icon_padding (float): The gap between the icon and the text.
+        font_metrics (Optional[QFontMetricsF]): Shared metrics of the font, or None to measure them.
+        device_pixel_ratio (float): The device pixel ratio the outline, icon and sprite are rendered at.
+        layout (Optional[StaticTextLayout]): The shared glyphs and outline of the text.
+        glyph_cache (GlyphCache): Cache of the glyph outlines and drop shadows.
+        icon_rect (QRectF): Where the icon is drawn, null without an icon.
+        scaled_icon (QPixmap): The icon scaled to icon_rect once.
+        collision_rect (QRectF): Rectangle used for collision detection.
+        _bounding_rect (QRectF): Cached bounding rectangle of the item.
+        sprite_cache (SpriteCache): Cache the text, its icon and their drop shadow are rendered into.
+        shadow_layers (List[Tuple[QPointF, QPixmap]]): Where the drop shadow of each glyph is drawn.
+        sprite (Optional[Sprite]): The text and icon over their baked drop shadow, or None without an icon or
+                                   without a drop shadow.
+    """
+
+    def __init__(
+            self,
+            font: QFont = QFont("Helvetica"),
+            text: str = "No Message Set",
+            color: QColor = QColor(Qt.GlobalColor.white),
+            outline: bool = True,
+            outline_pen: QPen = QPen(Qt.GlobalColor.black, 2.0),
+            drop_shadow: bool = True,
+            drop_shadow_offset: QPointF = QPointF(3.5, 6.1),
+            drop_shadow_blur_radius: float = 7.0,
+            drop_shadow_color: QColor = QColor(0, 0, 0, 191),
+            icon_pixmap: Optional[QPixmap] = None,
+            icon_alignment: str = "left",
+            icon_padding: float = 0.0,
+            font_metrics: Optional[QFontMetricsF] = None,
+            parent_object: Optional[QObject] = None,
+            parent_item: Optional[QGraphicsItem] = None,
+            sprite_cache: Optional[SpriteCache] = None,
+            glyph_cache: Optional[GlyphCache] = None
+    ) -> None:
+        """
+        Initialize the JQGraphicsStaticTextItem with specified properties.
+
+        Args:
+            font (QFont, optional): Font used for the text.
+            text (str, optional): The text to display.
+            color (QColor, optional): Text color.
+            outline (bool, optional): Enable outline effect.
+            outline_pen (QPen, optional): Pen for the outline.
+            drop_shadow (bool, optional): Enable drop shadow effect.
+            drop_shadow_offset (QPointF, optional): Offset for the drop shadow.
+            drop_shadow_blur_radius (float, optional): Blur radius for the drop shadow.
+            drop_shadow_color (QColor, optional): Color of the drop shadow.
+            icon_pixmap (Optional[QPixmap], optional): Icon drawn beside the text, or None.
+            icon_alignment (str, optional): The side of the text the icon is drawn on, "left" or "right".
+            icon_padding (float, optional): The gap between the icon and the text.
+            font_metrics (Optional[QFontMetricsF], optional): Shared metrics of font, measured if not provided.
+            parent_object (Optional[QObject], optional): Parent QObject owning the item.
+            parent_item (Optional[QGraphicsItem], optional): Parent QGraphicsItem.
+            sprite_cache (Optional[SpriteCache], optional): Cache for the baked drop shadow, the shared one by default.
+            glyph_cache (Optional[GlyphCache], optional): Cache for the glyph outlines and shadows, the shared one
+                                                          by default.
+        """
+        super().__init__(parent_item)
+
+        try:
+            self.setParent(parent_object)
+            self.font: QFont = font
+            self.text: str = text
+            self.color: QColor = color
+            self.outline: bool = outline
+            self.outline_pen: QPen = outline_pen
+            self.drop_shadow: bool = drop_shadow
+            self.drop_shadow_offset: QPointF = drop_shadow_offset
+            self.drop_shadow_blur_radius: float = drop_shadow_blur_radius
+            self.drop_shadow_color: QColor = drop_shadow_color
+            self.icon_pixmap: Optional[QPixmap] = icon_pixmap
+            self.icon_alignment: str = icon_alignment
+            self.icon_padding: float = icon_padding
+            self.font_metrics: Optional[QFontMetricsF] = font_metrics
+            self.device_pixel_ratio: float = 1.0
+            self.layout: Optional[StaticTextLayout] = None
+            self.icon_rect: QRectF = QRectF()
+            self.scaled_icon: QPixmap = QPixmap()
+            self.collision_rect: QRectF = QRectF()
+            self._bounding_rect: QRectF = QRectF()
+            self.sprite_cache: SpriteCache = sprite_cache if sprite_cache is not None else SpriteCache.shared()
+            self.glyph_cache: GlyphCache = glyph_cache if glyph_cache is not None else GlyphCache.shared()
+            self.shadow_layers: List[Tuple[QPointF, QPixmap]] = []
+            self.sprite: Optional[Sprite] = None
+
+            self.update_sprite()
+        except Exception as e:
+            logging.exception("Failed to initialize JQGraphicsStaticTextItem: %s", e)
+
+    def boundingRect(self) -> QRectF:
+        """
+        Override the boundingRect method to provide the custom bounding rectangle.
+
+        Returns:
+            QRectF: The bounding rectangle of the item.
+        """
+        return self._bounding_rect
+
+    def update_sprite(self) -> None:
+        """
+        Look up the layout of the text, its glyph shadows and the icon, baking an icon over its drop shadow once.
+
+        Call it again after changing the text, font, colors, outline, icon or drop shadow of the item.
+        """
+        try:
+            self.device_pixel_ratio = self._get_device_pixel_ratio()
+            self.layout = static_text_layout(
+                self.font,
+                self.text,
+                self.outline_pen if self.outline else None,
+                self.font_metrics,
+                self.device_pixel_ratio,
+                self.glyph_cache
+            )
+            self._place_icon()
+
+            self.prepareGeometryChange()  # Call before boundingRect changes
+            self.collision_rect = self.layout.ink_rect.united(self.icon_rect)
+            # Set the origin point to the center of the text for transformations (excludes drop shadow)
+            self.setTransformOriginPoint(self.layout.layout_rect.center())
+
+            self.sprite = None
+            self.shadow_layers = []
+            bounding_rect: QRectF = self.collision_rect
+            if self.drop_shadow and not self.icon_rect.isNull():
+                # An icon is no glyph, so the shadow of the whole sprite is blurred once instead
+                self.sprite = self._shadowed_sprite()
+                bounding_rect = bounding_rect.united(self.sprite.rect)
+            elif self.drop_shadow:
+                self.shadow_layers, shadow_rect = self.glyph_cache.shadow_layers(
+                    self.layout.glyph_runs,
+                    self.color,
+                    self.outline_pen if self.outline else None,
+                    self.drop_shadow_offset,
+                    self.drop_shadow_blur_radius,
+                    self.drop_shadow_color,
+                    self.device_pixel_ratio
+                )
+                bounding_rect = bounding_rect.united(shadow_rect)
+            self._bounding_rect = bounding_rect.united(self.childrenBoundingRect())
+        except Exception as e:
+            logging.exception("Failed to update JQGraphicsStaticTextItem sprite: %s", e)
+            self.sprite = None
+        if self.sprite is None:
+            apply_cache_mode(self, ITEM_KIND_LIVE_TEXT)
+        else:
+            apply_cache_mode(self, ITEM_KIND_BATCHED if batches_sprites(self.scene()) else ITEM_KIND_SPRITE)
+
+    def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value: Any) -> Any:
+        """
+        Drop the item coordinate cache of a baked sprite when the item is added to a scene whose view batches
+        sprites, before Qt paints the sprite into a cache it would otherwise draw on top of the batch.
+
+        Args:
+            change (QGraphicsItem.GraphicsItemChange): The type of change.
+            value (Any): The value associated with the change.
+
+        Returns:
+            Any: The result of the change.
+        """
+        if (
+                change == QGraphicsItem.GraphicsItemChange.ItemSceneHasChanged
+                and getattr(self, "sprite", None) is not None
+                and batches_sprites(value)
+        ):
+            apply_cache_mode(self, ITEM_KIND_BATCHED)
+        return super().itemChange(change, value)
+
+    def paint(self, painter: QPainter, option, widget=None) -> None:
+        """
+        Blit an icon over its baked drop shadow, or draw the glyph shadows, outlines and glyphs directly.
+        Baked sprites are not painted on viewports that draw them with the SpriteBatchRenderer instead.
+
+        Args:
+            painter (QPainter): The painter used to draw the item.
+            option: Style options for the item.
+            widget (optional): The widget being painted on.
+        """
+        try:
+            if self.sprite is None or self.sprite.pixmap.isNull():
+                for shadow_position, shadow_pixmap in self.shadow_layers:
+                    painter.drawPixmap(shadow_position, shadow_pixmap)
+                self._render_text(painter)
+                return
+            if widget is not None and widget.property(SPRITE_BATCH_PROPERTY):
+                return
+            if self.scale() != 1.0:
+                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+            painter.drawPixmap(self.sprite.rect.topLeft(), self.sprite.pixmap)
+        except Exception as e:
+            logging.exception("Failed to paint JQGraphicsStaticTextItem: %s", e)
+
+    def _shadowed_sprite(self) -> Sprite:
+        """
+        Get the sprite of the text and icon over their drop shadow, baking it only the first time.
+
+        Returns:
+            Sprite: The cached sprite.
+        """
+        key: Tuple = (
+            "JQGraphicsStaticTextItem",
+            self.font.key(),
+            self.text,
+            self.color.rgba(),
+            pen_key(self.outline_pen) if self.outline else None,
+            self.icon_pixmap.cacheKey(),
+            self.icon_alignment,
+            self.icon_padding
+        )
+        sprite: Sprite = self.sprite_cache.sprite(key, self.collision_rect, self._render_text, self.device_pixel_ratio)
+        return self.sprite_cache.shadowed(
+            sprite, self.drop_shadow_offset, self.drop_shadow_blur_radius, self.drop_shadow_color
+        )
+
+    def _render_text(self, painter: QPainter) -> None:
+        """
+        Draw the outline, the glyphs and the icon, used to paint the item and to render its sprite.
+
+        Args:
+            painter (QPainter): The painter, in item coordinates.
+        """
+        if self.layout is None:
+            return
+        if self.outline:
+            for outline_position, outline_pixmap in self.layout.outline_layers:
+                painter.drawPixmap(outline_position, outline_pixmap)
+        painter.setPen(self.color)
+        for glyph_run in self.layout.glyph_runs:
+            painter.drawGlyphRun(QPointF(), glyph_run)
+        if not self.icon_rect.isNull():
+            painter.drawPixmap(self.icon_rect.topLeft(), self.scaled_icon)
+
+    def _place_icon(self) -> None:
+        """Place the icon beside the text at the height of the font, like SpriteCache.text_sprite does."""
+        self.icon_rect = QRectF()
+        self.scaled_icon = QPixmap()
+        if self.icon_pixmap is None or self.icon_pixmap.isNull() or self.icon_pixmap.height() <= 0:
+            return
+
+        padding: float = ANTIALIASING_PADDING + (self.outline_pen.widthF() / 2.0 if self.outline else 0.0)
+        icon_height: float = self.layout.line_height
+        icon_width: float = icon_height * self.icon_pixmap.width() / self.icon_pixmap.height()
+        if self.icon_alignment.lower() == "right":
+            icon_x: float = TEXT_MARGIN + self.layout.advance + padding + self.icon_padding
+        else:
+            icon_x = TEXT_MARGIN - padding - self.icon_padding - icon_width
+        self.icon_rect = QRectF(icon_x, TEXT_MARGIN, icon_width, icon_height)
+
+        self.scaled_icon = self.icon_pixmap.scaled(
+            max(1, round(icon_width * self.device_pixel_ratio)),
+            max(1, round(icon_height * self.device_pixel_ratio)),
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        self.scaled_icon.setDevicePixelRatio(self.device_pixel_ratio)
+
+    @staticmethod
+    def _get_device_pixel_ratio() -> float:
+        """
+        Gets the device pixel ratio of the primary screen, the ratio sprites and icons are rendered at.
+
+        Returns:
+            float: The device pixel ratio, 1.0 without a screen.
+        """
+        screen = QGuiApplication.primaryScreen()
+        return screen.devicePixelRatio() if screen is not None else 1.0
@@ -7,24 +7,65 @@ from PyQt6.QtCore import QObject, QRect, Qt
 from PyQt6.QtWidgets import QGraphicsScene
 
 from jetque.source.animations.anchor_object import AnchorObject
-from jetque.source.gui.jetque_view import JetQueView
+from jetque.source.animations.anchor_position_table import AnchorPositionTable
+from jetque.source.animations.animation_manager import AnimationManager
+from jetque.source.gui.anchor_region_layout import DEFAULT_REGION_MARGIN, AnchorRegionLayout
+from jetque.source.gui.jetque_view import RENDER_MODE_FULL, JetQueView
+
+# Constants
+# Animation items move every frame and spawn and expire constantly, which keeps a BSP tree index busy re-inserting
+# them. tests/benchmark_scene_index.py (offscreen, Qt 6.11) measured 1.03 / 1.64 / 5.06 / 37.5 ms per frame with a
+# BSP tree against 1.00 / 1.48 / 4.79 / 33.7 ms without an index for 10 / 50 / 200 / 1000 items, 3 to 10 % faster.
+# The anchors stay in this scene without an index of their own: they are hidden in run mode and dragged around in
+# configuration mode, so a BSP tree over them would neither be queried while animating nor stay static.
+DEFAULT_ITEM_INDEX_METHOD: QGraphicsScene.ItemIndexMethod = QGraphicsScene.ItemIndexMethod.NoIndex
+OVERLAY_MODE_FULLSCREEN: str = "Fullscreen"  # One view covering the available screen geometry
+OVERLAY_MODE_ANCHOR_REGIONS: str = "AnchorRegions"  # One small view per group of anchors while in run mode
 
 
 class JetQueOverlay(QGraphicsScene):
-    """Overlay scene for JetQue, managing anchor points and configuration modes."""
-
-    def __init__(self, geometry: QRect, parent: Optional[QObject] = None) -> None:
+    """Overlay scene for JetQue, managing anchor points and configuration modes.
+
+    In anchor region mode the fullscreen view is only shown in configuration mode, so anchors can be dragged
+    anywhere. In run mode every group of overlapping anchors gets a small frameless view of this scene
+    covering the region its animations play in, so the compositor only blends those regions instead of a
+    translucent surface the size of the screen. The views share the scene, and through it the sprite caches.
+    """
+
+    def __init__(
+            self,
+            geometry: QRect,
+            parent: Optional[QObject] = None,
+            item_index_method: QGraphicsScene.ItemIndexMethod = DEFAULT_ITEM_INDEX_METHOD,
+            overlay_mode: str = OVERLAY_MODE_FULLSCREEN,
+            region_margin: float = DEFAULT_REGION_MARGIN,
+            render_mode: str = RENDER_MODE_FULL
+    ) -> None:
         """Initialize the overlay scene.
 
         Args:
             geometry (QRect): The available screen geometry.
             parent (Optional[QObject], optional): Parent object. Defaults to None.
+            item_index_method (QGraphicsScene.ItemIndexMethod, optional): How the scene indexes its items.
+                                                                          Defaults to no index.
+            overlay_mode (str, optional): OVERLAY_MODE_FULLSCREEN or OVERLAY_MODE_ANCHOR_REGIONS.
+                                          Defaults to fullscreen.
+            region_margin (float, optional): Pixels around an anchor's circles its region view covers.
+            render_mode (str, optional): How the views repaint, one of RENDER_MODES. Defaults to full repaints.
         """
         super().__init__(parent)
+        self.setItemIndexMethod(item_index_method)
         # logging.debug("JetQueOverlay: Initializing.")
-        self.view: JetQueView = JetQueView(self, geometry)
+        self.render_mode: str = render_mode
+        self.view: JetQueView = JetQueView(self, geometry, render_mode=render_mode)
         self.is_configuration_mode: bool = False
+        self.is_idle: bool = True
         self.anchor_points: List[AnchorObject] = []
+        self.position_table: AnchorPositionTable = AnchorPositionTable(geometry.toRectF(), parent=self)
+        self.overlay_mode: str = OVERLAY_MODE_FULLSCREEN
+        self.region_layout: AnchorRegionLayout = AnchorRegionLayout(geometry.toRectF(), region_margin)
+        self.region_views: List[JetQueView] = []
+        self.set_overlay_mode(overlay_mode)
 
     def add_anchor_point(self, anchor_point: AnchorObject) -> None:
         """Add an anchor point to the scene.
@@ -36,6 +77,55 @@ class JetQueOverlay(QGraphicsScene):
         anchor_point.hide()
         self.anchor_points.append(anchor_point)
         anchor_point.positionChanged.connect(self.view.update_mask)
+        self.position_table.watch_anchor(anchor_point)
+        self._update_region_views()
+
+    def attach_animation_manager(self, animation_manager: AnimationManager) -> None:
+        """Display the animation manager's animations and let its idle state put rendering to sleep.
+
+        Args:
+            animation_manager (AnimationManager): The manager driving this overlay's animations.
+        """
+        animation_manager.set_scene(self)
+        animation_manager.set_position_table(self.position_table)
+        animation_manager.idleChanged.connect(self.set_idle)
+        self.set_idle(animation_manager.is_idle)
+
+    def set_geometry(self, geometry: QRect) -> None:
+        """Move the overlay to new screen geometry, e.g. after the screen or its resolution changed.
+
+        Args:
+            geometry (QRect): The available screen geometry.
+        """
+        self.view.available_geometry = geometry
+        self.view.setGeometry(geometry)
+        self.view.setSceneRect(geometry.toRectF())
+        self.position_table.set_geometry(geometry.toRectF())
+        self.region_layout.set_geometry(geometry.toRectF())
+        self._update_region_views()
+
+    def set_idle(self, idle: bool) -> None:
+        """Forward the idle state to the views.
+
+        Args:
+            idle (bool): True when no animation is active.
+        """
+        self.is_idle = idle
+        self.view.set_idle(idle)
+        for region_view in self.region_views:
+            region_view.set_idle(idle)
+
+    def set_overlay_mode(self, overlay_mode: str) -> None:
+        """Choose between one fullscreen view and one view per anchor region in run mode.
+
+        Args:
+            overlay_mode (str): OVERLAY_MODE_FULLSCREEN or OVERLAY_MODE_ANCHOR_REGIONS.
+        """
+        if overlay_mode not in (OVERLAY_MODE_FULLSCREEN, OVERLAY_MODE_ANCHOR_REGIONS):
+            logging.error("Unknown overlay mode: %s", overlay_mode)
+            return
+        self.overlay_mode = overlay_mode
+        self._update_region_views()
 
     def configuration_mode(self) -> None:
         """Switch the overlay to configuration mode."""
@@ -45,6 +135,7 @@ class JetQueOverlay(QGraphicsScene):
         for anchor_point in self.anchor_points:
             anchor_point.show()
 
+        self._update_region_views()
         self.view.configuration_mode()
 
     def run_mode(self) -> None:
@@ -56,6 +147,7 @@ class JetQueOverlay(QGraphicsScene):
             anchor_point.hide()
 
         self.view.run_mode()
+        self._update_region_views()
 
     def switch_mode(self) -> None:
         """Toggle between run mode and configuration mode."""
@@ -64,3 +156,31 @@ class JetQueOverlay(QGraphicsScene):
             self.run_mode()
         else:
             self.configuration_mode()
+
+    def _update_region_views(self) -> None:
+        """Show the region views in anchor region run mode, one per merged anchor region, else the fullscreen view."""
+        try:
+            regions: List[QRect] = []
+            if self.overlay_mode == OVERLAY_MODE_ANCHOR_REGIONS and not self.is_configuration_mode:
+                regions = self.region_layout.regions(self.anchor_points)
+
+            # Reuse the existing views, closing the ones no longer needed
+            while len(self.region_views) > len(regions):
+                self.region_views.pop().close()
+            for index, region in enumerate(regions):
+                if index < len(self.region_views):
+                    region_view: JetQueView = self.region_views[index]
+                    region_view.available_geometry = region
+                    region_view.setGeometry(region)
+                    region_view.setSceneRect(region.toRectF())
+                else:
+                    region_view = JetQueView(self, region, render_mode=self.render_mode)
+                    region_view.set_idle(self.is_idle)
+                    self.region_views.append(region_view)
+
+            if self.overlay_mode == OVERLAY_MODE_ANCHOR_REGIONS and not self.is_configuration_mode:
+                self.view.hide()
+            elif not self.view.isVisible():
+                self.view.show()
+        except Exception as e:
+            logging.exception("Error updating region views: %s", e)
@@ -1,18 +1,35 @@
 # jetque/source/gui/jetque_view.py
 import ctypes
 import logging
-from typing import Optional
+import time
+from typing import Dict, List, Optional
 
-from PyQt6.QtCore import Qt, QRect
-from PyQt6.QtGui import QPainter, QRegion, QPainterPath, QPainterPathStroker
+from PyQt6.QtCore import Qt, QRect, QRectF, QTimer
+from PyQt6.QtGui import QColor, QFont, QPainter, QPaintEvent, QRegion, QPainterPath, QPainterPathStroker
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget
 from PyQt6.QtWidgets import (
     QFrame,
+    QGraphicsItem,
     QGraphicsScene,
     QGraphicsView,
     QWidget
 )
 
+from jetque.source.animations.animation_sprite import AnimationSprite
+from jetque.source.gui.cache_policy import ITEM_KIND_BATCHED, apply_cache_mode
+from jetque.source.gui.items.jq_graphics_static_text_item import JQGraphicsStaticTextItem
+from jetque.source.gui.dirty_region_tracker import DirtyRegionTracker
+from jetque.source.gui.frame_timing import FrameTimingRecorder
+from jetque.source.gui.sprite_batch_renderer import SPRITE_BATCH_PROPERTY, SpriteBatchRenderer, projection_matrix
+
+# Constants
+RENDER_MODE_FULL: str = "Full"  # Repaint the whole viewport on every scene change
+RENDER_MODE_DIRTY_REGION: str = "DirtyRegion"  # Repaint only the regions of items that moved or changed
+RENDER_MODE_SPRITE_BATCH: str = "SpriteBatch"  # Repaint the whole viewport, drawing animation sprites in one draw call
+RENDER_MODES: List[str] = [RENDER_MODE_FULL, RENDER_MODE_DIRTY_REGION, RENDER_MODE_SPRITE_BATCH]
+FRAME_TIMING_OVERLAY_RECT: QRect = QRect(8, 8, 360, 24)  # Viewport rect of the frame timing debug overlay
+FRAME_TIMING_OVERLAY_INTERVAL: int = 250  # Milliseconds between refreshes of the frame timing debug overlay
+
 # Windows API Constants
 GWL_EXSTYLE = -20
 WS_EX_TOOLWINDOW = 0x00000080
@@ -33,6 +50,7 @@ class JetQueView(QGraphicsView):
             scene: QGraphicsScene,
             geometry: QRect,
             parent: Optional[QWidget] = None,
+            render_mode: str = RENDER_MODE_FULL
     ) -> None:
         """Initialize the JetQueView.
 
@@ -40,6 +58,7 @@ class JetQueView(QGraphicsView):
             scene (QGraphicsScene): The graphics scene to display.
             geometry (QRect): The geometry of the available screen space.
             parent (Optional[QWidget], optional): The parent widget. Defaults to None.
+            render_mode (str, optional): One of RENDER_MODES. Defaults to full repaints.
         """
         super().__init__(scene, parent)
         # logging.debug("Initializing.")
@@ -54,6 +73,8 @@ class JetQueView(QGraphicsView):
 
         # Create a widget to render graphics using OpenGL
         self.viewport_widget: QOpenGLWidget = QOpenGLWidget()
+        if render_mode == RENDER_MODE_SPRITE_BATCH:
+            self.viewport_widget.setFormat(SpriteBatchRenderer.surface_format())
         self.setViewport(self.viewport_widget)
 
         # Remove the default frame around the view
@@ -65,7 +86,21 @@ class JetQueView(QGraphicsView):
         self.setAttribute(Qt.WidgetAttribute.WA_AcceptDrops, False)
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.setRenderHint(QPainter.RenderHint.TextAntialiasing)
-        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        self.active_update_mode: QGraphicsView.ViewportUpdateMode = QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+        self.is_idle: bool = True  # Nothing animates until the animation manager wakes the overlay
+        self.is_configuration_mode: bool = False
+        self.render_mode: str = RENDER_MODE_FULL
+        self.dirty_region_tracker: DirtyRegionTracker = DirtyRegionTracker(self, parent=self)
+        self.sprite_batch_renderer: SpriteBatchRenderer = SpriteBatchRenderer()
+        self.frame_timing: FrameTimingRecorder = FrameTimingRecorder()
+        self.frame_timing_enabled: bool = False
+        self.frame_timing_overlay_visible: bool = False
+        self.frame_timing_overlay_timer: QTimer = QTimer(self)
+        self.frame_timing_overlay_timer.setInterval(FRAME_TIMING_OVERLAY_INTERVAL)
+        self.frame_timing_overlay_timer.timeout.connect(
+            lambda: self.viewport().update(FRAME_TIMING_OVERLAY_RECT)
+        )
+        self.set_render_mode(render_mode)
 
         # Disable scroll bars
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -104,6 +139,8 @@ class JetQueView(QGraphicsView):
                 | Qt.WindowType.WindowDoesNotAcceptFocus
             )
 
+            self.is_configuration_mode = True
+            self._apply_viewport_update_mode()
             self.show()
             self.update_mask()  # Use a mask to only allow anchors to be manipulated
             self.viewport().update()
@@ -134,6 +171,8 @@ class JetQueView(QGraphicsView):
             )
 
             # self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+            self.is_configuration_mode = False
+            self._apply_viewport_update_mode()
             self.clearMask()
             self.show()
             self.viewport().update()
@@ -150,6 +189,209 @@ class JetQueView(QGraphicsView):
         except Exception as e:
             logging.exception(f"Failed to switch to active mode with exception: {e}")
 
+    def set_render_mode(self, render_mode: str) -> None:
+        """Choose between repainting the whole viewport, repainting only dirty regions and batching sprites.
+
+        In dirty region mode the view stops scheduling its own repaints and the dirty region tracker
+        repaints the old and new bounding rects of changed items, falling back to a full update past
+        its threshold. The OpenGL viewport then keeps its framebuffer between frames.
+        In sprite batch mode the whole viewport is repainted, and animation sprites skip their own paint
+        calls and are drawn together by the sprite batch renderer on top of the other items.
+
+        Args:
+            render_mode (str): One of RENDER_MODES.
+        """
+        if render_mode not in RENDER_MODES:
+            logging.error("Unknown render mode: %s", render_mode)
+            return
+        self.render_mode = render_mode
+        self.viewport_widget.setProperty(SPRITE_BATCH_PROPERTY, render_mode == RENDER_MODE_SPRITE_BATCH)
+        if render_mode == RENDER_MODE_SPRITE_BATCH and self.scene() is not None:
+            # Sprites added from now on drop their caches themselves when they join the scene
+            for item in self._batched_items(self.scene().items()):
+                apply_cache_mode(item, ITEM_KIND_BATCHED)
+        if render_mode == RENDER_MODE_DIRTY_REGION:
+            self.active_update_mode = QGraphicsView.ViewportUpdateMode.NoViewportUpdate
+            self.viewport_widget.setUpdateBehavior(QOpenGLWidget.UpdateBehavior.PartialUpdate)
+        else:
+            self.active_update_mode = QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+            self.viewport_widget.setUpdateBehavior(QOpenGLWidget.UpdateBehavior.NoPartialUpdate)
+        self._apply_viewport_update_mode()
+
+    def drawBackground(self, painter: QPainter, rect: QRectF) -> None:
+        """Clear repainted dirty regions to transparent, the framebuffer is not cleared between partial updates.
+
+        Args:
+            painter (QPainter): The painter of the viewport.
+            rect (QRectF): The exposed rect in scene coordinates.
+        """
+        if self.render_mode != RENDER_MODE_DIRTY_REGION:
+            super().drawBackground(painter, rect)
+            return
+        painter.save()
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(rect, Qt.GlobalColor.transparent)
+        painter.restore()
+
+    def set_frame_timing_enabled(self, enabled: bool, show_overlay: bool = False) -> None:
+        """Start or stop recording the paint duration and interval of every frame.
+
+        Recording starts from an empty ring buffer and counts dropped frames against the refresh rate
+        of the view's screen. While disabled, painting a frame only checks a flag.
+
+        Args:
+            enabled (bool): True to record frame timing.
+            show_overlay (bool, optional): True to draw the percentiles in the top left corner. Defaults to False.
+        """
+        if enabled and not self.frame_timing_enabled:
+            self.frame_timing.reset()
+            if self.screen() is not None:
+                self.frame_timing.set_refresh_rate(self.screen().refreshRate())
+        self.frame_timing_enabled = enabled
+        self.frame_timing_overlay_visible = enabled and show_overlay
+        if self.frame_timing_overlay_visible:
+            self.frame_timing_overlay_timer.start()
+        else:
+            self.frame_timing_overlay_timer.stop()
+        self.viewport().update(FRAME_TIMING_OVERLAY_RECT)
+
+    def frame_timing_summary(self) -> Dict[str, object]:
+        """Get the frame count, dropped frames, percentiles and histogram of the recorded frames.
+
+        Returns:
+            Dict[str, object]: The summary of FrameTimingRecorder.summary().
+        """
+        return self.frame_timing.summary()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Paint the viewport, timing the frame while frame timing is enabled.
+
+        Args:
+            event (QPaintEvent): The paint event of the viewport.
+        """
+        if not self.frame_timing_enabled:
+            super().paintEvent(event)
+            return
+        frame_start: float = time.perf_counter() * 1000.0
+        super().paintEvent(event)
+        self.frame_timing.record(frame_start, time.perf_counter() * 1000.0)
+
+    def drawForeground(self, painter: QPainter, rect: QRectF) -> None:
+        """Draw the animation sprites in sprite batch mode and the frame timing overlay if it is shown.
+
+        Args:
+            painter (QPainter): The painter of the viewport.
+            rect (QRectF): The exposed rect in scene coordinates.
+        """
+        super().drawForeground(painter, rect)
+        if self.render_mode == RENDER_MODE_SPRITE_BATCH and self.scene() is not None:
+            self._draw_sprite_batch(painter, rect)
+        if self.frame_timing_overlay_visible:
+            self._draw_frame_timing_overlay(painter)
+
+    def _draw_sprite_batch(self, painter: QPainter, rect: QRectF) -> None:
+        """Draw the visible animation sprites in a single instanced draw call.
+
+        Falls back to full viewport updates with QPainter if the viewport's context cannot run the renderer.
+
+        Args:
+            painter (QPainter): The painter of the viewport.
+            rect (QRectF): The exposed rect in scene coordinates.
+        """
+        sprites: List[QGraphicsItem] = [
+            item for item in self._batched_items(self.scene().items(
+                rect, Qt.ItemSelectionMode.IntersectsItemBoundingRect, Qt.SortOrder.AscendingOrder
+            ))
+            if item.isVisible()
+        ]
+        painter.beginNativePainting()
+        try:
+            if not self.sprite_batch_renderer.initialized:
+                if not self.sprite_batch_renderer.initialize(self.viewport_widget.context()):
+                    logging.error("Sprite batching is unavailable, falling back to full viewport updates.")
+                    self.set_render_mode(RENDER_MODE_FULL)
+                    return
+                self.viewport_widget.context().aboutToBeDestroyed.connect(self._cleanup_sprite_batch_renderer)
+            self.sprite_batch_renderer.render(
+                sprites, projection_matrix(QRectF(self.viewport().rect()), self.viewportTransform())
+            )
+        except Exception as e:
+            logging.exception("Failed to draw sprite batch: %s", e)
+        finally:
+            painter.endNativePainting()
+
+    @staticmethod
+    def _batched_items(items: List[QGraphicsItem]) -> List[QGraphicsItem]:
+        """Select the items drawn by the sprite batch renderer, animation sprites and baked static text.
+
+        Args:
+            items (List[QGraphicsItem]): The items to select from, in painting order.
+
+        Returns:
+            List[QGraphicsItem]: The items that skip their own paint calls in sprite batch mode.
+        """
+        return [
+            item for item in items
+            if isinstance(item, AnimationSprite)
+            or (isinstance(item, JQGraphicsStaticTextItem) and item.sprite is not None)
+        ]
+
+    def _draw_frame_timing_overlay(self, painter: QPainter) -> None:
+        """Draw the paint duration percentiles and dropped frame count over the top left corner of the viewport.
+
+        Args:
+            painter (QPainter): The painter of the viewport.
+        """
+        try:
+            paint_percentiles: Dict[str, float] = self.frame_timing.percentiles()["paint"]
+            text: str = "paint " + " ".join(
+                f"{name} {value:.2f}" for name, value in paint_percentiles.items()
+            ) + f" ms, dropped {self.frame_timing.dropped_frames}"
+            painter.save()
+            painter.resetTransform()
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            painter.fillRect(FRAME_TIMING_OVERLAY_RECT, QColor(0, 0, 0, 160))
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+            painter.setPen(QColor(Qt.GlobalColor.white))
+            painter.setFont(QFont("Consolas", 9))
+            painter.drawText(
+                FRAME_TIMING_OVERLAY_RECT.adjusted(6, 0, -6, 0),
+                Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+                text
+            )
+            painter.restore()
+        except Exception as e:
+            logging.exception("Failed to draw frame timing overlay: %s", e)
+
+    def _cleanup_sprite_batch_renderer(self) -> None:
+        """Release the sprite batch renderer's OpenGL resources before the viewport's context goes away."""
+        self.viewport_widget.makeCurrent()
+        self.sprite_batch_renderer.cleanup()
+        self.viewport_widget.doneCurrent()
+
+    def set_idle(self, idle: bool) -> None:
+        """Put rendering to sleep while nothing is animating, or wake it up again.
+
+        Args:
+            idle (bool): True when no animation is active.
+        """
+        if idle == self.is_idle:
+            return
+        self.is_idle = idle
+        self._apply_viewport_update_mode()
+
+    def _apply_viewport_update_mode(self) -> None:
+        """Stop viewport updates while idle in run mode, otherwise use the active update mode and render mode."""
+        if self.is_idle and not self.is_configuration_mode:
+            # Repaint once so the last finished item is cleared, then stop reacting to scene changes
+            self.viewport().update()
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.NoViewportUpdate)
+            self.dirty_region_tracker.set_enabled(False)
+        else:
+            self.setViewportUpdateMode(self.active_update_mode)
+            self.dirty_region_tracker.set_enabled(self.render_mode == RENDER_MODE_DIRTY_REGION)
+            self.viewport().update()
+
     def update_mask(self) -> None:
         # Update the window mask to include anchor points and texts.
         mask_region = QRegion()
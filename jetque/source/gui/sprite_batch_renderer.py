@@ -0,0 +1,445 @@
+# jetque/source/gui/sprite_batch_renderer.py
+
+import logging
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PyQt6 import sip
+from PyQt6.QtCore import QRect, QRectF, Qt
+from PyQt6.QtGui import QImage, QMatrix4x4, QOpenGLContext, QPainter, QSurfaceFormat, QTransform
+from PyQt6.QtOpenGL import (
+    QOpenGLBuffer,
+    QOpenGLFunctions_4_1_Core,
+    QOpenGLShader,
+    QOpenGLShaderProgram,
+    QOpenGLTexture,
+    QOpenGLVersionFunctionsFactory,
+    QOpenGLVersionProfile,
+    QOpenGLVertexArrayObject
+)
+from PyQt6.QtWidgets import QGraphicsItem
+
+from jetque.source.managers.sprite_cache import Sprite
+
+# Constants
+SPRITE_BATCH_PROPERTY: str = "spriteBatching"  # Viewport property telling sprite items not to paint themselves
+DEFAULT_ATLAS_SIZE: int = 2048  # Width and height of the sprite texture atlas in pixels
+ATLAS_PADDING: int = 1  # Transparent pixels between atlas regions, so linear filtering never samples a neighbour
+GL_VERSION: Tuple[int, int] = (4, 1)  # OpenGL version providing instanced drawing and attribute divisors
+
+# Per-instance vertex attributes and their number of floats, in buffer order
+INSTANCE_ATTRIBUTES: List[Tuple[str, int]] = [
+    ("a_position", 2),  # Scene position of the item
+    ("a_rect", 4),  # Sprite rect in item coordinates: x, y, width, height
+    ("a_origin", 2),  # Transform origin in item coordinates
+    ("a_transform", 3),  # Scale, rotation in radians, effective opacity
+    ("a_uv", 4),  # Atlas region: left, top, right, bottom texture coordinates
+]
+INSTANCE_FLOATS: int = sum(size for _, size in INSTANCE_ATTRIBUTES)
+
+# OpenGL enums, PyQt6 does not export them
+GL_FLOAT: int = 0x1406
+GL_TRIANGLE_STRIP: int = 0x0005
+GL_BLEND: int = 0x0BE2
+GL_ONE: int = 1
+GL_ONE_MINUS_SRC_ALPHA: int = 0x0303
+
+VERTEX_SHADER: str = """
+#version 330 core
+in vec2 a_corner;
+in vec2 a_position;
+in vec4 a_rect;
+in vec2 a_origin;
+in vec3 a_transform;
+in vec4 a_uv;
+uniform mat4 u_projection;
+out vec2 v_uv;
+out float v_opacity;
+
+void main() {
+    vec2 local = a_rect.xy + a_corner * a_rect.zw - a_origin;
+    float c = cos(a_transform.y);
+    float s = sin(a_transform.y);
+    vec2 turned = vec2(c * local.x - s * local.y, s * local.x + c * local.y) * a_transform.x;
+    gl_Position = u_projection * vec4(a_position + a_origin + turned, 0.0, 1.0);
+    v_uv = mix(a_uv.xy, a_uv.zw, a_corner);
+    v_opacity = a_transform.z;
+}
+"""
+
+FRAGMENT_SHADER: str = """
+#version 330 core
+in vec2 v_uv;
+in float v_opacity;
+uniform sampler2D u_atlas;
+out vec4 frag_color;
+
+void main() {
+    frag_color = texture(u_atlas, v_uv) * v_opacity;
+}
+"""
+
+
+def projection_matrix(viewport_rect: QRectF, transform: QTransform) -> QMatrix4x4:
+    """
+    Build the matrix mapping scene coordinates to normalized device coordinates of a viewport.
+
+    Args:
+        viewport_rect (QRectF): The viewport rect in logical pixels.
+        transform (QTransform): The scene to viewport transform, e.g. QGraphicsView.viewportTransform().
+
+    Returns:
+        QMatrix4x4: The projection matrix, with the y axis pointing down like the scene's.
+    """
+    projection: QMatrix4x4 = QMatrix4x4()
+    projection.ortho(viewport_rect)
+    return projection * QMatrix4x4(transform)
+
+
+class SpriteTextureAtlas:
+    """
+    Packs sprite pixmaps into one image, so every sprite on screen can be drawn from a single texture.
+
+    Regions are placed left to right on shelves as high as their tallest sprite and keyed by the pixmap's
+    cache key, so sprites shared through the SpriteCache take up one region however many items show them.
+    Once the atlas is full it is cleared and refilled with the sprites of the next frame.
+
+    Attributes:
+        size (int): Width and height of the atlas in pixels.
+        image (QImage): The packed sprites, premultiplied RGBA in device pixels.
+        regions (Dict[int, Tuple[float, float, float, float]]): Texture coordinates of each packed pixmap.
+        cursor_x (int): Left edge of the next region on the current shelf.
+        cursor_y (int): Top edge of the current shelf.
+        shelf_height (int): Height of the tallest region on the current shelf.
+        dirty_rect (QRect): The part of the image changed since it was last uploaded, null if none did.
+    """
+
+    def __init__(self, size: int = DEFAULT_ATLAS_SIZE) -> None:
+        """
+        Initialize an empty atlas.
+
+        Args:
+            size (int): Width and height of the atlas in pixels.
+        """
+        self.size: int = size
+        self.image: QImage = QImage(size, size, QImage.Format.Format_RGBA8888_Premultiplied)
+        self.regions: Dict[int, Tuple[float, float, float, float]] = {}
+        self.cursor_x: int = 0
+        self.cursor_y: int = 0
+        self.shelf_height: int = 0
+        self.dirty_rect: QRect = QRect()
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove every region and start packing from the top left corner again."""
+        self.image.fill(Qt.GlobalColor.transparent)
+        self.regions.clear()
+        self.cursor_x = 0
+        self.cursor_y = 0
+        self.shelf_height = 0
+        self.dirty_rect = self.image.rect()
+
+    def region_for(self, sprite: Sprite) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Get the texture coordinates of a sprite, packing its pixmap first if it is not in the atlas yet.
+
+        Args:
+            sprite (Sprite): The sprite to look up.
+
+        Returns:
+            Optional[Tuple[float, float, float, float]]: Left, top, right and bottom texture coordinates,
+                                                         or None if the atlas has no room left for the sprite.
+        """
+        key: int = sprite.pixmap.cacheKey()
+        region: Optional[Tuple[float, float, float, float]] = self.regions.get(key)
+        if region is not None:
+            return region
+
+        width: int = sprite.pixmap.width()
+        height: int = sprite.pixmap.height()
+        if self.cursor_x + width > self.size:
+            self.cursor_x = 0
+            self.cursor_y += self.shelf_height + ATLAS_PADDING
+            self.shelf_height = 0
+        if self.cursor_x + width > self.size or self.cursor_y + height > self.size:
+            return None
+
+        image: QImage = sprite.pixmap.toImage()
+        image.setDevicePixelRatio(1.0)
+        painter: QPainter = QPainter(self.image)
+        try:
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            painter.drawImage(self.cursor_x, self.cursor_y, image)
+        finally:
+            painter.end()
+
+        region = (
+            self.cursor_x / self.size,
+            self.cursor_y / self.size,
+            (self.cursor_x + width) / self.size,
+            (self.cursor_y + height) / self.size
+        )
+        self.regions[key] = region
+        self.dirty_rect = self.dirty_rect.united(QRect(self.cursor_x, self.cursor_y, width, height))
+        self.cursor_x += width + ATLAS_PADDING
+        self.shelf_height = max(self.shelf_height, height)
+        return region
+
+    def take_dirty_image(self) -> Tuple[QRect, QImage]:
+        """
+        Get the part of the image changed since the last call, so only that part has to be uploaded.
+
+        Returns:
+            Tuple[QRect, QImage]: The changed rect, null if nothing changed, and a tightly packed copy of it.
+        """
+        dirty_rect: QRect = self.dirty_rect
+        self.dirty_rect = QRect()
+        if dirty_rect.isNull():
+            return dirty_rect, QImage()
+        return dirty_rect, self.image.copy(dirty_rect)
+
+
+class SpriteBatchRenderer:
+    """
+    Draws animation sprites as textured quads from a shared atlas texture with one instanced draw call.
+
+    Every frame the position, sprite rect, transform origin, scale, rotation, opacity and atlas region of
+    each item are written to a per-instance vertex buffer, and a four vertex quad is drawn once per instance.
+    Per frame that costs one pass over the items, one buffer upload and one draw call, instead of a paint
+    call with its own state changes per item.
+    The renderer draws into whatever framebuffer is bound, e.g. between QPainter.beginNativePainting() and
+    endNativePainting() of a QOpenGLWidget viewport. Rotation and scale are applied around the transform
+    origin like QGraphicsItem does; custom item transforms and parent rotations are not supported.
+
+    Attributes:
+        atlas (SpriteTextureAtlas): The atlas holding the pixmaps of drawn sprites.
+        functions (Optional[QOpenGLFunctions_4_1_Core]): The OpenGL functions of the current context.
+        program (Optional[QOpenGLShaderProgram]): The sprite shader program.
+        vertex_array (Optional[QOpenGLVertexArrayObject]): The attribute layout of the quad and instance buffers.
+        corner_buffer (Optional[QOpenGLBuffer]): The four corners of the unit quad.
+        instance_buffer (Optional[QOpenGLBuffer]): The per-instance attributes of the last frame.
+        texture (Optional[QOpenGLTexture]): The atlas texture.
+        initialized (bool): Whether the OpenGL resources were created.
+        instance_count (int): Number of sprites drawn in the last frame.
+    """
+
+    def __init__(self, atlas_size: int = DEFAULT_ATLAS_SIZE) -> None:
+        """
+        Initialize the renderer without creating any OpenGL resources yet.
+
+        Args:
+            atlas_size (int): Width and height of the atlas texture in pixels.
+        """
+        self.atlas: SpriteTextureAtlas = SpriteTextureAtlas(atlas_size)
+        self.functions: Optional[QOpenGLFunctions_4_1_Core] = None
+        self.program: Optional[QOpenGLShaderProgram] = None
+        self.vertex_array: Optional[QOpenGLVertexArrayObject] = None
+        self.corner_buffer: Optional[QOpenGLBuffer] = None
+        self.instance_buffer: Optional[QOpenGLBuffer] = None
+        self.texture: Optional[QOpenGLTexture] = None
+        self.initialized: bool = False
+        self.instance_count: int = 0
+
+    @staticmethod
+    def surface_format() -> QSurfaceFormat:
+        """
+        Get a surface format whose contexts support the renderer, for QOpenGLWidget.setFormat().
+
+        Returns:
+            QSurfaceFormat: A compatibility profile format of the required OpenGL version with an alpha channel.
+        """
+        surface_format: QSurfaceFormat = QSurfaceFormat.defaultFormat()
+        surface_format.setVersion(*GL_VERSION)
+        surface_format.setProfile(QSurfaceFormat.OpenGLContextProfile.CompatibilityProfile)
+        surface_format.setAlphaBufferSize(8)
+        return surface_format
+
+    def initialize(self, context: Optional[QOpenGLContext] = None) -> bool:
+        """
+        Create the shaders, buffers and atlas texture. The context must be current.
+
+        Args:
+            context (Optional[QOpenGLContext]): The context to create resources in, defaults to the current one.
+
+        Returns:
+            bool: True if the renderer is ready to draw, False if the context lacks the required OpenGL version.
+        """
+        if self.initialized:
+            return True
+        try:
+            context = context or QOpenGLContext.currentContext()
+            if context is None:
+                logging.error("Sprite batch renderer needs a current OpenGL context.")
+                return False
+
+            profile: QOpenGLVersionProfile = QOpenGLVersionProfile()
+            profile.setVersion(*GL_VERSION)
+            profile.setProfile(QSurfaceFormat.OpenGLContextProfile.CoreProfile)
+            self.functions = QOpenGLVersionFunctionsFactory.get(profile, context)
+            if self.functions is None:
+                logging.error("OpenGL %d.%d is not available for sprite batching.", *GL_VERSION)
+                return False
+
+            self.program = QOpenGLShaderProgram()
+            if (
+                    not self.program.addShaderFromSourceCode(QOpenGLShader.ShaderTypeBit.Vertex, VERTEX_SHADER)
+                    or not self.program.addShaderFromSourceCode(QOpenGLShader.ShaderTypeBit.Fragment, FRAGMENT_SHADER)
+                    or not self.program.link()
+            ):
+                logging.error("Failed to build sprite batch shaders: %s", self.program.log())
+                return False
+
+            self.vertex_array = QOpenGLVertexArrayObject()
+            self.vertex_array.create()
+            self.vertex_array.bind()
+
+            corners: np.ndarray = np.array([0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0], dtype=np.float32)
+            self.corner_buffer = QOpenGLBuffer(QOpenGLBuffer.Type.VertexBuffer)
+            self.corner_buffer.create()
+            self.corner_buffer.bind()
+            self.corner_buffer.allocate(sip.voidptr(corners), corners.nbytes)
+            corner_location: int = self.program.attributeLocation("a_corner")
+            self.program.enableAttributeArray(corner_location)
+            self.program.setAttributeBuffer(corner_location, GL_FLOAT, 0, 2)
+
+            self.instance_buffer = QOpenGLBuffer(QOpenGLBuffer.Type.VertexBuffer)
+            self.instance_buffer.setUsagePattern(QOpenGLBuffer.UsagePattern.StreamDraw)
+            self.instance_buffer.create()
+            self.instance_buffer.bind()
+            stride: int = INSTANCE_FLOATS * 4
+            offset: int = 0
+            for name, size in INSTANCE_ATTRIBUTES:
+                location: int = self.program.attributeLocation(name)
+                self.program.enableAttributeArray(location)
+                self.program.setAttributeBuffer(location, GL_FLOAT, offset, size, stride)
+                self.functions.glVertexAttribDivisor(location, 1)
+                offset += size * 4
+
+            self.vertex_array.release()
+            self.instance_buffer.release()
+
+            self.texture = QOpenGLTexture(QOpenGLTexture.Target.Target2D)
+            self.texture.setFormat(QOpenGLTexture.TextureFormat.RGBA8_UNorm)
+            self.texture.setSize(self.atlas.size, self.atlas.size)
+            self.texture.setMinMagFilters(QOpenGLTexture.Filter.Linear, QOpenGLTexture.Filter.Linear)
+            self.texture.setWrapMode(QOpenGLTexture.WrapMode.ClampToEdge)
+            self.texture.allocateStorage(QOpenGLTexture.PixelFormat.RGBA, QOpenGLTexture.PixelType.UInt8)
+            self.atlas.dirty_rect = self.atlas.image.rect()  # The new texture holds none of the packed sprites
+
+            self.initialized = True
+            return True
+        except Exception as e:
+            logging.exception("Failed to initialize sprite batch renderer: %s", e)
+            return False
+
+    def instance_data(self, items: Sequence[QGraphicsItem]) -> np.ndarray:
+        """
+        Pack the per-instance attributes of the items' sprites, adding new sprites to the atlas.
+
+        Items without a sprite or without room in the atlas are left out. When the atlas runs out of room
+        it is cleared once and refilled with this frame's sprites only.
+
+        Args:
+            items (Sequence[QGraphicsItem]): Items with a sprite attribute, in painting order.
+
+        Returns:
+            np.ndarray: One row of INSTANCE_FLOATS float32 values per drawn item.
+        """
+        sprites: List[Tuple[QGraphicsItem, Sprite]] = [
+            (item, item.sprite) for item in items if getattr(item, "sprite", None) is not None
+        ]
+        regions: List[Optional[Tuple[float, float, float, float]]] = [
+            self.atlas.region_for(sprite) for _, sprite in sprites
+        ]
+        if None in regions and len(self.atlas.regions) > len(set(regions) - {None}):
+            # Regions of sprites from earlier frames take up the room, repack with this frame's sprites only
+            self.atlas.clear()
+            regions = [self.atlas.region_for(sprite) for _, sprite in sprites]
+        if None in regions:
+            logging.warning("Sprite atlas is full, %d sprites are not drawn.", regions.count(None))
+
+        rows: List[Tuple[float, ...]] = []
+        for (item, sprite), region in zip(sprites, regions):
+            if region is None:
+                continue
+            position = item.pos() if item.parentItem() is None else item.parentItem().mapToScene(item.pos())
+            origin = item.transformOriginPoint()
+            rows.append((
+                position.x(), position.y(),
+                sprite.rect.x(), sprite.rect.y(), sprite.rect.width(), sprite.rect.height(),
+                origin.x(), origin.y(),
+                item.scale(), math.radians(item.rotation()), item.effectiveOpacity(),
+                *region
+            ))
+        return np.array(rows, dtype=np.float32).reshape(-1, INSTANCE_FLOATS)
+
+    def render(self, items: Iterable[QGraphicsItem], projection: QMatrix4x4) -> int:
+        """
+        Draw the items' sprites into the bound framebuffer with a single instanced draw call.
+
+        Args:
+            items (Iterable[QGraphicsItem]): Visible items with a sprite attribute, in painting order.
+            projection (QMatrix4x4): The scene to normalized device coordinates matrix, see projection_matrix().
+
+        Returns:
+            int: The number of sprites drawn.
+        """
+        self.instance_count = 0
+        if not self.initialized:
+            return 0
+        try:
+            data: np.ndarray = self.instance_data(list(items))
+            if not len(data):
+                return 0
+
+            dirty_rect, dirty_image = self.atlas.take_dirty_image()
+            if not dirty_rect.isNull():
+                # Upload only the newly packed sprites instead of the whole atlas
+                self.texture.setData(
+                    dirty_rect.x(), dirty_rect.y(), 0, dirty_rect.width(), dirty_rect.height(), 1,
+                    QOpenGLTexture.PixelFormat.RGBA,
+                    QOpenGLTexture.PixelType.UInt8,
+                    dirty_image.constBits()
+                )
+
+            self.instance_buffer.bind()
+            self.instance_buffer.allocate(sip.voidptr(data), data.nbytes)
+            self.instance_buffer.release()
+
+            self.program.bind()
+            self.program.setUniformValue(self.program.uniformLocation("u_projection"), projection)
+            self.program.setUniformValue(self.program.uniformLocation("u_atlas"), 0)
+            self.texture.bind(0)
+            self.functions.glEnable(GL_BLEND)
+            self.functions.glBlendFunc(GL_ONE, GL_ONE_MINUS_SRC_ALPHA)
+
+            self.vertex_array.bind()
+            self.functions.glDrawArraysInstanced(GL_TRIANGLE_STRIP, 0, 4, len(data))
+            self.vertex_array.release()
+
+            self.texture.release(0)
+            self.program.release()
+            self.instance_count = len(data)
+            return self.instance_count
+        except Exception as e:
+            logging.exception("Failed to render sprite batch: %s", e)
+            return 0
+
+    def cleanup(self) -> None:
+        """Destroy the OpenGL resources. The context they were created in must be current."""
+        try:
+            for resource in (self.texture, self.instance_buffer, self.corner_buffer, self.vertex_array):
+                if resource is not None:
+                    resource.destroy()
+            if self.program is not None:
+                self.program.removeAllShaders()
+        except Exception as e:
+            logging.exception("Failed to clean up sprite batch renderer: %s", e)
+        self.functions = None
+        self.program = None
+        self.vertex_array = None
+        self.corner_buffer = None
+        self.instance_buffer = None
+        self.texture = None
+        self.initialized = False
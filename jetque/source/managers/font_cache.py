@@ -0,0 +1,181 @@
+# jetque/source/managers/font_cache.py
+
+import logging
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+from PyQt6.QtGui import QFont, QFontMetricsF
+
+from jetque.source.animations.animation_font import AnimationFont
+
+# Constants
+DEFAULT_ADVANCE_CACHE_SIZE: int = 4096  # Memoised horizontal advances kept, e.g. damage numbers and skill names
+
+
+class FontCache:
+    """
+    Shares fonts, font metrics and text measurements between every animation that uses the same font.
+
+    Fonts are keyed by the full AnimationFont parameter tuple, so only a handful of fonts and metrics
+    exist however many animations are built. Horizontal advances of frequent strings such as damage
+    numbers and skill names are memoised per font and text, least recently used ones being evicted first.
+
+    Attributes:
+        advance_cache_size (int): Maximum number of memoised advances.
+        fonts (Dict[Tuple, AnimationFont]): Shared fonts keyed by their parameter tuple.
+        font_metrics (Dict[Hashable, QFontMetricsF]): Shared float font metrics keyed by font key.
+        advances (OrderedDict): Memoised horizontal advances keyed by font key and text.
+        hits (int): Number of advance lookups answered from the cache.
+        misses (int): Number of advance lookups that had to be measured.
+    """
+
+    _shared: Optional["FontCache"] = None
+
+    def __init__(self, advance_cache_size: int = DEFAULT_ADVANCE_CACHE_SIZE) -> None:
+        """
+        Initialize an empty font cache.
+
+        Args:
+            advance_cache_size (int): Maximum number of memoised advances.
+        """
+        self.advance_cache_size: int = advance_cache_size
+        self.fonts: Dict[Tuple, AnimationFont] = {}
+        self.font_metrics: Dict[Hashable, QFontMetricsF] = {}
+        self.advances: "OrderedDict[Tuple[Hashable, str], float]" = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @classmethod
+    def shared(cls) -> "FontCache":
+        """
+        Get the application wide font cache.
+
+        Returns:
+            FontCache: The shared font cache.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def font(
+            self,
+            font_type: str,
+            font_size: int,
+            font_weight: QFont.Weight,
+            font_capitalization: QFont.Capitalization,
+            font_stretch: QFont.Stretch,
+            font_letter_spacing: float,
+            font_word_spacing: float,
+            font_italic: bool,
+            font_kerning: bool,
+            font_overline: bool,
+            font_strikethrough: bool,
+            font_underline: bool
+    ) -> AnimationFont:
+        """
+        Get the shared font for a set of font parameters, creating it on first use.
+
+        Args:
+            font_type (str): The font family.
+            font_size (int): The point size.
+            font_weight (QFont.Weight): The weight.
+            font_capitalization (QFont.Capitalization): The capitalization.
+            font_stretch (QFont.Stretch): The stretch.
+            font_letter_spacing (float): The absolute letter spacing.
+            font_word_spacing (float): The word spacing.
+            font_italic (bool): Whether the font is italic.
+            font_kerning (bool): Whether kerning is enabled.
+            font_overline (bool): Whether the font is overlined.
+            font_strikethrough (bool): Whether the font is struck through.
+            font_underline (bool): Whether the font is underlined.
+
+        Returns:
+            AnimationFont: The shared font.
+        """
+        cache_key: Tuple = AnimationFont.make_cache_key(
+            font_type, font_size, font_weight, font_capitalization, font_stretch, font_letter_spacing,
+            font_word_spacing, font_italic, font_kerning, font_overline, font_strikethrough, font_underline
+        )
+        font: AnimationFont = self.fonts.get(cache_key)
+        if font is None:
+            font = AnimationFont(
+                font_type=font_type,
+                font_size=font_size,
+                font_weight=font_weight,
+                font_capitalization=font_capitalization,
+                font_stretch=font_stretch,
+                font_letter_spacing=font_letter_spacing,
+                font_word_spacing=font_word_spacing,
+                font_italic=font_italic,
+                font_kerning=font_kerning,
+                font_overline=font_overline,
+                font_strikethrough=font_strikethrough,
+                font_underline=font_underline
+            )
+            self.fonts[cache_key] = font
+            logging.debug("FontCache created font: %s", cache_key)
+        return font
+
+    def metrics(self, font: QFont) -> QFontMetricsF:
+        """
+        Get the shared float font metrics of a font.
+
+        Args:
+            font (QFont): The font to measure with, usually an AnimationFont.
+
+        Returns:
+            QFontMetricsF: The shared font metrics.
+        """
+        font_key: Hashable = self._font_key(font)
+        font_metrics: QFontMetricsF = self.font_metrics.get(font_key)
+        if font_metrics is None:
+            font_metrics = QFontMetricsF(font)
+            self.font_metrics[font_key] = font_metrics
+        return font_metrics
+
+    def horizontal_advance(self, font: QFont, text: str) -> float:
+        """
+        Get the horizontal advance of a text in a font, measuring it only the first time.
+
+        Args:
+            font (QFont): The font the text is drawn in, usually an AnimationFont.
+            text (str): The text to measure.
+
+        Returns:
+            float: The horizontal advance in pixels.
+        """
+        key: Tuple[Hashable, str] = (self._font_key(font), text)
+        advance: Optional[float] = self.advances.get(key)
+        if advance is not None:
+            self.hits += 1
+            self.advances.move_to_end(key)
+            return advance
+
+        self.misses += 1
+        advance = self.metrics(font).horizontalAdvance(text)
+        self.advances[key] = advance
+        if len(self.advances) > self.advance_cache_size:
+            self.advances.popitem(last=False)
+        return advance
+
+    def clear(self) -> None:
+        """Drop every cached font, metric and measurement, e.g. after the configured fonts change."""
+        self.fonts.clear()
+        self.font_metrics.clear()
+        self.advances.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _font_key(font: QFont) -> Hashable:
+        """
+        Get the key a font's metrics and measurements are cached under.
+
+        Args:
+            font (QFont): The font.
+
+        Returns:
+            Hashable: The parameter tuple of an AnimationFont, the font key of any other font.
+        """
+        return font.cache_key if isinstance(font, AnimationFont) else font.key()
+
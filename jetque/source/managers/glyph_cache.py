@@ -0,0 +1,273 @@
+# jetque/source/managers/glyph_cache.py
+
+import math
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from PyQt6.QtCore import QPointF, QRectF
+from PyQt6.QtGui import QColor, QFont, QGlyphRun, QPainter, QPainterPath, QPen, QPixmap, QRawFont
+
+from jetque.source.managers.icon_cache import pen_key
+from jetque.source.managers.shadow_renderer import render_drop_shadow_layer
+from jetque.source.managers.sprite_cache import ANTIALIASING_PADDING, render_pixmap
+
+# Constants
+DEFAULT_GLYPH_CACHE_SIZE: int = 4096  # Rendered glyph layers kept, one per glyph, subpixel offset and style
+SUBPIXEL_STEPS: int = 4  # Glyph outlines are rendered at quarter pixel offsets, so glyphs keep their spacing
+SHADOW_SUBPIXEL_STEPS: int = 1  # Blurred shadows hide subpixel offsets, so they are rendered at whole pixels
+
+
+def raw_font_key(raw_font: QRawFont) -> Hashable:
+    """
+    Build a hashable key identifying the glyph shapes of a raw font.
+
+    Args:
+        raw_font (QRawFont): The raw font.
+
+    Returns:
+        Hashable: The raw font key.
+    """
+    return (
+        raw_font.familyName(),
+        raw_font.styleName(),
+        raw_font.pixelSize(),
+        raw_font.weight(),
+        raw_font.style().value,
+        raw_font.hintingPreference().value
+    )
+
+
+def split_position(x: float, y: float, steps: int = SUBPIXEL_STEPS) -> Tuple[int, int, float, float]:
+    """
+    Split a glyph position into a whole pixel origin and the subpixel offset of the glyph from it.
+
+    Args:
+        x (float): The horizontal position of the glyph on the baseline.
+        y (float): The vertical position of the glyph's baseline.
+        steps (int): The number of offsets a pixel is divided into.
+
+    Returns:
+        Tuple[int, int, float, float]: The whole pixel origin and the offset, rounded to 1 / steps pixel.
+    """
+    x = round(x * steps) / steps
+    y = round(y * steps) / steps
+    origin_x: int = math.floor(x)
+    origin_y: int = math.floor(y)
+    return origin_x, origin_y, x - origin_x, y - origin_y
+
+
+class GlyphCache:
+    """
+    Renders the outline and the drop shadow of single glyphs once per style and subpixel offset, and memoises them.
+
+    Stroking glyph outlines and blurring drop shadows costs far more than drawing glyphs, but texts only combine
+    a small set of glyphs, so outlined and shadowed texts are composed from these layers instead of stroking and
+    blurring every distinct text. The shadows of neighbouring glyphs are drawn over each other, so where they
+    overlap they are slightly darker than the shadow of the whole text would be. Layers are evicted least
+    recently used first.
+
+    Attributes:
+        max_layers (int): Number of rendered layers kept.
+        layers (OrderedDict): Rendered layers in least recently used order.
+        raw_fonts (Dict[str, QRawFont]): The raw fonts of the fonts glyphs were requested in, keyed by font key.
+        hits (int): Number of layers answered from the cache.
+        misses (int): Number of layers that had to be rendered.
+    """
+
+    _shared: Optional["GlyphCache"] = None
+
+    def __init__(self, max_layers: int = DEFAULT_GLYPH_CACHE_SIZE) -> None:
+        """
+        Initialize an empty glyph cache.
+
+        Args:
+            max_layers (int): Number of rendered layers kept.
+        """
+        self.max_layers: int = max_layers
+        self.layers: "OrderedDict[Hashable, Tuple[QPixmap, QRectF]]" = OrderedDict()
+        self.raw_fonts: Dict[str, QRawFont] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @classmethod
+    def shared(cls) -> "GlyphCache":
+        """
+        Get the application wide glyph cache.
+
+        Returns:
+            GlyphCache: The shared glyph cache.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def raw_font(self, font: QFont) -> QRawFont:
+        """
+        Get the raw font of a font, loading it only the first time.
+
+        Args:
+            font (QFont): The font.
+
+        Returns:
+            QRawFont: The raw font the glyphs of the font are drawn from.
+        """
+        raw_font: Optional[QRawFont] = self.raw_fonts.get(font.key())
+        if raw_font is None:
+            raw_font = QRawFont.fromFont(font)
+            self.raw_fonts[font.key()] = raw_font
+        return raw_font
+
+    def outline_layers(
+            self,
+            glyph_runs: List[QGlyphRun],
+            outline_pen: QPen,
+            device_pixel_ratio: float = 1.0
+    ) -> Tuple[List[Tuple[QPointF, QPixmap]], QRectF]:
+        """
+        Get the stroked outlines of positioned glyphs.
+
+        Args:
+            glyph_runs (List[QGlyphRun]): The positioned glyphs.
+            outline_pen (QPen): The outline pen.
+            device_pixel_ratio (float): The device pixel ratio the layers are displayed at.
+
+        Returns:
+            Tuple[List[Tuple[QPointF, QPixmap]], QRectF]: Where each outline is drawn and the rectangle they cover,
+                                                          glyphs without outline, e.g. spaces, are left out.
+        """
+        padding: float = ANTIALIASING_PADDING + outline_pen.widthF() / 2.0
+
+        def render(path: QPainterPath) -> Tuple[QPixmap, QRectF]:
+            return render_pixmap(
+                path.boundingRect().adjusted(-padding, -padding, padding, padding),
+                lambda painter: painter.strokePath(path, outline_pen),
+                device_pixel_ratio
+            )
+
+        return self._layers(
+            glyph_runs, ("outline", pen_key(outline_pen), device_pixel_ratio), render, SUBPIXEL_STEPS
+        )
+
+    def shadow_layers(
+            self,
+            glyph_runs: List[QGlyphRun],
+            color: QColor,
+            outline_pen: Optional[QPen],
+            drop_shadow_offset: QPointF,
+            drop_shadow_blur_radius: float,
+            drop_shadow_color: QColor,
+            device_pixel_ratio: float = 1.0
+    ) -> Tuple[List[Tuple[QPointF, QPixmap]], QRectF]:
+        """
+        Get the drop shadows positioned glyphs cast with their outline, the way SpriteCache.shadowed casts them.
+
+        Args:
+            glyph_runs (List[QGlyphRun]): The positioned glyphs.
+            color (QColor): The fill color of the glyphs.
+            outline_pen (Optional[QPen]): The outline pen, or None for no outline.
+            drop_shadow_offset (QPointF): The offset of the drop shadow.
+            drop_shadow_blur_radius (float): The blur radius of the drop shadow.
+            drop_shadow_color (QColor): The color of the drop shadow.
+            device_pixel_ratio (float): The device pixel ratio the layers are displayed at.
+
+        Returns:
+            Tuple[List[Tuple[QPointF, QPixmap]], QRectF]: Where each shadow is drawn and the rectangle they cover,
+                                                          glyphs without ink, e.g. spaces, are left out.
+        """
+        padding: float = ANTIALIASING_PADDING + (outline_pen.widthF() / 2.0 if outline_pen is not None else 0.0)
+
+        def render(path: QPainterPath) -> Tuple[QPixmap, QRectF]:
+            def render_glyph(painter: QPainter) -> None:
+                if outline_pen is not None:
+                    painter.strokePath(path, outline_pen)
+                painter.fillPath(path, color)
+
+            glyph_pixmap, glyph_rect = render_pixmap(
+                path.boundingRect().adjusted(-padding, -padding, padding, padding), render_glyph, device_pixel_ratio
+            )
+            return render_drop_shadow_layer(
+                glyph_pixmap, glyph_rect, drop_shadow_offset, drop_shadow_blur_radius, drop_shadow_color
+            )
+
+        style_key: Hashable = (
+            "shadow", color.rgba(), pen_key(outline_pen), drop_shadow_offset.x(), drop_shadow_offset.y(),
+            drop_shadow_blur_radius, drop_shadow_color.rgba(), device_pixel_ratio
+        )
+        return self._layers(glyph_runs, style_key, render, SHADOW_SUBPIXEL_STEPS)
+
+    def _layers(
+            self,
+            glyph_runs: List[QGlyphRun],
+            style_key: Hashable,
+            render: Callable[[QPainterPath], Tuple[QPixmap, QRectF]],
+            subpixel_steps: int
+    ) -> Tuple[List[Tuple[QPointF, QPixmap]], QRectF]:
+        """
+        Get a layer of every positioned glyph, rendering the layers of glyphs, styles and offsets not seen yet.
+
+        Args:
+            glyph_runs (List[QGlyphRun]): The positioned glyphs.
+            style_key (Hashable): Identifies everything render draws besides the glyph.
+            render (Callable[[QPainterPath], Tuple[QPixmap, QRectF]]): Renders the layer of a glyph path.
+            subpixel_steps (int): The number of offsets a pixel is divided into, see split_position.
+
+        Returns:
+            Tuple[List[Tuple[QPointF, QPixmap]], QRectF]: Where each layer is drawn and the rectangle they cover.
+        """
+        layers: List[Tuple[QPointF, QPixmap]] = []
+        covered_rect: QRectF = QRectF()
+        for glyph_run in glyph_runs:
+            raw_font: QRawFont = glyph_run.rawFont()
+            font_key: Hashable = raw_font_key(raw_font)
+            for glyph_index, position in zip(glyph_run.glyphIndexes(), glyph_run.positions()):
+                origin_x, origin_y, offset_x, offset_y = split_position(position.x(), position.y(), subpixel_steps)
+                key: Hashable = (style_key, font_key, glyph_index, offset_x, offset_y)
+                layer: Optional[Tuple[QPixmap, QRectF]] = self._lookup(key)
+                if layer is None:
+                    path: QPainterPath = raw_font.pathForGlyph(glyph_index).translated(offset_x, offset_y)
+                    layer = render(path) if not path.isEmpty() else (QPixmap(), QRectF())
+                    self._insert(key, layer)
+                pixmap, rect = layer
+                if pixmap.isNull():
+                    continue
+                target: QRectF = rect.translated(origin_x, origin_y)
+                layers.append((target.topLeft(), pixmap))
+                covered_rect = covered_rect.united(target)
+        return layers, covered_rect
+
+    def clear(self) -> None:
+        """Drop every rendered layer and raw font."""
+        self.layers.clear()
+        self.raw_fonts.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key: Hashable) -> Optional[Tuple[QPixmap, QRectF]]:
+        """
+        Get a rendered layer, marking it as the most recently used.
+
+        Args:
+            key (Hashable): The layer key.
+
+        Returns:
+            Optional[Tuple[QPixmap, QRectF]]: The layer, or None if it has to be rendered.
+        """
+        layer: Optional[Tuple[QPixmap, QRectF]] = self.layers.get(key)
+        if layer is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.layers.move_to_end(key)
+        return layer
+
+    def _insert(self, key: Hashable, layer: Tuple[QPixmap, QRectF]) -> None:
+        """
+        Cache a rendered layer, evicting the least recently used layers beyond max_layers.
+
+        Args:
+            key (Hashable): The layer key.
+            layer (Tuple[QPixmap, QRectF]): The rendered layer.
+        """
+        self.layers[key] = layer
+        while len(self.layers) > self.max_layers:
+            self.layers.popitem(last=False)
@@ -0,0 +1,251 @@
+# jetque/source/managers/icon_cache.py
+
+import logging
+import math
+import os
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from PyQt6.QtGui import QImage, QPainter, QPen, QPixmap
+
+from jetque.source.managers.pixmap_memory import pixmap_byte_size
+
+# Constants
+ICON_DIRECTORY: str = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "resources")
+DEFAULT_ICON_CACHE_BYTES: int = 32 * 1024 * 1024  # Memory allowed for outlined and scaled variants
+
+
+def pen_key(outline_pen: Optional[QPen]) -> Optional[Tuple]:
+    """
+    Build a hashable key from the properties of a pen that affect an outline.
+
+    Args:
+        outline_pen (Optional[QPen]): The outline pen.
+
+    Returns:
+        Optional[Tuple]: The pen key, or None for no outline.
+    """
+    if outline_pen is None:
+        return None
+    return (
+        outline_pen.color().rgba(),
+        outline_pen.widthF(),
+        outline_pen.style().value,
+        outline_pen.capStyle().value,
+        outline_pen.joinStyle().value
+    )
+
+
+def add_outline_to_image(original_image: QImage, outline_pen: QPen) -> QImage:
+    """
+    Draw a rectangular outline around an image, padding it so the outline is not clipped.
+
+    Args:
+        original_image (QImage): The image to outline.
+        outline_pen (QPen): The pen the outline is drawn with, its width is doubled like text outlines.
+
+    Returns:
+        QImage: The padded, outlined image.
+    """
+    if original_image.format() != QImage.Format.Format_ARGB32_Premultiplied:
+        original_image = original_image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+
+    local_pen: QPen = QPen(outline_pen)
+    local_pen.setWidthF(local_pen.widthF() * 2.0)
+    pen_width: float = local_pen.widthF()
+    half_pen_width: float = pen_width / 2.0
+    padding: int = math.ceil(half_pen_width)
+    under_padding: float = (1.0 - (padding - half_pen_width)) / 2.0
+    if under_padding.is_integer():
+        under_padding = 0.0
+
+    new_width: int = original_image.width() + 2 * padding
+    new_height: int = original_image.height() + 2 * padding
+
+    new_image: QImage = QImage(new_width, new_height, QImage.Format.Format_ARGB32_Premultiplied)
+    new_image.fill(Qt.GlobalColor.transparent)
+
+    painter: QPainter = QPainter(new_image)
+    try:
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setPen(local_pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+
+        rect: QRectF = QRectF(
+            padding - under_padding,
+            padding - under_padding,
+            original_image.width(),
+            original_image.height(),
+        )
+
+        painter.drawRect(rect)
+        painter.drawImage(QPointF(padding, padding), original_image)
+    except Exception as e:
+        logging.exception("Failed to add outline to image: %s", e)
+    finally:
+        painter.end()
+
+    return new_image
+
+
+class IconCache:
+    """
+    Loads every icon once and memoises its outlined and scaled variants.
+
+    Every PNG in the resources directory is decoded when the cache is created. Variants are keyed by
+    (icon, outline pen, target height, device pixel ratio) and kept within a byte budget, the least
+    recently used variants being evicted first, so creating an icon item is a dictionary lookup.
+
+    Attributes:
+        max_bytes (int): Memory allowed for cached variants.
+        images (Dict[str, QImage]): The decoded original of every loaded icon, keyed by absolute path.
+        names (Dict[str, str]): Absolute path of every preloaded icon, keyed by file name without extension.
+        variants (OrderedDict): Cached variants in least recently used order.
+        byte_count (int): Memory currently held by cached variants.
+    """
+
+    _shared: Optional["IconCache"] = None
+
+    def __init__(self, max_bytes: int = DEFAULT_ICON_CACHE_BYTES) -> None:
+        """
+        Initialize an empty icon cache.
+
+        Args:
+            max_bytes (int): Memory allowed for cached variants.
+        """
+        self.max_bytes: int = max_bytes
+        self.images: Dict[str, QImage] = {}
+        self.names: Dict[str, str] = {}
+        self.variants: "OrderedDict[Tuple, QPixmap]" = OrderedDict()
+        self.byte_count: int = 0
+
+    @classmethod
+    def shared(cls) -> "IconCache":
+        """
+        Get the application wide icon cache, preloading the resources directory on first use.
+
+        Returns:
+            IconCache: The shared icon cache.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+            cls._shared.preload()
+        return cls._shared
+
+    def preload(self, directory: str = ICON_DIRECTORY) -> None:
+        """
+        Decode every PNG in a directory.
+
+        Args:
+            directory (str): The directory to load icons from.
+        """
+        try:
+            for file_name in sorted(os.listdir(directory)):
+                name, extension = os.path.splitext(file_name)
+                if extension.lower() != ".png":
+                    continue
+                path: str = os.path.join(directory, file_name)
+                if self._load(path) is not None:
+                    self.names[name] = os.path.abspath(path)
+            logging.debug("IconCache preloaded %d icons from %s", len(self.names), directory)
+        except Exception as e:
+            logging.exception("Error preloading icons from '%s': %s", directory, e)
+
+    def pixmap(
+            self,
+            icon: str,
+            outline_pen: Optional[QPen] = None,
+            height: Optional[int] = None,
+            device_pixel_ratio: float = 1.0
+    ) -> QPixmap:
+        """
+        Get an icon, outlined and scaled as requested, rendering the variant only the first time.
+
+        Args:
+            icon (str): The icon name (e.g. "hit") or the path of an image file.
+            outline_pen (Optional[QPen]): The outline pen, or None for no outline.
+            height (Optional[int]): The target height in logical pixels, or None to keep the original size.
+            device_pixel_ratio (float): The device pixel ratio the icon is displayed at.
+
+        Returns:
+            QPixmap: The cached pixmap, or a null pixmap if the icon cannot be loaded.
+        """
+        path: str = self._resolve(icon)
+        key: Tuple = (path, pen_key(outline_pen), height, device_pixel_ratio)
+
+        pixmap: Optional[QPixmap] = self.variants.get(key)
+        if pixmap is not None:
+            self.variants.move_to_end(key)
+            return pixmap
+
+        image: Optional[QImage] = self._load(path)
+        if image is None:
+            return QPixmap()
+
+        try:
+            if outline_pen is not None:
+                image = add_outline_to_image(image, outline_pen)
+            if height is not None and image.height() > 0:
+                image = image.scaledToHeight(
+                    max(1, round(height * device_pixel_ratio)),
+                    Qt.TransformationMode.SmoothTransformation
+                )
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(device_pixel_ratio)
+        except Exception as e:
+            logging.exception("Error rendering icon variant '%s': %s", icon, e)
+            return QPixmap()
+
+        self._insert(key, pixmap)
+        return pixmap
+
+    def clear(self) -> None:
+        """Drop every cached variant, keeping the decoded originals."""
+        self.variants.clear()
+        self.byte_count = 0
+
+    def _resolve(self, icon: str) -> str:
+        """
+        Get the absolute path of an icon name or path.
+
+        Args:
+            icon (str): The icon name or the path of an image file.
+
+        Returns:
+            str: The absolute path.
+        """
+        return self.names.get(icon) or os.path.abspath(icon)
+
+    def _load(self, path: str) -> Optional[QImage]:
+        """
+        Get the decoded original of an icon, reading it from disk the first time.
+
+        Args:
+            path (str): The absolute path of the image file.
+
+        Returns:
+            Optional[QImage]: The decoded image, or None if it cannot be read.
+        """
+        image: Optional[QImage] = self.images.get(path)
+        if image is None:
+            image = QImage(path)
+            if image.isNull():
+                logging.warning("Failed to load icon: %s", path)
+                return None
+            self.images[path] = image
+        return image
+
+    def _insert(self, key: Tuple, pixmap: QPixmap) -> None:
+        """
+        Cache a variant, evicting the least recently used variants beyond the byte budget.
+
+        Args:
+            key (Tuple): The variant key.
+            pixmap (QPixmap): The rendered variant.
+        """
+        self.variants[key] = pixmap
+        self.byte_count += pixmap_byte_size(pixmap)
+        while self.byte_count > self.max_bytes and len(self.variants) > 1:
+            _, evicted = self.variants.popitem(last=False)
+            self.byte_count -= pixmap_byte_size(evicted)
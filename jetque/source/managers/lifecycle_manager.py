@@ -0,0 +1,186 @@
+# jetque/source/managers/lifecycle_manager.py
+
+import functools
+import inspect
+import logging
+import weakref
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+from PyQt6.QtCore import QAbstractAnimation, QObject
+from PyQt6.QtWidgets import QGraphicsItem, QGraphicsScene
+
+
+class LifecycleManager(QObject):
+    """
+    Tracks which graphics item every animation owns and tears both down once the animation is done.
+
+    Finish callbacks only hold weak references, so a connection never keeps an animation alive,
+    and finished items are removed from the scene before being scheduled for deletion.
+    Live instance counts per class are kept so leaks show up as counts that keep growing.
+
+    Attributes:
+        scene (Optional[QGraphicsScene]): The scene animation items are displayed in.
+        tracked_items (Dict[int, QGraphicsItem]): Graphics item owned by each tracked animation, keyed by id().
+        created_counts (Counter): Number of tracked objects created per class name.
+        destroyed_counts (Counter): Number of tracked objects destroyed per class name.
+    """
+
+    def __init__(self, scene: Optional[QGraphicsScene] = None, parent: Optional[QObject] = None) -> None:
+        """
+        Initialize the LifecycleManager.
+
+        Args:
+            scene (Optional[QGraphicsScene]): The scene animation items are displayed in.
+            parent (Optional[QObject]): The parent object.
+        """
+        super().__init__(parent)
+        self.scene: Optional[QGraphicsScene] = scene
+        self.tracked_items: Dict[int, QGraphicsItem] = {}
+        self.created_counts: Counter = Counter()
+        self.destroyed_counts: Counter = Counter()
+
+    def set_scene(self, scene: Optional[QGraphicsScene]) -> None:
+        """
+        Set the scene animation items are displayed in.
+
+        Args:
+            scene (Optional[QGraphicsScene]): The scene, or None to stop displaying items.
+        """
+        self.scene = scene
+
+    def track(
+            self,
+            animation: QAbstractAnimation,
+            item: Optional[QGraphicsItem],
+            on_finished: Optional[Callable[[QAbstractAnimation], None]] = None
+    ) -> None:
+        """
+        Start tracking an animation and the graphics item it owns.
+
+        Args:
+            animation (QAbstractAnimation): The animation to track.
+            item (Optional[QGraphicsItem]): The graphics item the animation owns.
+            on_finished (Optional[Callable[[QAbstractAnimation], None]]): Called with the animation once it finishes.
+                                                                          Bound methods are held weakly.
+        """
+        try:
+            self.tracked_items[id(animation)] = item
+            self._count_creation(animation)
+            if item is not None:
+                self._count_creation(item)
+
+            callback_reference = None
+            if on_finished is not None:
+                callback_reference = (
+                    weakref.WeakMethod(on_finished) if inspect.ismethod(on_finished) else lambda: on_finished
+                )
+            animation.finished.connect(
+                functools.partial(self._on_animation_finished, weakref.ref(animation), callback_reference)
+            )
+        except Exception as e:
+            logging.exception("Error tracking animation: %s", e)
+
+    def display(self, item: QGraphicsItem) -> None:
+        """
+        Add a tracked item to the scene.
+
+        Args:
+            item (QGraphicsItem): The graphics item to display.
+        """
+        if self.scene is not None and item.scene() is None:
+            self.scene.addItem(item)
+
+    def release(self, animation: QAbstractAnimation) -> None:
+        """
+        Remove the animation's item from the scene and schedule both for deletion.
+        Releasing an animation more than once has no effect.
+
+        Args:
+            animation (QAbstractAnimation): The tracked animation to release.
+        """
+        if id(animation) not in self.tracked_items:
+            return
+
+        item: Optional[QGraphicsItem] = self.tracked_items.pop(id(animation))
+        try:
+            if item is not None:
+                if item.scene() is not None:
+                    item.scene().removeItem(item)
+                if isinstance(item, QObject):
+                    item.deleteLater()
+            if hasattr(animation, "animation_object"):
+                animation.animation_object = None
+            animation.deleteLater()
+        except Exception as e:
+            logging.exception("Error releasing animation: %s", e)
+
+    def live_counts(self) -> Dict[str, int]:
+        """
+        Get the number of tracked objects still alive per class name.
+
+        Returns:
+            Dict[str, int]: Live instance counts, omitting classes with none alive.
+        """
+        counts: Counter = self.created_counts - self.destroyed_counts
+        return dict(counts)
+
+    def tracked_count(self) -> int:
+        """
+        Get the number of animations currently tracked.
+
+        Returns:
+            int: The number of tracked animations.
+        """
+        return len(self.tracked_items)
+
+    def _count_creation(self, tracked_object: object) -> None:
+        """
+        Count a newly tracked object and arrange for its destruction to be counted.
+
+        Args:
+            tracked_object (object): The animation or graphics item being tracked.
+        """
+        class_name: str = type(tracked_object).__name__
+        self.created_counts[class_name] += 1
+        # Bind the counter rather than self, tracked children may outlive this manager's Python attributes
+        on_destroyed = functools.partial(self._count_destruction, self.destroyed_counts, class_name)
+        if isinstance(tracked_object, QObject):
+            tracked_object.destroyed.connect(on_destroyed)
+        else:
+            weakref.finalize(tracked_object, on_destroyed)
+
+    @staticmethod
+    def _count_destruction(destroyed_counts: Counter, class_name: str, *_) -> None:
+        """
+        Count the destruction of a tracked object.
+
+        Args:
+            destroyed_counts (Counter): The counter to update.
+            class_name (str): The class name of the destroyed object.
+        """
+        destroyed_counts[class_name] += 1
+
+    def _on_animation_finished(
+            self,
+            animation_reference: weakref.ref,
+            callback_reference: Optional[Callable[[], Optional[Callable[[QAbstractAnimation], None]]]]
+    ) -> None:
+        """
+        Hand a finished animation to its callback, then release it.
+
+        Args:
+            animation_reference (weakref.ref): Weak reference to the finished animation.
+            callback_reference (Optional[Callable]): Weak reference to the finish callback.
+        """
+        animation: Optional[QAbstractAnimation] = animation_reference()
+        if animation is None:
+            return
+        try:
+            callback = callback_reference() if callback_reference is not None else None
+            if callback is not None:
+                callback(animation)
+        except Exception as e:
+            logging.exception("Error in animation finished callback: %s", e)
+        finally:
+            self.release(animation)
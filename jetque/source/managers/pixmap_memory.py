@@ -0,0 +1,16 @@
+# jetque/source/managers/pixmap_memory.py
+
+from PyQt6.QtGui import QPixmap
+
+
+def pixmap_byte_size(pixmap: QPixmap) -> int:
+    """
+    Estimate the memory held by a pixmap, the measure the pixmap caches keep their byte budgets with.
+
+    Args:
+        pixmap (QPixmap): The pixmap.
+
+    Returns:
+        int: The size in bytes.
+    """
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
@@ -0,0 +1,153 @@
+# jetque/source/managers/shadow_renderer.py
+
+import logging
+import math
+from typing import Tuple
+
+from PyQt6.QtCore import QPointF, QRect, QRectF, Qt
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
+from PyQt6.QtWidgets import QGraphicsDropShadowEffect, QGraphicsPixmapItem, QGraphicsScene
+
+
+def bake_drop_shadow(
+        pixmap: QPixmap,
+        rect: QRectF,
+        offset: QPointF,
+        blur_radius: float,
+        color: QColor
+) -> Tuple[QPixmap, QRectF]:
+    """
+    Render a pixmap through a QGraphicsDropShadowEffect once, keeping the shadow and the pixmap in one image.
+
+    The effect itself does the offsetting, blurring and coloring, so the baked result looks like the live
+    effect with the same parameters, but the blur runs once instead of on every frame the item changes.
+
+    Args:
+        pixmap (QPixmap): The pixmap casting the shadow, drawn at its device pixel ratio.
+        rect (QRectF): The logical rectangle the pixmap covers in item coordinates.
+        offset (QPointF): The offset of the shadow.
+        blur_radius (float): The blur radius of the shadow.
+        color (QColor): The color of the shadow.
+
+    Returns:
+        Tuple[QPixmap, QRectF]: The pixmap drawn over its shadow and the logical rectangle the result covers,
+                                or the pixmap and rectangle unchanged if baking failed.
+    """
+    if pixmap.isNull():
+        return pixmap, rect
+
+    try:
+        effect: QGraphicsDropShadowEffect = QGraphicsDropShadowEffect()
+        effect.setOffset(offset)
+        effect.setBlurRadius(blur_radius)
+        effect.setColor(color)
+
+        item: QGraphicsPixmapItem = QGraphicsPixmapItem(pixmap)
+        item.setOffset(rect.topLeft())
+        item.setGraphicsEffect(effect)
+        scene: QGraphicsScene = QGraphicsScene()
+        scene.addItem(item)
+
+        aligned_rect: QRect = effect.boundingRectFor(rect).toAlignedRect()
+        device_pixel_ratio: float = pixmap.devicePixelRatio()
+        image: QImage = QImage(
+            max(1, math.ceil(aligned_rect.width() * device_pixel_ratio)),
+            max(1, math.ceil(aligned_rect.height() * device_pixel_ratio)),
+            QImage.Format.Format_ARGB32_Premultiplied
+        )
+        image.setDevicePixelRatio(device_pixel_ratio)
+        image.fill(Qt.GlobalColor.transparent)
+
+        painter: QPainter = QPainter(image)
+        try:
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+            scene.render(
+                painter,
+                QRectF(0.0, 0.0, aligned_rect.width(), aligned_rect.height()),
+                QRectF(aligned_rect)
+            )
+        finally:
+            painter.end()
+
+        return QPixmap.fromImage(image), QRectF(aligned_rect)
+    except Exception as e:
+        logging.exception("Failed to bake drop shadow: %s", e)
+        return pixmap, rect
+
+
+def render_drop_shadow_layer(
+        pixmap: QPixmap,
+        rect: QRectF,
+        offset: QPointF,
+        blur_radius: float,
+        color: QColor
+) -> Tuple[QPixmap, QRectF]:
+    """
+    Render only the drop shadow a QGraphicsDropShadowEffect would cast from a pixmap, without the pixmap itself.
+
+    The effect is run with its offset pushed past the blurred edge of the pixmap, so the shadow does not overlap
+    the source and can be cropped out, then moved back by a whole number of pixels to the requested offset.
+    Shadows of sources that do not overlap can be added to each other to get the shadow of their union.
+
+    Args:
+        pixmap (QPixmap): The pixmap casting the shadow, drawn at its device pixel ratio.
+        rect (QRectF): The logical rectangle the pixmap covers in item coordinates.
+        offset (QPointF): The offset of the shadow.
+        blur_radius (float): The blur radius of the shadow.
+        color (QColor): The color of the shadow.
+
+    Returns:
+        Tuple[QPixmap, QRectF]: The shadow and the logical rectangle it covers, or a null pixmap if rendering failed.
+    """
+    if pixmap.isNull():
+        return QPixmap(), QRectF()
+
+    try:
+        shift: float = float(math.ceil(rect.width() + 2.0 * blur_radius) + 2)
+        effect: QGraphicsDropShadowEffect = QGraphicsDropShadowEffect()
+        effect.setOffset(offset + QPointF(shift, 0.0))
+        effect.setBlurRadius(blur_radius)
+        effect.setColor(color)
+
+        item: QGraphicsPixmapItem = QGraphicsPixmapItem(pixmap)
+        item.setOffset(rect.topLeft())
+        item.setGraphicsEffect(effect)
+        scene: QGraphicsScene = QGraphicsScene()
+        scene.addItem(item)
+
+        region_rect: QRect = effect.boundingRectFor(rect).toAlignedRect()
+        shadow_rect: QRect = rect.translated(offset + QPointF(shift, 0.0)).adjusted(
+            -blur_radius, -blur_radius, blur_radius, blur_radius
+        ).toAlignedRect().intersected(region_rect)
+        device_pixel_ratio: float = pixmap.devicePixelRatio()
+        image: QImage = QImage(
+            max(1, math.ceil(region_rect.width() * device_pixel_ratio)),
+            max(1, math.ceil(region_rect.height() * device_pixel_ratio)),
+            QImage.Format.Format_ARGB32_Premultiplied
+        )
+        image.setDevicePixelRatio(device_pixel_ratio)
+        image.fill(Qt.GlobalColor.transparent)
+
+        # The whole region is rendered because the effect only blurs the part of its source that is exposed
+        painter: QPainter = QPainter(image)
+        try:
+            scene.render(
+                painter,
+                QRectF(0.0, 0.0, region_rect.width(), region_rect.height()),
+                QRectF(region_rect)
+            )
+        finally:
+            painter.end()
+
+        shadow_image: QImage = image.copy(
+            round((shadow_rect.x() - region_rect.x()) * device_pixel_ratio),
+            round((shadow_rect.y() - region_rect.y()) * device_pixel_ratio),
+            math.ceil(shadow_rect.width() * device_pixel_ratio),
+            math.ceil(shadow_rect.height() * device_pixel_ratio)
+        )
+        shadow_image.setDevicePixelRatio(device_pixel_ratio)
+
+        return QPixmap.fromImage(shadow_image), QRectF(shadow_rect).translated(-shift, 0.0)
+    except Exception as e:
+        logging.exception("Failed to render drop shadow layer: %s", e)
+        return QPixmap(), QRectF()
@@ -0,0 +1,161 @@
+# jetque/source/managers/sound_bank.py
+
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from PyQt6.QtCore import QElapsedTimer, QObject, QUrl
+from PyQt6.QtMultimedia import QSoundEffect
+
+from jetque.source.managers.sound_cue import SoundCue
+
+# Constants
+DEFAULT_VOICES_PER_SOUND: int = 3  # Pre-decoded effects per sound, i.e. how often one sound can overlap
+DEFAULT_MAX_CONCURRENT_PLAYS: int = 8  # Voices allowed to play at once across every sound
+DEFAULT_REPEAT_WINDOW: int = 40  # Milliseconds in which repeats of the same sound merge into one play
+
+
+class SoundBank(QObject):
+    """
+    Preloads every configured sound once and plays it from a small pool of pre-decoded voices.
+
+    Audio files are decoded when a sound is first loaded, never on the hit path. Plays are capped
+    per sound by the size of its voice pool and in total by max_concurrent_plays, and repeats of a
+    sound within repeat_window milliseconds are merged into the play already started.
+
+    Attributes:
+        voices_per_sound (int): Number of pre-decoded effects created per sound.
+        max_concurrent_plays (int): Number of voices allowed to play at once across every sound.
+        repeat_window (int): Milliseconds in which repeats of the same sound are merged.
+        voices (Dict[str, List[QSoundEffect]]): The voice pool of every loaded sound, keyed by source.
+        cues (Dict[str, SoundCue]): The shared cue of every loaded sound, keyed by source.
+        last_played (Dict[str, int]): Clock time in milliseconds of the last play of every sound.
+        dropped_count (int): Number of plays dropped by the limits or merged into earlier plays.
+        clock (QElapsedTimer): Monotonic clock the repeat window is measured with.
+    """
+
+    def __init__(
+            self,
+            voices_per_sound: int = DEFAULT_VOICES_PER_SOUND,
+            max_concurrent_plays: int = DEFAULT_MAX_CONCURRENT_PLAYS,
+            repeat_window: int = DEFAULT_REPEAT_WINDOW,
+            parent: Optional[QObject] = None
+    ) -> None:
+        """
+        Initialize an empty sound bank.
+
+        Args:
+            voices_per_sound (int): Number of pre-decoded effects created per sound.
+            max_concurrent_plays (int): Number of voices allowed to play at once across every sound.
+            repeat_window (int): Milliseconds in which repeats of the same sound are merged.
+            parent (Optional[QObject]): The parent object.
+        """
+        super().__init__(parent)
+        self.voices_per_sound: int = max(1, voices_per_sound)
+        self.max_concurrent_plays: int = max(1, max_concurrent_plays)
+        self.repeat_window: int = repeat_window
+        self.voices: Dict[str, List[QSoundEffect]] = {}
+        self.cues: Dict[str, SoundCue] = {}
+        self.last_played: Dict[str, int] = {}
+        self.dropped_count: int = 0
+        self.clock: QElapsedTimer = QElapsedTimer()
+        self.clock.start()
+
+    def preload(self, sources: Iterable[str]) -> None:
+        """
+        Load and decode every given sound up front.
+
+        Args:
+            sources (Iterable[str]): Paths of the sound files.
+        """
+        for source in sources:
+            self.cue(source)
+
+    def cue(self, source: Optional[str]) -> Optional[SoundCue]:
+        """
+        Get the cue of a sound, loading its voice pool the first time the sound is requested.
+
+        Args:
+            source (Optional[str]): Path of the sound file.
+
+        Returns:
+            Optional[SoundCue]: The shared cue, or None if no sound is given or it failed to load.
+        """
+        if not source:
+            return None
+
+        sound_cue: Optional[SoundCue] = self.cues.get(source)
+        if sound_cue is not None:
+            return sound_cue
+
+        try:
+            url: QUrl = QUrl.fromLocalFile(source)
+            voices: List[QSoundEffect] = []
+            for _ in range(self.voices_per_sound):
+                voice = QSoundEffect(self)
+                voice.setSource(url)
+                voices.append(voice)
+            self.voices[source] = voices
+            sound_cue = SoundCue(self, source)
+            self.cues[source] = sound_cue
+            logging.debug("SoundBank loaded %d voices for: %s", len(voices), source)
+            return sound_cue
+        except Exception as e:
+            logging.exception("Error loading sound '%s': %s", source, e)
+            return None
+
+    def play(self, source: str) -> bool:
+        """
+        Play a loaded sound on a free voice, unless a limit drops the play.
+
+        Args:
+            source (str): Path of the sound file.
+
+        Returns:
+            bool: True if the sound started playing, False if the play was dropped.
+        """
+        voices: Optional[List[QSoundEffect]] = self.voices.get(source)
+        if not voices:
+            logging.warning("Sound was not preloaded: %s", source)
+            return False
+
+        now: int = self.clock.elapsed()
+        last_played: Optional[int] = self.last_played.get(source)
+        if last_played is not None and now - last_played < self.repeat_window:
+            self.dropped_count += 1
+            return False
+
+        if self.playing_count() >= self.max_concurrent_plays:
+            self.dropped_count += 1
+            return False
+
+        for voice in voices:
+            if not voice.isPlaying():
+                try:
+                    voice.play()
+                    self.last_played[source] = now
+                    return True
+                except Exception as e:
+                    logging.exception("Error playing sound '%s': %s", source, e)
+                    return False
+
+        self.dropped_count += 1
+        return False
+
+    def playing_count(self) -> int:
+        """
+        Count the voices currently playing across every sound.
+
+        Returns:
+            int: The number of playing voices.
+        """
+        return sum(voice.isPlaying() for voices in self.voices.values() for voice in voices)
+
+    def clear(self) -> None:
+        """Stop and release every loaded sound."""
+        for voices in self.voices.values():
+            for voice in voices:
+                voice.stop()
+                voice.deleteLater()
+        self.voices.clear()
+        self.cues.clear()
+        self.last_played.clear()
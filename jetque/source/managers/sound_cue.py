@@ -0,0 +1,36 @@
+# jetque/source/managers/sound_cue.py
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from jetque.source.managers.sound_bank import SoundBank
+
+
+class SoundCue:
+    """
+    Handle to a preloaded sound, handed to animations in place of their own QSoundEffect.
+
+    Attributes:
+        sound_bank (SoundBank): The bank the sound is preloaded in.
+        source (str): Path of the sound file.
+    """
+
+    def __init__(self, sound_bank: "SoundBank", source: str) -> None:
+        """
+        Initialize the SoundCue.
+
+        Args:
+            sound_bank (SoundBank): The bank the sound is preloaded in.
+            source (str): Path of the sound file.
+        """
+        self.sound_bank: "SoundBank" = sound_bank
+        self.source: str = source
+
+    def play(self) -> bool:
+        """
+        Play the sound on a free voice of the bank.
+
+        Returns:
+            bool: True if the sound started playing, False if the play was dropped.
+        """
+        return self.sound_bank.play(self.source)
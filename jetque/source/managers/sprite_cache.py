@@ -0,0 +1,340 @@
+# jetque/source/managers/sprite_cache.py
+
+import logging
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional, Tuple
+
+from PyQt6.QtCore import QPointF, QRect, QRectF, Qt
+from PyQt6.QtGui import QColor, QFont, QFontMetricsF, QImage, QPainter, QPainterPath, QPen, QPixmap
+
+from jetque.source.managers.icon_cache import pen_key
+from jetque.source.managers.pixmap_memory import pixmap_byte_size
+from jetque.source.managers.shadow_renderer import bake_drop_shadow
+
+# Constants
+DEFAULT_SPRITE_CACHE_BYTES: int = 64 * 1024 * 1024  # Memory allowed for rendered sprites
+TEXT_MARGIN: float = 4.0  # Default QTextDocument margin, so sprites line up with QGraphicsTextItem text
+ANTIALIASING_PADDING: float = 1.0  # Room for antialiased edges around the glyphs
+
+
+@dataclass(frozen=True)
+class Sprite:
+    """
+    A pre-rendered image and where it is drawn in the coordinates of the item displaying it.
+
+    Attributes:
+        pixmap (QPixmap): The premultiplied image, its device pixel ratio already set.
+        rect (QRectF): The logical rectangle the pixmap covers in item coordinates.
+        layout_rect (QRectF): The text box the sprite was laid out in, used as transform origin and collision rect.
+    """
+    pixmap: QPixmap
+    rect: QRectF
+    layout_rect: QRectF
+
+
+def render_pixmap(
+        rect: QRectF,
+        render: Callable[[QPainter], None],
+        device_pixel_ratio: float = 1.0
+) -> Tuple[QPixmap, QRectF]:
+    """
+    Render content into a premultiplied pixmap aligned to whole logical pixels.
+
+    Args:
+        rect (QRectF): The logical rectangle the content is drawn in.
+        render (Callable[[QPainter], None]): Draws the content in item coordinates.
+        device_pixel_ratio (float): The device pixel ratio the pixmap is displayed at.
+
+    Returns:
+        Tuple[QPixmap, QRectF]: The pixmap and the logical rectangle it covers, or a null pixmap if rendering failed.
+    """
+    aligned_rect: QRect = rect.toAlignedRect()
+    image: QImage = QImage(
+        max(1, math.ceil(aligned_rect.width() * device_pixel_ratio)),
+        max(1, math.ceil(aligned_rect.height() * device_pixel_ratio)),
+        QImage.Format.Format_ARGB32_Premultiplied
+    )
+    image.setDevicePixelRatio(device_pixel_ratio)
+    image.fill(Qt.GlobalColor.transparent)
+
+    painter: QPainter = QPainter(image)
+    try:
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+        painter.translate(-aligned_rect.x(), -aligned_rect.y())
+        render(painter)
+    except Exception as e:
+        logging.exception("Failed to render sprite: %s", e)
+        return QPixmap(), QRectF()
+    finally:
+        painter.end()
+
+    return QPixmap.fromImage(image), QRectF(aligned_rect)
+
+
+class SpriteCache:
+    """
+    Renders each distinct text, style and device pixel ratio once to a pixmap and memoises it.
+
+    A moving label then only blits its sprite each frame instead of stroking and filling glyph outlines.
+    Sprites are kept within a byte budget, the least recently used sprites being evicted first, so
+    frequent strings such as damage numbers and skill names stay rendered.
+
+    Attributes:
+        max_bytes (int): Memory allowed for cached sprites.
+        sprites (OrderedDict): Cached sprites in least recently used order.
+        byte_count (int): Memory currently held by cached sprites.
+        hits (int): Number of sprites answered from the cache.
+        misses (int): Number of sprites that had to be rendered.
+    """
+
+    _shared: Optional["SpriteCache"] = None
+
+    def __init__(self, max_bytes: int = DEFAULT_SPRITE_CACHE_BYTES) -> None:
+        """
+        Initialize an empty sprite cache.
+
+        Args:
+            max_bytes (int): Memory allowed for cached sprites.
+        """
+        self.max_bytes: int = max_bytes
+        self.sprites: "OrderedDict[Hashable, Sprite]" = OrderedDict()
+        self.byte_count: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @classmethod
+    def shared(cls) -> "SpriteCache":
+        """
+        Get the application wide sprite cache.
+
+        Returns:
+            SpriteCache: The shared sprite cache.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def text_sprite(
+            self,
+            font: QFont,
+            text: str,
+            color: QColor,
+            outline_pen: Optional[QPen] = None,
+            icon_pixmap: Optional[QPixmap] = None,
+            icon_alignment: str = "left",
+            icon_padding: float = 0.0,
+            device_pixel_ratio: float = 1.0,
+            font_metrics: Optional[QFontMetricsF] = None
+    ) -> Sprite:
+        """
+        Get the sprite of a text with its outline, fill and icon baked in, rendering it only the first time.
+
+        The glyphs are placed like QGraphicsTextItem places plain text, so the sprite can replace such an item
+        without moving its text. The outline pen is stroked along the glyph outlines and the fill is drawn over it,
+        so only the outer half of the pen shows.
+
+        Args:
+            font (QFont): The font of the text.
+            text (str): The text.
+            color (QColor): The fill color of the glyphs.
+            outline_pen (Optional[QPen]): The outline pen, or None for no outline.
+            icon_pixmap (Optional[QPixmap]): An icon drawn beside the text at the height of the font, or None.
+            icon_alignment (str): The side of the text the icon is drawn on, "left" or "right".
+            icon_padding (float): The gap between the icon and the text.
+            device_pixel_ratio (float): The device pixel ratio the sprite is displayed at.
+            font_metrics (Optional[QFontMetricsF]): Shared metrics of font, measured here if not provided.
+
+        Returns:
+            Sprite: The cached sprite.
+        """
+        key: Hashable = (
+            font.key(),
+            text,
+            color.rgba(),
+            pen_key(outline_pen),
+            icon_pixmap.cacheKey() if icon_pixmap is not None else None,
+            icon_alignment,
+            icon_padding,
+            device_pixel_ratio
+        )
+        sprite: Optional[Sprite] = self._lookup(key)
+        if sprite is not None:
+            return sprite
+
+        metrics: QFontMetricsF = font_metrics if font_metrics is not None else QFontMetricsF(font)
+        advance: float = metrics.horizontalAdvance(text)
+        layout_rect: QRectF = QRectF(0.0, 0.0, advance + 2.0 * TEXT_MARGIN, metrics.height() + 2.0 * TEXT_MARGIN)
+        baseline: QPointF = QPointF(TEXT_MARGIN, TEXT_MARGIN + metrics.ascent())
+        padding: float = ANTIALIASING_PADDING + (outline_pen.widthF() / 2.0 if outline_pen is not None else 0.0)
+        ink_rect: QRectF = QRectF(
+            TEXT_MARGIN - padding,
+            TEXT_MARGIN - padding,
+            advance + 2.0 * padding,
+            metrics.height() + 2.0 * padding
+        ).united(layout_rect)
+
+        icon_rect: QRectF = QRectF()
+        if icon_pixmap is not None and not icon_pixmap.isNull() and icon_pixmap.height() > 0:
+            icon_height: float = metrics.height()
+            icon_width: float = icon_height * icon_pixmap.width() / icon_pixmap.height()
+            if icon_alignment.lower() == "right":
+                icon_x: float = TEXT_MARGIN + advance + padding + icon_padding
+            else:
+                icon_x = TEXT_MARGIN - padding - icon_padding - icon_width
+            icon_rect = QRectF(icon_x, TEXT_MARGIN, icon_width, icon_height)
+            ink_rect = ink_rect.united(icon_rect)
+
+        def render(painter: QPainter) -> None:
+            if outline_pen is not None:
+                path: QPainterPath = QPainterPath()
+                path.addText(baseline, font, text)
+                painter.strokePath(path, outline_pen)
+                painter.fillPath(path, color)
+            else:
+                painter.setFont(font)
+                painter.setPen(color)
+                painter.drawText(baseline, text)
+            if not icon_rect.isNull():
+                painter.drawPixmap(icon_rect, icon_pixmap, QRectF(icon_pixmap.rect()))
+
+        return self._render(key, ink_rect, layout_rect, render, device_pixel_ratio)
+
+    def sprite(
+            self,
+            key: Hashable,
+            rect: QRectF,
+            render: Callable[[QPainter], None],
+            device_pixel_ratio: float = 1.0
+    ) -> Sprite:
+        """
+        Get a sprite drawn by a callback, calling it only the first time the key is requested.
+
+        Args:
+            key (Hashable): Identifies everything the callback draws, the device pixel ratio is added to it.
+            rect (QRectF): The logical rectangle the callback draws in, in item coordinates.
+            render (Callable[[QPainter], None]): Draws the content in item coordinates.
+            device_pixel_ratio (float): The device pixel ratio the sprite is displayed at.
+
+        Returns:
+            Sprite: The cached sprite.
+        """
+        full_key: Hashable = (key, device_pixel_ratio)
+        sprite: Optional[Sprite] = self._lookup(full_key)
+        if sprite is not None:
+            return sprite
+        return self._render(full_key, rect, rect, render, device_pixel_ratio)
+
+    def shadowed(self, sprite: Sprite, offset: QPointF, blur_radius: float, color: QColor) -> Sprite:
+        """
+        Get a sprite with a drop shadow baked beneath it, blurring the shadow only the first time.
+
+        Args:
+            sprite (Sprite): The sprite casting the shadow.
+            offset (QPointF): The offset of the shadow.
+            blur_radius (float): The blur radius of the shadow.
+            color (QColor): The color of the shadow.
+
+        Returns:
+            Sprite: The cached shadowed sprite, sharing the layout rect of the original.
+        """
+        key: Hashable = ("shadow", sprite.pixmap.cacheKey(), offset.x(), offset.y(), blur_radius, color.rgba())
+        shadowed: Optional[Sprite] = self._lookup(key)
+        if shadowed is not None:
+            return shadowed
+
+        pixmap, rect = bake_drop_shadow(sprite.pixmap, sprite.rect, offset, blur_radius, color)
+        shadowed = Sprite(pixmap, rect, sprite.layout_rect)
+        self._insert(key, shadowed)
+        return shadowed
+
+    def composed(self, key: Hashable, compose: Callable[[], Optional[Sprite]]) -> Optional[Sprite]:
+        """
+        Get a sprite assembled by a callback, e.g. from glyph atlas cells, assembling it only the first time.
+
+        Args:
+            key (Hashable): Identifies everything the callback assembles.
+            compose (Callable[[], Optional[Sprite]]): Assembles the sprite, or returns None if it cannot.
+
+        Returns:
+            Optional[Sprite]: The cached sprite, or None if the callback could not assemble it.
+        """
+        sprite: Optional[Sprite] = self._lookup(key)
+        if sprite is not None:
+            return sprite
+
+        sprite = compose()
+        if sprite is not None:
+            self._insert(key, sprite)
+        return sprite
+
+    def clear(self) -> None:
+        """Drop every cached sprite, e.g. after the configured styles change."""
+        self.sprites.clear()
+        self.byte_count = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key: Hashable) -> Optional[Sprite]:
+        """
+        Get a cached sprite, marking it as the most recently used.
+
+        Args:
+            key (Hashable): The sprite key.
+
+        Returns:
+            Optional[Sprite]: The cached sprite, or None if it has to be rendered.
+        """
+        sprite: Optional[Sprite] = self.sprites.get(key)
+        if sprite is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.sprites.move_to_end(key)
+        return sprite
+
+    def _render(
+            self,
+            key: Hashable,
+            rect: QRectF,
+            layout_rect: QRectF,
+            render: Callable[[QPainter], None],
+            device_pixel_ratio: float
+    ) -> Sprite:
+        """
+        Render a sprite and cache it.
+
+        Args:
+            key (Hashable): The sprite key.
+            rect (QRectF): The logical rectangle the content is drawn in.
+            layout_rect (QRectF): The text box of the sprite.
+            render (Callable[[QPainter], None]): Draws the content in item coordinates.
+            device_pixel_ratio (float): The device pixel ratio the sprite is displayed at.
+
+        Returns:
+            Sprite: The rendered sprite, or an empty sprite if rendering failed.
+        """
+        pixmap, pixmap_rect = render_pixmap(rect, render, device_pixel_ratio)
+        if pixmap.isNull():
+            return Sprite(QPixmap(), QRectF(), QRectF(layout_rect))
+
+        sprite: Sprite = Sprite(pixmap, pixmap_rect, QRectF(layout_rect))
+        self._insert(key, sprite)
+        return sprite
+
+    def _insert(self, key: Hashable, sprite: Sprite) -> None:
+        """
+        Cache a sprite, evicting the least recently used sprites beyond the byte budget.
+
+        Args:
+            key (Hashable): The sprite key.
+            sprite (Sprite): The rendered sprite.
+        """
+        self.sprites[key] = sprite
+        self.byte_count += pixmap_byte_size(sprite.pixmap)
+        while self.byte_count > self.max_bytes and len(self.sprites) > 1:
+            _, evicted = self.sprites.popitem(last=False)
+            self.byte_count -= pixmap_byte_size(evicted.pixmap)
@@ -0,0 +1,132 @@
+# Paint time of every item cache mode per kind of overlay item, run with: python -m tests.benchmark_cache_mode
+
+import os
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QColor, QFont, QPen
+from PyQt6.QtWidgets import QApplication, QGraphicsItem, QGraphicsScene, QGraphicsView
+
+from jetque.source.animations.anchor_circle_object import AnchorCircleObject
+from jetque.source.animations.animation_sprite import AnimationSprite
+from jetque.source.gui.items.jq_graphics_simple_text_item import JQGraphicsSimpleTextItem
+from jetque.source.managers.glyph_atlas import GlyphAtlas
+
+SCREEN_RECT: QRectF = QRectF(0, 0, 1920, 1080)
+ITEM_COUNT: int = 200
+FRAMES: int = 60
+
+CACHE_MODES: Dict[str, QGraphicsItem.CacheMode] = {
+    "NoCache": QGraphicsItem.CacheMode.NoCache,
+    "DeviceCoordinate": QGraphicsItem.CacheMode.DeviceCoordinateCache,
+    "ItemCoordinate": QGraphicsItem.CacheMode.ItemCoordinateCache,
+}
+
+
+class TimedView(QGraphicsView):
+    """A QGraphicsView that accumulates the time spent painting its viewport."""
+
+    def __init__(self, scene: QGraphicsScene) -> None:
+        super().__init__(scene)
+        self.paint_time: float = 0.0
+
+    def paintEvent(self, event) -> None:
+        start: float = time.perf_counter()
+        super().paintEvent(event)
+        self.paint_time += time.perf_counter() - start
+
+
+def move(item: QGraphicsItem, frame: int) -> None:
+    """Float the item upwards like a damage number."""
+    item.moveBy(random.uniform(-3, 3), -2)
+
+
+def move_and_scale(item: QGraphicsItem, frame: int) -> None:
+    """Float the item upwards while it pops, like a critical hit."""
+    item.moveBy(random.uniform(-3, 3), -2)
+    item.setScale(1.0 + 0.5 * abs(((frame % 20) - 10) / 10.0))
+
+
+def hold(item: QGraphicsItem, frame: int) -> None:
+    """Leave the item in place while other items move over it, like an anchor in configuration mode."""
+
+
+def run(
+        create: Callable[[], QGraphicsItem],
+        animate: Callable[[QGraphicsItem, int], None],
+        cache_mode: QGraphicsItem.CacheMode
+) -> float:
+    """
+    Animate items of one kind with one cache mode and measure the paint time per frame.
+
+    Args:
+        create (Callable[[], QGraphicsItem]): Creates an item of the measured kind.
+        animate (Callable[[QGraphicsItem, int], None]): Changes an item for the given frame.
+        cache_mode (QGraphicsItem.CacheMode): The cache mode of every item.
+
+    Returns:
+        float: The average paint time per frame in milliseconds.
+    """
+    random.seed(ITEM_COUNT)
+    scene: QGraphicsScene = QGraphicsScene(SCREEN_RECT)
+    scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+    view: TimedView = TimedView(scene)
+    view.setFixedSize(int(SCREEN_RECT.width()), int(SCREEN_RECT.height()))
+    view.setSceneRect(SCREEN_RECT)
+    view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+
+    items: List[QGraphicsItem] = []
+    for _ in range(ITEM_COUNT):
+        item: QGraphicsItem = create()
+        item.setCacheMode(cache_mode)
+        item.setPos(random.uniform(0, SCREEN_RECT.width() - 100), random.uniform(100, SCREEN_RECT.height() - 50))
+        scene.addItem(item)
+        items.append(item)
+
+    view.show()
+    QApplication.processEvents()
+    view.paint_time = 0.0
+
+    for frame in range(FRAMES):
+        for item in items:
+            animate(item, frame)
+        view.viewport().update()  # Repaint even when the measured items stand still
+        QApplication.processEvents()
+
+    view.close()
+    return view.paint_time * 1000.0 / FRAMES
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    font: QFont = QFont("Arial", 24)
+    outline_pen: QPen = QPen(QColor("black"), 2.0)
+    atlas: GlyphAtlas = GlyphAtlas(font, QColor("white"), outline_pen)
+
+    kinds = {
+        "live text, moving": (
+            lambda: JQGraphicsSimpleTextItem(font, str(random.randint(1, 99999)), drop_shadow=False), move
+        ),
+        "live text, scaling": (
+            lambda: JQGraphicsSimpleTextItem(font, str(random.randint(1, 99999)), drop_shadow=False), move_and_scale
+        ),
+        "sprite, moving": (lambda: AnimationSprite(atlas.compose(str(random.randint(1, 99999)))), move),
+        "sprite, scaling": (lambda: AnimationSprite(atlas.compose(str(random.randint(1, 99999)))), move_and_scale),
+        "anchor circle, static": (AnchorCircleObject, hold),
+    }
+
+    print(f"{'kind':<22}" + "".join(f" {name + ' ms':>19}" for name in CACHE_MODES))
+    for name, (create, animate) in kinds.items():
+        times: List[float] = [run(create, animate, cache_mode) for cache_mode in CACHE_MODES.values()]
+        print(f"{name:<22}" + "".join(f" {paint_time:>19.3f}" for paint_time in times))
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+# Headless render benchmark of the animation item kinds, run with: python -m tests.benchmark_render [--output FILE]
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import PYQT_VERSION_STR, QT_VERSION_STR, QPointF, QRectF, Qt
+from PyQt6.QtGui import QColor, QFont, QImage, QPainter, QPen, QPixmap
+from PyQt6.QtWidgets import QApplication, QGraphicsItem, QGraphicsScene
+
+from jetque.source.animations.animation_text import AnimationText
+from jetque.source.gui.items.jq_graphics_pixmap_item import JQGraphicsPixmapItem
+from jetque.source.gui.items.jq_graphics_simple_text_item import JQGraphicsSimpleTextItem
+from jetque.source.gui.items.jq_graphics_static_text_item import JQGraphicsStaticTextItem
+from jetque.source.gui.items.jq_graphics_text_item import JQGraphicsTextItem
+from jetque.source.managers.icon_cache import ICON_DIRECTORY, IconCache
+from jetque.source.managers.sprite_cache import SpriteCache
+
+SCREEN_RECT: QRectF = QRectF(0, 0, 1920, 1080)
+DEFAULT_ITEM_COUNTS: List[int] = [50, 200]
+DEFAULT_FRAMES: int = 60
+ICON_PATH: str = os.path.join(ICON_DIRECTORY, "default.png")
+FONT: QFont = QFont("Helvetica", 24, QFont.Weight.Bold)
+COLOR: QColor = QColor("gold")
+OUTLINE_PEN: QPen = QPen(QColor("black"), 2.0)
+SHADOW_OFFSET: QPointF = QPointF(3.5, 6.1)
+SHADOW_BLUR_RADIUS: float = 7.0
+SHADOW_COLOR: QColor = QColor(0, 0, 0, 191)
+
+
+class ItemBuilder:
+    """
+    Creates items of one kind with one combination of outline, drop shadow and icon.
+
+    Every benchmark run gets its own builder, so sprites and icons cached by an earlier run are not reused.
+
+    Attributes:
+        outline (bool): Whether items are outlined.
+        drop_shadow (bool): Whether items have a drop shadow.
+        icon (bool): Whether text items show an icon.
+        sprite_cache (SpriteCache): Sprite cache of this run.
+        icon_cache (IconCache): Icon cache of this run.
+    """
+
+    def __init__(self, outline: bool, drop_shadow: bool, icon: bool) -> None:
+        self.outline: bool = outline
+        self.drop_shadow: bool = drop_shadow
+        self.icon: bool = icon
+        self.sprite_cache: SpriteCache = SpriteCache()
+        self.icon_cache: IconCache = IconCache()
+
+    def animation_text(self, text: str) -> QGraphicsItem:
+        """Create an AnimationText, the item the factory used before sprites."""
+        return AnimationText(
+            FONT, text, COLOR, self.outline, OUTLINE_PEN, self.drop_shadow, SHADOW_OFFSET, SHADOW_BLUR_RADIUS,
+            SHADOW_COLOR, icon=self.icon, icon_pixmap=QPixmap(ICON_PATH) if self.icon else None
+        )
+
+    def text_item(self, text: str) -> QGraphicsItem:
+        """Create a JQGraphicsTextItem, with a JQGraphicsPixmapItem child as icon."""
+        item: JQGraphicsTextItem = JQGraphicsTextItem(
+            FONT, text, COLOR, self.outline, OUTLINE_PEN, self.drop_shadow, SHADOW_OFFSET, SHADOW_BLUR_RADIUS,
+            SHADOW_COLOR, sprite_cache=self.sprite_cache
+        )
+        self._attach_icon(item)
+        return item
+
+    def simple_text_item(self, text: str) -> QGraphicsItem:
+        """Create a JQGraphicsSimpleTextItem, with a JQGraphicsPixmapItem child as icon."""
+        item: JQGraphicsSimpleTextItem = JQGraphicsSimpleTextItem(
+            FONT, text, COLOR, self.outline, OUTLINE_PEN, self.drop_shadow, SHADOW_OFFSET, SHADOW_BLUR_RADIUS,
+            SHADOW_COLOR, sprite_cache=self.sprite_cache
+        )
+        self._attach_icon(item)
+        return item
+
+    def static_text_item(self, text: str) -> QGraphicsItem:
+        """Create a JQGraphicsStaticTextItem, which draws its icon itself."""
+        return JQGraphicsStaticTextItem(
+            FONT, text, COLOR, self.outline, OUTLINE_PEN, self.drop_shadow, SHADOW_OFFSET, SHADOW_BLUR_RADIUS,
+            SHADOW_COLOR, icon_pixmap=QPixmap(ICON_PATH) if self.icon else None, sprite_cache=self.sprite_cache
+        )
+
+    def pixmap_item(self, text: str) -> QGraphicsItem:
+        """Create a JQGraphicsPixmapItem, which is an icon by itself and ignores the text."""
+        return self._icon_item()
+
+    def _attach_icon(self, item: QGraphicsItem) -> None:
+        """Put an icon left of a text item if icons are benchmarked."""
+        if not self.icon:
+            return
+        icon: JQGraphicsPixmapItem = self._icon_item()
+        icon.setParentItem(item)
+        icon.setPos(-icon.boundingRect().width(), 0.0)
+
+    def _icon_item(self) -> JQGraphicsPixmapItem:
+        """Create an icon item with the outline and drop shadow of this run."""
+        return JQGraphicsPixmapItem(
+            ICON_PATH, self.outline, OUTLINE_PEN, self.drop_shadow, SHADOW_OFFSET, SHADOW_BLUR_RADIUS, SHADOW_COLOR,
+            icon_cache=self.icon_cache, sprite_cache=self.sprite_cache
+        )
+
+
+ITEM_KINDS: Dict[str, Callable[[ItemBuilder], Callable[[str], QGraphicsItem]]] = {
+    "AnimationText": lambda builder: builder.animation_text,
+    "JQGraphicsTextItem": lambda builder: builder.text_item,
+    "JQGraphicsSimpleTextItem": lambda builder: builder.simple_text_item,
+    "JQGraphicsStaticTextItem": lambda builder: builder.static_text_item,
+    "JQGraphicsPixmapItem": lambda builder: builder.pixmap_item,
+}
+
+
+def run(kind: str, outline: bool, drop_shadow: bool, icon: bool, item_count: int, frames: int) -> Dict[str, object]:
+    """
+    Render a scene of moving items of one kind into an image for a number of frames.
+
+    Args:
+        kind (str): One of ITEM_KINDS.
+        outline (bool): Whether items are outlined.
+        drop_shadow (bool): Whether items have a drop shadow.
+        icon (bool): Whether text items show an icon.
+        item_count (int): The number of items in the scene.
+        frames (int): The number of frames rendered.
+
+    Returns:
+        Dict[str, object]: The combination and its construction time, ms per frame and items per second.
+    """
+    random.seed(item_count)
+    create: Callable[[str], QGraphicsItem] = ITEM_KINDS[kind](ItemBuilder(outline, drop_shadow, icon))
+    scene: QGraphicsScene = QGraphicsScene(SCREEN_RECT)
+    scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+
+    start: float = time.perf_counter()
+    items: List[QGraphicsItem] = []
+    for _ in range(item_count):
+        item: QGraphicsItem = create(str(random.randint(1, 99999)))
+        item.setPos(random.uniform(50, SCREEN_RECT.width() - 150), random.uniform(100, SCREEN_RECT.height() - 50))
+        scene.addItem(item)
+        items.append(item)
+    construction_time: float = time.perf_counter() - start
+
+    image: QImage = QImage(
+        int(SCREEN_RECT.width()), int(SCREEN_RECT.height()), QImage.Format.Format_ARGB32_Premultiplied
+    )
+    start = time.perf_counter()
+    for frame in range(frames):
+        for item in items:
+            item.moveBy(random.uniform(-3, 3), -1)
+            item.setOpacity(1.0 - frame / (2.0 * frames))
+        image.fill(Qt.GlobalColor.transparent)
+        painter: QPainter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        scene.render(painter, QRectF(image.rect()), SCREEN_RECT)
+        painter.end()
+    render_time: float = time.perf_counter() - start
+
+    scene.clear()
+    return {
+        "item": kind,
+        "outline": outline,
+        "drop_shadow": drop_shadow,
+        "icon": icon,
+        "items": item_count,
+        "frames": frames,
+        "construction_ms": round(construction_time * 1000.0, 3),
+        "ms_per_frame": round(render_time * 1000.0 / frames, 3),
+        "items_per_second": round(item_count * frames / max(render_time, 1e-9), 1),
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Headless render benchmark of the animation item kinds.")
+    parser.add_argument("--items", type=int, nargs="+", default=DEFAULT_ITEM_COUNTS, help="Item counts to render")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="Frames rendered per combination")
+    parser.add_argument("--kinds", nargs="+", choices=list(ITEM_KINDS), default=list(ITEM_KINDS))
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout")
+    arguments = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    results: List[Dict[str, object]] = []
+    for kind, item_count in itertools.product(arguments.kinds, arguments.items):
+        for outline, drop_shadow, icon in itertools.product((False, True), repeat=3):
+            if kind == "JQGraphicsPixmapItem" and not icon:
+                continue  # The pixmap item is the icon
+            result: Dict[str, object] = run(kind, outline, drop_shadow, icon, item_count, arguments.frames)
+            results.append(result)
+            print(
+                f"{kind:<25} items={item_count:<5} outline={outline!s:<5} shadow={drop_shadow!s:<5} "
+                f"icon={icon!s:<5} {result['ms_per_frame']:>9.3f} ms/frame",
+                file=sys.stderr
+            )
+
+    report: Dict[str, object] = {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "pyqt": PYQT_VERSION_STR,
+        "qpa_platform": QApplication.platformName(),
+        "screen": [int(SCREEN_RECT.width()), int(SCREEN_RECT.height())],
+        "results": results,
+    }
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
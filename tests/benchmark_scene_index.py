@@ -0,0 +1,97 @@
+# Frame time of BSP tree indexing against no index, run with: python -m tests.benchmark_scene_index
+
+import os
+import random
+import sys
+import time
+from typing import List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QColor, QFont, QPen
+from PyQt6.QtWidgets import QApplication, QGraphicsScene, QGraphicsView
+
+from jetque.source.animations.anchor_object import AnchorObject
+from jetque.source.animations.animation_sprite import AnimationSprite
+from jetque.source.gui.dirty_region_tracker import DirtyRegionTracker
+from jetque.source.managers.glyph_atlas import GlyphAtlas
+
+SCREEN_RECT: QRectF = QRectF(0, 0, 1920, 1080)
+ITEM_COUNTS: List[int] = [10, 50, 200, 1000]
+ANCHOR_COUNT: int = 8
+FRAMES: int = 60
+CHURN: float = 0.05  # Share of the items expiring and respawning every frame
+
+INDEX_METHODS = {
+    "BspTree": QGraphicsScene.ItemIndexMethod.BspTreeIndex,
+    "NoIndex": QGraphicsScene.ItemIndexMethod.NoIndex,
+}
+
+
+def run(item_count: int, index_method: QGraphicsScene.ItemIndexMethod, atlas: GlyphAtlas) -> float:
+    """
+    Animate damage numbers over a scene holding a few static anchors and measure the time per frame.
+    The view repaints dirty regions like the overlay does, so the index lookups are not buried under full repaints.
+
+    Args:
+        item_count (int): The number of moving items.
+        index_method (QGraphicsScene.ItemIndexMethod): The item index method of the scene.
+        atlas (GlyphAtlas): Composes the damage number sprites.
+
+    Returns:
+        float: The average time per frame in milliseconds, moving, spawning and painting included.
+    """
+    random.seed(item_count)
+    scene: QGraphicsScene = QGraphicsScene(SCREEN_RECT)
+    scene.setItemIndexMethod(index_method)
+    view: QGraphicsView = QGraphicsView(scene)
+    view.setFixedSize(int(SCREEN_RECT.width()), int(SCREEN_RECT.height()))
+    view.setSceneRect(SCREEN_RECT)
+    view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.NoViewportUpdate)
+    tracker: DirtyRegionTracker = DirtyRegionTracker(view)
+    tracker.set_enabled(True)
+
+    for index in range(ANCHOR_COUNT):
+        anchor: AnchorObject = AnchorObject(f"Anchor {index}")
+        anchor.setPos(random.uniform(0, SCREEN_RECT.width() - 300), random.uniform(0, SCREEN_RECT.height() - 100))
+        scene.addItem(anchor)
+
+    def spawn() -> AnimationSprite:
+        item: AnimationSprite = AnimationSprite(atlas.compose(str(random.randint(1, 99999))))
+        item.setPos(random.uniform(0, SCREEN_RECT.width() - 100), random.uniform(0, SCREEN_RECT.height() - 50))
+        scene.addItem(item)
+        return item
+
+    items: List[AnimationSprite] = [spawn() for _ in range(item_count)]
+    view.show()
+    QApplication.processEvents()
+
+    start: float = time.perf_counter()
+    for _ in range(FRAMES):
+        for _ in range(max(1, int(item_count * CHURN))):
+            scene.removeItem(items.pop(0))
+            items.append(spawn())
+        for item in items:
+            item.moveBy(random.uniform(-3, 3), -2)
+        QApplication.processEvents()
+    elapsed: float = time.perf_counter() - start
+
+    view.close()
+    return elapsed * 1000.0 / FRAMES
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    atlas: GlyphAtlas = GlyphAtlas(QFont("Arial", 24), QColor("white"), QPen(QColor("black"), 2.0))
+
+    print(f"{'items':>6}" + "".join(f" {name + ' ms/frame':>17}" for name in INDEX_METHODS))
+    for item_count in ITEM_COUNTS:
+        times: List[float] = [run(item_count, method, atlas) for method in INDEX_METHODS.values()]
+        print(f"{item_count:>6}" + "".join(f" {frame_time:>17.3f}" for frame_time in times))
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
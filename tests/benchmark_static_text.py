@@ -0,0 +1,196 @@
+# Headless construction and render benchmark of the text item kinds, run with: python -m tests.benchmark_static_text
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import PYQT_VERSION_STR, QT_VERSION_STR, QPointF, QRectF, Qt
+from PyQt6.QtGui import QColor, QFont, QImage, QPainter, QPen
+from PyQt6.QtWidgets import QApplication, QGraphicsItem, QGraphicsScene
+
+from jetque.source.gui.items import jq_graphics_static_text_item
+from jetque.source.gui.items.jq_graphics_simple_text_item import JQGraphicsSimpleTextItem
+from jetque.source.gui.items.jq_graphics_static_text_item import JQGraphicsStaticTextItem
+from jetque.source.gui.items.jq_graphics_text_item import JQGraphicsTextItem
+from jetque.source.managers.glyph_cache import GlyphCache
+from jetque.source.managers.sprite_cache import SpriteCache
+
+SCREEN_RECT: QRectF = QRectF(0, 0, 1920, 1080)
+DEFAULT_ITEM_COUNT: int = 200
+DEFAULT_FRAMES: int = 30
+BASELINE_KIND: str = "JQGraphicsTextItem"
+FONT: QFont = QFont("Helvetica", 24, QFont.Weight.Bold)
+COLOR: QColor = QColor("gold")
+OUTLINE_PEN: QPen = QPen(QColor("black"), 2.0)
+SHADOW_OFFSET: QPointF = QPointF(3.5, 6.1)
+SHADOW_BLUR_RADIUS: float = 7.0
+SHADOW_COLOR: QColor = QColor(0, 0, 0, 191)
+
+ITEM_KINDS: Dict[str, Callable[..., QGraphicsItem]] = {
+    "JQGraphicsTextItem": lambda text, outline, drop_shadow, sprite_cache, glyph_cache: JQGraphicsTextItem(
+        FONT, text, COLOR, outline, OUTLINE_PEN, drop_shadow, SHADOW_OFFSET, SHADOW_BLUR_RADIUS, SHADOW_COLOR,
+        sprite_cache=sprite_cache
+    ),
+    "JQGraphicsSimpleTextItem": lambda text, outline, drop_shadow, sprite_cache, glyph_cache: JQGraphicsSimpleTextItem(
+        FONT, text, COLOR, outline, OUTLINE_PEN, drop_shadow, SHADOW_OFFSET, SHADOW_BLUR_RADIUS, SHADOW_COLOR,
+        sprite_cache=sprite_cache
+    ),
+    "JQGraphicsStaticTextItem": lambda text, outline, drop_shadow, sprite_cache, glyph_cache: JQGraphicsStaticTextItem(
+        FONT, text, COLOR, outline, OUTLINE_PEN, drop_shadow, SHADOW_OFFSET, SHADOW_BLUR_RADIUS, SHADOW_COLOR,
+        sprite_cache=sprite_cache, glyph_cache=glyph_cache
+    ),
+}
+
+
+def render_frame(scene: QGraphicsScene, image: QImage) -> float:
+    """
+    Render a scene into an image.
+
+    Args:
+        scene (QGraphicsScene): The scene.
+        image (QImage): The image the scene is rendered into.
+
+    Returns:
+        float: The render time in milliseconds.
+    """
+    start: float = time.perf_counter()
+    image.fill(Qt.GlobalColor.transparent)
+    painter: QPainter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    scene.render(painter, QRectF(image.rect()), SCREEN_RECT)
+    painter.end()
+    return (time.perf_counter() - start) * 1000.0
+
+
+def run(kind: str, outline: bool, drop_shadow: bool, item_count: int, frames: int) -> Dict[str, object]:
+    """
+    Construct items showing distinct combat numbers, then render them in a scene for a number of frames.
+
+    The first frame paints every item once, filling the item coordinate caches the items request, later
+    frames move the items and mostly blit those caches. Every run starts with empty sprite, layout and glyph
+    caches.
+
+    Args:
+        kind (str): One of ITEM_KINDS.
+        outline (bool): Whether items are outlined.
+        drop_shadow (bool): Whether items have a drop shadow.
+        item_count (int): The number of items.
+        frames (int): The number of frames rendered after the first one.
+
+    Returns:
+        Dict[str, object]: The combination, its construction time per item in microseconds and the time of
+                           its first and later frames in milliseconds.
+    """
+    random.seed(item_count)
+    texts: List[str] = [f"{random.randint(1, 999999):,}" for _ in range(item_count)]
+    sprite_cache: SpriteCache = SpriteCache()
+    jq_graphics_static_text_item._layouts.clear()
+    glyph_cache: GlyphCache = GlyphCache()
+    create: Callable[..., QGraphicsItem] = ITEM_KINDS[kind]
+
+    start: float = time.perf_counter()
+    items: List[QGraphicsItem] = [create(text, outline, drop_shadow, sprite_cache, glyph_cache) for text in texts]
+    construction_time: float = time.perf_counter() - start
+
+    scene: QGraphicsScene = QGraphicsScene(SCREEN_RECT)
+    scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+    for item in items:
+        item.setPos(random.uniform(0, SCREEN_RECT.width() - 200), random.uniform(0, SCREEN_RECT.height() - 60))
+        scene.addItem(item)
+
+    image: QImage = QImage(
+        int(SCREEN_RECT.width()), int(SCREEN_RECT.height()), QImage.Format.Format_ARGB32_Premultiplied
+    )
+    render_frame(QGraphicsScene(SCREEN_RECT), image)  # Touch the image once, so the first frame times only the items
+    first_frame_time: float = render_frame(scene, image)
+    frame_time: float = 0.0
+    for frame in range(frames):
+        for item in items:
+            item.moveBy(random.uniform(-3, 3), -1)
+            item.setOpacity(1.0 - frame / (2.0 * frames))
+        frame_time += render_frame(scene, image)
+
+    scene.clear()
+    return {
+        "item": kind,
+        "outline": outline,
+        "drop_shadow": drop_shadow,
+        "items": item_count,
+        "frames": frames,
+        "construction_us_per_item": round(construction_time * 1e6 / item_count, 2),
+        "first_frame_ms": round(first_frame_time, 3),
+        "ms_per_frame": round(frame_time / frames, 3),
+    }
+
+
+def add_speedups(results: List[Dict[str, object]]) -> None:
+    """
+    Add the speedup of every measure of a result over the baseline kind with the same outline and drop shadow.
+
+    Args:
+        results (List[Dict[str, object]]): The results of run, updated in place.
+    """
+    baselines: Dict[tuple, Dict[str, object]] = {
+        (result["outline"], result["drop_shadow"]): result for result in results if result["item"] == BASELINE_KIND
+    }
+    for result in results:
+        baseline: Optional[Dict[str, object]] = baselines.get((result["outline"], result["drop_shadow"]))
+        if baseline is None:
+            continue
+        for measure in ("construction_us_per_item", "first_frame_ms", "ms_per_frame"):
+            result[f"{measure}_speedup"] = round(baseline[measure] / max(result[measure], 1e-6), 2)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Headless construction and render benchmark of the text item kinds.")
+    parser.add_argument("--items", type=int, default=DEFAULT_ITEM_COUNT, help="Items constructed per combination")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="Frames rendered after the first one")
+    parser.add_argument("--kinds", nargs="+", choices=list(ITEM_KINDS), default=list(ITEM_KINDS))
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout")
+    arguments = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    results: List[Dict[str, object]] = []
+    for kind in arguments.kinds:
+        for outline, drop_shadow in itertools.product((False, True), repeat=2):
+            results.append(run(kind, outline, drop_shadow, arguments.items, arguments.frames))
+    add_speedups(results)
+    for result in results:
+        print(
+            f"{result['item']:<25} outline={result['outline']!s:<5} shadow={result['drop_shadow']!s:<5} "
+            f"construction={result['construction_us_per_item']:>8.2f} us/item "
+            f"first frame={result['first_frame_ms']:>8.3f} ms frame={result['ms_per_frame']:>7.3f} ms",
+            file=sys.stderr
+        )
+
+    report: Dict[str, object] = {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "pyqt": PYQT_VERSION_STR,
+        "qpa_platform": QApplication.platformName(),
+        "baseline": BASELINE_KIND,
+        "results": results,
+    }
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
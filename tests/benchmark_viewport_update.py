@@ -0,0 +1,96 @@
+# Paint time of full viewport updates against dirty region updates, run with: python -m tests.benchmark_viewport_update
+
+import os
+import random
+import sys
+import time
+from typing import List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QColor, QFont, QPen
+from PyQt6.QtWidgets import QApplication, QGraphicsScene, QGraphicsView
+
+from jetque.source.animations.animation_sprite import AnimationSprite
+from jetque.source.gui.dirty_region_tracker import DirtyRegionTracker
+from jetque.source.managers.glyph_atlas import GlyphAtlas
+
+SCREEN_RECT: QRectF = QRectF(0, 0, 1920, 1080)
+ITEM_COUNTS: List[int] = [3, 10, 50, 200, 1000]
+FRAMES: int = 60
+
+
+class TimedView(QGraphicsView):
+    """A QGraphicsView that accumulates the time spent painting its viewport."""
+
+    def __init__(self, scene: QGraphicsScene) -> None:
+        super().__init__(scene)
+        self.paint_time: float = 0.0
+        self.paint_count: int = 0
+
+    def paintEvent(self, event) -> None:
+        start: float = time.perf_counter()
+        super().paintEvent(event)
+        self.paint_time += time.perf_counter() - start
+        self.paint_count += 1
+
+
+def run(item_count: int, dirty_region: bool) -> float:
+    """
+    Move damage numbers around a full screen view and measure the paint time per frame.
+
+    Args:
+        item_count (int): The number of moving items.
+        dirty_region (bool): True to repaint dirty regions through DirtyRegionTracker, False for full updates.
+
+    Returns:
+        float: The average paint time per frame in milliseconds.
+    """
+    random.seed(item_count)
+    scene: QGraphicsScene = QGraphicsScene(SCREEN_RECT)
+    view: TimedView = TimedView(scene)
+    view.setFixedSize(int(SCREEN_RECT.width()), int(SCREEN_RECT.height()))
+    view.setSceneRect(SCREEN_RECT)
+    tracker: DirtyRegionTracker = DirtyRegionTracker(view)
+    if dirty_region:
+        view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.NoViewportUpdate)
+        tracker.set_enabled(True)
+    else:
+        view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+
+    atlas: GlyphAtlas = GlyphAtlas(QFont("Arial", 24), QColor("white"), QPen(QColor("black"), 2.0))
+    items: List[AnimationSprite] = []
+    for _ in range(item_count):
+        item: AnimationSprite = AnimationSprite(atlas.compose(str(random.randint(1, 99999))))
+        item.setPos(random.uniform(0, SCREEN_RECT.width() - 100), random.uniform(0, SCREEN_RECT.height() - 50))
+        scene.addItem(item)
+        items.append(item)
+
+    view.show()
+    QApplication.processEvents()
+    view.paint_time, view.paint_count = 0.0, 0
+
+    for _ in range(FRAMES):
+        for item in items:
+            item.moveBy(random.uniform(-3, 3), -2)
+        QApplication.processEvents()
+
+    view.close()
+    return view.paint_time * 1000.0 / FRAMES
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print(f"{'items':>6} {'full ms/frame':>14} {'dirty ms/frame':>15} {'speedup':>8}")
+    for item_count in ITEM_COUNTS:
+        full: float = run(item_count, dirty_region=False)
+        dirty: float = run(item_count, dirty_region=True)
+        print(f"{item_count:>6} {full:>14.3f} {dirty:>15.3f} {full / max(dirty, 1e-9):>7.1f}x")
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QPointF, QRectF
+from PyQt6.QtWidgets import QApplication, QGraphicsScene
+
+from jetque.source.animations.anchor_object import AnchorObject
+from jetque.source.animations.anchor_position_table import AnchorPositionTable
+
+APPLICATION = QApplication.instance() or QApplication([])
+
+
+def test_grid_positions_follow_the_overlay_geometry():
+    position_table = AnchorPositionTable(QRectF(0.0, 0.0, 1920.0, 1040.0))
+
+    assert position_table.position("Middle-Center") == QPointF(960.0, 520.0)
+
+    position_table.set_geometry(QRectF(1920.0, 0.0, 2560.0, 1400.0))
+
+    assert position_table.position("Bottom-Right") == QPointF(4480.0, 1400.0)
+    assert position_table.position("Unknown") is None
+
+
+def test_anchor_circles_are_recomputed_only_when_they_move():
+    scene = QGraphicsScene()
+    anchor = AnchorObject("Incoming")
+    scene.addItem(anchor)
+    position_table = AnchorPositionTable(QRectF(0.0, 0.0, 800.0, 600.0))
+    changes = []
+    position_table.positionsChanged.connect(lambda: changes.append(True))
+
+    position_table.watch_anchor(anchor)
+    starting_position = position_table.position("Incoming-Start")
+    position_table.recompute()
+    anchor.end_circle.setPos(300.0, 150.0)
+
+    assert starting_position == QPointF(20.0, 20.0)
+    assert position_table.position("Incoming-End") == QPointF(320.0, 170.0)
+    assert len(changes) == 2
@@ -0,0 +1,47 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QRect, QRectF
+from PyQt6.QtWidgets import QApplication, QGraphicsScene
+
+from jetque.source.animations.anchor_object import AnchorObject
+from jetque.source.gui.anchor_region_layout import AnchorRegionLayout
+
+APPLICATION = QApplication.instance() or QApplication([])
+
+
+def add_anchor(scene, name, x, y):
+    anchor = AnchorObject(name)
+    anchor.setPos(x, y)
+    scene.addItem(anchor)
+    return anchor
+
+
+def test_regions_cover_the_anchors_and_stay_on_screen():
+    scene = QGraphicsScene()
+    layout = AnchorRegionLayout(QRectF(0.0, 0.0, 3840.0, 2160.0), margin=100.0)
+    incoming = add_anchor(scene, "Incoming", 1000.0, 1000.0)
+    outgoing = add_anchor(scene, "Outgoing", 3000.0, 50.0)
+
+    regions = layout.regions([incoming, outgoing])
+
+    assert len(regions) == 2
+    assert regions[0].contains(incoming.sceneBoundingRect().toAlignedRect())
+    assert regions[0].width() * regions[0].height() < 3840 * 2160 / 20
+    assert regions[1].top() == 0
+    assert regions[1].contains(outgoing.end_circle.sceneBoundingRect().toAlignedRect())
+
+
+def test_overlapping_regions_are_merged():
+    scene = QGraphicsScene()
+    layout = AnchorRegionLayout(QRectF(0.0, 0.0, 1920.0, 1080.0), margin=100.0)
+    anchors = [add_anchor(scene, "Incoming", 200.0, 200.0), add_anchor(scene, "Outgoing", 500.0, 300.0)]
+
+    assert layout.regions(anchors) == [layout.anchor_region(anchors[0]).united(
+        layout.anchor_region(anchors[1])
+    ).toAlignedRect()]
+    assert AnchorRegionLayout.merge([QRect(0, 0, 10, 10), QRect(20, 0, 10, 10), QRect(5, 5, 20, 2)]) == [
+        QRect(0, 0, 30, 10)
+    ]
+    assert AnchorRegionLayout.merge([QRect(), QRect(0, 0, 10, 10)]) == [QRect(0, 0, 10, 10)]
@@ -0,0 +1,133 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from array import array
+
+import numpy as np
+from PyQt6.QtCore import QEasingCurve, QPointF
+from PyQt6.QtWidgets import QApplication, QGraphicsTextItem
+
+from jetque.source.animations.animation_batch import PATH_TABLE_COMPACT_ROWS, AnimationBatch
+from jetque.source.animations.dynamics.directional_animation import DirectionalAnimation
+from jetque.source.animations.dynamics.swivel_animation import SwivelAnimation
+from jetque.source.animations.easing_table import EASING_TABLE_TOLERANCE, EasingTable
+from jetque.source.animations.path_animation import PathAnimation
+
+APPLICATION = QApplication.instance() or QApplication([])
+EASING_TABLE = EasingTable()
+FADES = dict(
+    fade_in=True,
+    fade_out=True,
+    fade_in_duration=200,
+    fade_out_duration=300,
+    fade_out_delay=600,
+    fade_in_easing_style=QEasingCurve.Type.InQuad,
+    fade_out_easing_style=QEasingCurve.Type.OutCubic
+)
+
+
+def _assert_batch_matches(animation, times):
+    batch = AnimationBatch(easing_table=EASING_TABLE)
+    batched_item = QGraphicsTextItem("1234")
+    path_positions, path_offset, easing_style = animation.batch_path()
+    slot = batch.add(
+        batched_item,
+        path_positions,
+        0.0,
+        animation.duration,
+        offset=path_offset,
+        total_duration=animation.totalDuration(),
+        easing_style=easing_style,
+        fade_in_duration=animation.fade_in_duration,
+        fade_in_easing_style=animation.fade_in_easing_style,
+        fade_out_delay=animation.fade_out_delay,
+        fade_out_duration=animation.fade_out_duration,
+        fade_out_easing_style=animation.fade_out_easing_style
+    )
+    animation.start()
+    animation.pause()
+    for time in times:
+        animation.setCurrentTime(time)
+        positions, opacities, _ = batch.evaluate_slots(np.asarray([slot]), float(time))
+        expected = animation.animation_object
+        assert abs(positions[0][0] - expected.x()) < 1e-3 + 400 * EASING_TABLE_TOLERANCE, time
+        assert abs(positions[0][1] - expected.y()) < 1e-3 + 400 * EASING_TABLE_TOLERANCE, time
+        assert abs(opacities[0] - expected.opacity()) < 1e-3, time
+
+
+def test_straight_and_swivel_paths_match_their_property_animations():
+    common = dict(
+        animation_type="Test",
+        sound=None,
+        duration=1000,
+        starting_position=QPointF(10.0, 20.0),
+        ending_position=QPointF(310.0, -80.0),
+        easing_style=QEasingCurve.Type.OutQuad,
+        **FADES
+    )
+    directional = DirectionalAnimation(animation_object=QGraphicsTextItem("1"), **common)
+    swivel = SwivelAnimation(
+        animation_object=QGraphicsTextItem("2"),
+        phase_1_duration=500,
+        phase_2_duration=500,
+        swivel_position=QPointF(200.0, 200.0),
+        **common
+    )
+
+    _assert_batch_matches(directional, range(0, 1001, 50))
+    _assert_batch_matches(swivel, range(0, 1001, 50))
+
+
+def test_sampled_paths_match_path_animation():
+    positions = array("d", [0.0, 0.0, 100.0, 50.0, 100.0, 250.0, 40.0, 300.0])
+    batch = AnimationBatch(easing_table=EASING_TABLE)
+    offset = QPointF(5.0, -5.0)
+    slots = [
+        batch.add(QGraphicsTextItem(), positions, 0.0, 1000, offset=offset, easing_style=easing_style)
+        for easing_style in (QEasingCurve.Type.Linear, QEasingCurve.Type.InOutSine, QEasingCurve.Type.OutBack)
+    ]
+
+    for time in range(0, 1001, 25):
+        evaluated, _, _ = batch.evaluate_slots(np.asarray(slots), float(time))
+        for (x, y), easing_style in zip(
+                evaluated, (QEasingCurve.Type.Linear, QEasingCurve.Type.InOutSine, QEasingCurve.Type.OutBack)
+        ):
+            path_animation = PathAnimation(None, positions, 1000, easing_style, offset=offset)
+            expected = path_animation.position_at(QEasingCurve(easing_style).valueForProgress(time / 1000.0))
+            assert abs(x - expected.x()) < 1e-3 + 300 * EASING_TABLE_TOLERANCE
+            assert abs(y - expected.y()) < 1e-3 + 300 * EASING_TABLE_TOLERANCE
+
+
+def test_items_start_in_place_and_finished_owners_are_returned():
+    batch = AnimationBatch(capacity=1, easing_table=EASING_TABLE)
+    item = QGraphicsTextItem()
+    path_positions = array("d", [0.0, 0.0, 100.0, 0.0])
+    batch.add(item, path_positions, 100.0, 1000, fade_in_duration=200, owner="short")
+    batch.add(QGraphicsTextItem(), path_positions, 100.0, 1000, total_duration=1500, owner="long")
+
+    assert item.pos() == QPointF(0.0, 0.0) and item.opacity() == 0.0
+    assert batch.capacity == 2
+    assert batch.advance(600.0) == []
+    assert item.pos() == QPointF(50.0, 0.0) and item.opacity() == 1.0
+    assert batch.advance(1100.0) == ["short"]
+    assert batch.advance(1600.0) == ["long"]
+    assert len(batch) == 0
+
+
+def test_shared_paths_are_stored_once_and_released_rows_are_compacted():
+    batch = AnimationBatch(easing_table=EASING_TABLE)
+    shared = array("d", [0.0, 0.0, 10.0, 10.0, 20.0, 0.0])
+    for owner in range(3):
+        batch.add(QGraphicsTextItem(), shared, 0.0, 1000, owner=owner)
+    assert len(batch.path_table) == 3
+
+    long_path = array("d", [0.0, 0.0] * PATH_TABLE_COMPACT_ROWS + [100.0, 0.0])
+    batch.add(QGraphicsTextItem(), long_path, 0.0, 1000, owner="long")
+    kept = QGraphicsTextItem()
+    batch.add(kept, array("d", [0.0, 0.0, 0.0, 100.0]), 0.0, 1000, owner="kept")
+    batch.remove_owner("long")
+
+    assert len(batch.path_table) == 5
+    batch.advance(500.0)
+    assert kept.pos() == QPointF(0.0, 50.0)
@@ -0,0 +1,90 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+pytest.importorskip("PyQt6.QtMultimedia", exc_type=ImportError)  # The factory owns a SoundBank
+
+from PyQt6.QtCore import QPointF, QRectF
+from PyQt6.QtWidgets import QApplication, QGraphicsObject, QGraphicsScene
+
+from config.config_schema import parse_config
+from jetque.source.animations.anchor_object import AnchorObject
+from jetque.source.animations.anchor_position_table import AnchorPositionTable
+from jetque.source.animations.animation_factory import AnimationFactory
+from jetque.source.animations.dynamics.directional_animation import DirectionalAnimation
+from jetque.source.animations.statics.pow_animation import PowAnimation
+
+APPLICATION = QApplication.instance() or QApplication([])
+
+CONFIG = parse_config({
+    "animations": {
+        "Hit": {
+            "type": "Directional",
+            "behavior": "CurvedLeft",
+            "duration": 1,
+            "starting_position": "Top-Left",
+            "ending_position": "Bottom-Right"
+        },
+        "Crit": {"type": "Pow", "duration": 1, "scale_percentage": 1.5}
+    }
+})
+
+
+def test_compiled_styles_build_animations():
+    factory = AnimationFactory()
+    styles = factory.compile_styles(CONFIG.animations)
+
+    hit = factory.build_animation(styles["Hit"], "12")
+    crit = factory.build_animation(styles["Crit"], "Crit!")
+
+    assert set(styles) == {"Hit", "Crit"}
+    assert isinstance(hit, DirectionalAnimation)
+    assert isinstance(crit, PowAnimation)
+    assert isinstance(hit.animation_object, QGraphicsObject)
+    assert factory.build_animations(styles["Hit"], ["1", "2", "3"])
+
+
+def test_curved_path_starts_and_ends_at_the_overridden_position():
+    factory = AnimationFactory()
+    style = factory.compile_styles(CONFIG.animations)["Hit"]
+    offset = QPointF(50.0, 20.0)
+
+    animation = factory.build_animation(style, "12", style.starting_position + offset)
+
+    animation.setCurrentTime(0)
+    assert animation.animation_object.pos() == style.starting_position + offset
+    animation.setCurrentTime(animation.duration)
+    assert animation.animation_object.pos() == style.ending_position + offset
+
+
+def test_only_styles_at_a_moved_anchor_are_repositioned():
+    config = parse_config({
+        "animations": {
+            "Incoming": {
+                "type": "Parabola",
+                "duration": 1,
+                "starting_position": "Incoming-Start",
+                "ending_position": "Incoming-End"
+            },
+            "Crit": {"type": "Pow", "duration": 1}
+        }
+    })
+    scene = QGraphicsScene()
+    anchor = AnchorObject("Incoming")
+    scene.addItem(anchor)
+    factory = AnimationFactory()
+    factory.position_table = AnchorPositionTable(QRectF(0.0, 0.0, 800.0, 600.0))
+    factory.position_table.watch_anchor(anchor)
+    styles = factory.compile_styles(config.animations)
+
+    assert factory.reposition_styles(styles, config.animations)["Incoming"] is styles["Incoming"]
+
+    anchor.end_circle.setPos(300.0, 150.0)
+    repositioned = factory.reposition_styles(styles, config.animations)
+
+    assert repositioned["Crit"] is styles["Crit"]
+    assert repositioned["Incoming"].ending_position == QPointF(320.0, 170.0)
+    assert repositioned["Incoming"].path is not styles["Incoming"].path
+    assert repositioned["Incoming"].glyph_atlas is styles["Incoming"].glyph_atlas
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from PyQt6.QtCore import QPointF
+
+from jetque.source.animations.animation_path import (
+    CubicBezierSegment,
+    LineSegment,
+    MAX_PATH_SAMPLES,
+    PathCache,
+    PathSegment,
+    catmull_rom_segments,
+    parabola_segments
+)
+
+
+def test_samples_are_evenly_spaced_along_the_arc():
+    path_cache = PathCache()
+    path = path_cache.get((CubicBezierSegment((0.0, 0.0), (0.0, 300.0), (300.0, -200.0), (300.0, 100.0)),))
+
+    steps = np.hypot(*np.diff(path.sample(240), axis=0).T)
+
+    assert np.allclose(steps, path.length / 239, rtol=1e-2)
+
+
+def test_parabola_follows_the_vertex_form_between_start_and_end():
+    starting_position, vertex_position, ending_position = QPointF(250.0, 300.0), QPointF(375.0, 150.0), QPointF(0.0, 0.0)
+    path = PathCache().get(parabola_segments(starting_position, vertex_position, ending_position))
+
+    positions = path.sample(60)
+    a = (300.0 - 150.0) / (250.0 - 375.0) ** 2
+
+    assert np.allclose(positions[0], (250.0, 300.0))
+    assert positions[-1][0] == 0.0
+    assert np.allclose(positions[:, 1], a * (positions[:, 0] - 375.0) ** 2 + 150.0, atol=1e-6)
+
+
+def test_timing_places_segment_boundaries_at_their_share_of_the_duration():
+    segments = (LineSegment((0.0, 0.0), (100.0, 0.0)), LineSegment((100.0, 0.0), (100.0, 300.0)))
+    path = PathCache().get(segments, timing=(0.25, 0.75))
+
+    assert np.allclose(path.positions_at(np.array([0.25, 0.625])), [(100.0, 0.0), (100.0, 150.0)])
+
+
+def test_identical_paths_share_one_lookup_table():
+    path_cache = PathCache()
+
+    path = path_cache.get(catmull_rom_segments([(0.0, 0.0), (50.0, 80.0), (100.0, 0.0)]))
+
+    assert path_cache.get(catmull_rom_segments([(0.0, 0.0), (50.0, 80.0), (100.0, 0.0)])) is path
+    assert path.buffer(30) is path.buffer(30)
+    assert len(path.buffer(30)) == 60
+
+
+def test_curved_paths_bow_to_the_requested_side():
+    path_cache = PathCache()
+    starting_position, ending_position = QPointF(0.0, 600.0), QPointF(0.0, 0.0)
+
+    left = path_cache.build("CurvedLeft", starting_position, QPointF(), ending_position)
+    right = path_cache.build("CurvedRight", starting_position, QPointF(), ending_position)
+
+    assert left.positions_at(np.array([0.5]))[0][0] < 0.0 < right.positions_at(np.array([0.5]))[0][0]
+
+
+def test_samples_follow_the_refresh_rate_within_bounds():
+    path = PathCache().get((LineSegment((0.0, 0.0), (100.0, 0.0)),))
+
+    assert len(path.buffer_for(1000, 240.0)) == 2 * 241
+    assert len(path.buffer_for(1000, 60.0)) == 2 * 61
+    assert len(path.buffer_for(0, 60.0)) == 2 * 2
+    assert len(path.buffer_for(600000, 240.0)) == 2 * MAX_PATH_SAMPLES
+
+
+def test_segments_must_implement_evaluate():
+    with pytest.raises(TypeError):
+        PathSegment()
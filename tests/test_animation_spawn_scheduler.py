@@ -0,0 +1,50 @@
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from types import SimpleNamespace
+
+from PyQt6.QtWidgets import QApplication
+
+from jetque.source.animations.animation_spawn_scheduler import AnimationSpawnScheduler
+
+APPLICATION = QApplication.instance() or QApplication([])
+
+
+def test_consecutive_requests_in_one_style_are_built_as_a_batch():
+    batches = []
+    singles = []
+    scheduler = AnimationSpawnScheduler(
+        lambda style, message: singles.append(message) or message,
+        budget=100.0,
+        batch_build_function=lambda style, messages: batches.append(list(messages)) or list(messages)
+    )
+    spawned = []
+    scheduler.animationSpawned.connect(spawned.append)
+    hit, crit = SimpleNamespace(name="Hit"), SimpleNamespace(name="Crit")
+
+    for style, message in ((hit, "1"), (hit, "2"), (hit, "3"), (crit, "4"), (hit, "5")):
+        scheduler.schedule(style, message)
+    scheduler._spawn_frame()
+
+    assert batches == [["1", "2", "3"]]
+    assert singles == ["4", "5"]
+    assert spawned == ["1", "2", "3", "4", "5"]
+    assert not scheduler.pending
+
+
+def test_batches_stop_at_the_frame_budget():
+    scheduler = AnimationSpawnScheduler(
+        lambda style, message: message,
+        budget=2.5,
+        batch_build_function=lambda style, messages: time.sleep(0.001 * len(messages)) or list(messages)
+    )
+    hit = SimpleNamespace(name="Hit")
+    scheduler.build_costs["Hit"] = 1.0
+
+    for message in "12345":
+        scheduler.schedule(hit, message)
+    scheduler._spawn_frame()
+
+    assert [message for _, message in scheduler.pending] == ["3", "4", "5"]
@@ -0,0 +1,81 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QColor, QPixmap
+from PyQt6.QtWidgets import QApplication, QGraphicsItem, QGraphicsScene, QGraphicsView
+
+from jetque.source.animations.anchor_circle_object import AnchorCircleObject
+from jetque.source.animations.animation_sprite import AnimationSprite
+from jetque.source.gui.cache_policy import (
+    CACHE_MODES, ITEM_KIND_BATCHED, ITEM_KIND_LIVE_TEXT, ITEM_KIND_SCALING, apply_cache_mode
+)
+from jetque.source.gui.items.jq_graphics_simple_text_item import JQGraphicsSimpleTextItem
+from jetque.source.gui.items.jq_graphics_static_text_item import JQGraphicsStaticTextItem
+from jetque.source.gui.sprite_batch_renderer import SPRITE_BATCH_PROPERTY
+from jetque.source.managers.sprite_cache import SpriteCache
+
+APPLICATION = QApplication.instance() or QApplication([])
+
+
+def test_items_pick_their_cache_mode_by_kind():
+    sprite_cache = SpriteCache()
+    sprite = AnimationSprite(
+        sprite_cache.sprite("dot", QRectF(0, 0, 4, 4), lambda painter: painter.fillRect(0, 0, 4, 4, QColor("red")))
+    )
+    live_text = JQGraphicsSimpleTextItem(text="Miss", drop_shadow=False, sprite_cache=sprite_cache)
+    shadowed_text = JQGraphicsSimpleTextItem(text="Miss", drop_shadow=True, sprite_cache=sprite_cache)
+
+    assert sprite.cacheMode() == QGraphicsItem.CacheMode.ItemCoordinateCache
+    assert live_text.cacheMode() == CACHE_MODES[ITEM_KIND_LIVE_TEXT]
+    assert shadowed_text.sprite is not None
+    assert shadowed_text.cacheMode() == QGraphicsItem.CacheMode.ItemCoordinateCache
+    assert AnchorCircleObject().cacheMode() == QGraphicsItem.CacheMode.ItemCoordinateCache
+
+    apply_cache_mode(sprite, ITEM_KIND_BATCHED)
+    assert sprite.cacheMode() == QGraphicsItem.CacheMode.NoCache
+    apply_cache_mode(sprite, "Unknown")
+    assert sprite.cacheMode() == QGraphicsItem.CacheMode.NoCache
+
+
+def test_scaling_items_are_not_cached():
+    sprite_cache = SpriteCache()
+    sprite = AnimationSprite(
+        sprite_cache.sprite("dot", QRectF(0, 0, 4, 4), lambda painter: painter.fillRect(0, 0, 4, 4, QColor("red")))
+    )
+
+    apply_cache_mode(sprite, ITEM_KIND_SCALING)
+
+    assert CACHE_MODES[ITEM_KIND_SCALING] == QGraphicsItem.CacheMode.NoCache
+    assert sprite.cacheMode() == QGraphicsItem.CacheMode.NoCache
+
+
+def test_sprites_drop_their_cache_when_added_to_a_batching_scene():
+    sprite_cache = SpriteCache()
+    scene = QGraphicsScene()
+    view = QGraphicsView(scene)
+    view.viewport().setProperty(SPRITE_BATCH_PROPERTY, True)
+    sprite = AnimationSprite(
+        sprite_cache.sprite("dot", QRectF(0, 0, 4, 4), lambda painter: painter.fillRect(0, 0, 4, 4, QColor("red")))
+    )
+    icon = QPixmap(8, 8)
+    icon.fill(QColor("red"))
+    shadowed_text = JQGraphicsStaticTextItem(
+        text="Miss", drop_shadow=True, icon_pixmap=icon, sprite_cache=sprite_cache
+    )
+    live_text = JQGraphicsStaticTextItem(text="Miss", drop_shadow=False, sprite_cache=sprite_cache)
+
+    for item in (sprite, shadowed_text, live_text):
+        scene.addItem(item)
+
+    assert sprite.cacheMode() == QGraphicsItem.CacheMode.NoCache
+    assert shadowed_text.cacheMode() == QGraphicsItem.CacheMode.NoCache
+    assert live_text.cacheMode() == CACHE_MODES[ITEM_KIND_LIVE_TEXT]
+
+    unbatched_scene = QGraphicsScene()
+    unbatched_view = QGraphicsView(unbatched_scene)
+    other_sprite = AnimationSprite(sprite.sprite)
+    unbatched_scene.addItem(other_sprite)
+    assert unbatched_view.scene() is unbatched_scene
+    assert other_sprite.cacheMode() == QGraphicsItem.CacheMode.ItemCoordinateCache
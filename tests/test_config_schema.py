@@ -0,0 +1,78 @@
+import json
+import os
+
+import pytest
+from PyQt6.QtCore import QEasingCurve
+from PyQt6.QtGui import QFont
+
+from config.config_schema import ConfigError, parse_color, parse_config
+
+
+def test_styles_are_normalised_at_load():
+    config = parse_config({
+        "spawn_budget_ms": 6,
+        "animations": {
+            "Hit": {
+                "type": "Parabola",
+                "duration": 1.5,
+                "fade_out": True,
+                "fade_out_percentage": 0.25,
+                "phase_1_percentage": 0.3,
+                "text_color": [1.0, 0.0, 0.0],
+                "outline_color": "#00ff00",
+                "easing_style": "Out-Back",
+                "font_weight": "Bold"
+            }
+        }
+    })
+    hit = config.animations["Hit"]
+
+    assert config.spawn_budget_ms == 6.0
+    assert (hit.duration, hit.fade_out_percentage, hit.phase_1_percentage) == (1500, 25, 30)
+    assert hit.text_color.name() == "#ff0000"
+    assert hit.outline_color.name() == "#00ff00"
+    assert hit.easing_style == QEasingCurve.Type.OutBack
+    assert hit.fade_in_easing_style == QEasingCurve.Type.Linear
+    assert hit.font.font_weight == QFont.Weight.Bold
+    assert not hasattr(hit, "__dict__")
+
+
+@pytest.mark.parametrize("style, path", [
+    ({"type": "Wobble", "duration": 1}, "animations.Hit.type"),
+    ({"type": "Pow"}, "animations.Hit.duration"),
+    ({"type": "Pow", "duration": 1, "text_color": "not-a-color"}, "animations.Hit.text_color"),
+    ({"type": "Pow", "duration": 1, "text_color": [1.0, 0, 0]}, "animations.Hit.text_color"),
+    ({"type": "Pow", "duration": 1, "fade_in_percentage": 1.4}, "animations.Hit.fade_in_percentage"),
+    ({"type": "Pow", "duration": 1, "phase_1_percentage": 30}, "animations.Hit.phase_1_percentage"),
+    ({"type": "Pow", "duration": 1, "jiggle": "yes"}, "animations.Hit.jiggle"),
+])
+def test_invalid_values_are_reported_with_their_path(style, path):
+    with pytest.raises(ConfigError) as error:
+        parse_config({"animations": {"Hit": style}})
+
+    assert error.value.path == path
+
+
+def test_color_scale_follows_the_component_type():
+    assert parse_color([1, 0, 0]).getRgb() == (1, 0, 0, 255)
+    assert parse_color([1.0, 0.0, 0.0]).getRgb() == (255, 0, 0, 255)
+    assert parse_color([255, 128, 0, 64]).getRgb() == (255, 128, 0, 64)
+    with pytest.raises(ConfigError):
+        parse_color([2.0, 0.0, 0.0])
+
+
+def test_shipped_config_is_valid():
+    config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "config.json")
+    with open(config_path, "r") as file:
+        config = parse_config(json.load(file))
+
+    assert config.animations
+
+
+def test_render_mode_defaults_to_full_repaints():
+    assert parse_config({}).render_mode == "Full"
+    assert parse_config({"render_mode": "DirtyRegion"}).render_mode == "DirtyRegion"
+    with pytest.raises(ConfigError) as error:
+        parse_config({"render_mode": "Partial"})
+
+    assert error.value.path == "config.render_mode"
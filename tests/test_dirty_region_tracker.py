@@ -0,0 +1,63 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QPoint
+from PyQt6.QtGui import QRegion
+from PyQt6.QtWidgets import QApplication, QGraphicsRectItem, QGraphicsScene, QGraphicsView
+
+from jetque.source.gui.dirty_region_tracker import DirtyRegionTracker
+
+APPLICATION = QApplication.instance() or QApplication([])
+
+
+def make_view():
+    scene = QGraphicsScene(0, 0, 800, 600)
+    view = QGraphicsView(scene)
+    view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.NoViewportUpdate)
+    view.setFixedSize(800, 600)
+    view.setSceneRect(0, 0, 800, 600)
+    tracker = DirtyRegionTracker(view)
+    tracker.set_enabled(True)
+    QApplication.processEvents()
+    return scene, view, tracker
+
+
+def test_moving_items_repaint_their_old_and_new_rects_only():
+    scene, view, tracker = make_view()
+    item = QGraphicsRectItem(0, 0, 40, 20)
+    item.setPos(100, 100)
+    scene.addItem(item)
+    QApplication.processEvents()
+    full_updates = tracker.full_updates
+    regions = []
+    scene.changed.connect(lambda rects: regions.append(tracker.last_region))
+
+    item.setPos(300, 200)
+    QApplication.processEvents()
+    repainted = QRegion()
+    for region in regions:
+        repainted = repainted.united(region)
+
+    assert tracker.full_updates == full_updates
+    assert repainted.contains(view.mapFromScene(110, 110))
+    assert repainted.contains(view.mapFromScene(310, 210))
+    assert not repainted.contains(QPoint(600, 500))
+
+
+def test_large_dirty_areas_fall_back_to_a_full_update():
+    scene, view, tracker = make_view()
+    items = [QGraphicsRectItem(0, 0, 200, 150) for _ in range(8)]
+    for index, item in enumerate(items):
+        scene.addItem(item)
+        item.setPos(index * 70, index * 50)
+    QApplication.processEvents()
+    full_updates = tracker.full_updates
+
+    for item in items:
+        item.moveBy(5, 5)
+    QApplication.processEvents()
+
+    assert tracker.full_updates == full_updates + 1
+    assert tracker.last_dirty_fraction >= tracker.full_update_threshold
+    assert tracker.last_region.isEmpty()
@@ -0,0 +1,42 @@
+import random
+
+import numpy as np
+from PyQt6.QtCore import QEasingCurve
+
+from jetque.source.animations.easing_table import EASING_TABLE_CURVE_COUNT, EASING_TABLE_TOLERANCE, EasingTable
+
+EASING_TABLE = EasingTable()
+PROGRESS_VALUES = [i / 10000.0 for i in range(10001)] + [random.Random(1999).random() for _ in range(5000)]
+
+
+def test_values_match_qeasingcurve_within_tolerance():
+    progress = np.asarray(PROGRESS_VALUES)
+    for easing_value in range(EASING_TABLE_CURVE_COUNT):
+        easing_type = QEasingCurve.Type(easing_value)
+        curve = QEasingCurve(easing_type)
+        expected = np.asarray([curve.valueForProgress(value) for value in PROGRESS_VALUES])
+        error = np.abs(EASING_TABLE.values(easing_type, progress) - expected).max()
+        assert error <= EASING_TABLE_TOLERANCE, f"{easing_type.name} differs by {error}"
+
+
+def test_scalar_value_matches_vectorised_values():
+    for easing_value in range(EASING_TABLE_CURVE_COUNT):
+        vectorised = EASING_TABLE.values(easing_value, np.asarray(PROGRESS_VALUES[::97]))
+        scalar = [EASING_TABLE.value(easing_value, value) for value in PROGRESS_VALUES[::97]]
+        assert np.allclose(vectorised, scalar)
+
+
+def test_mixed_curves_in_one_lookup():
+    easing_types = np.asarray([QEasingCurve.Type.Linear.value, QEasingCurve.Type.OutBounce.value,
+                               QEasingCurve.Type.InOutCirc.value, QEasingCurve.Type.Custom.value])
+    progress = np.asarray([0.3, 0.3, 0.5, 0.7])
+    eased = EASING_TABLE.values(easing_types, progress)
+    assert abs(eased[0] - 0.3) <= EASING_TABLE_TOLERANCE
+    assert abs(eased[1] - QEasingCurve(QEasingCurve.Type.OutBounce).valueForProgress(0.3)) <= EASING_TABLE_TOLERANCE
+    assert abs(eased[2] - QEasingCurve(QEasingCurve.Type.InOutCirc).valueForProgress(0.5)) <= EASING_TABLE_TOLERANCE
+    assert eased[3] == 0.7  # Untabulated curves fall back to Linear
+
+
+def test_progress_is_clamped():
+    assert EASING_TABLE.value(QEasingCurve.Type.OutQuad, -1.0) == 0.0
+    assert EASING_TABLE.value(QEasingCurve.Type.OutQuad, 2.0) == 1.0
@@ -0,0 +1,72 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtGui import QFont, QFontMetricsF
+from PyQt6.QtWidgets import QApplication
+
+from jetque.source.gui.items import jq_graphics_static_text_item
+from jetque.source.gui.items.jq_graphics_static_text_item import static_text_layout
+from jetque.source.managers.font_cache import FontCache
+from jetque.source.managers.glyph_cache import GlyphCache
+
+APPLICATION = QApplication.instance() or QApplication([])
+
+FONT_PARAMETERS = {
+    "font_type": "Arial",
+    "font_size": 18,
+    "font_weight": QFont.Weight.Bold,
+    "font_capitalization": QFont.Capitalization.MixedCase,
+    "font_stretch": QFont.Stretch.Unstretched,
+    "font_letter_spacing": 0.0,
+    "font_word_spacing": 0.0,
+    "font_italic": False,
+    "font_kerning": True,
+    "font_overline": False,
+    "font_strikethrough": False,
+    "font_underline": False
+}
+
+
+def test_identical_parameters_share_font_and_metrics():
+    font_cache = FontCache()
+
+    font = font_cache.font(**FONT_PARAMETERS)
+
+    assert font_cache.font(**FONT_PARAMETERS) is font
+    assert font_cache.metrics(font) is font_cache.metrics(font)
+    assert font_cache.font(**{**FONT_PARAMETERS, "font_size": 24}) is not font
+
+
+
+def test_horizontal_advance_is_memoised():
+    font_cache = FontCache()
+    font = font_cache.font(**FONT_PARAMETERS)
+
+    first = font_cache.horizontal_advance(font, "1234")
+    second = font_cache.horizontal_advance(font, "1234")
+
+    assert first == second == QFontMetricsF(font).horizontalAdvance("1234")
+    assert (font_cache.hits, font_cache.misses) == (1, 1)
+
+
+def test_least_recently_used_advances_are_evicted():
+    font_cache = FontCache(advance_cache_size=2)
+    font = font_cache.font(**FONT_PARAMETERS)
+
+    for text in ("1", "2", "1", "3"):
+        font_cache.horizontal_advance(font, text)
+
+    assert list(font_cache.advances) == [(font.cache_key, "1"), (font.cache_key, "3")]
+
+
+def test_static_text_layouts_are_measured_through_the_font_cache():
+    font_cache = FontCache()
+    font = font_cache.font(**FONT_PARAMETERS)
+    jq_graphics_static_text_item._layouts.clear()
+
+    layout = static_text_layout(font, "98,765", glyph_cache=GlyphCache(), font_cache=font_cache)
+
+    assert font_cache.misses == 1
+    assert (font.cache_key, "98,765") in font_cache.advances
+    assert layout.layout_rect.width() >= font_cache.horizontal_advance(font, "98,765")
@@ -0,0 +1,44 @@
+import time
+
+import pytest
+
+from jetque.source.gui.frame_timing import FrameTimingRecorder
+
+
+def test_percentiles_histogram_and_dropped_frames():
+    frame_timing = FrameTimingRecorder(capacity=100, refresh_rate=144.0)
+    refresh_interval = 1000.0 / 144.0
+
+    frame_start = 0.0
+    for frame in range(150):
+        paint_duration = 10.0 if frame % 50 == 49 else 1.0 + (frame % 10) * 0.1
+        frame_timing.record(frame_start, frame_start + paint_duration)
+        frame_start += refresh_interval * (3 if frame % 50 == 49 else 1)
+    # Rendering slept while nothing was animating, the gap is no dropped frame
+    frame_timing.record(frame_start + 5000.0, frame_start + 5001.0)
+
+    summary = frame_timing.summary()
+
+    assert summary["frames"] == 151
+    assert summary["dropped_frames"] == 4
+    assert frame_timing.interval_count == 149
+    assert summary["percentiles"]["paint"]["p50"] == pytest.approx(1.45, abs=0.05)
+    assert summary["percentiles"]["paint"]["p99"] == pytest.approx(10.0, abs=0.1)
+    assert summary["percentiles"]["interval"]["p50"] == pytest.approx(refresh_interval)
+    assert sum(summary["histogram"].values()) == 100
+    assert summary["histogram"]["8.33-11.11"] == 2
+
+    frame_timing.reset()
+    assert frame_timing.percentiles() == {"paint": {}, "interval": {}}
+
+
+def test_recording_costs_under_one_percent_of_a_frame():
+    frame_timing = FrameTimingRecorder()
+    frames = 10000
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        frame_timing.record(frame * 6.9, frame * 6.9 + 2.0)
+    cost = (time.perf_counter() - start) * 1000.0 / frames
+
+    assert cost < (1000.0 / 144.0) * 0.01
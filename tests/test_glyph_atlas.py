@@ -0,0 +1,57 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QPointF, Qt
+from PyQt6.QtGui import QColor, QFont, QPen
+from PyQt6.QtWidgets import QApplication
+
+from jetque.source.managers.glyph_atlas import GlyphAtlas
+from jetque.source.managers.sprite_cache import SpriteCache
+
+APPLICATION = QApplication.instance() or QApplication([])
+
+FONT = QFont("Arial", 28)
+OUTLINE_PEN = QPen(Qt.GlobalColor.black, 4.0)
+SHADOW = (QPointF(3.5, 6.1), 7.0, QColor(0, 0, 0, 191))
+
+
+def coverage(sprite):
+    image = sprite.pixmap.toImage()
+    return sum(QColor.fromRgba(image.pixel(x, y)).alpha() for x in range(image.width()) for y in range(image.height()))
+
+
+def test_numbers_are_composed_like_the_rendered_text():
+    atlas = GlyphAtlas(FONT, QColor("yellow"), OUTLINE_PEN, *SHADOW)
+    sprite_cache = SpriteCache()
+
+    for text in ("1,243", "crit 98765"):
+        composed = atlas.compose(text)
+        rendered = sprite_cache.shadowed(sprite_cache.text_sprite(FONT, text, QColor("yellow"), OUTLINE_PEN), *SHADOW)
+
+        assert composed.layout_rect == rendered.layout_rect
+        assert abs(coverage(composed) / coverage(rendered) - 1.0) < 0.01
+
+
+def test_atlas_size_does_not_depend_on_the_numbers_composed():
+    atlas = GlyphAtlas(FONT, QColor("white"))
+    byte_size = atlas.byte_size()
+
+    sprites = [atlas.compose(str(value)) for value in range(0, 100000, 997)]
+
+    assert all(sprite is not None for sprite in sprites)
+    assert atlas.byte_size() == byte_size
+    assert atlas.compose("Backstab") is None
+    assert atlas.compose("") is None
+    assert len(atlas.cells_for("crit 12")) == 4
+
+
+def test_recent_compositions_are_memoised_in_the_sprite_cache():
+    atlas = GlyphAtlas(FONT, QColor("white"), OUTLINE_PEN)
+    sprite_cache = SpriteCache()
+
+    first = atlas.compose("1,243", sprite_cache)
+
+    assert atlas.compose("1,243", sprite_cache) is first
+    assert atlas.compose("Backstab", sprite_cache) is None
+    assert (sprite_cache.hits, sprite_cache.misses, len(sprite_cache.sprites)) == (1, 2, 1)
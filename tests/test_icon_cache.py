@@ -0,0 +1,46 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPen
+from PyQt6.QtWidgets import QApplication
+
+from jetque.source.managers.icon_cache import IconCache
+
+APPLICATION = QApplication.instance() or QApplication([])
+
+
+def test_resources_are_preloaded_by_name():
+    icon_cache = IconCache()
+    icon_cache.preload()
+
+    assert {"hit", "slash", "backstab", "dodge"} <= set(icon_cache.names)
+    assert not icon_cache.pixmap("hit").isNull()
+
+
+def test_variants_are_memoised_per_pen_height_and_ratio():
+    icon_cache = IconCache()
+    icon_cache.preload()
+    pen = QPen(Qt.GlobalColor.black, 2.0)
+
+    outlined = icon_cache.pixmap("hit", pen, height=24)
+
+    assert icon_cache.pixmap("hit", QPen(Qt.GlobalColor.black, 2.0), height=24) is outlined
+    assert icon_cache.pixmap("hit", pen, height=24, device_pixel_ratio=2.0) is not outlined
+    assert outlined.height() == 24
+    assert icon_cache.pixmap("hit", pen, height=24, device_pixel_ratio=2.0).height() == 48
+
+
+def test_least_recently_used_variants_are_evicted_beyond_the_byte_budget():
+    icon_cache = IconCache(max_bytes=2 * 32 * 32 * 4)
+    icon_cache.preload()
+
+    first = icon_cache.pixmap("hit", height=32)
+    icon_cache.pixmap("slash", height=32)
+    icon_cache.pixmap("hit", height=32)
+    icon_cache.pixmap("dodge", height=32)
+
+    assert icon_cache.byte_count <= icon_cache.max_bytes
+    assert icon_cache.pixmap("hit", height=32) is first
+    assert len(icon_cache.variants) == 2
@@ -0,0 +1,77 @@
+import gc
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication, QElapsedTimer, QEvent, QPointF, QPropertyAnimation
+from PyQt6.QtWidgets import QApplication, QGraphicsScene, QGraphicsTextItem
+
+from jetque.source.managers.lifecycle_manager import LifecycleManager
+
+APPLICATION = QApplication.instance() or QApplication([])
+
+
+def _run_animations(lifecycle_manager: LifecycleManager, count: int) -> None:
+    finished = []
+    for index in range(count):
+        item = QGraphicsTextItem(str(index))
+        animation = QPropertyAnimation(item, b"pos", lifecycle_manager)  # Parented like the manager's animations
+        animation.setDuration(1)
+        animation.setEndValue(QPointF(10.0, 10.0))
+        lifecycle_manager.track(animation, item, finished.append)
+        lifecycle_manager.display(item)
+        animation.start()
+
+    timer = QElapsedTimer()
+    timer.start()
+    while len(finished) < count and timer.elapsed() < 5000:
+        QCoreApplication.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    gc.collect()
+    assert len(finished) == count
+
+
+def test_finished_animations_are_removed_from_the_scene():
+    scene = QGraphicsScene()
+    lifecycle_manager = LifecycleManager(scene)
+
+    _run_animations(lifecycle_manager, 20)
+
+    assert lifecycle_manager.tracked_count() == 0
+    assert scene.items() == []
+    assert lifecycle_manager.live_counts() == {}
+
+
+def test_live_counts_stay_flat_across_waves():
+    scene = QGraphicsScene()
+    lifecycle_manager = LifecycleManager(scene)
+
+    for _ in range(5):
+        _run_animations(lifecycle_manager, 50)
+        assert lifecycle_manager.live_counts() == {}
+
+    assert lifecycle_manager.created_counts["QPropertyAnimation"] == 250
+    assert lifecycle_manager.destroyed_counts["QGraphicsTextItem"] == 250
+
+
+def test_finish_callback_does_not_keep_its_owner_alive():
+    class Owner:
+        def __init__(self):
+            self.calls = 0
+
+        def on_finished(self, _animation):
+            self.calls += 1
+
+    lifecycle_manager = LifecycleManager(QGraphicsScene())
+    owner = Owner()
+    item = QGraphicsTextItem("owner")
+    animation = QPropertyAnimation(item, b"pos", lifecycle_manager)
+    lifecycle_manager.track(animation, item, owner.on_finished)
+    del owner
+    gc.collect()
+
+    assert not any(type(obj).__name__ == "Owner" for obj in gc.get_objects())
+
+    lifecycle_manager.release(animation)
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    assert lifecycle_manager.live_counts() == {}
@@ -0,0 +1,46 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from array import array
+
+from PyQt6.QtCore import QEasingCurve, QPointF
+from PyQt6.QtWidgets import QApplication, QGraphicsTextItem
+
+from jetque.source.animations.path_animation import PathAnimation
+
+APPLICATION = QApplication.instance() or QApplication([])
+
+
+def test_positions_are_interpolated_between_samples():
+    positions = array("d", [0.0, 0.0, 100.0, 50.0, 100.0, 250.0])
+    path_animation = PathAnimation(None, positions, 1000, QEasingCurve.Type.Linear)
+
+    assert path_animation.position_at(0.25) == QPointF(50.0, 25.0)
+    assert path_animation.position_at(0.75) == QPointF(100.0, 150.0)
+    assert path_animation.position_at(1.0) == QPointF(100.0, 250.0)
+
+
+def test_overshooting_easing_extrapolates_the_end_samples():
+    path_animation = PathAnimation(None, array("d", [0.0, 0.0, 100.0, 0.0]), 1000, QEasingCurve.Type.OutBack)
+
+    assert path_animation.position_at(1.1) == QPointF(110.0, 0.0)
+    assert path_animation.position_at(-0.1) == QPointF(-10.0, 0.0)
+
+
+def test_item_follows_the_path_as_time_advances():
+    item = QGraphicsTextItem("1234")
+    path_animation = PathAnimation(item, array("d", [0.0, 0.0, 0.0, 300.0]), 1000, QEasingCurve.Type.Linear)
+
+    path_animation.setCurrentTime(500)
+
+    assert item.pos() == QPointF(0.0, 150.0)
+
+
+def test_offset_translates_the_whole_path():
+    positions = array("d", [0.0, 0.0, 100.0, 0.0])
+    path_animation = PathAnimation(None, positions, 1000, QEasingCurve.Type.Linear, offset=QPointF(50.0, 50.0))
+
+    assert path_animation.position_at(0.0) == QPointF(50.0, 50.0)
+    assert path_animation.position_at(0.5) == QPointF(100.0, 50.0)
+    assert path_animation.position_at(1.0) == QPointF(150.0, 50.0)
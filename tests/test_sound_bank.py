@@ -0,0 +1,92 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+pytest.importorskip("PyQt6.QtMultimedia", exc_type=ImportError)
+
+from PyQt6.QtCore import QObject
+
+from jetque.source.managers import sound_bank
+from jetque.source.managers.sound_bank import SoundBank
+
+
+class StubSoundEffect(QObject):
+    """Stands in for QSoundEffect, playing until stop() is called."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.playing = False
+        self.play_count = 0
+
+    def setSource(self, url):
+        self.source = url
+
+    def play(self):
+        self.playing = True
+        self.play_count += 1
+
+    def stop(self):
+        self.playing = False
+
+    def isPlaying(self):
+        return self.playing
+
+
+class StubClock:
+    """Stands in for QElapsedTimer, reporting a time set by the test."""
+
+    def __init__(self):
+        self.now = 0
+
+    def elapsed(self):
+        return self.now
+
+
+@pytest.fixture
+def make_bank(monkeypatch):
+    monkeypatch.setattr(sound_bank, "QSoundEffect", StubSoundEffect)
+
+    def make(**kwargs):
+        bank = SoundBank(**kwargs)
+        bank.clock = StubClock()
+        return bank
+
+    return make
+
+
+def test_plays_are_capped_by_the_voices_of_a_sound(make_bank):
+    bank = make_bank(voices_per_sound=2, repeat_window=0)
+    cue = bank.cue("hit.wav")
+
+    assert [cue.play(), cue.play(), cue.play()] == [True, True, False]
+    assert [voice.play_count for voice in bank.voices["hit.wav"]] == [1, 1]
+    assert bank.dropped_count == 1
+
+    bank.voices["hit.wav"][0].stop()
+    assert cue.play()
+
+
+def test_plays_are_capped_across_every_sound(make_bank):
+    bank = make_bank(voices_per_sound=2, max_concurrent_plays=2, repeat_window=0)
+    bank.preload(["hit.wav", "crit.wav"])
+
+    assert bank.play("hit.wav") and bank.play("crit.wav")
+    assert not bank.play("hit.wav")
+    assert bank.playing_count() == 2
+    assert bank.dropped_count == 1
+
+
+def test_repeats_within_the_window_are_merged(make_bank):
+    bank = make_bank(voices_per_sound=3, repeat_window=40)
+    cue = bank.cue("hit.wav")
+
+    assert cue.play()
+    bank.clock.now = 39
+    assert not cue.play()
+    bank.clock.now = 40
+    assert cue.play()
+    assert bank.playing_count() == 2
+    assert bank.dropped_count == 1
+    assert bank.cue("hit.wav") is cue
@@ -0,0 +1,134 @@
+import math
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import pytest
+from PyQt6.QtCore import QRect, QRectF, Qt
+from PyQt6.QtGui import QColor, QFont, QImage, QOffscreenSurface, QOpenGLContext, QPainter, QTransform
+from PyQt6.QtOpenGL import QOpenGLFramebufferObject
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from jetque.source.animations.animation_sprite import AnimationSprite
+from jetque.source.gui.sprite_batch_renderer import (
+    INSTANCE_FLOATS,
+    SPRITE_BATCH_PROPERTY,
+    SpriteBatchRenderer,
+    SpriteTextureAtlas,
+    projection_matrix
+)
+from jetque.source.managers.sprite_cache import SpriteCache
+
+APPLICATION = QApplication.instance() or QApplication([])
+
+
+def solid_sprite(sprite_cache, width, height, color):
+    return sprite_cache.sprite(
+        ("solid", width, height, color), QRectF(0, 0, width, height), lambda painter: painter.fillRect(
+            QRectF(0, 0, width, height), QColor(color)
+        )
+    )
+
+
+def test_instances_share_atlas_regions_and_carry_item_state():
+    sprite_cache = SpriteCache()
+    renderer = SpriteBatchRenderer(atlas_size=256)
+    label = sprite_cache.text_sprite(QFont("Arial", 20), "1,234", QColor("white"))
+    items = [AnimationSprite(label), AnimationSprite(label), AnimationSprite(solid_sprite(sprite_cache, 30, 20, "red"))]
+    items[1].setPos(40.0, 25.0)
+    items[1].setScale(1.5)
+    items[1].setRotation(90.0)
+    items[1].setOpacity(0.25)
+
+    data = renderer.instance_data(items)
+
+    assert data.shape == (3, INSTANCE_FLOATS)
+    assert len(renderer.atlas.regions) == 2
+    assert np.array_equal(data[0, 11:], data[1, 11:])
+    assert not np.array_equal(data[0, 11:], data[2, 11:])
+    assert data[1, 0:2].tolist() == [40.0, 25.0]
+    assert data[1, 8:11] == pytest.approx([1.5, math.pi / 2.0, 0.25])
+    assert data[1, 6:8] == pytest.approx([label.layout_rect.center().x(), label.layout_rect.center().y()])
+
+    # A full atlas is repacked with the sprites of the current frame only
+    large = [
+        AnimationSprite(solid_sprite(sprite_cache, 120, 120, color)) for color in ("green", "blue", "cyan", "magenta")
+    ]
+    assert len(renderer.instance_data(large)) == 4
+    assert len(renderer.atlas.regions) == 4
+
+
+def test_only_newly_packed_sprites_are_uploaded():
+    sprite_cache = SpriteCache()
+    atlas = SpriteTextureAtlas(size=256)
+    red = solid_sprite(sprite_cache, 30, 20, "red")
+
+    assert atlas.take_dirty_image()[0] == QRect(0, 0, 256, 256)
+    assert atlas.take_dirty_image()[0].isNull()
+
+    atlas.region_for(red)
+    atlas.region_for(red)
+    atlas.region_for(solid_sprite(sprite_cache, 10, 40, "blue"))
+    dirty_rect, dirty_image = atlas.take_dirty_image()
+
+    assert (dirty_rect.x(), dirty_rect.y()) == (0, 0)
+    assert dirty_rect.height() == 40 and dirty_rect.width() < 256
+    assert dirty_image.size() == dirty_rect.size()
+    assert dirty_image.pixelColor(0, 0) == QColor("red")
+    assert atlas.take_dirty_image()[0].isNull()
+
+
+def test_batched_sprites_are_not_painted_by_qpainter():
+    sprite_cache = SpriteCache()
+    item = AnimationSprite(solid_sprite(sprite_cache, 10, 10, "red"))
+    viewport = QWidget()
+    image = QImage(10, 10, QImage.Format.Format_ARGB32_Premultiplied)
+
+    for batched, alpha in ((True, 0), (False, 255)):
+        viewport.setProperty(SPRITE_BATCH_PROPERTY, batched)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        item.paint(painter, None, viewport)
+        painter.end()
+        assert QColor.fromRgba(image.pixel(5, 5)).alpha() == alpha
+
+
+def test_sprites_are_drawn_with_one_instanced_draw_call():
+    context = QOpenGLContext()
+    context.setFormat(SpriteBatchRenderer.surface_format())
+    surface = QOffscreenSurface()
+    surface.setFormat(context.format())
+    surface.create()
+    if not context.create() or not context.makeCurrent(surface):
+        pytest.skip("No OpenGL context available, e.g. run with Mesa's llvmpipe")
+
+    renderer = SpriteBatchRenderer(atlas_size=256)
+    try:
+        if not renderer.initialize(context):
+            pytest.skip("OpenGL context lacks instanced drawing")
+        sprite_cache = SpriteCache()
+        framebuffer = QOpenGLFramebufferObject(64, 64)
+        framebuffer.bind()
+        renderer.functions.glViewport(0, 0, 64, 64)
+        renderer.functions.glClearColor(0.0, 0.0, 0.0, 0.0)
+        renderer.functions.glClear(0x00004000)
+
+        red = AnimationSprite(solid_sprite(sprite_cache, 10, 10, "red"))
+        red.setPos(5.0, 5.0)
+        blue = AnimationSprite(solid_sprite(sprite_cache, 20, 10, "blue"))
+        blue.setPos(30.0, 40.0)
+        blue.setOpacity(0.5)
+
+        drawn = renderer.render([red, blue], projection_matrix(QRectF(0, 0, 64, 64), QTransform()))
+        image = framebuffer.toImage()
+        framebuffer.release()
+
+        assert drawn == 2
+        assert QColor.fromRgba(image.pixel(10, 10)).red() == 255
+        assert abs(QColor.fromRgba(image.pixel(40, 45)).alpha() - 128) <= 2
+        assert QColor.fromRgba(image.pixel(2, 2)).alpha() == 0
+        assert QColor.fromRgba(image.pixel(40, 35)).alpha() == 0
+    finally:
+        renderer.cleanup()
+        context.doneCurrent()
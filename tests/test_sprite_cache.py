@@ -0,0 +1,100 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from PyQt6.QtGui import QColor, QFont, QImage, QPainter, QPen
+from PyQt6.QtWidgets import QApplication, QGraphicsDropShadowEffect, QGraphicsScene
+
+from jetque.source.animations.animation_sprite import AnimationSprite
+from jetque.source.gui.items.jq_graphics_simple_text_item import JQGraphicsSimpleTextItem
+from jetque.source.gui.items.jq_graphics_text_item import JQGraphicsTextItem
+from jetque.source.managers.sprite_cache import SpriteCache
+
+APPLICATION = QApplication.instance() or QApplication([])
+
+
+def test_text_is_rendered_once_per_style_and_ratio():
+    sprite_cache = SpriteCache()
+    font = QFont("Arial", 24)
+
+    sprite = sprite_cache.text_sprite(font, "1234", QColor("red"), QPen(Qt.GlobalColor.black, 4.0))
+
+    assert sprite_cache.text_sprite(font, "1234", QColor("red"), QPen(Qt.GlobalColor.black, 4.0)) is sprite
+    assert sprite_cache.text_sprite(font, "1234", QColor("red")) is not sprite
+    assert sprite_cache.text_sprite(font, "1234", QColor("red"), device_pixel_ratio=2.0).pixmap.width() > sprite.pixmap.width()
+    assert sprite.pixmap.toImage().format() == QImage.Format.Format_ARGB32_Premultiplied
+    assert sprite.rect.contains(sprite.layout_rect)
+    assert (sprite_cache.hits, sprite_cache.misses) == (1, 3)
+
+
+def test_least_recently_used_sprites_are_evicted_beyond_the_byte_budget():
+    sprite_cache = SpriteCache()
+    font = QFont("Arial", 12)
+    first = sprite_cache.text_sprite(font, "first", QColor("white"))
+    sprite_cache.max_bytes = 2 * sprite_cache.byte_count
+
+    sprite_cache.text_sprite(font, "first", QColor("white"))
+    for text in ("second", "third", "fourth"):
+        sprite_cache.text_sprite(font, text, QColor("white"))
+
+    assert sprite_cache.byte_count <= sprite_cache.max_bytes
+    assert sprite_cache.text_sprite(font, "fourth", QColor("white")) is not first
+    assert len(sprite_cache.sprites) < 4
+
+
+def test_items_share_the_sprite_of_the_same_text():
+    sprite_cache = SpriteCache()
+    first = JQGraphicsTextItem(text="Crit!", sprite_cache=sprite_cache)
+    second = JQGraphicsTextItem(text="Crit!", sprite_cache=sprite_cache)
+    label = AnimationSprite(sprite_cache.text_sprite(QFont("Arial", 16), "Crit!", QColor("white")))
+
+    assert first.sprite is second.sprite and not first.sprite.pixmap.isNull()
+    assert label.boundingRect() == label.sprite.rect
+    assert label.transformOriginPoint() == label.sprite.layout_rect.center()
+
+
+def render(item, rect):
+    scene = QGraphicsScene()
+    scene.addItem(item)
+    image = QImage(int(rect.width()), int(rect.height()), QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    scene.render(painter, QRectF(image.rect()), rect)
+    painter.end()
+    return image
+
+
+def test_baked_shadow_matches_the_live_effect():
+    sprite_cache = SpriteCache()
+    sprite = sprite_cache.text_sprite(QFont("Arial", 32), "1234", QColor("white"), QPen(Qt.GlobalColor.black, 2.0))
+    offset, blur_radius, color = QPointF(3.5, 6.1), 7.0, QColor(0, 0, 0, 191)
+
+    shadowed = sprite_cache.shadowed(sprite, offset, blur_radius, color)
+    live = AnimationSprite(sprite)
+    effect = QGraphicsDropShadowEffect()
+    effect.setOffset(offset)
+    effect.setBlurRadius(blur_radius)
+    effect.setColor(color)
+    live.setGraphicsEffect(effect)
+    rect = QRectF(shadowed.rect)
+
+    baked_image, live_image = render(AnimationSprite(shadowed), rect), render(live, rect)
+    difference = max(
+        abs(QColor(baked_image.pixel(x, y)).alpha() - QColor(live_image.pixel(x, y)).alpha())
+        for x in range(baked_image.width()) for y in range(baked_image.height())
+    )
+
+    assert sprite_cache.shadowed(sprite, offset, blur_radius, color) is shadowed
+    assert shadowed.rect.contains(sprite.rect) and shadowed.layout_rect == sprite.layout_rect
+    assert difference <= 2
+
+
+def test_items_bake_their_shadow_instead_of_attaching_an_effect():
+    sprite_cache = SpriteCache()
+    text_item = JQGraphicsTextItem(text="Dodge", drop_shadow=True, sprite_cache=sprite_cache)
+    simple_text_item = JQGraphicsSimpleTextItem(text="Dodge", drop_shadow=True, sprite_cache=sprite_cache)
+
+    for item in (text_item, simple_text_item):
+        assert item.graphicsEffect() is None
+        assert item.boundingRect().contains(item.sprite.rect)
@@ -0,0 +1,104 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QPointF, Qt
+from PyQt6.QtGui import QColor, QFont, QImage, QPainter, QPen, QPixmap
+from PyQt6.QtWidgets import QApplication
+
+from jetque.source.gui.items.jq_graphics_static_text_item import JQGraphicsStaticTextItem
+from jetque.source.managers.glyph_cache import GlyphCache
+from jetque.source.managers.sprite_cache import SpriteCache
+
+APPLICATION = QApplication.instance() or QApplication([])
+FONT = QFont("Arial", 24, QFont.Weight.Bold)
+OUTLINE_PEN = QPen(Qt.GlobalColor.black, 2.0)
+
+
+def render(paint, width=300, height=80):
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.translate(20.0, 10.0)
+    paint(painter)
+    painter.end()
+    return image
+
+
+def test_static_text_matches_the_text_sprite():
+    sprite_cache = SpriteCache()
+    for outline in (False, True):
+        item = JQGraphicsStaticTextItem(
+            FONT, "12,345 Crit", QColor("gold"), outline, OUTLINE_PEN, drop_shadow=False, sprite_cache=sprite_cache
+        )
+        sprite = sprite_cache.text_sprite(FONT, "12,345 Crit", QColor("gold"), OUTLINE_PEN if outline else None)
+
+        painted = render(lambda painter: item.paint(painter, None))
+        expected = render(lambda painter: painter.drawPixmap(sprite.rect.topLeft(), sprite.pixmap))
+        differing = sum(
+            1 for x in range(painted.width()) for y in range(painted.height())
+            if abs(QColor.fromRgba(painted.pixel(x, y)).alpha() - QColor.fromRgba(expected.pixel(x, y)).alpha()) > 64
+        )
+
+        assert item.sprite is None
+        assert item.collision_rect.contains(sprite.layout_rect)
+        assert sprite.rect.contains(item.collision_rect)
+        assert item.transformOriginPoint() == sprite.layout_rect.center()
+        assert differing < 20
+
+
+def test_layouts_and_glyph_layers_are_shared():
+    sprite_cache = SpriteCache()
+    glyph_cache = GlyphCache()
+    first = JQGraphicsStaticTextItem(
+        FONT, "Dodge", outline_pen=OUTLINE_PEN, drop_shadow=False, glyph_cache=glyph_cache
+    )
+    second = JQGraphicsStaticTextItem(
+        FONT, "Dodge", outline_pen=OUTLINE_PEN, drop_shadow=False, glyph_cache=glyph_cache
+    )
+
+    assert second.layout is first.layout
+    assert len(first.layout.outline_layers) == 5
+    assert glyph_cache.hits == 0 and glyph_cache.misses == len(glyph_cache.layers)
+
+    JQGraphicsStaticTextItem(FONT, "Dodged", outline_pen=OUTLINE_PEN, drop_shadow=False, glyph_cache=glyph_cache)
+    assert glyph_cache.hits >= 5
+
+    shadowed = JQGraphicsStaticTextItem(
+        FONT, "Dodge", outline_pen=OUTLINE_PEN, drop_shadow_offset=QPointF(3.0, 6.0), glyph_cache=glyph_cache
+    )
+    assert shadowed.sprite is None
+    assert len(shadowed.shadow_layers) == 5
+    assert shadowed.boundingRect().contains(shadowed.collision_rect.translated(3.0, 6.0))
+    assert JQGraphicsStaticTextItem(
+        FONT, "Dodge", outline_pen=OUTLINE_PEN, drop_shadow_offset=QPointF(3.0, 6.0), glyph_cache=glyph_cache
+    ).shadow_layers[0][1] is shadowed.shadow_layers[0][1]
+
+    icon = QPixmap(20, 10)
+    icon.fill(QColor("red"))
+    with_icon = JQGraphicsStaticTextItem(FONT, "Dodge", icon_pixmap=icon, sprite_cache=sprite_cache)
+    assert with_icon.sprite is not None and not with_icon.shadow_layers
+    assert JQGraphicsStaticTextItem(
+        FONT, "Dodge", icon_pixmap=icon, sprite_cache=sprite_cache
+    ).sprite is with_icon.sprite
+
+
+def test_icon_is_aligned_beside_the_text():
+    icon = QPixmap(20, 10)
+    icon.fill(QColor("red"))
+    plain = JQGraphicsStaticTextItem(FONT, "Heal", drop_shadow=False)
+    left = JQGraphicsStaticTextItem(FONT, "Heal", drop_shadow=False, icon_pixmap=icon, icon_padding=2.0)
+    right = JQGraphicsStaticTextItem(
+        FONT, "Heal", drop_shadow=False, icon_pixmap=icon, icon_alignment="right", icon_padding=2.0
+    )
+
+    assert left.icon_rect.height() == plain.layout.line_height
+    assert left.icon_rect.width() == 2.0 * left.icon_rect.height()
+    assert left.icon_rect.right() <= plain.layout.ink_rect.left()
+    assert right.icon_rect.left() > plain.layout.ink_rect.right() - 4.0
+    assert left.collision_rect.contains(left.icon_rect)
+    assert right.boundingRect().contains(right.icon_rect)
+    assert QColor.fromRgba(render(lambda painter: right.paint(painter, None)).pixel(
+        round(20.0 + right.icon_rect.center().x()), round(10.0 + right.icon_rect.center().y())
+    )) == QColor("red")